@@ -0,0 +1,11 @@
+"""
+Benchmarks Package for ChestBuddy application.
+
+This package contains the reproducible benchmark suite: a seeded generator for
+synthetic Total Battle chest data and a runner that measures the main data
+pipeline stages.
+"""
+
+from benchmarks.data_generator import TotalBattleDataGenerator
+
+__all__ = ["TotalBattleDataGenerator"]
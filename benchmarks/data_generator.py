@@ -0,0 +1,388 @@
+"""
+data_generator.py
+
+Description: Seeded generator for synthetic Total Battle chest data.
+Usage:
+    generator = TotalBattleDataGenerator(seed=42, invalid_rate=0.05)
+    df = generator.generate(100_000)
+    generator.write_csv(df, "chests.csv")
+    generator.write_validation_lists("validation/")
+    generator.write_correction_rules("corrections.csv")
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from chestbuddy.core.models.correction_rule import CorrectionRule
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+# Latin characters and their Cyrillic look-alikes (as seen in real OCR'd exports)
+CYRILLIC_LOOKALIKES = {
+    "a": "а",
+    "c": "с",
+    "e": "е",
+    "o": "о",
+    "p": "р",
+    "x": "х",
+    "y": "у",
+    "A": "А",
+    "B": "В",
+    "C": "С",
+    "E": "Е",
+    "H": "Н",
+    "K": "К",
+    "M": "М",
+    "O": "О",
+    "P": "Р",
+    "T": "Т",
+    "X": "Х",
+}
+
+
+class TotalBattleDataGenerator:
+    """
+    Generates realistic DATE/PLAYER/SOURCE/CHEST/SCORE/CLAN chest data.
+
+    The same seed always produces the same rows, validation lists and correction
+    rules, so benchmark runs on different machines or commits are comparable.
+
+    Attributes:
+        seed (int): Seed for the random number generator
+        invalid_rate (float): Fraction of rows that receive one corrupted field
+        start_date (str): First date of the generated period (YYYY-MM-DD)
+        days (int): Number of days the generated period spans
+
+    Implementation Notes:
+        - Clean values are drawn with vectorized NumPy sampling
+        - Only the corrupted rows are touched individually
+        - Corruptions are mojibake (UTF-8 read as cp1252), Cyrillic look-alikes,
+          typos, missing values and score outliers
+        - Mojibake and look-alike variants are deterministic per value, so the
+          generated correction rules fix them while typos stay invalid
+    """
+
+    EXPECTED_COLUMNS = ["DATE", "PLAYER", "SOURCE", "CHEST", "SCORE", "CLAN"]
+
+    PLAYERS = [
+        "Feldjäger",
+        "Jürgen",
+        "Müllermeister",
+        "Kröte",
+        "Gräfin Zoë",
+        "Björn Eisenfaust",
+        "Éowyn",
+        "Señor Oso",
+        "D4rkBlizZ4rD",
+        "Engelchen",
+        "Alarich",
+        "Alexa Elly",
+        "Anararad",
+        "Moonstone",
+        "Copper Kettle",
+        "Hexenmeister",
+        "Nightmare",
+        "Papa Bear",
+        "Ragnar",
+        "Sir Lancelot",
+        "Tempest",
+        "Valkyrie",
+        "Wolfsherz",
+        "Xenon",
+        "Yggdrasil",
+        "Zorro",
+        "Mahon12",
+        "Ostara",
+        "Krampus",
+        "Chimera",
+    ]
+
+    SOURCES = [
+        "Level 10 Crypt",
+        "Level 15 Crypt",
+        "Level 20 Crypt",
+        "Level 25 Crypt",
+        "Level 25 rare Crypt",
+        "Level 25 epic Crypt",
+        "Level 30 epic Crypt",
+        "Arena",
+        "Bank",
+        "Clan wealth",
+        "Mercenary Exchange",
+        "Epic Ancient squad",
+        "Clash for the Throne tournament",
+    ]
+
+    CHESTS = {
+        "Forgotten Chest": 25,
+        "Fire Chest": 275,
+        "Bone Chest": 275,
+        "Rare Dragon Chest": 350,
+        "Ancient Bastion Chest": 550,
+        "Barbarian Chest": 100,
+        "Elegant Chest": 150,
+        "Orc Chest": 75,
+        "Cobra Chest": 200,
+        "Sand Chest": 50,
+        "Arachne Chest": 400,
+        "Fenrir's Chest": 500,
+    }
+
+    CLANS = ["MY_CLAN", "Iron Wolves", "Nordlicht", "Dragon Riders"]
+
+    # Relative weights of the corruption kinds applied to invalid rows
+    CORRUPTIONS = {
+        "mojibake": 0.3,
+        "lookalike": 0.3,
+        "typo": 0.2,
+        "missing": 0.1,
+        "outlier": 0.1,
+    }
+
+    def __init__(
+        self,
+        seed: int = 42,
+        invalid_rate: float = 0.05,
+        start_date: str = "2025-01-01",
+        days: int = 90,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Seed for the random number generator
+            invalid_rate: Fraction of rows (0.0 - 1.0) that get one corrupted field
+            start_date: First date of the generated period (YYYY-MM-DD)
+            days: Number of days the generated period spans
+
+        Raises:
+            ValueError: If invalid_rate is outside 0.0 - 1.0
+        """
+        if not 0.0 <= invalid_rate <= 1.0:
+            raise ValueError(f"invalid_rate must be between 0 and 1, got {invalid_rate}")
+
+        self.seed = seed
+        self.invalid_rate = invalid_rate
+        self.start_date = start_date
+        self.days = days
+
+    @staticmethod
+    def mojibake(value: str) -> str:
+        """
+        Garble a value the way a UTF-8 file opened as cp1252 would.
+
+        Args:
+            value: The clean value
+
+        Returns:
+            str: The garbled value (unchanged if the value is plain ASCII)
+        """
+        return value.encode("utf-8").decode("cp1252", errors="replace")
+
+    @staticmethod
+    def lookalike(value: str) -> str:
+        """
+        Replace the first Latin letter that has a Cyrillic twin.
+
+        Args:
+            value: The clean value
+
+        Returns:
+            str: The value with one look-alike character (unchanged if none apply)
+        """
+        for i, char in enumerate(value):
+            replacement = CYRILLIC_LOOKALIKES.get(char)
+            if replacement:
+                return value[:i] + replacement + value[i + 1 :]
+        return value
+
+    @staticmethod
+    def typo(value: str) -> str:
+        """
+        Swap the two middle characters of a value.
+
+        Args:
+            value: The clean value
+
+        Returns:
+            str: The misspelled value
+        """
+        if len(value) < 2:
+            return value + value
+        mid = len(value) // 2
+        return value[: mid - 1] + value[mid] + value[mid - 1] + value[mid + 1 :]
+
+    def generate(self, rows: int) -> pd.DataFrame:
+        """
+        Generate a chest data DataFrame.
+
+        Args:
+            rows: Number of rows to generate
+
+        Returns:
+            pd.DataFrame: DataFrame with the EXPECTED_COLUMNS
+        """
+        rng = np.random.default_rng(self.seed)
+
+        players = np.array(self.PLAYERS, dtype=object)
+        sources = np.array(self.SOURCES, dtype=object)
+        chests = np.array(list(self.CHESTS), dtype=object)
+        chest_scores = np.array(list(self.CHESTS.values()), dtype=np.int64)
+        clans = np.array(self.CLANS, dtype=object)
+        dates = (
+            pd.date_range(self.start_date, periods=self.days, freq="D")
+            .strftime("%Y-%m-%d")
+            .to_numpy(dtype=object)
+        )
+
+        # Zipf-like player activity: a few players open most of the chests
+        player_weights = 1.0 / np.arange(1, len(players) + 1)
+        player_weights /= player_weights.sum()
+
+        player_idx = rng.choice(len(players), size=rows, p=player_weights)
+        chest_idx = rng.integers(0, len(chests), size=rows)
+
+        data = {
+            "DATE": np.sort(dates[rng.integers(0, len(dates), size=rows)]),
+            "PLAYER": players[player_idx],
+            "SOURCE": sources[rng.integers(0, len(sources), size=rows)],
+            "CHEST": chests[chest_idx],
+            "SCORE": chest_scores[chest_idx],
+            # Players stay in one clan
+            "CLAN": clans[player_idx % len(clans)],
+        }
+
+        self._corrupt(data, rng, rows)
+
+        df = pd.DataFrame(data, columns=self.EXPECTED_COLUMNS)
+        logger.info(
+            f"Generated {rows} rows (seed={self.seed}, invalid_rate={self.invalid_rate:.2%})"
+        )
+        return df
+
+    def _corrupt(self, data: Dict[str, np.ndarray], rng: np.random.Generator, rows: int) -> None:
+        """
+        Corrupt one field in a random subset of rows, in place.
+
+        Args:
+            data: Column arrays to modify
+            rng: The random number generator
+            rows: Number of rows in the arrays
+        """
+        invalid_count = int(round(rows * self.invalid_rate))
+        if invalid_count == 0:
+            return
+
+        invalid_rows = rng.choice(rows, size=invalid_count, replace=False)
+        kinds = list(self.CORRUPTIONS)
+        weights = np.array(list(self.CORRUPTIONS.values()))
+        kind_idx = rng.choice(len(kinds), size=invalid_count, p=weights / weights.sum())
+        text_columns = np.array(["PLAYER", "SOURCE", "CHEST"], dtype=object)
+        columns = text_columns[rng.integers(0, len(text_columns), size=invalid_count)]
+
+        # SCORE becomes float so missing values can be represented as NaN
+        scores = data["SCORE"].astype(np.float64)
+
+        for row, kind, column in zip(invalid_rows, kind_idx, columns):
+            kind = kinds[kind]
+            if kind == "outlier":
+                scores[row] = scores[row] * 100
+            elif kind == "missing":
+                data[column][row] = ""
+            else:
+                clean = data[column][row]
+                corrupted = getattr(self, kind)(clean)
+                if corrupted == clean:
+                    # Plain ASCII without look-alike candidates; fall back to a typo
+                    corrupted = self.typo(clean)
+                data[column][row] = corrupted
+
+        data["SCORE"] = scores
+
+    def correction_rules(self) -> List[CorrectionRule]:
+        """
+        Build correction rules that undo mojibake and look-alike corruption.
+
+        Returns:
+            List[CorrectionRule]: One rule per distinct corrupted value
+        """
+        rules = []
+        seen = set()
+        for category, values in self._reference_values().items():
+            for value in values:
+                for corrupted in (self.mojibake(value), self.lookalike(value)):
+                    key = (category, corrupted)
+                    if corrupted != value and key not in seen:
+                        seen.add(key)
+                        rules.append(CorrectionRule(value, corrupted, category))
+        return rules
+
+    def _reference_values(self) -> Dict[str, List[str]]:
+        """Map correction categories to the clean values of their column."""
+        return {
+            "player": list(self.PLAYERS),
+            "source": list(self.SOURCES),
+            "chest": list(self.CHESTS),
+        }
+
+    def write_csv(self, df: pd.DataFrame, file_path: Union[str, Path]) -> Path:
+        """
+        Write generated data to a UTF-8 CSV file.
+
+        Args:
+            df: The generated data
+            file_path: Destination path
+
+        Returns:
+            Path: The written file
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False, encoding="utf-8")
+        return path
+
+    def write_validation_lists(self, directory: Union[str, Path]) -> Tuple[Path, Path, Path]:
+        """
+        Write the players/chest types/sources validation lists.
+
+        The file names match those resolved by ValidationService.
+
+        Args:
+            directory: Destination directory
+
+        Returns:
+            Tuple[Path, Path, Path]: Paths of players.txt, chest_types.txt and sources.txt
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = (
+            directory / "players.txt",
+            directory / "chest_types.txt",
+            directory / "sources.txt",
+        )
+        for path, values in zip(paths, (self.PLAYERS, list(self.CHESTS), self.SOURCES)):
+            path.write_text("\n".join(sorted(values)) + "\n", encoding="utf-8")
+        return paths
+
+    def write_correction_rules(self, file_path: Union[str, Path]) -> Path:
+        """
+        Write the generated correction rules in the CorrectionRuleManager CSV format.
+
+        Args:
+            file_path: Destination path
+
+        Returns:
+            Path: The written file
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame([rule.to_dict() for rule in self.correction_rules()]).to_csv(
+            path, index=False
+        )
+        return path
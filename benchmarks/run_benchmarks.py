@@ -0,0 +1,389 @@
+"""
+run_benchmarks.py
+
+Description: Measures the ChestBuddy data pipeline on synthetic data.
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 10000 100000
+    python -m benchmarks.run_benchmarks --output results.json --baseline benchmarks/baseline.json
+
+Each size runs the stages load, normalize, validate, correct, filter, sort,
+chart_aggregation and save in order, recording wall time and peak traced memory
+per stage. Results are written as JSON and can be compared against a stored
+baseline run.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.data_generator import TotalBattleDataGenerator
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+STAGES = [
+    "load",
+    "normalize",
+    "validate",
+    "correct",
+    "filter",
+    "sort",
+    "chart_aggregation",
+    "save",
+]
+
+# Stages slower than baseline by more than this fraction are reported as regressions
+DEFAULT_THRESHOLD = 0.20
+
+# Ignore timing differences below this many seconds (noise on small inputs)
+MIN_SIGNIFICANT_SECONDS = 0.01
+
+
+class BenchmarkConfig:
+    """
+    Minimal stand-in for ConfigManager pointing the services at generated files.
+
+    Keeps benchmark runs from reading or modifying the user's configuration.
+
+    Attributes:
+        _values (Dict[Tuple[str, str], str]): Configured (section, option) values
+    """
+
+    def __init__(self, validation_dir: Path, rules_file: Path) -> None:
+        """
+        Initialize the configuration.
+
+        Args:
+            validation_dir: Directory containing the generated validation lists
+            rules_file: Path of the generated correction rules
+        """
+        self._values = {
+            ("Validation", "validation_lists_dir"): str(validation_dir),
+            ("Corrections", "rules_file_path"): str(rules_file),
+        }
+
+    def get(self, section: str, option: str, fallback: Any = "") -> Any:
+        """Get a configuration value as a string."""
+        return self._values.get((section, option), fallback)
+
+    def get_bool(self, section: str, option: str, fallback: bool = False) -> bool:
+        """Get a configuration value as a boolean."""
+        return fallback
+
+    def get_int(self, section: str, option: str, fallback: int = 0) -> int:
+        """Get a configuration value as an integer."""
+        return fallback
+
+
+def measure(func: Callable[[], Any], trace_memory: bool = True) -> Tuple[Any, Dict[str, float]]:
+    """
+    Run a callable and measure its wall time and peak traced memory.
+
+    Args:
+        func: The callable to measure
+        trace_memory: Whether to track peak memory with tracemalloc
+
+    Returns:
+        Tuple[Any, Dict[str, float]]: The callable's result and its metrics
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if trace_memory:
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mb = round(peak / (1024 * 1024), 3)
+
+    return result, {"seconds": round(seconds, 6), "peak_mb": peak_mb}
+
+
+def run_size(
+    rows: int,
+    generator: TotalBattleDataGenerator,
+    work_dir: Path,
+    stages: List[str],
+    trace_memory: bool = True,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the selected stages for one dataset size.
+
+    Args:
+        rows: Number of rows to generate
+        generator: The data generator
+        work_dir: Directory for generated and saved files
+        stages: Stages to run (in pipeline order)
+        trace_memory: Whether to track peak memory
+
+    Returns:
+        Dict[str, Dict[str, float]]: Metrics per stage
+    """
+    # Imported here so --help works without initializing Qt
+    from PySide6.QtWidgets import QApplication
+
+    from chestbuddy.core.models import ChestDataModel
+    from chestbuddy.core.services import (
+        ChartService,
+        CorrectionService,
+        CSVService,
+        ValidationService,
+    )
+
+    # Chart objects require a QApplication
+    _app = QApplication.instance() or QApplication([])
+
+    size_dir = work_dir / str(rows)
+    validation_dir = size_dir / "validation"
+    rules_file = size_dir / "corrections.csv"
+    input_file = size_dir / "input.csv"
+    output_file = size_dir / "output.csv"
+
+    generator.write_validation_lists(validation_dir)
+    generator.write_correction_rules(rules_file)
+    generator.write_csv(generator.generate(rows), input_file)
+    config = BenchmarkConfig(validation_dir, rules_file)
+
+    csv_service = CSVService()
+    data_model = ChestDataModel()
+    results: Dict[str, Dict[str, float]] = {}
+    df: Optional[pd.DataFrame] = None
+
+    def load() -> pd.DataFrame:
+        loaded, error = csv_service.read_csv(input_file, encoding="utf-8", normalize_text=False)
+        if loaded is None:
+            raise RuntimeError(f"Failed to load benchmark data: {error}")
+        return loaded
+
+    def normalize() -> pd.DataFrame:
+        normalized = csv_service._normalize_dataframe_text(df)
+        data_model.update_data(normalized)
+        return normalized
+
+    def validate() -> Any:
+        return ValidationService(data_model, config).validate_data()
+
+    def correct() -> Any:
+        service = CorrectionService(data_model, config)
+        service._rule_manager.load_rules(rules_file)
+        return service.apply_corrections()
+
+    def filter_() -> pd.DataFrame:
+        return data_model.filter_data("PLAYER", "er", "Contains", False)
+
+    def sort() -> pd.DataFrame:
+        return data_model.data.sort_values(["SCORE", "PLAYER"], kind="stable")
+
+    def chart_aggregation() -> Any:
+        chart_service = ChartService(data_model)
+        return [
+            chart_service.create_bar_chart("PLAYER", "SCORE"),
+            chart_service.create_pie_chart("CHEST", "SCORE"),
+            chart_service.create_line_chart("DATE", "SCORE"),
+        ]
+
+    def save() -> Any:
+        return csv_service.write_csv(output_file, data_model.data)
+
+    stage_functions = {
+        "load": load,
+        "normalize": normalize,
+        "validate": validate,
+        "correct": correct,
+        "filter": filter_,
+        "sort": sort,
+        "chart_aggregation": chart_aggregation,
+        "save": save,
+    }
+
+    for stage in STAGES:
+        if stage not in stages:
+            # Later stages still need the data loaded into the model
+            if stage == "load":
+                df = load()
+            elif stage == "normalize":
+                data_model.update_data(df)
+            continue
+
+        logger.info(f"[{rows} rows] running {stage}")
+        result, metrics = measure(stage_functions[stage], trace_memory)
+        if stage == "load":
+            df = result
+        results[stage] = metrics
+        memory = f", peak {metrics['peak_mb']:.1f} MB" if metrics["peak_mb"] is not None else ""
+        logger.info(f"[{rows} rows] {stage}: {metrics['seconds']:.3f}s{memory}")
+
+    return results
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    Compare stage timings of two result files.
+
+    Args:
+        current: Results of the current run
+        baseline: Stored baseline results
+        threshold: Allowed slowdown as a fraction of the baseline time
+
+    Returns:
+        List[Dict[str, Any]]: One entry per (size, stage) present in both runs
+    """
+    comparisons = []
+    for size, stages in current.get("results", {}).items():
+        baseline_stages = baseline.get("results", {}).get(size, {})
+        for stage, metrics in stages.items():
+            if stage not in baseline_stages:
+                continue
+            base_seconds = baseline_stages[stage]["seconds"]
+            seconds = metrics["seconds"]
+            ratio = seconds / base_seconds if base_seconds > 0 else float("inf")
+            regression = (
+                ratio > 1.0 + threshold and seconds - base_seconds > MIN_SIGNIFICANT_SECONDS
+            )
+            comparisons.append(
+                {
+                    "size": size,
+                    "stage": stage,
+                    "baseline_seconds": base_seconds,
+                    "seconds": seconds,
+                    "ratio": round(ratio, 3),
+                    "regression": regression,
+                }
+            )
+    return comparisons
+
+
+def format_comparison(comparisons: List[Dict[str, Any]]) -> str:
+    """
+    Format a baseline comparison as a text table.
+
+    Args:
+        comparisons: Output of compare_results
+
+    Returns:
+        str: The formatted table
+    """
+    lines = [f"{'size':>9} | {'stage':<18} | {'baseline':>10} | {'current':>10} | ratio"]
+    for entry in comparisons:
+        marker = "  REGRESSION" if entry["regression"] else ""
+        lines.append(
+            f"{entry['size']:>9} | {entry['stage']:<18} | {entry['baseline_seconds']:>9.3f}s"
+            f" | {entry['seconds']:>9.3f}s | {entry['ratio']:.2f}x{marker}"
+        )
+    return "\n".join(lines)
+
+
+def collect_metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    """Describe the environment and parameters of a benchmark run."""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "seed": args.seed,
+        "invalid_rate": args.invalid_rate,
+        "memory_traced": not args.no_memory,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the ChestBuddy benchmark suite.")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts to benchmark"
+    )
+    parser.add_argument(
+        "--stages", nargs="+", choices=STAGES, default=STAGES, help="Stages to run"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the data generator")
+    parser.add_argument(
+        "--invalid-rate", type=float, default=0.05, help="Fraction of corrupted rows"
+    )
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown versus the baseline (0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip tracemalloc (more accurate timings, no peak memory)",
+    )
+    parser.add_argument(
+        "--work-dir", type=Path, help="Keep generated files here instead of a temp dir"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        int: 1 if a regression against the baseline was found, 0 otherwise
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Keep service logging from dominating the benchmark output and timings
+    logging.getLogger("chestbuddy").setLevel(logging.WARNING)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    generator = TotalBattleDataGenerator(seed=args.seed, invalid_rate=args.invalid_rate)
+    stages = [stage for stage in STAGES if stage in args.stages]
+    output = {"metadata": collect_metadata(args), "results": {}}
+
+    with tempfile.TemporaryDirectory(prefix="chestbuddy-bench-") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        for rows in args.sizes:
+            output["results"][str(rows)] = run_size(
+                rows, generator, work_dir, stages, trace_memory=not args.no_memory
+            )
+
+    text = json.dumps(output, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+        logger.info(f"Results written to {args.output}")
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparisons = compare_results(output, baseline, args.threshold)
+        logger.info("\n" + format_comparison(comparisons))
+        if any(entry["regression"] for entry in comparisons):
+            logger.warning("Performance regressions detected")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
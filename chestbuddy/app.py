@@ -5,12 +5,19 @@ This module provides the main ChestBuddy application class that initializes
 all services and UI components.
 """
 
+import argparse
 import logging
+import multiprocessing
 import os
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from chestbuddy.utils.startup_profiler import startup_profiler
+from chestbuddy.utils.signal_tracer import signal_tracer
+
+_import_started = time.perf_counter()
 
 import pandas as pd
 from PySide6.QtWidgets import QApplication
@@ -22,7 +29,9 @@ from chestbuddy.core.services import (
     ValidationService,
     CorrectionService,
     ChartService,
+    RollupService,
     DataManager,
+    QueryService,
 )
 from chestbuddy.core.controllers import (
     FileOperationsController,
@@ -36,16 +45,23 @@ from chestbuddy.core.controllers.correction_controller import CorrectionControll
 from chestbuddy.ui.main_window import MainWindow
 from chestbuddy.utils.config import ConfigManager
 from chestbuddy.utils.background_processing import BackgroundWorker
+from chestbuddy.utils.task_scheduler import TaskScheduler
+from chestbuddy.utils.process_pool import ProcessPool
+from chestbuddy.utils.log_pipeline import configure_logging, hot_path, shutdown_logging
 from chestbuddy.ui.resources.style import apply_application_style
 from chestbuddy.ui.resources.resource_manager import ResourceManager
 from chestbuddy.utils.signal_manager import SignalManager
 from chestbuddy.utils.service_locator import ServiceLocator
+from chestbuddy.utils.span_tracer import span_tracer
+from chestbuddy.utils.write_behind import flush_all
 from chestbuddy.ui.utils.update_manager import UpdateManager
 from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
 from chestbuddy.core.table_state_manager import TableStateManager
 from chestbuddy.ui.data.adapters.validation_adapter import ValidationAdapter
 from chestbuddy.ui.data.adapters.correction_adapter import CorrectionAdapter
 
+startup_profiler.record("import chestbuddy.app", _import_started, time.perf_counter())
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -91,172 +107,202 @@ class ChestBuddyApp(QObject):
         """Initialize the application and its components."""
         try:
             # Set up logging
-            self._setup_logging()
+            with startup_profiler.phase("logging"):
+                self._setup_logging()
 
             # Create configuration manager
-            self._config_manager = ConfigManager("chestbuddy")
+            with startup_profiler.phase("core"):
+                self._config_manager = ConfigManager("chestbuddy")
+                self._setup_logging(self._config_manager)
+
+                # Keep cheap latency statistics for key signals
+                if self._config_manager.get_bool("Debug", "signal_sampling", True):
+                    signal_tracer.start_sampling(
+                        sample_rate=self._config_manager.get_int("Debug", "signal_sample_rate", 10),
+                        digest_interval=self._config_manager.get_float(
+                            "Debug", "signal_digest_interval", 300.0
+                        ),
+                    )
 
-            # Initialize data model
-            self._data_model = ChestDataModel()
+                # Initialize data model
+                self._data_model = ChestDataModel()
 
-            # Initialize table state manager
-            self._table_state_manager = TableStateManager(self._data_model)
-            ServiceLocator.register("table_state_manager", self._table_state_manager)
-            logger.info("TableStateManager initialized and registered")
+                # Initialize table state manager
+                self._table_state_manager = TableStateManager(self._data_model)
+                ServiceLocator.register("table_state_manager", self._table_state_manager)
+                logger.info("TableStateManager initialized and registered")
 
-            # Create controllers - create error controller early
-            self._error_controller = ErrorHandlingController(self._signal_manager)
+                # Undo/redo restores cell states as well as values
+                self._data_model.journal.set_state_manager(self._table_state_manager)
+                ServiceLocator.register("change_journal", self._data_model.journal)
 
-            # Create services
-            try:
-                # Create services
-                self._csv_service = CSVService()
+                # Background work shares one prioritized thread pool
+                ServiceLocator.register("task_scheduler", TaskScheduler.instance())
 
-                # Create DataManager with the correct arguments
-                self._data_manager = DataManager(self._data_model, self._csv_service)
+                # Create controllers - create error controller early
+                self._error_controller = ErrorHandlingController(self._signal_manager)
 
-                self._validation_service = ValidationService(self._data_model, self._config_manager)
-                ServiceLocator.register("validation_service", self._validation_service)
-                logger.info("ValidationService initialized and registered")
-
-                # Initialize CorrectionRuleManager and CorrectionService with all required parameters
-                self._correction_rule_manager = CorrectionRuleManager(self._config_manager)
-                self._correction_service = CorrectionService(self._data_model, self._config_manager)
-                self._correction_service._validation_service = self._validation_service
-                ServiceLocator.register("correction_service", self._correction_service)
-                logger.info("CorrectionService initialized and registered")
-
-                # Load correction rules
+            # Create services
+            with startup_profiler.phase("services"):
                 try:
-                    self._correction_rule_manager.load_rules()
-                    logger.info("Correction rules loaded during startup")
-                except Exception as e:
-                    logger.warning(f"Error loading correction rules during startup: {e}")
+                    # Create services
+                    self._csv_service = CSVService()
 
-                self._chart_service = ChartService(self._data_model)
+                    # Create DataManager with the correct arguments
+                    self._data_manager = DataManager(self._data_model, self._csv_service)
 
-                # Create and Connect Adapters
-                self._validation_adapter = ValidationAdapter(
-                    validation_service=self._validation_service,
-                    table_state_manager=self._table_state_manager,
-                )
-                logger.info("ValidationAdapter initialized and connected")
+                    self._validation_service = ValidationService(
+                        self._data_model, self._config_manager
+                    )
+                    ServiceLocator.register("validation_service", self._validation_service)
+                    logger.info("ValidationService initialized and registered")
 
-                self._correction_adapter = CorrectionAdapter(
-                    correction_service=self._correction_service,
-                    table_state_manager=self._table_state_manager,
-                )
-                logger.info("CorrectionAdapter initialized and connected")
+                    # Initialize CorrectionRuleManager and CorrectionService
+                    self._correction_rule_manager = CorrectionRuleManager(self._config_manager)
+                    self._correction_service = CorrectionService(
+                        self._data_model, self._config_manager
+                    )
+                    self._correction_service._validation_service = self._validation_service
+                    ServiceLocator.register("correction_service", self._correction_service)
+                    logger.info("CorrectionService initialized and registered")
+
+                    # Load correction rules
+                    try:
+                        self._correction_rule_manager.load_rules()
+                        logger.info("Correction rules loaded during startup")
+                    except Exception as e:
+                        logger.warning(f"Error loading correction rules during startup: {e}")
+
+                    self._rollup_service = RollupService(self._data_model)
+                    ServiceLocator.register("rollup_service", self._rollup_service)
+                    self._chart_service = ChartService(self._data_model, self._rollup_service)
+                    self._query_service = QueryService(self._data_model, self._csv_service)
+                    ServiceLocator.register("query_service", self._query_service)
+
+                    # Create and Connect Adapters
+                    self._validation_adapter = ValidationAdapter(
+                        validation_service=self._validation_service,
+                        table_state_manager=self._table_state_manager,
+                    )
+                    logger.info("ValidationAdapter initialized and connected")
 
-                # Initialize DataManager with config_manager
-                self._data_manager._config = self._config_manager
-            except Exception as e:
-                logger.error(f"Error initializing services: {e}")
-                self._error_controller.handle_exception(e, "Error initializing services")
-                raise
+                    self._correction_adapter = CorrectionAdapter(
+                        correction_service=self._correction_service,
+                        table_state_manager=self._table_state_manager,
+                    )
+                    logger.info("CorrectionAdapter initialized and connected")
+
+                    # Initialize DataManager with config_manager
+                    self._data_manager._config = self._config_manager
+                except Exception as e:
+                    logger.error(f"Error initializing services: {e}")
+                    self._error_controller.handle_exception(e, "Error initializing services")
+                    raise
 
             # Create remaining controllers
-            try:
-                self._file_controller = FileOperationsController(
-                    self._data_manager, self._config_manager, self._signal_manager
-                )
-                self._progress_controller = ProgressController(self._signal_manager)
-                self._view_state_controller = ViewStateController(
-                    self._data_model, self._signal_manager
-                )
-                self._ui_state_controller = UIStateController(self._signal_manager)
-                self._data_view_controller = DataViewController(
-                    self._data_model,
-                    self._signal_manager,
-                    ui_state_controller=self._ui_state_controller,
-                )
+            with startup_profiler.phase("controllers"):
+                try:
+                    self._file_controller = FileOperationsController(
+                        self._data_manager, self._config_manager, self._signal_manager
+                    )
+                    self._progress_controller = ProgressController(self._signal_manager)
+                    self._view_state_controller = ViewStateController(
+                        self._data_model, self._signal_manager
+                    )
+                    self._ui_state_controller = UIStateController(self._signal_manager)
+                    self._data_view_controller = DataViewController(
+                        self._data_model,
+                        self._signal_manager,
+                        ui_state_controller=self._ui_state_controller,
+                    )
 
-                # Initialize CorrectionController
-                self._correction_controller = CorrectionController(
-                    self._correction_service,
-                    self._correction_rule_manager,
-                    self._config_manager,
-                    self._validation_service,
-                    self._signal_manager,
-                )
-                ServiceLocator.register("correction_controller", self._correction_controller)
-                logger.info("CorrectionController initialized and registered")
+                    # Initialize CorrectionController
+                    self._correction_controller = CorrectionController(
+                        self._correction_service,
+                        self._correction_rule_manager,
+                        self._config_manager,
+                        self._validation_service,
+                        self._signal_manager,
+                    )
+                    ServiceLocator.register("correction_controller", self._correction_controller)
+                    logger.info("CorrectionController initialized and registered")
 
-            except Exception as e:
-                logger.error(f"Error initializing controllers: {e}")
-                self._error_controller.handle_exception(e, "Error initializing controllers")
-                raise
+                except Exception as e:
+                    logger.error(f"Error initializing controllers: {e}")
+                    self._error_controller.handle_exception(e, "Error initializing controllers")
+                    raise
 
             # Initialize UpdateManager and register with ServiceLocator
-            try:
-                self._update_manager = UpdateManager()
-                # Register with class name and string name for compatibility
-                ServiceLocator.register(UpdateManager, self._update_manager)
-                ServiceLocator.register("update_manager", self._update_manager)
-                logger.info("UpdateManager initialized and registered with ServiceLocator")
-            except Exception as e:
-                logger.error(f"Error initializing UpdateManager: {e}")
-                self._error_controller.handle_exception(e, "Error initializing UpdateManager")
-                raise
+            with startup_profiler.phase("wiring"):
+                try:
+                    self._update_manager = UpdateManager()
+                    # Register with class name and string name for compatibility
+                    ServiceLocator.register(UpdateManager, self._update_manager)
+                    ServiceLocator.register("update_manager", self._update_manager)
+                    logger.info("UpdateManager initialized and registered with ServiceLocator")
+                except Exception as e:
+                    logger.error(f"Error initializing UpdateManager: {e}")
+                    self._error_controller.handle_exception(e, "Error initializing UpdateManager")
+                    raise
 
-            # Set up controller relationships
-            self._error_controller.set_progress_controller(self._progress_controller)
+                # Set up controller relationships
+                self._error_controller.set_progress_controller(self._progress_controller)
 
-            # Connect ViewStateController and DataViewController
-            self._view_state_controller.set_data_view_controller(self._data_view_controller)
+                # Connect ViewStateController and DataViewController
+                self._view_state_controller.set_data_view_controller(self._data_view_controller)
 
-            # Create resource manager
-            self._resource_manager = ResourceManager()
+                # Create resource manager
+                self._resource_manager = ResourceManager()
 
             # Create UI
-            self._create_ui()
+            with startup_profiler.phase("ui"):
+                self._create_ui()
 
             # Connect signals
-            self._connect_signals()
+            with startup_profiler.phase("signals"):
+                self._connect_signals()
 
             # Apply application-wide styling
-            app = QApplication.instance()
-            apply_application_style(app)
+            with startup_profiler.phase("style"):
+                app = QApplication.instance()
+                apply_application_style(app)
 
             logger.info("Application initialized successfully")
+            startup_profiler.log_timeline(logger)
         except Exception as e:
             logger.critical(f"Failed to initialize application: {e}")
             self._error_controller.handle_exception(e, "Failed to initialize application")
             sys.exit(1)
 
-    def _setup_logging(self) -> None:
-        """Set up logging for the application."""
+    def _setup_logging(self, config_manager: Optional[ConfigManager] = None) -> None:
+        """
+        Set up asynchronous logging for the application.
+
+        Records are written to a rotating file and the console by a background
+        thread. Until the configuration is loaded, defaults are used.
+
+        Args:
+            config_manager: Configuration with the Logging and Debug settings
+        """
         try:
             # Get application base directory (directory containing app.py)
             base_dir = Path(__file__).parent
             # Create logs directory in chestbuddy/logs
             log_dir = base_dir / "logs"
             log_dir.mkdir(exist_ok=True, parents=True)
-
-            # Set up file handler with UTF-8 encoding
             log_file = log_dir / "chestbuddy.log"
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
-            file_handler.setLevel(logging.DEBUG)
 
-            # Set up console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-
-            # Set up formatters
-            file_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            console_formatter = logging.Formatter("%(levelname)s: %(message)s")
-
-            # Apply formatters
-            file_handler.setFormatter(file_formatter)
-            console_handler.setFormatter(console_formatter)
-
-            # Configure root logger
-            root_logger = logging.getLogger()
-            root_logger.setLevel(logging.DEBUG)
-            root_logger.addHandler(file_handler)
-            root_logger.addHandler(console_handler)
+            if config_manager is None:
+                configure_logging(log_file)
+            else:
+                configure_logging(
+                    log_file,
+                    level=config_manager.get("Logging", "level", "INFO"),
+                    max_bytes=config_manager.get_int("Logging", "max_bytes", 5 * 1024 * 1024),
+                    backup_count=config_manager.get_int("Logging", "backup_count", 3),
+                    queue_size=config_manager.get_int("Logging", "queue_size", 10000),
+                )
+                hot_path.set_enabled(config_manager.get_bool("Debug", "hot_path_logging", False))
 
             logger.info(f"Logging initialized with UTF-8 support in {log_file}")
         except Exception as e:
@@ -285,6 +331,7 @@ class ChestBuddyApp(QObject):
                 table_state_manager=self._table_state_manager,
             )
             self._main_window.show()
+            startup_profiler.mark("first_window_shown")
             logging.info("UI created successfully")
         except Exception as e:
             logger.critical(f"Failed to create UI: {e}")
@@ -377,7 +424,7 @@ class ChestBuddyApp(QObject):
                 )
 
             # Connect ValidationController signals
-            self._validation_service.validation_changed.connect(self._on_validation_changed)
+            self._validation_service.validation_complete.connect(self._on_validation_changed)
             self._validation_service.status_message_changed.connect(
                 self._main_window._on_status_message_changed
             )
@@ -388,7 +435,10 @@ class ChestBuddyApp(QObject):
             # )
 
             # Connect CorrectionController signals
+            self._correction_controller.correction_started.connect(self._on_correction_started)
+            self._correction_controller.correction_progress.connect(self._on_correction_progress)
             self._correction_controller.correction_completed.connect(self._on_correction_complete)
+            self._correction_controller.correction_error.connect(self._on_correction_error)
             self._correction_controller.status_message_changed.connect(
                 self._main_window._on_status_message_changed
             )
@@ -413,6 +463,10 @@ class ChestBuddyApp(QObject):
             except Exception as e:
                 logger.debug(f"Skipping _process_pending: {e}")
 
+            # Drop deferred change notifications before their views go away
+            if self._data_model is not None:
+                self._data_model.cancel_notifications()
+
             # Disconnect all signals
             self._signal_manager.disconnect_all()
 
@@ -423,16 +477,24 @@ class ChestBuddyApp(QObject):
             if self._main_window is not None:
                 self._main_window.close()
 
+            # Write validation list and rule changes still pending in write-behind persisters
+            flush_all()
+
             # Save configuration
             if hasattr(self, "_config_manager"):
                 self._config_manager.save()
 
-            # Clean up BackgroundWorker threads
+            # Cancel background tasks and stop the shared thread pool
             BackgroundWorker.shutdown()
+            TaskScheduler.shutdown_instance()
+            ProcessPool.shutdown_instance()
 
             logger.info("Application cleanup completed")
         except Exception as e:
             logger.error(f"Error during application cleanup: {e}")
+        finally:
+            # Write queued log records before the process exits
+            shutdown_logging()
 
     @Slot()
     def _process_pending(self) -> None:
@@ -644,6 +706,43 @@ class ChestBuddyApp(QObject):
             f"App: Received validation_changed signal. Status DF shape: {validation_status_df.shape if validation_status_df is not None else 'None'}"
         )
 
+    @Slot(str)
+    def _on_correction_started(self, description: str) -> None:
+        """
+        Show progress for corrections applied in the background.
+
+        Args:
+            description: Description of the correction operation
+        """
+        self._progress_controller.start_progress(
+            "Applying Corrections",
+            f"{description}...",
+            True,
+            self._correction_controller.cancel_corrections,
+        )
+
+    @Slot(int, int)
+    def _on_correction_progress(self, current: int, total: int) -> None:
+        """
+        Update the correction progress.
+
+        Args:
+            current: Current progress value
+            total: Total progress value
+        """
+        self._progress_controller.update_progress(current, total)
+
+    @Slot(str)
+    def _on_correction_error(self, error_message: str) -> None:
+        """
+        Show a failed correction in the progress dialog.
+
+        Args:
+            error_message: Error message
+        """
+        self._progress_controller.finish_progress(f"Correction failed: {error_message}", True)
+        QTimer.singleShot(1500, self._progress_controller.close_progress)
+
     @Slot(object)
     def _on_correction_complete(self, correction_stats):
         """
@@ -658,6 +757,8 @@ class ChestBuddyApp(QObject):
         # Update status if needed
         status_message = f"Applied corrections to {affected_rows} rows"
         logger.debug(status_message)
+        self._progress_controller.finish_progress(status_message)
+        QTimer.singleShot(1500, self._progress_controller.close_progress)
 
         # Trigger validation after correction if auto-validation is enabled
         if (
@@ -679,17 +780,45 @@ class ChestBuddyApp(QObject):
         return app.exec() if app else 1
 
 
+def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """
+    Parse ChestBuddy command line options.
+
+    Unknown arguments are returned so they can be passed on to Qt.
+
+    Args:
+        argv: Full argument list including the program name
+
+    Returns:
+        Tuple[argparse.Namespace, List[str]]: Parsed options and the remaining Qt arguments
+    """
+    parser = argparse.ArgumentParser(prog="chestbuddy")
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record timing spans and write them as a Chrome trace JSON file on exit",
+    )
+    options, remaining = parser.parse_known_args(argv[1:])
+    return options, argv[:1] + remaining
+
+
 def main():
     """Main entry point for the application."""
+    # Worker processes of frozen builds re-enter here
+    multiprocessing.freeze_support()
+    options, qt_argv = parse_arguments(sys.argv)
+    if options.trace:
+        span_tracer.enable()
+
     try:
         # Create QApplication instance
-        app = QApplication(sys.argv)
+        app = QApplication(qt_argv)
         app.setApplicationName("ChestBuddy")
         app.setOrganizationName("ChestBuddy")
         app.setOrganizationDomain("chestbuddy.org")
 
         # Create and initialize ChestBuddyApp
-        chest_buddy_app = ChestBuddyApp(sys.argv)
+        chest_buddy_app = ChestBuddyApp(qt_argv)
 
         # Connect aboutToQuit signal to cleanup
         app.aboutToQuit.connect(chest_buddy_app.cleanup)
@@ -699,6 +828,9 @@ def main():
     except Exception as e:
         logger.critical(f"Critical error: {e}", exc_info=True)
         return 1
+    finally:
+        if options.trace:
+            span_tracer.export_chrome_trace(options.trace)
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import QMessageBox
 
 from chestbuddy.core.controllers.base_controller import BaseController
 from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_graph import CorrectionRuleGraph
 from chestbuddy.utils.background_processing import BackgroundWorker
 from chestbuddy.core.services import CorrectionService, ValidationService
 from chestbuddy.ui.dialogs import CorrectionPreviewDialog
@@ -102,6 +103,15 @@ class CorrectionController(BaseController):
             recursive (bool): If True, apply corrections recursively
             selected_only (bool): If True, only apply to selected cells
         """
+        # A repeated request for the same data and options joins the run in flight;
+        # selections can change between requests, so selected runs are never merged
+        fingerprint = None
+        if not selected_only:
+            fingerprint = (self._get_data_fingerprint(), only_invalid, recursive)
+            if self._worker is not None and self._worker.is_duplicate(fingerprint):
+                logger.info("Identical corrections are already running, ignoring the request")
+                return
+
         # Clean up any existing worker
         self._cleanup_worker()
 
@@ -109,20 +119,25 @@ class CorrectionController(BaseController):
         self.correction_started.emit("Applying correction rules")
 
         # Create a new worker for the background task
-        self._worker = BackgroundWorker()
+        self._worker = BackgroundWorker(task_type="corrections")
 
         # Connect signals
-        self._worker.started.connect(lambda: logger.debug("Correction task started"))
-        self._worker.progress.connect(self._on_corrections_progress)
-        self._worker.finished.connect(self._on_corrections_completed)
-        self._worker.error.connect(self._on_corrections_error)
+        worker = self._worker
+        worker.started.connect(lambda: logger.debug("Correction task started"))
+        worker.progress.connect(self._on_corrections_progress)
+        worker.finished.connect(self._on_corrections_completed)
+        worker.error.connect(self._on_corrections_error)
+        worker.cancelled.connect(self._on_corrections_cancelled)
 
         # Start the task with the proper function and parameters
-        self._worker.run_task(
+        worker.run_task(
             self._apply_corrections_task,
             only_invalid=only_invalid,
             recursive=recursive,
             selected_only=selected_only,
+            progress_callback=worker.progress.emit,
+            cancel_check=lambda: worker.is_cancelled,
+            fingerprint=fingerprint,
         )
 
         # Start the worker (this starts the background thread)
@@ -132,21 +147,51 @@ class CorrectionController(BaseController):
             f"Started applying corrections (only_invalid={only_invalid}, recursive={recursive}, selected_only={selected_only})"
         )
 
+    def cancel_corrections(self):
+        """Cancel corrections that are being applied in the background."""
+        if self._worker is not None and self._worker.is_running:
+            logger.info("Cancelling correction task")
+            self._worker.cancel()
+
     def _apply_corrections_task(
-        self, only_invalid=False, recursive=True, selected_only=False, progress_callback=None
+        self,
+        only_invalid=False,
+        recursive=True,
+        selected_only=False,
+        progress_callback=None,
+        cancel_check=None,
     ):
         """
         Background task for applying corrections.
 
+        Large datasets are corrected recursively on the shared process pool in
+        one pass; everything else runs correction rounds in this thread.
+
         Args:
             only_invalid (bool): If True, only apply corrections to invalid cells
             recursive (bool): If True, apply corrections recursively until no more changes occur
             selected_only (bool): If True, only apply to selected cells
             progress_callback (callable): Function to report progress
+            cancel_check (callable): Returns True when the task should stop
 
         Returns:
             Dict[str, int]: Correction statistics
         """
+        if recursive and not selected_only:
+            parallel_stats = self._correction_service.apply_corrections_in_parallel(
+                only_invalid=only_invalid,
+                progress_callback=(
+                    (lambda done, total: progress_callback(int(100 * done / total), 100))
+                    if progress_callback
+                    else None
+                ),
+                cancel_check=cancel_check,
+            )
+            # None means the data is too small to be worth distributing
+            if isinstance(parallel_stats, dict):
+                logger.info(f"Parallel correction completed: {parallel_stats}")
+                return parallel_stats
+
         # Initialize accumulators for statistics
         total_stats = {"total_corrections": 0, "corrected_rows": 0, "corrected_cells": 0}
         iteration = 0
@@ -180,6 +225,11 @@ class CorrectionController(BaseController):
         try:
             # Apply corrections iteratively if recursive is True
             while iteration < self.MAX_ITERATIONS:
+                if cancel_check is not None and cancel_check():
+                    logger.info(f"Correction cancelled after {iteration} iterations")
+                    total_stats["cancelled"] = True
+                    break
+
                 # Apply a single round of corrections
                 current_stats = self._correction_service.apply_corrections(
                     only_invalid=only_invalid
@@ -274,6 +324,14 @@ class CorrectionController(BaseController):
 
         logger.error(f"Correction error: {error_message}")
 
+    def _on_corrections_cancelled(self):
+        """Handle cancellation of the correction task."""
+        # The worker releases itself once the cancelled task has stopped
+        self._worker = None
+        self._worker_thread = None
+        self.status_message_changed.emit("Correction cancelled")
+        logger.info("Corrections cancelled")
+
     def _cleanup_worker(self):
         """Clean up background worker resources."""
         if self._worker:
@@ -487,6 +545,24 @@ class CorrectionController(BaseController):
             self.correction_error.emit(f"Error getting rule: {str(e)}")
             return None
 
+    def get_rule_graph(self) -> Optional[CorrectionRuleGraph]:
+        """
+        Compile the enabled rules to inspect correction chains and cycles.
+
+        Returns:
+            CorrectionRuleGraph: The compiled rules, or None if compilation failed
+        """
+        try:
+            case_sensitive = False
+            if self._correction_service is not None:
+                case_sensitive = bool(self._correction_service.get_case_sensitive())
+            return CorrectionRuleGraph(
+                self._rule_manager.get_prioritized_rules(), case_sensitive=case_sensitive
+            )
+        except Exception as e:
+            logger.error(f"Error compiling correction rules: {e}")
+            return None
+
     def apply_single_rule(self, rule, only_invalid=False):
         """
         Apply a single correction rule.
@@ -668,24 +744,13 @@ class CorrectionController(BaseController):
         Returns:
             List of applicable CorrectionRule objects
         """
-        applicable_rules = []
-
         try:
-            # Get all enabled rules
-            rules = self.get_rules(status="enabled")
+            # Look up enabled rules with an exact from_value match in the rule index
+            categories = [column_name, ""] if column_name else [""]
+            rules = self._rule_manager.find_rules(str(value), categories, case_sensitive=True)
 
-            # Find applicable rules
-            for rule in rules:
-                if rule.from_value == str(value):
-                    # Check category if specified
-                    if column_name and rule.category:
-                        if rule.category == column_name:
-                            applicable_rules.append(rule)
-                    elif not rule.category:
-                        # General rule with no category
-                        applicable_rules.append(rule)
-
-            return applicable_rules
+            # Rules must match the column exactly, rules without a category always apply
+            return [rule for rule in rules if not rule.category or rule.category == column_name]
 
         except Exception as e:
             logger.error(f"Error getting applicable rules: {e}")
@@ -883,6 +948,21 @@ class CorrectionController(BaseController):
             logger.error(f"Error calculating data hash: {e}")
             return None
 
+    def _get_data_fingerprint(self):
+        """
+        Get a cheap identity of the data the corrections would run on.
+
+        Returns:
+            The data model's sampled data hash, or None if there is no model
+        """
+        data_model = getattr(self._correction_service, "_data_model", None)
+        if data_model is None:
+            return None
+        if hasattr(data_model, "flush_notifications"):
+            # The sampled hash is refreshed when the pending change is emitted
+            data_model.flush_notifications()
+        return getattr(data_model, "data_hash", None)
+
     def auto_correct_after_validation(self, results=None):
         """
         Apply auto-correction after validation if enabled.
@@ -371,14 +371,14 @@ class DataViewController(BaseController):
                 # Update status label if exists
                 if hasattr(self._view, "_status_label"):
                     row_count = len(filtered_data)
-                    total_count = len(self._data_model.data)
+                    total_count = self._data_model.row_count
                     self._view._status_label.setText(f"Showing {row_count} of {total_count} rows")
 
             # Emit filter applied signal
             self.filter_applied.emit(self._current_filters)
 
             logger.info(
-                f"Filter applied: {column}={value} ({mode}), showing {len(filtered_data)} of {len(self._data_model.data)} rows"
+                f"Filter applied: {column}={value} ({mode}), showing {len(filtered_data)} of {self._data_model.row_count} rows"
             )
             return True
 
@@ -1088,8 +1088,9 @@ class DataViewController(BaseController):
                 self.operation_error.emit("No data available for chart creation")
                 return False
 
-            # Validate columns
-            if not x_column or not y_column:
+            # Validate columns; rollup charts only read the grouping column
+            rollup_chart = chart_type in ("Leaderboard", "Weekly Trend")
+            if not x_column or (not y_column and not rollup_chart):
                 logger.warning(f"Invalid chart columns: x={x_column}, y={y_column}")
                 self.operation_error.emit("Invalid chart columns")
                 return False
@@ -1120,6 +1121,11 @@ class DataViewController(BaseController):
                 chart = chart_service.create_line_chart(
                     x_column, y_column, title, group_by=group_by
                 )
+            elif chart_type == "Leaderboard":
+                by = "clan" if x_column == "CLAN" else "player"
+                chart = chart_service.create_leaderboard_chart(by=by, title=title)
+            elif chart_type == "Weekly Trend":
+                chart = chart_service.create_trend_chart("week", title=title)
             else:
                 logger.warning(f"Unsupported chart type: {chart_type}")
                 self.operation_error.emit(f"Unsupported chart type: {chart_type}")
@@ -8,7 +8,7 @@ Usage:
 """
 
 import logging
-from typing import Optional, Any, Callable, Tuple
+from typing import Optional, Any, Callable, Dict, Tuple
 import time
 
 from PySide6.QtCore import QObject, Signal, Slot, Qt, QTimer, QSettings
@@ -18,6 +18,7 @@ from chestbuddy.core.models import ChestDataModel
 from chestbuddy.ui.widgets.sidebar_navigation import SidebarNavigation
 from chestbuddy.core.controllers.base_controller import BaseController
 from chestbuddy.ui.interfaces import IUpdatable
+from chestbuddy.utils.service_locator import ServiceLocator
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ class ViewStateController(BaseController):
     Attributes:
         data_model (ChestDataModel): The data model
         _views (dict[str, QWidget]): Dictionary of views
+        _view_factories (dict[str, Callable]): Factories for views created on first navigation
         _sidebar (SidebarNavigation): The sidebar navigation widget
         _content_stack (QStackedWidget): The content stack widget
         _active_view (str): The name of the currently active view
@@ -84,6 +86,7 @@ class ViewStateController(BaseController):
 
         # Initialize state
         self._views = {}
+        self._view_factories: dict[str, Callable[[], QWidget]] = {}
         self._sidebar = None
         self._content_stack = None
         self._active_view = ""
@@ -140,7 +143,11 @@ class ViewStateController(BaseController):
         logger.debug(f"ViewStateController connected to model: {model.__class__.__name__}")
 
     def set_ui_components(
-        self, views: dict[str, QWidget], sidebar: SidebarNavigation, content_stack: QStackedWidget
+        self,
+        views: dict[str, QWidget],
+        sidebar: SidebarNavigation,
+        content_stack: QStackedWidget,
+        view_factories: Optional[dict[str, Callable[[], QWidget]]] = None,
     ) -> None:
         """
         Set UI components needed by the controller.
@@ -151,10 +158,13 @@ class ViewStateController(BaseController):
             views (dict[str, QWidget]): Dictionary of views
             sidebar (SidebarNavigation): The sidebar navigation widget
             content_stack (QStackedWidget): The content stack widget
+            view_factories (Optional[dict[str, Callable]]): Factories for views that are
+                created on first navigation instead of at startup
         """
         self._views = views
         self._sidebar = sidebar
         self._content_stack = content_stack
+        self._view_factories = dict(view_factories or {})
 
         # Connect to sidebar signals using signal manager
         if self._sidebar:
@@ -175,7 +185,7 @@ class ViewStateController(BaseController):
                 self._sidebar.populate()
 
         # Initialize view availability
-        for view_name in self._views:
+        for view_name in self.view_names:
             self._view_availability[view_name] = True
 
         # Set up standard view dependencies
@@ -226,6 +236,9 @@ class ViewStateController(BaseController):
         # Charts depends on data being loaded
         self.register_view_dependency("Charts", {"Data"})
 
+        # Reports depend on data being loaded
+        self.register_view_dependency("Reports", {"Data"})
+
         # Register standard prerequisites
         self.register_view_prerequisite(
             "Validation", lambda: (self._has_data_loaded, "Data must be loaded first")
@@ -236,6 +249,9 @@ class ViewStateController(BaseController):
         self.register_view_prerequisite(
             "Charts", lambda: (self._has_data_loaded, "Data must be loaded first")
         )
+        self.register_view_prerequisite(
+            "Reports", lambda: (self._has_data_loaded, "Data must be loaded first")
+        )
 
     def _on_data_dependent_view_clicked(self, view_name: str, subsection: Optional[str]) -> None:
         """
@@ -257,6 +273,61 @@ class ViewStateController(BaseController):
 
     # ===== Public API =====
 
+    @property
+    def view_names(self) -> list[str]:
+        """Get the names of all registered views, including ones not created yet."""
+        pending = [name for name in self._view_factories if name not in self._views]
+        return list(self._views) + pending
+
+    def is_view_created(self, view_name: str) -> bool:
+        """
+        Check whether a view has been created.
+
+        Args:
+            view_name (str): The name of the view
+
+        Returns:
+            bool: True if the view widget exists, False if it is still pending creation
+        """
+        return view_name in self._views
+
+    def _ensure_view(self, view_name: str) -> Optional[QWidget]:
+        """
+        Get a view, creating it from its factory on first access.
+
+        Args:
+            view_name (str): The name of the view
+
+        Returns:
+            Optional[QWidget]: The view widget, or None if no such view is registered
+        """
+        view = self._views.get(view_name)
+        if view is not None:
+            return view
+
+        factory = self._view_factories.get(view_name)
+        if factory is None:
+            return None
+
+        start_time = time.perf_counter()
+        view = factory()
+        self._views[view_name] = view
+        if self._content_stack is not None:
+            self._content_stack.addWidget(view)
+
+        # Bring the new view up to date with the current data state
+        if hasattr(view, "set_data_loaded") and callable(getattr(view, "set_data_loaded")):
+            try:
+                view.set_data_loaded(self._has_data_loaded)
+            except Exception as e:
+                logger.error(f"Error setting data loaded state for view '{view_name}': {e}")
+
+        logger.info(
+            f"Created view '{view_name}' on first use in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
+        return view
+
     @property
     def active_view(self) -> str:
         """Get the name of the currently active view."""
@@ -389,7 +460,7 @@ class ViewStateController(BaseController):
         changes = {}
 
         # First pass: check basic data dependency
-        for view_name in self._views:
+        for view_name in self.view_names:
             # Dashboard is always available
             if view_name == "Dashboard":
                 available = True
@@ -408,7 +479,7 @@ class ViewStateController(BaseController):
             self._view_availability[view_name] = available
 
         # Second pass: check dependencies and prerequisites
-        for view_name in self._views:
+        for view_name in self.view_names:
             # Skip Dashboard which is always available
             if view_name == "Dashboard":
                 continue
@@ -452,7 +523,7 @@ class ViewStateController(BaseController):
             self._pending_view_change = (view_name, subsection)
             return
 
-        if view_name not in self._views:
+        if view_name not in self._views and view_name not in self._view_factories:
             logger.error(f"View '{view_name}' not found in registered views")
             return
 
@@ -479,8 +550,8 @@ class ViewStateController(BaseController):
         # Get the current widget
         current_widget = self._content_stack.currentWidget()
 
-        # Get the target widget
-        target_widget = self._views.get(view_name)
+        # Get the target widget, creating it on first navigation
+        target_widget = self._ensure_view(view_name)
         if not target_widget:
             logger.error(f"Widget for view '{view_name}' not found")
             self._view_transition_in_progress = False
@@ -726,6 +797,21 @@ class ViewStateController(BaseController):
         if not has_data and self._active_view != "Dashboard":
             self.set_active_view("Dashboard")
 
+    def get_data_summary(self) -> Dict[str, int]:
+        """
+        Get the row count and the validation state counts of the data.
+
+        All values come from counters maintained by the data model and the
+        TableStateManager, so this is cheap enough to call on every refresh.
+
+        Returns:
+            Dict[str, int]: "rows" plus the counts of TableStateManager.summary()
+        """
+        summary = {"rows": self._data_model.row_count if self._has_data_loaded else 0}
+        if ServiceLocator.has_service("table_state_manager"):
+            summary.update(ServiceLocator.get("table_state_manager").summary())
+        return summary
+
     def refresh_active_view(self) -> None:
         """Refresh the currently active view."""
         if not self._active_view:
@@ -846,7 +932,7 @@ class ViewStateController(BaseController):
 
         # Restore the view if it exists (don't restore immediately to avoid issues during initialization)
         QTimer.singleShot(
-            100, lambda: self.set_active_view(last_view) if last_view in self._views else None
+            100, lambda: self.set_active_view(last_view) if last_view in self.view_names else None
         )
 
     # ==== DataViewController integration ====
@@ -928,7 +1014,7 @@ class ViewStateController(BaseController):
 
     def get_view(self, view_name: str) -> Optional[QWidget]:
         """
-        Get a view by name.
+        Get a view by name, creating it if it has not been created yet.
 
         Args:
             view_name: The name of the view to get
@@ -936,4 +1022,4 @@ class ViewStateController(BaseController):
         Returns:
             The view widget, or None if not found
         """
-        return self._views.get(view_name)
+        return self._ensure_view(view_name)
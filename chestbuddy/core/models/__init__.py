@@ -11,6 +11,7 @@ from chestbuddy.core.models.chest_data_model import ChestDataModel
 from chestbuddy.core.models.validation_list_model import ValidationListModel
 from chestbuddy.core.models.correction_rule import CorrectionRule
 from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.core.models.correction_rule_graph import CorrectionRuleGraph
 from chestbuddy.core.validation_enums import ValidationStatus
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "ValidationStatus",
     "CorrectionRule",
     "CorrectionRuleManager",
+    "CorrectionRuleGraph",
 ]
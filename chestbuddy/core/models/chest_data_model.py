@@ -5,19 +5,34 @@ This module provides the ChestDataModel class for managing chest data.
 """
 
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 import time
 import hashlib
 import json
+import threading
 import numpy as np
 
 import pandas as pd
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import (
+    QCoreApplication,
+    QMetaObject,
+    QObject,
+    QThread,
+    QTimer,
+    Qt,
+    Signal,
+    Slot,
+)
 
 from chestbuddy.core.models.base_model import BaseModel
 from chestbuddy.utils.config import ConfigManager
 from chestbuddy.core.state.data_state import DataState
+from chestbuddy.core.state.change_journal import ChangeJournal
+from chestbuddy.core.storage import DatasetStore
+from chestbuddy.utils.signal_tracer import signal_tracer
+from chestbuddy.utils.log_pipeline import hot_path
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -42,6 +57,14 @@ class ChestDataModel(QObject):
         - Tracks data state changes using DataState for efficient UI updates
         - Emits signals to notify observers of changes
         - Provides methods for filtering and manipulating data
+        - Records cell changes in a ChangeJournal for undo/redo
+        - Change notifications within the rate-limit window are coalesced into
+          one deferred data_changed carrying the merged changed cell ranges
+        - Cell edits made between begin_batch() and commit_batch() are staged and
+          written with one assignment per column, one status update per column
+          and a single data_changed carrying the affected cell ranges
+        - An attached DatasetStore replaces the in-memory DataFrame for data that
+          does not fit in memory; read methods then query the store
     """
 
     # Define signals
@@ -50,6 +73,9 @@ class ChestDataModel(QObject):
     correction_applied = Signal()
     data_cleared = Signal()
 
+    # Pending cell ranges above which a deferred notification reports the whole data
+    MAX_PENDING_RANGES = 1000
+
     # Define expected columns
     EXPECTED_COLUMNS = ["DATE", "PLAYER", "SOURCE", "CHEST", "SCORE", "CLAN"]
 
@@ -71,13 +97,26 @@ class ChestDataModel(QObject):
         self._data = pd.DataFrame(columns=self.EXPECTED_COLUMNS)
         self._validation_status = pd.DataFrame()
         self._correction_status = pd.DataFrame()
+        # Cached number of corrected rows, None until counted
+        self._correction_row_count: Optional[int] = None
+        # Out-of-core dataset used instead of _data, None for in-memory data
+        self._dataset: Optional[DatasetStore] = None
 
         # Initialize config manager
         self._config = ConfigManager()
 
-        # Track update time to limit emission frequency
+        # Track update time to limit emission frequency; changes within the
+        # window are merged into one deferred notification
         self._last_emission_time = 0
         self._emission_rate_limit_ms = 500
+        self._pending_change = False
+        self._pending_forced = False
+        self._pending_ranges: Optional[List[Tuple[int, int, int, int]]] = None
+        # Guards the pending change; edits may arrive from worker threads
+        self._pending_lock = threading.Lock()
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.timeout.connect(self._emit_pending_change)
 
         # Track the data state via hash for meaningful change detection
         self._current_data_hash = None
@@ -92,11 +131,23 @@ class ChestDataModel(QObject):
         # Track whether we're in the process of an update
         self._updating = False
 
+        # Cell edits staged by an open batch as (rows, cols, values) chunks
+        self._batch_depth = 0
+        self._batch_label = ""
+        self._batch_cells: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+        # Undo/redo history of cell changes
+        self._journal = ChangeJournal(
+            self,
+            max_memory_mb=self._config.get_float("Journal", "max_memory_mb", 16.0),
+            max_transactions=self._config.get_int("Journal", "max_transactions", 100),
+        )
+
     def _update_data_hash(self) -> None:
         """Update the hash of the current data state."""
         try:
             self._current_data_hash = self._calculate_data_hash()
-            logger.debug(f"Updated data hash to: {self._current_data_hash}")
+            hot_path.debug(logger, "Updated data hash to: %s", self._current_data_hash)
         except Exception as e:
             logger.error(f"Error calculating data hash: {str(e)}")
 
@@ -160,75 +211,229 @@ class ChestDataModel(QObject):
 
     def initialize(self) -> None:
         """Initialize the model with an empty DataFrame."""
+        self.cancel_notifications()
+        self._close_dataset()
         self._data = pd.DataFrame(columns=self.EXPECTED_COLUMNS)
         self._validation_status = pd.DataFrame()
         self._correction_status = pd.DataFrame()
+        self._correction_row_count = None
+        self._journal.clear()
         self._notify_change()
+        self.flush_notifications()
 
     def clear(self) -> None:
         """Clear all data and status DataFrames."""
+        self.cancel_notifications()
+        self._close_dataset()
         self._data = pd.DataFrame(columns=self.EXPECTED_COLUMNS)
         self._validation_status = pd.DataFrame()
         self._correction_status = pd.DataFrame()
+        self._correction_row_count = None
 
         # Reset the DataState
         self._data_state = DataState(self._data)
+        self._journal.clear()
 
-        # Emit data_cleared signal
+        # Emit data_cleared signal and the reset right away, leaving no timer running
         self.data_cleared.emit()
         self._notify_change()
+        self.flush_notifications()
+
+    def _notify_change(
+        self, changed_ranges: Optional[List[Tuple[int, int, int, int]]] = None
+    ) -> None:
+        """
+        Notify observers of a data change, coalescing bursts of changes.
+
+        The first change after a quiet period is emitted immediately. Changes
+        within _emission_rate_limit_ms of the last emission are merged into one
+        pending notification that is emitted at the end of the window, so the
+        last change of a burst is never lost.
+
+        Changes made on another thread are merged right away, and the emission is
+        scheduled on the model's own thread, which owns the notification timer.
 
-    def _notify_change(self) -> None:
-        """Emit a data changed signal."""
+        Args:
+            changed_ranges: Cell ranges known to have changed, or None if any cell
+                may have changed. Known changes are emitted even if the sampled
+                data hash is unchanged.
+        """
         try:
-            print("ChestDataModel._notify_change called")
             # Skip emission if signals are blocked
             if self.signalsBlocked():
-                print("Signals blocked, skipping emission.")
-                logger.debug("Signals blocked, skipping emission.")
+                hot_path.debug(logger, "Signals blocked, skipping emission.")
                 return
 
-            # Check if we're updating too frequently
-            current_time = int(time.time() * 1000)  # Current time in milliseconds
-            elapsed_ms = current_time - self._last_emission_time
+            with self._pending_lock:
+                self._merge_pending_change(changed_ranges)
 
-            if elapsed_ms < self._emission_rate_limit_ms:
-                print(f"Skipping emission, occurred too soon after previous ({elapsed_ms}ms).")
-                logger.debug(
-                    f"Skipping emission, occurred too soon after previous ({elapsed_ms}ms)."
+            if QCoreApplication.instance() is None:
+                self._emit_pending_change()
+            elif self._on_model_thread():
+                self._schedule_pending_change()
+            else:
+                QMetaObject.invokeMethod(
+                    self, "_schedule_pending_change", Qt.ConnectionType.QueuedConnection
                 )
-                return
+        except Exception as e:
+            logger.error(f"Error emitting data_changed signal: {str(e)}")
+
+    def _on_model_thread(self) -> bool:
+        """Check whether the caller runs on the thread that owns the model's timer."""
+        return QThread.currentThread() is self.thread()
+
+    @Slot()
+    def _schedule_pending_change(self) -> None:
+        """Emit the pending change now or at the end of the current window."""
+        current_time = int(time.time() * 1000)  # Current time in milliseconds
+        elapsed_ms = current_time - self._last_emission_time
+        if elapsed_ms >= self._emission_rate_limit_ms:
+            self._emit_pending_change()
+        elif not self._notify_timer.isActive():
+            # Emit the merged change at the end of the current window
+            delay_ms = self._emission_rate_limit_ms - elapsed_ms
+            self._notify_timer.start(delay_ms)
+            hot_path.debug(logger, "Deferring emission by %dms", delay_ms)
+
+    def flush_notifications(self) -> None:
+        """Emit a deferred change notification now, if one is pending."""
+        if self._pending_change:
+            self._emit_pending_change()
+
+    def cancel_notifications(self) -> None:
+        """
+        Stop the notification timer and drop any pending change.
+
+        Called when the data is replaced wholesale and before the model's
+        observers are torn down, so a deferred emission cannot reach them.
+        """
+        if self._on_model_thread():
+            self._notify_timer.stop()
+        with self._pending_lock:
+            self._pending_change = False
+            self._pending_forced = False
+            self._pending_ranges = None
+
+    def _merge_pending_change(
+        self, changed_ranges: Optional[List[Tuple[int, int, int, int]]]
+    ) -> None:
+        """
+        Merge a change into the pending notification.
+
+        Args:
+            changed_ranges: Cell ranges of the change, or None if unknown
+        """
+        forced = changed_ranges is not None or self._current_data_hash is None
+        if not self._pending_change:
+            self._pending_change = True
+            self._pending_forced = forced
+            self._pending_ranges = list(changed_ranges) if changed_ranges is not None else None
+            return
+
+        self._pending_forced = self._pending_forced or forced
+        if self._pending_ranges is None or changed_ranges is None:
+            # An unknown change covers everything
+            self._pending_ranges = None
+        elif len(self._pending_ranges) + len(changed_ranges) > self.MAX_PENDING_RANGES:
+            self._pending_ranges = None
+        else:
+            self._pending_ranges.extend(changed_ranges)
+
+    def _emit_pending_change(self) -> None:
+        """Emit data_changed for the pending, merged change."""
+        on_model_thread = self._on_model_thread()
+        if on_model_thread:
+            self._notify_timer.stop()
+        if not self._pending_change:
+            return
+        if self.signalsBlocked():
+            # Keep the change pending until signals are unblocked
+            if on_model_thread:
+                self._notify_timer.start(self._emission_rate_limit_ms)
+            return
+
+        with self._pending_lock:
+            changed_ranges = self._pending_ranges
+            forced = self._pending_forced
+            self._pending_change = False
+            self._pending_forced = False
+            self._pending_ranges = None
 
+        try:
             # Calculate a new hash to detect actual changes
             new_hash = self._calculate_data_hash()
 
-            # If we had a blank current hash or the hash has changed, emit
-            if self._current_data_hash is None or new_hash != self._current_data_hash:
+            # If the change is known or the hash has changed, emit
+            if forced or new_hash != self._current_data_hash:
                 # Update the data hash and time tracking
                 self._current_data_hash = new_hash
-                self._last_emission_time = current_time
+                self._last_emission_time = int(time.time() * 1000)
 
                 # Update the DataState from the current data
                 self._data_state.update_from_data(self._data)
+                self._data_state.set_changed_ranges(changed_ranges)
 
                 # Emit the signal with the DataState
-                print("EMITTING data_changed signal with DataState!!!")
-                logger.debug("Emitting data_changed signal with DataState.")
-                self.data_changed.emit(self._data_state)
-                print("data_changed signal emitted.")
+                hot_path.debug(logger, "Emitting data_changed signal with DataState.")
+                signal_tracer.emit(self, "data_changed", self._data_state)
             else:
-                print("Skipping emission, no actual data change detected.")
-                logger.debug("Skipping emission, no actual data change detected.")
-
+                hot_path.debug(logger, "Skipping emission, no actual data change detected.")
         except Exception as e:
-            print(f"Error emitting data_changed signal: {e}")
             logger.error(f"Error emitting data_changed signal: {str(e)}")
 
+    # --- Out-of-core storage --- #
+
+    def attach_dataset(self, dataset: DatasetStore) -> None:
+        """
+        Use an out-of-core dataset instead of the in-memory DataFrame.
+
+        The in-memory data is replaced by an empty frame with the dataset's
+        columns; row access, filters and unique values are answered by the
+        dataset. Status frames start empty.
+
+        Args:
+            dataset: The opened dataset
+        """
+        self._close_dataset()
+        self._dataset = dataset
+        self._data = pd.DataFrame(columns=dataset.column_names)
+        self._validation_status = pd.DataFrame()
+        self._correction_status = pd.DataFrame()
+        self._correction_row_count = None
+        self._data_state = DataState(self._data)
+        self._journal.clear()
+        logger.info(f"Attached dataset with {dataset.row_count} rows")
+        self._notify_change()
+
+    def detach_dataset(self) -> None:
+        """Close the attached dataset and return to empty in-memory data."""
+        if self._dataset is not None:
+            self.clear()
+
+    @property
+    def dataset(self) -> Optional[DatasetStore]:
+        """
+        Get the attached out-of-core dataset.
+
+        Returns:
+            The dataset, or None if the data is held in memory.
+        """
+        return self._dataset
+
+    def _close_dataset(self) -> None:
+        """Close and forget the attached dataset, if any."""
+        if self._dataset is not None:
+            dataset, self._dataset = self._dataset, None
+            dataset.close()
+
     @property
     def data(self) -> pd.DataFrame:
         """
         Get a copy of the chest data DataFrame.
 
+        With an attached dataset the frame has the dataset's columns but no
+        rows; read rows through the dataset instead.
+
         Returns:
             A copy of the chest data DataFrame.
         """
@@ -242,6 +447,8 @@ class ChestDataModel(QObject):
         Returns:
             True if the data is empty, False otherwise.
         """
+        if self._dataset is not None:
+            return self._dataset.row_count == 0
         return self._data.empty
 
     @property
@@ -252,6 +459,8 @@ class ChestDataModel(QObject):
         Returns:
             The number of rows in the data.
         """
+        if self._dataset is not None:
+            return self._dataset.row_count
         return len(self._data)
 
     @property
@@ -305,6 +514,7 @@ class ChestDataModel(QObject):
 
             # Keep only the expected columns in the specified order
             self._data = df[self.EXPECTED_COLUMNS].copy()
+            self._journal.clear()
 
             # Initialize validation and correction status DataFrames
             self._init_status_dataframes()
@@ -360,22 +570,23 @@ class ChestDataModel(QObject):
         Args:
             new_data: The new DataFrame to use as the chest data.
         """
-        print(
-            f"ChestDataModel.update_data called with DataFrame of shape: {new_data.shape if new_data is not None else 'None'}"
+        logger.debug(
+            f"ChestDataModel.update_data called with DataFrame of shape: "
+            f"{new_data.shape if new_data is not None else 'None'}"
         )
 
+        # New in-memory data replaces an attached dataset
+        self._close_dataset()
+
         # Prevent recursive updates
         if self._updating:
-            print("Canceling update as another update is in progress.")
             logger.debug("Canceling update as another update is in progress.")
             return
 
         self._updating = True
         signals_were_blocked = self.signalsBlocked()
         try:
-            print(f"Set _updating to True. Signals were blocked: {signals_were_blocked}")
             if not signals_were_blocked:
-                print("Blocking signals")
                 self.blockSignals(True)
 
             # Create a copy to avoid modifying the original
@@ -395,24 +606,23 @@ class ChestDataModel(QObject):
                     )  # Use NA for numeric, '' for others
 
             # --- Step 3: Select final columns in the correct order --- #
+            previous_data = self._data
             self._data = processed_data[self.EXPECTED_COLUMNS].copy()
+            self._record_frame_changes(previous_data)
 
             # Initialize validation and correction status DataFrames
             self._init_status_dataframes()
             self._current_data_hash = None  # Force hash update for notification
 
         except Exception as e:
-            print(f"Error during data processing: {e}")
             logger.error(f"Error updating data: {e}")
             # Optionally re-raise or handle
         finally:
             # Only unblock if this call blocked them
             if not signals_were_blocked:
-                print("Unblocking signals")
                 self.blockSignals(False)
             # Mark update as complete *before* notifying
             self._updating = False
-            print("Data update complete, set _updating to False. Calling _notify_change.")
             # Notify after update is complete and signals are unblocked
             self._notify_change()
 
@@ -436,6 +646,9 @@ class ChestDataModel(QObject):
         Returns:
             The row as a pandas Series.
         """
+        if self._dataset is not None:
+            rows = self._dataset.rows(index, index + 1)
+            return rows.iloc[0].copy() if len(rows) else pd.Series()
         if 0 <= index < len(self._data):
             return self._data.iloc[index].copy()
         return pd.Series()
@@ -452,12 +665,20 @@ class ChestDataModel(QObject):
             True if the row was updated successfully, False otherwise.
         """
         if 0 <= index < len(self._data):
-            for col, value in row_data.items():
-                if col in self._data.columns:
-                    self._data.at[index, col] = value
+            cols = []
+            self._journal.begin("Edit row")
+            try:
+                for col, value in row_data.items():
+                    if col in self._data.columns:
+                        old_value = self._data.at[index, col]
+                        self._data.at[index, col] = value
+                        cols.append(self._data.columns.get_loc(col))
+                        self._journal.record(index, cols[-1], old_value, value)
+            finally:
+                self._journal.commit()
 
             # Emit the data changed signal
-            self._notify_change()
+            self._notify_change(DataState.ranges_from_cells([index] * len(cols), cols))
             return True
         return False
 
@@ -474,6 +695,10 @@ class ChestDataModel(QObject):
             True if the cell was updated successfully, False otherwise.
         """
         try:
+            if self._dataset is not None:
+                logger.warning("Cannot update a cell of an out-of-core dataset")
+                return False
+
             # Check if row and column exist
             if not (0 <= row_idx < len(self._data)) or column_name not in self._data.columns:
                 logger.error(f"Invalid row or column: {row_idx}, {column_name}")
@@ -484,14 +709,25 @@ class ChestDataModel(QObject):
 
             # Skip update if value hasn't changed
             if str(current_value) == str(value):
-                logger.debug(
-                    f"Skipping cell update as value is identical: {row_idx}, {column_name}"
+                hot_path.debug(
+                    logger,
+                    "Skipping cell update as value is identical: %s, %s",
+                    row_idx,
+                    column_name,
                 )
                 return True
 
+            # Inside a batch the edit is staged and written on commit_batch()
+            if self._batch_depth:
+                self._stage_cells([row_idx], [self._data.columns.get_loc(column_name)], [value])
+                return True
+
             # Update the cell directly using loc instead of copying and replacing rows
             # This is safer and avoids the "equal len keys and value" error
             self._data.loc[row_idx, column_name] = value
+            self._journal.record(
+                row_idx, self._data.columns.get_loc(column_name), current_value, value
+            )
 
             # Update validation status for this cell
             val_status = self.get_cell_validation_status(row_idx, column_name)
@@ -510,9 +746,11 @@ class ChestDataModel(QObject):
                 correction_col = f"{column_name}_corrected"
                 if correction_col in self._correction_status.columns:
                     self._correction_status.loc[row_idx, correction_col] = False
+                    self._correction_row_count = None
 
             # Notify of the change
-            self._notify_change()
+            col_idx = self._data.columns.get_loc(column_name)
+            self._notify_change([(row_idx, col_idx, row_idx, col_idx)])
 
             return True
         except Exception as e:
@@ -531,6 +769,9 @@ class ChestDataModel(QObject):
             The cell value, or None if the cell doesn't exist.
         """
         try:
+            if self._dataset is not None:
+                return self._dataset.value_at(row_idx, column_name)
+
             # Check if row and column exist
             if not (0 <= row_idx < len(self._data)) or column_name not in self._data.columns:
                 logger.error(f"Invalid row or column: {row_idx}, {column_name}")
@@ -542,6 +783,283 @@ class ChestDataModel(QObject):
             logger.error(f"Error getting cell value: {e}")
             return None
 
+    def set_cell_value(self, row_idx: int, column: Union[int, str], value: Any) -> bool:
+        """
+        Update a cell addressed by column index or column name.
+
+        Args:
+            row_idx: The row index.
+            column: The column index or column name.
+            value: The new value.
+
+        Returns:
+            True if the cell was updated successfully, False otherwise.
+        """
+        if isinstance(column, (int, np.integer)):
+            if not (0 <= column < len(self._data.columns)):
+                logger.error(f"Invalid column index: {column}")
+                return False
+            column = self._data.columns[column]
+        return self.update_cell(row_idx, column, value)
+
+    def apply_cell_values(
+        self,
+        rows: Union[List[int], np.ndarray],
+        cols: Union[List[int], np.ndarray],
+        values: Union[List[Any], np.ndarray],
+        record: bool = True,
+    ) -> int:
+        """
+        Write a block of cell values by position with a single change notification.
+
+        Recorded writes behave like a batch of one call: the values are journaled
+        and the cells' validation and correction status is reset. Inside an open
+        batch the cells are staged until commit_batch(). If a cell appears more
+        than once, the last value wins.
+
+        Args:
+            rows: Positional row indices.
+            cols: Column indices.
+            values: The new values, parallel to rows and cols.
+            record: Whether to record the changes in the journal. Unrecorded
+                writes (undo/redo replay) are applied immediately.
+
+        Returns:
+            The number of cells written or staged.
+        """
+        if record:
+            self.begin_batch("Edit cells")
+            try:
+                staged = self._stage_cells(rows, cols, values)
+            except Exception:
+                self.rollback_batch()
+                raise
+            self.commit_batch()
+            return staged
+
+        rows, cols, values = self._valid_cells(rows, cols, values)
+        if len(rows) == 0:
+            return 0
+        self._write_cells(rows, cols, values, record=False)
+
+        # Force a notification; the sampled hash may miss edits in other rows
+        self._current_data_hash = None
+        self._notify_change(DataState.ranges_from_cells(rows, cols))
+        return len(rows)
+
+    def begin_batch(self, label: str = "Batch edit") -> None:
+        """
+        Start staging cell edits.
+
+        update_cell(), set_cell_value() and apply_cell_values() only stage their
+        values until the matching commit_batch(). Batches nest; only the
+        outermost commit writes.
+
+        Args:
+            label: Undo label of the batch.
+        """
+        if self._batch_depth == 0:
+            self._batch_label = label
+            self._batch_cells = []
+        self._batch_depth += 1
+
+    def commit_batch(self) -> int:
+        """
+        Write the staged cell edits.
+
+        The outermost commit assigns all staged values with one indexed
+        assignment per column, resets the validation and correction status of
+        the cells in bulk, records one journal step and emits one data_changed.
+
+        Returns:
+            The number of cells written, 0 for an inner commit.
+        """
+        if self._batch_depth == 0:
+            logger.warning("commit_batch called without an open batch")
+            return 0
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return 0
+
+        chunks, self._batch_cells = self._batch_cells, []
+        if not chunks:
+            return 0
+        rows = np.concatenate([chunk[0] for chunk in chunks])
+        cols = np.concatenate([chunk[1] for chunk in chunks])
+        values = np.concatenate([chunk[2] for chunk in chunks])
+
+        # Keep only the last staged value of each cell
+        keys = rows * len(self._data.columns) + cols
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = np.sort(len(keys) - 1 - last)
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        self._journal.begin(self._batch_label)
+        try:
+            self._write_cells(rows, cols, values, record=True)
+            self._reset_cell_status(rows, cols)
+        finally:
+            self._journal.commit()
+
+        self._current_data_hash = None
+        self._notify_change(DataState.ranges_from_cells(rows, cols))
+        logger.debug(f"Committed batch '{self._batch_label}' with {len(rows)} cells")
+        return len(rows)
+
+    def rollback_batch(self) -> None:
+        """Discard all staged cell edits and close the batch."""
+        self._batch_depth = 0
+        self._batch_cells = []
+
+    @contextmanager
+    def batch(self, label: str = "Batch edit") -> Iterator["ChestDataModel"]:
+        """
+        Stage the cell edits made in a with-block and commit them together.
+
+        The staged edits are discarded if the block raises.
+
+        Args:
+            label: Undo label of the batch.
+
+        Yields:
+            This model.
+        """
+        self.begin_batch(label)
+        try:
+            yield self
+        except BaseException:
+            self.rollback_batch()
+            raise
+        self.commit_batch()
+
+    @property
+    def in_batch(self) -> bool:
+        """Whether cell edits are currently being staged."""
+        return self._batch_depth > 0
+
+    def _stage_cells(
+        self,
+        rows: Union[List[int], np.ndarray],
+        cols: Union[List[int], np.ndarray],
+        values: Union[List[Any], np.ndarray],
+    ) -> int:
+        """Validate cell positions and add them to the open batch."""
+        rows, cols, values = self._valid_cells(rows, cols, values)
+        if len(rows):
+            self._batch_cells.append((rows, cols, values))
+        return len(rows)
+
+    def _valid_cells(
+        self,
+        rows: Union[List[int], np.ndarray],
+        cols: Union[List[int], np.ndarray],
+        values: Union[List[Any], np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert cell positions to arrays, dropping out-of-range cells."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if isinstance(values, np.ndarray) and values.dtype == object:
+            values = values.copy()
+        else:
+            # Build the object array element-wise so sequences stay single values
+            values_list = list(values)
+            values = np.empty(len(values_list), dtype=object)
+            values[:] = values_list
+        if len(rows) != len(cols) or len(rows) != len(values):
+            raise ValueError("rows, cols and values must have the same length")
+
+        row_count, column_count = self._data.shape
+        valid = (rows >= 0) & (rows < row_count) & (cols >= 0) & (cols < column_count)
+        if not valid.all():
+            logger.warning(f"Ignoring {int((~valid).sum())} out-of-range cells")
+            rows, cols, values = rows[valid], cols[valid], values[valid]
+        return rows, cols, values
+
+    def _write_cells(
+        self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray, record: bool
+    ) -> None:
+        """
+        Assign cell values with one indexed assignment per touched column.
+
+        Args:
+            rows: Positional row indices.
+            cols: Column indices.
+            values: The new values.
+            record: Whether to record the changes in the journal.
+        """
+        for col_idx in np.unique(cols):
+            mask = cols == col_idx
+            col_rows = rows[mask]
+            column_values = self._data.iloc[:, col_idx].to_numpy(dtype=object, copy=True)
+            old_values = column_values[col_rows]
+            column_values[col_rows] = values[mask]
+            self._data.isetitem(
+                int(col_idx), pd.Series(column_values, index=self._data.index).infer_objects()
+            )
+            if record:
+                self._journal.record_many(
+                    col_rows, np.full(len(col_rows), col_idx), old_values, values[mask]
+                )
+
+    def _reset_cell_status(self, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Mark edited cells as not validated and not corrected, one column at a time.
+
+        Args:
+            rows: Positional row indices.
+            cols: Column indices.
+        """
+        self._correction_row_count = None
+        for col_idx in np.unique(cols):
+            column_name = self._data.columns[col_idx]
+            col_rows = rows[cols == col_idx]
+            for status, suffix in (
+                (self._validation_status, "_valid"),
+                (self._correction_status, "_corrected"),
+            ):
+                status_col = f"{column_name}{suffix}"
+                if status_col in status.columns:
+                    status_rows = col_rows[col_rows < len(status)]
+                    status.iloc[status_rows, status.columns.get_loc(status_col)] = False
+
+    def _record_frame_changes(self, previous_data: pd.DataFrame) -> None:
+        """
+        Record the cells that differ between the previous and the current data.
+
+        Frames with a different shape, columns or index cannot be diffed by
+        position, so the journal is cleared instead.
+
+        Args:
+            previous_data: The data before the update.
+        """
+        if (
+            previous_data.shape != self._data.shape
+            or not previous_data.columns.equals(self._data.columns)
+            or not previous_data.index.equals(self._data.index)
+        ):
+            self._journal.clear()
+            return
+
+        try:
+            self._journal.begin("Update data")
+            for col_idx in range(len(self._data.columns)):
+                old = previous_data.iloc[:, col_idx]
+                new = self._data.iloc[:, col_idx]
+                same = old.eq(new).fillna(False).to_numpy(dtype=bool)
+                same |= old.isna().to_numpy() & new.isna().to_numpy()
+                changed_rows = np.flatnonzero(~same)
+                if len(changed_rows):
+                    self._journal.record_many(
+                        changed_rows,
+                        np.full(len(changed_rows), col_idx),
+                        old.to_numpy(dtype=object)[changed_rows],
+                        new.to_numpy(dtype=object)[changed_rows],
+                    )
+            self._journal.commit()
+        except Exception as e:
+            logger.error(f"Error recording data changes, clearing undo history: {e}")
+            self._journal.clear()
+
     def add_row(self, row_data: Dict[str, Any]) -> int:
         """
         Add a new row to the data.
@@ -562,6 +1080,7 @@ class ChestDataModel(QObject):
 
         # Add the row to the DataFrame
         self._data = pd.concat([self._data, pd.DataFrame([new_row])], ignore_index=True)
+        self._journal.clear()
 
         # Update status DataFrames
         self._add_status_row()
@@ -583,6 +1102,7 @@ class ChestDataModel(QObject):
         """
         if 0 <= index < len(self._data):
             self._data = self._data.drop(index).reset_index(drop=True)
+            self._journal.clear()
 
             # Update status DataFrames
             if not self._validation_status.empty:
@@ -590,6 +1110,7 @@ class ChestDataModel(QObject):
 
             if not self._correction_status.empty:
                 self._correction_status = self._correction_status.drop(index).reset_index(drop=True)
+            self._correction_row_count = None
 
             # Emit the data changed signal
             self._notify_change()
@@ -609,13 +1130,24 @@ class ChestDataModel(QObject):
             case_sensitive: Whether the filter is case sensitive.
 
         Returns:
-            Filtered DataFrame.
+            Filtered DataFrame. With an attached dataset, only the first page
+            of matching rows is loaded, or the first page of the data if the
+            filter text is empty.
         """
         # Check if column exists
         if column not in self._data.columns:
             logger.error(f"Column {column} does not exist in the data")
             return pd.DataFrame()
 
+        if self._dataset is not None:
+            page_size = self._dataset.page_size
+            if not filter_text:
+                return self._dataset.rows(0, page_size)
+            # Filter inside the dataset and load only the first matching rows
+            return self._dataset.filter_rows(
+                column, filter_text, filter_mode, case_sensitive, limit=page_size
+            )
+
         # Create a copy of the data
         df = self._data.copy()
 
@@ -671,6 +1203,8 @@ class ChestDataModel(QObject):
         Returns:
             List of unique values in the column.
         """
+        if self._dataset is not None and column in self._data.columns:
+            return self._dataset.unique_values(column)
         if column in self._data.columns:
             # Get unique values and remove any NaN values
             values = self._data[column].dropna().unique().tolist()
@@ -753,6 +1287,31 @@ class ChestDataModel(QObject):
         )
         self.validation_changed.emit(self._validation_status)
 
+    def get_validation_status_mask(self, column_name: str, statuses: Sequence[Any]) -> np.ndarray:
+        """
+        Select the rows whose validation status for a column is one of statuses.
+
+        Reads the column's status from the validation status frame in one pass,
+        without copying the frame.
+
+        Args:
+            column_name: Data column name
+            statuses: ValidationStatus values to select
+
+        Returns:
+            Boolean mask with one entry per data row; rows without a recorded
+            status are not selected.
+        """
+        mask = np.zeros(self.row_count, dtype=bool)
+        status_column = f"{column_name}_status"
+        if self._validation_status.empty or status_column not in self._validation_status.columns:
+            return mask
+        selected = self._validation_status[status_column].isin(list(statuses)).to_numpy()
+        # Status rows are labelled by data row, so a partial status frame works too
+        rows = self._validation_status.index.to_numpy()[selected]
+        mask[rows[(rows >= 0) & (rows < len(mask))]] = True
+        return mask
+
     def get_correction_status(self) -> pd.DataFrame:
         """
         Get the correction status DataFrame.
@@ -794,10 +1353,12 @@ class ChestDataModel(QObject):
             status_df: The new correction status DataFrame.
         """
         self._correction_status = status_df.copy()
+        self._correction_row_count = None
         self.correction_applied.emit()
 
     def _init_status_dataframes(self) -> None:
         """Initialize the validation and correction status DataFrames."""
+        self._correction_row_count = None
         if not self._data.empty:
             # Create DataFrames with the same number of rows as the data
             row_count = len(self._data)
@@ -835,6 +1396,7 @@ class ChestDataModel(QObject):
             self._correction_status = pd.concat(
                 [self._correction_status, pd.DataFrame([new_correction_row])], ignore_index=True
             )
+            self._correction_row_count = None
 
     def get_cell_validation_status(self, row_idx: int, column_name: str) -> Dict[str, Any]:
         """
@@ -917,7 +1479,7 @@ class ChestDataModel(QObject):
             A dictionary mapping rule names to error messages, or None if there are no issues.
         """
         try:
-            if self._validation_status is None or row_idx >= len(self._validation_status):
+            if self._validation_status is None:
                 return None
 
             # Check if the row exists in the validation status
@@ -1002,7 +1564,19 @@ class ChestDataModel(QObject):
         """
         Get the count of rows that have corrections applied.
 
-        This method avoids returning a full DataFrame which can cause recursion issues.
+        The count is cached until the correction status changes, so repeated
+        reads, e.g. from dashboard refreshes, take constant time.
+
+        Returns:
+            The number of rows with corrections applied.
+        """
+        if self._correction_row_count is None:
+            self._correction_row_count = self._count_corrected_rows()
+        return self._correction_row_count
+
+    def _count_corrected_rows(self) -> int:
+        """
+        Count the rows where any correction column is True.
 
         Returns:
             The number of rows with corrections applied.
@@ -1019,14 +1593,8 @@ class ChestDataModel(QObject):
             if not correction_columns:
                 return 0
 
-            # Count rows where any correction column is True
-            row_count = 0
-            for i in range(len(self._correction_status)):
-                row = self._correction_status.iloc[i]
-                if any(row[col] for col in correction_columns):
-                    row_count += 1
-
-            return row_count
+            corrected = self._correction_status[correction_columns].to_numpy(dtype=bool)
+            return int(np.count_nonzero(corrected.any(axis=1)))
         except Exception as e:
             logger.error(f"Error getting correction row count: {e}")
             return 0
@@ -1053,13 +1621,8 @@ class ChestDataModel(QObject):
                 return []
 
             # Find rows where any validation column is False
-            invalid_rows = []
-            for i in range(len(self._validation_status)):
-                row = self._validation_status.iloc[i]
-                if any(not row[col] for col in validation_columns):
-                    invalid_rows.append(i)
-
-            return invalid_rows
+            valid = self._validation_status[validation_columns].to_numpy(dtype=bool)
+            return self._validation_status.index[~valid.all(axis=1)].tolist()
         except Exception as e:
             logger.error(f"Error getting invalid rows: {e}")
             return []
@@ -1077,6 +1640,16 @@ class ChestDataModel(QObject):
             self._update_data_hash()
         return self._current_data_hash
 
+    @property
+    def journal(self) -> ChangeJournal:
+        """
+        Get the undo/redo journal of cell changes.
+
+        Returns:
+            ChangeJournal: The journal recording changes to this model
+        """
+        return self._journal
+
     @property
     def data_state(self) -> DataState:
         """
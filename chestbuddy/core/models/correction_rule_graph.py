@@ -0,0 +1,235 @@
+"""
+correction_rule_graph.py
+
+Description: Compiles correction rules into resolved mappings for single-pass recursive correction.
+Usage:
+    graph = CorrectionRuleGraph(rule_manager.get_prioritized_rules())
+    for cycle in graph.cycles:
+        print(" -> ".join(cycle))
+
+    resolution = graph.resolve("Jhon", "player")  # ("John", 2) after following the chain
+"""
+
+import logging
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .correction_rule import CorrectionRule
+from .correction_rule_manager import normalize_rule_value
+
+
+logger = logging.getLogger(__name__)
+
+
+class CorrectionRuleGraph:
+    """
+    Directed graph of enabled correction rules with chains resolved ahead of time.
+
+    One correction pass maps a value through the general rules and then through
+    the rules of the column's category. Recursive correction repeats passes
+    until the value stops changing; the graph follows those chains once per
+    distinct value instead of re-scanning the data on every iteration.
+
+    Attributes:
+        cycles (List[List[str]]): Detected rule cycles, each as the values visited
+            in order (e.g. ["A", "B"] for A -> B -> A)
+
+    Implementation Notes:
+        - When several rules match a value, the first one in the given order wins
+        - Values that run into a cycle are corrected with a single pass, which is
+          what a non-recursive correction would produce
+        - Resolutions are memoized per (category, value), so each distinct value
+          is resolved once regardless of how many cells contain it
+    """
+
+    GENERAL_CATEGORY = "general"
+
+    def __init__(self, rules: Iterable[CorrectionRule], case_sensitive: bool = False):
+        """
+        Compile the rules into lookup tables.
+
+        Args:
+            rules: Rules in priority order; disabled rules are ignored
+            case_sensitive: Whether from_value must match case exactly
+        """
+        self._case_sensitive = case_sensitive
+        self._tables: Dict[str, Dict[str, str]] = {}
+        for rule in rules:
+            if rule.status != "enabled":
+                continue
+            table = self._tables.setdefault(str(rule.category).lower(), {})
+            key = normalize_rule_value(rule.from_value, case_sensitive)
+            # Keep the first (highest priority) rule for each key
+            table.setdefault(key, str(rule.to_value))
+
+        self._general = self._tables.get(self.GENERAL_CATEGORY, {})
+        self._memo: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self.cycles: List[List[str]] = []
+        self._cycle_keys: Set[str] = set()
+
+        # Resolve every rule target up front so cycles are known before any data is touched
+        for category in self._tables:
+            self.resolve_all(category)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the graph contains no enabled rules."""
+        return not any(self._tables.values())
+
+    def has_rules_for(self, category: str) -> bool:
+        """
+        Check if any rule can apply to a column category.
+
+        Args:
+            category: Column category
+
+        Returns:
+            bool: True if general or category rules exist
+        """
+        return bool(self._general) or bool(self._tables.get(category.lower()))
+
+    def matches(self, value: str, category: str) -> bool:
+        """
+        Check if a rule matches a value on the first pass.
+
+        Args:
+            value: The cell value as a string
+            category: Column category
+
+        Returns:
+            bool: True if a general or category rule matches the value
+        """
+        key = normalize_rule_value(value, self._case_sensitive)
+        table = self._tables.get(category.lower(), {})
+        return key in self._general or key in table
+
+    def apply_pass(self, value: str, category: str) -> Tuple[str, int]:
+        """
+        Apply one correction pass: general rules, then category rules.
+
+        Args:
+            value: The cell value as a string
+            category: Column category
+
+        Returns:
+            Tuple[str, int]: The corrected value and the number of rules that changed it
+        """
+        steps = 0
+        corrected = self._general.get(normalize_rule_value(value, self._case_sensitive))
+        if corrected is not None and corrected != value:
+            value = corrected
+            steps += 1
+
+        if category.lower() != self.GENERAL_CATEGORY:
+            table = self._tables.get(category.lower(), {})
+            corrected = table.get(normalize_rule_value(value, self._case_sensitive))
+            if corrected is not None and corrected != value:
+                value = corrected
+                steps += 1
+
+        return value, steps
+
+    def resolve(self, value: str, category: str) -> Tuple[str, int]:
+        """
+        Follow a value's correction chain to its final target.
+
+        Args:
+            value: The cell value as a string
+            category: Column category
+
+        Returns:
+            Tuple[str, int]: The final value and the number of rule applications
+        """
+        category = category.lower()
+        memo_key = (category, value)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        path: List[str] = [value]
+        positions = {value: 0}
+        step_counts: List[int] = []
+        current = value
+        while True:
+            next_value, steps = self.apply_pass(current, category)
+            if steps == 0:
+                final = (current, 0)
+                break
+            cached = self._memo.get((category, next_value))
+            if cached is not None:
+                final = (cached[0], cached[1] + steps)
+                break
+            if next_value in positions:
+                # Chain loops back on itself
+                self._record_cycle(category, path[positions[next_value] :])
+                final = None
+                break
+            positions[next_value] = len(path)
+            path.append(next_value)
+            step_counts.append(steps)
+            current = next_value
+
+        if final is None:
+            # Values on or leading into a cycle fall back to a single pass
+            for node in path:
+                self._memo.setdefault((category, node), self.apply_pass(node, category))
+            return self._memo[memo_key]
+
+        # Memoize every value on the path, walking back from the end
+        target, remaining = final
+        self._memo[(category, path[-1])] = (target, remaining)
+        for index in range(len(path) - 2, -1, -1):
+            remaining += step_counts[index]
+            self._memo[(category, path[index])] = (target, remaining)
+        return self._memo[memo_key]
+
+    def resolve_all(self, category: str) -> Dict[str, Tuple[str, int]]:
+        """
+        Resolve the targets of every rule that applies to a category.
+
+        Args:
+            category: Column category
+
+        Returns:
+            Dict[str, Tuple[str, int]]: Rule target values mapped to their final resolution
+        """
+        category = category.lower()
+        targets = list(self._general.values())
+        if category != self.GENERAL_CATEGORY:
+            targets.extend(self._tables.get(category, {}).values())
+        return {target: self.resolve(target, category) for target in targets}
+
+    def rules_in_cycles(self, rules: Iterable[CorrectionRule]) -> List[CorrectionRule]:
+        """
+        Get the rules that take part in a detected cycle.
+
+        Args:
+            rules: Rules to check
+
+        Returns:
+            List[CorrectionRule]: Rules whose from_value and to_value both lie on a cycle
+        """
+        result = []
+        for rule in rules:
+            from_key = normalize_rule_value(rule.from_value, self._case_sensitive)
+            to_key = normalize_rule_value(rule.to_value, self._case_sensitive)
+            if from_key in self._cycle_keys and to_key in self._cycle_keys:
+                result.append(rule)
+        return result
+
+    def _record_cycle(self, category: str, cycle: List[str]) -> None:
+        """
+        Remember a detected cycle once, regardless of where it was entered.
+
+        Args:
+            category: Column category the cycle was found for
+            cycle: Values on the cycle in visiting order
+        """
+        keys = [normalize_rule_value(value, self._case_sensitive) for value in cycle]
+        if all(key in self._cycle_keys for key in keys):
+            return
+        self._cycle_keys.update(keys)
+        self.cycles.append(cycle)
+        logger.warning(
+            f"Correction rule cycle in category '{category}': "
+            f"{' -> '.join(cycle + cycle[:1])}"
+        )
+
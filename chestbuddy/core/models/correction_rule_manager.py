@@ -6,20 +6,38 @@ Usage:
     manager = CorrectionRuleManager()
     manager.load_rules('path/to/rules.csv')
     manager.add_rule(CorrectionRule('Correct', 'Incorrect', 'player'))
+    manager.find_rules('incorrect', ['player', 'general'])
     manager.save_rules()
+    manager.schedule_save()  # Coalesces repeated saves into one deferred write
 """
 
 import pandas as pd
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union, Iterator
+from typing import List, Optional, Dict, Any, Iterable, Set, Tuple, Union, Iterator
 
 from .correction_rule import CorrectionRule
+from chestbuddy.utils.write_behind import WriteBehindPersister, atomic_write_text
 
 
 logger = logging.getLogger(__name__)
 
 
+def normalize_rule_value(value: Any, case_sensitive: bool = False) -> str:
+    """
+    Normalize a cell or rule value for rule lookups.
+
+    Args:
+        value: The value to normalize
+        case_sensitive: Whether case is significant
+
+    Returns:
+        str: The lookup key for the value
+    """
+    text = str(value)
+    return text if case_sensitive else text.lower()
+
+
 class CorrectionRuleManager:
     """
     Manager for loading, saving, and organizing correction rules.
@@ -28,15 +46,24 @@ class CorrectionRuleManager:
 
     Attributes:
         _rules (List[CorrectionRule]): List of correction rules
+        _rule_set (Set[CorrectionRule]): Set of rules for constant-time duplicate checks
+        _index (Dict[Tuple[str, str], List[CorrectionRule]]): Rules keyed by
+            (lowercase category, lowercase from_value), each list in priority order
+        _priorities (Dict[int, int]): Priority of each rule keyed by id(rule)
         _config_manager: Optional configuration manager for settings
         _default_rules_path (Path): Default path for saving/loading rules
         _custom_path (Optional[Path]): Custom path for rules if configured
 
     Implementation Notes:
-        - Rules are stored in a plain list for simplicity
+        - Rules are stored in a plain list; a rule's priority is its position
         - Duplicates are prevented based on rule equality
         - Rules can be filtered by category and status
-        - Priority is maintained by explicit ordering
+        - The CSV is replaced atomically; schedule_save() defers and coalesces
+          writes through a WriteBehindPersister created on first use
+        - The lookup index holds enabled and disabled rules alike; status is
+          checked at lookup time so rules toggled elsewhere stay consistent
+        - Appending a rule updates the index in place, every other mutation
+          rebuilds it (mutations are rare compared to lookups)
     """
 
     def __init__(self, config_manager=None):
@@ -47,8 +74,13 @@ class CorrectionRuleManager:
             config_manager: Optional configuration manager for settings
         """
         self._rules: List[CorrectionRule] = []
+        self._rule_set: Set[CorrectionRule] = set()
+        self._index: Dict[Tuple[str, str], List[CorrectionRule]] = {}
+        self._priorities: Dict[int, int] = {}
+        self._indexed_rules: Optional[List[CorrectionRule]] = self._rules
         self._config_manager = config_manager
         self._default_rules_path = Path("data/corrections/default_corrections.csv")
+        self._persister: Optional[WriteBehindPersister] = None
 
         # If we have a config manager, check for custom path
         self._custom_path = None
@@ -109,7 +141,7 @@ class CorrectionRuleManager:
 
         try:
             df = pd.read_csv(path)
-            self._rules = []
+            self._set_rules([])
 
             for _, row in df.iterrows():
                 rule = CorrectionRule.from_dict(row.to_dict())
@@ -127,21 +159,58 @@ class CorrectionRuleManager:
             file_path: Path to the CSV file, uses configured path if None
         """
         path = Path(file_path) if file_path else self.get_correction_file_path()
+        if file_path is None and self._persister is not None:
+            self._persister.cancel()
 
         try:
-            # Create directory if it doesn't exist
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert rules to DataFrame
-            rules_data = [rule.to_dict() for rule in self._rules]
-            df = pd.DataFrame(rules_data)
-
-            # Save to CSV
-            df.to_csv(path, index=False)
-            logger.info(f"Saved {len(self._rules)} correction rules to {path}")
+            self._write_rules(path)
         except Exception as e:
             logger.error(f"Error saving rules to {path}: {e}")
 
+    def schedule_save(self, delay_ms: int = 1000) -> None:
+        """
+        Save rules to the configured path after a quiet period.
+
+        Repeated calls within the delay result in a single write.
+
+        Args:
+            delay_ms: Quiet period before the rules are written
+        """
+        if self._persister is None:
+            self._persister = WriteBehindPersister(
+                lambda: self._write_rules(self.get_correction_file_path()),
+                delay_ms,
+                name="correction rules",
+            )
+        self._persister.schedule()
+
+    def flush(self) -> bool:
+        """
+        Perform a save scheduled with schedule_save() now.
+
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        return self._persister.flush() if self._persister is not None else True
+
+    def _write_rules(self, path: Path) -> None:
+        """
+        Write all rules to a CSV file atomically.
+
+        Args:
+            path: Path to the CSV file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        # Convert rules to DataFrame
+        rules_data = [rule.to_dict() for rule in self._rules]
+        df = pd.DataFrame(rules_data)
+
+        # Render the CSV and replace the file in one step
+        atomic_write_text(path, df.to_csv(index=False))
+        logger.info(f"Saved {len(self._rules)} correction rules to {path}")
+
     def add_rule(self, rule: CorrectionRule) -> None:
         """
         Add a new rule to the manager.
@@ -152,8 +221,9 @@ class CorrectionRuleManager:
         Note:
             Prevents adding duplicate rules
         """
-        if rule not in self._rules:
-            self._rules.append(rule)
+        self._ensure_index()
+        if rule not in self._rule_set:
+            self._append_rule(rule)
 
     def update_rule(self, index: int, updated_rule: CorrectionRule) -> None:
         """
@@ -168,6 +238,7 @@ class CorrectionRuleManager:
         """
         if 0 <= index < len(self._rules):
             self._rules[index] = updated_rule
+            self._rebuild_index()
         else:
             raise IndexError(f"Rule index out of range: {index}")
 
@@ -183,6 +254,7 @@ class CorrectionRuleManager:
         """
         if 0 <= index < len(self._rules):
             del self._rules[index]
+            self._rebuild_index()
         else:
             raise IndexError(f"Rule index out of range: {index}")
 
@@ -262,6 +334,7 @@ class CorrectionRuleManager:
         # Move the rule by removing it and inserting at the new position
         rule = self._rules.pop(from_index)
         self._rules.insert(to_index, rule)
+        self._rebuild_index()
 
     def move_rule_to_top(self, index: int) -> None:
         """
@@ -289,6 +362,7 @@ class CorrectionRuleManager:
         # Move the rule by removing it and inserting at the category start
         self._rules.pop(index)
         self._rules.insert(category_start_index, rule)
+        self._rebuild_index()
 
     def move_rule_to_bottom(self, index: int) -> None:
         """
@@ -316,6 +390,7 @@ class CorrectionRuleManager:
         # Move the rule by removing it and inserting after the category end
         self._rules.pop(index)
         self._rules.insert(category_end_index + 1, rule)
+        self._rebuild_index()
 
     def toggle_rule_status(self, index: int) -> None:
         """
@@ -336,16 +411,154 @@ class CorrectionRuleManager:
         else:
             rule.status = "enabled"
 
+        # Status is checked at lookup time, so the index needs no update
+
+    def get_priority(self, rule: CorrectionRule) -> int:
+        """
+        Get the priority of a rule (lower values are applied first).
+
+        Args:
+            rule (CorrectionRule): A rule held by this manager
+
+        Returns:
+            int: The rule's priority
+
+        Raises:
+            KeyError: If the rule is not held by this manager
+        """
+        self._ensure_index()
+        return self._priorities[id(rule)]
+
     def get_prioritized_rules(self) -> List[CorrectionRule]:
         """
         Get rules sorted by priority.
 
         Returns:
-            List[CorrectionRule]: Rules ordered by category and position in the list
+            List[CorrectionRule]: Enabled rules, column-specific rules before general
+                rules, each group in stored priority order
+        """
+        self._ensure_index()
+        enabled = [rule for rule in self._rules if rule.status == "enabled"]
+        return sorted(
+            enabled,
+            key=lambda rule: (rule.category.lower() == "general", self._priorities[id(rule)]),
+        )
+
+    def find_rules(
+        self,
+        value: Any,
+        categories: Iterable[str],
+        case_sensitive: bool = False,
+        enabled_only: bool = True,
+    ) -> List[CorrectionRule]:
+        """
+        Find the rules whose from_value matches a value using the lookup index.
+
+        Args:
+            value: The cell value to look up
+            categories: Rule categories to consider (e.g. the column category and "general")
+            case_sensitive: Whether from_value must match case exactly
+            enabled_only: Whether to skip disabled rules
+
+        Returns:
+            List[CorrectionRule]: Matching rules ordered by priority
+        """
+        self._ensure_index()
+        key = normalize_rule_value(value)
+        text = str(value)
+        matches = []
+        for category in dict.fromkeys(c.lower() for c in categories):
+            for rule in self._index.get((category, key), ()):
+                if enabled_only and rule.status != "enabled":
+                    continue
+                if case_sensitive and str(rule.from_value) != text:
+                    continue
+                matches.append(rule)
+
+        if len(matches) > 1:
+            matches.sort(key=self.get_priority)
+        return matches
+
+    def get_correction_mapping(
+        self, categories: Iterable[str], case_sensitive: bool = False
+    ) -> Dict[str, str]:
+        """
+        Build a from_value -> to_value mapping of enabled rules for vectorized lookups.
+
+        Keys are normalized with normalize_rule_value(), so a column can be matched
+        in one pass with Series.isin(mapping) or Series.map(mapping). When several
+        rules share a key, the one with the highest priority wins.
+
+        Args:
+            categories: Rule categories to include
+            case_sensitive: Whether keys keep their case
+
+        Returns:
+            Dict[str, str]: Mapping of normalized from_value to to_value
+        """
+        self._ensure_index()
+        wanted = {category.lower() for category in categories}
+        best: Dict[str, Tuple[int, str]] = {}
+        for (category, _), rules in self._index.items():
+            if category not in wanted:
+                continue
+            for rule in rules:
+                if rule.status != "enabled":
+                    continue
+                key = normalize_rule_value(rule.from_value, case_sensitive)
+                priority = self._priorities[id(rule)]
+                if key not in best or priority < best[key][0]:
+                    best[key] = (priority, rule.to_value)
+        return {key: to_value for key, (_, to_value) in best.items()}
+
+    def _index_key(self, rule: CorrectionRule) -> Tuple[str, str]:
+        """
+        Get the lookup index key for a rule.
+
+        Args:
+            rule (CorrectionRule): The rule
+
+        Returns:
+            Tuple[str, str]: (lowercase category, normalized from_value)
         """
-        # Rules are already ordered by their position in the list
-        # We only need to filter for enabled rules
-        return [rule for rule in self._rules if rule.status == "enabled"]
+        return (str(rule.category).lower(), normalize_rule_value(rule.from_value))
+
+    def _append_rule(self, rule: CorrectionRule) -> None:
+        """
+        Append a rule with the lowest priority and index it.
+
+        Args:
+            rule (CorrectionRule): The rule to append
+        """
+        self._priorities[id(rule)] = len(self._rules)
+        self._rules.append(rule)
+        self._rule_set.add(rule)
+        self._index.setdefault(self._index_key(rule), []).append(rule)
+
+    def _set_rules(self, rules: List[CorrectionRule]) -> None:
+        """
+        Replace all rules and rebuild the lookup structures.
+
+        Args:
+            rules (List[CorrectionRule]): The new rules in priority order
+        """
+        self._rules = rules
+        self._rebuild_index()
+
+    def _ensure_index(self) -> None:
+        """Rebuild the lookup structures if the rule list was replaced directly."""
+        if self._indexed_rules is not self._rules:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the duplicate set, lookup index and priorities from the rule list."""
+        self._indexed_rules = self._rules
+        self._rule_set = set(self._rules)
+        self._index = {}
+        self._priorities = {}
+        for priority, rule in enumerate(self._rules):
+            self._priorities[id(rule)] = priority
+            self._index.setdefault(self._index_key(rule), []).append(rule)
 
     def import_rules(
         self, file_path: Union[str, Path], replace: bool = False, save_as_default: bool = True
@@ -380,9 +593,10 @@ class CorrectionRuleManager:
 
             # Clear existing rules if replace is True
             if replace:
-                self._rules = []
+                self._set_rules([])
 
             # Process each row
+            self._ensure_index()
             imported_count = 0
             for _, row in df.iterrows():
                 # Convert row to dict and create rule
@@ -395,8 +609,8 @@ class CorrectionRuleManager:
                 rule = CorrectionRule.from_dict(row_dict)
 
                 # Add rule if it doesn't exist
-                if rule not in self._rules:
-                    self._rules.append(rule)
+                if rule not in self._rule_set:
+                    self._append_rule(rule)
                     imported_count += 1
 
             logger.info(f"Imported {imported_count} rules from {path}")
@@ -10,6 +10,9 @@ from typing import List, Set, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
+from chestbuddy.utils.log_pipeline import hot_path
+from chestbuddy.utils.write_behind import AppendOnlyLog, WriteBehindPersister, atomic_write_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,22 +25,44 @@ class ValidationListModel(QObject):
         file_path (Path): Path to the file containing entries
         entries (Set[str]): Set of valid entries
         case_sensitive (bool): Whether validation is case sensitive
+
+    Implementation Notes:
+        - Single additions and removals are appended to a "<file>.log" sidecar
+          (O(1) I/O) and the sorted file is rewritten once after a quiet period
+          or on exit; without the log the rewrite itself is deferred
+        - The sorted file is always replaced atomically via temp file and rename
+        - Operations left in the log are replayed when the list is loaded
     """
 
     entries_changed = Signal()
 
-    def __init__(self, file_path: str, case_sensitive: bool = False):
+    def __init__(
+        self,
+        file_path: str,
+        case_sensitive: bool = False,
+        flush_delay_ms: int = 1000,
+        append_log: bool = True,
+    ):
         """
         Initialize the validation list model.
 
         Args:
             file_path (str): Path to the file containing entries
             case_sensitive (bool, optional): Whether validation is case sensitive. Defaults to False.
+            flush_delay_ms (int, optional): Quiet period before pending changes are written.
+                Defaults to 1000.
+            append_log (bool, optional): Whether single changes are appended to a log file
+                before the full rewrite. Defaults to True.
         """
         super().__init__()
         self.file_path = Path(file_path)
         self.entries: Set[str] = set()
         self._case_sensitive = case_sensitive
+        self._log = AppendOnlyLog(self.file_path.with_name(self.file_path.name + ".log"))
+        self._use_log = append_log
+        self._persister = WriteBehindPersister(
+            self._write_file, flush_delay_ms, name=self.file_path.name, parent=self
+        )
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,6 +128,18 @@ class ValidationListModel(QObject):
 
             # Strip whitespace and filter out empty lines
             self.entries = {line.strip() for line in lines if line.strip()}
+
+            # Replay changes that were logged but not yet compacted into the file
+            operations = self._log.read()
+            for op, entry in operations:
+                if op == AppendOnlyLog.ADD:
+                    self.entries.add(entry)
+                else:
+                    self.entries.discard(entry)
+            if operations:
+                logger.debug(f"Replayed {len(operations)} logged changes for {self.file_path}")
+                self._persister.schedule()
+
             logger.debug(f"Loaded {len(self.entries)} entries from {self.file_path}")
         except Exception as e:
             logger.error(f"Error loading entries from {self.file_path}: {str(e)}")
@@ -121,20 +158,51 @@ class ValidationListModel(QObject):
         Returns:
             bool: True if successful, False otherwise
         """
+        self._persister.cancel()
         try:
-            # Sort entries alphabetically
-            sorted_entries = sorted(self.entries)
-
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                for entry in sorted_entries:
-                    f.write(f"{entry}\n")
-
-            logger.debug(f"Saved {len(self.entries)} entries to {self.file_path}")
+            self._write_file()
             return True
         except Exception as e:
             logger.error(f"Error saving entries to {self.file_path}: {str(e)}")
             return False
 
+    def flush(self) -> bool:
+        """
+        Write pending changes to the file now.
+
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        return self._persister.flush()
+
+    def _write_file(self) -> None:
+        """Atomically rewrite the sorted file and drop the compacted change log."""
+        # Sort entries alphabetically
+        sorted_entries = sorted(self.entries)
+        atomic_write_text(self.file_path, "".join(f"{entry}\n" for entry in sorted_entries))
+        self._log.clear()
+        logger.debug(f"Saved {len(self.entries)} entries to {self.file_path}")
+
+    def _persist_change(self, op: str, entry: str) -> bool:
+        """
+        Persist a single addition or removal.
+
+        Args:
+            op (str): AppendOnlyLog.ADD or AppendOnlyLog.REMOVE
+            entry (str): The entry added or removed
+
+        Returns:
+            bool: True if the change was logged or scheduled, False if it could not be saved
+        """
+        if self._use_log:
+            try:
+                self._log.append(op, entry)
+            except Exception as e:
+                logger.warning(f"Could not append to {self._log.path}, saving directly: {e}")
+                return self.save_entries()
+        self._persister.schedule()
+        return True
+
     def _is_duplicate_entry(self, entry: str) -> bool:
         """
         Check if an entry already exists in the list.
@@ -181,7 +249,7 @@ class ValidationListModel(QObject):
         self.entries.add(entry)
 
         # Save changes
-        result = self.save_entries()
+        result = self._persist_change(AppendOnlyLog.ADD, entry)
         if result:
             self.entries_changed.emit()
             logger.info(f"Added entry '{entry}' to {self.file_path}")
@@ -214,7 +282,7 @@ class ValidationListModel(QObject):
         self.entries.remove(entry)
 
         # Save changes
-        result = self.save_entries()
+        result = self._persist_change(AppendOnlyLog.REMOVE, entry)
         if result:
             self.entries_changed.emit()
             logger.info(f"Removed entry '{entry}' from {self.file_path}")
@@ -293,30 +361,21 @@ class ValidationListModel(QObject):
         if entry is None or entry == "":
             return False
 
-        # Static counter for debugging - limit logging to first few checks
-        if not hasattr(self, "_contains_call_count"):
-            self._contains_call_count = 0
-        self._contains_call_count += 1
-
-        # Only log the first 10 calls for this file to avoid excessive logging
-        should_log = self._contains_call_count <= 10
-
-        # Check if entry exists
         if self._case_sensitive:
             result = entry in self.entries
-            if should_log:
-                logger.debug(
-                    f"[{self._contains_call_count}] CASE SENSITIVE check if '{entry}' in list '{self.file_path.name}': {result}"
-                )
-            return result
         else:
             entry_lower = entry.lower()
             result = any(e.lower() == entry_lower for e in self.entries)
-            if should_log:
-                logger.debug(
-                    f"[{self._contains_call_count}] CASE INSENSITIVE check if '{entry}' in list '{self.file_path.name}': {result}"
-                )
-            return result
+        if hot_path.enabled:
+            hot_path.debug(
+                logger,
+                "%s check if '%s' in list '%s': %s",
+                "CASE SENSITIVE" if self._case_sensitive else "CASE INSENSITIVE",
+                entry,
+                self.file_path.name,
+                result,
+            )
+        return result
 
     def get_entries(self) -> List[str]:
         """
@@ -406,6 +465,4 @@ class ValidationListModel(QObject):
         Returns:
             bool: True if there are unsaved changes, False otherwise
         """
-        # For now, we assume changes are saved immediately
-        # This is a placeholder in case we implement a more sophisticated change tracking system
-        return False
+        return self._persister.pending
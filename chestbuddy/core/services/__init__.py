@@ -7,13 +7,18 @@ This module exports all services provided by the ChestBuddy application.
 from chestbuddy.core.services.csv_service import CSVService
 from chestbuddy.core.services.validation_service import ValidationService
 from chestbuddy.core.services.correction_service import CorrectionService
+from chestbuddy.core.services.rollup_service import RollupService
 from chestbuddy.core.services.chart_service import ChartService
 from chestbuddy.core.services.data_manager import DataManager
+from chestbuddy.core.services.query_service import QueryService, QuerySpec
 
 __all__ = [
     "CSVService",
     "ValidationService",
     "CorrectionService",
+    "RollupService",
     "ChartService",
     "DataManager",
+    "QueryService",
+    "QuerySpec",
 ]
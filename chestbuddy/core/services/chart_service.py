@@ -10,24 +10,20 @@ Usage:
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, Any
 
 import pandas as pd
-from PySide6.QtCharts import (
-    QChart,
-    QBarSeries,
-    QBarSet,
-    QBarCategoryAxis,
-    QPieSeries,
-    QLineSeries,
-    QValueAxis,
-    QChartView,
-)
 from PySide6.QtCore import Qt, QPointF, QRectF
 from PySide6.QtGui import QPainter, QColor, QBrush, QPen
 from PySide6.QtWidgets import QGraphicsTextItem
 
 from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.rollup_service import RollupService
+from chestbuddy.core.storage import DatasetStore
+from chestbuddy.utils.span_tracer import span_tracer
+
+if TYPE_CHECKING:
+    from PySide6.QtCharts import QChart
 
 
 class ChartService:
@@ -36,21 +32,31 @@ class ChartService:
 
     Attributes:
         _data_model (ChestDataModel): The data model containing chest data
+        _rollup_service (RollupService): Precomputed scores for leaderboards and trends
 
     Implementation Notes:
         - Uses QtCharts for chart generation
         - Supports bar, pie, and line charts
+        - Leaderboard and trend charts read the rollups instead of grouping the data
+        - Bar, pie and line charts of an out-of-core dataset are drawn from totals
+          computed by the dataset
         - Allows exporting charts to image files
+        - QtCharts is imported on first use to keep application startup fast
     """
 
-    def __init__(self, data_model: ChestDataModel):
+    ROLLUP_CHART_TYPES = ("Leaderboard", "Weekly Trend")
+
+    def __init__(self, data_model: ChestDataModel, rollup_service: Optional[RollupService] = None):
         """
         Initialize the chart service with a data model.
 
         Args:
             data_model (ChestDataModel): The data model containing chest data
+            rollup_service (RollupService, optional): Rollups for leaderboard and trend
+                charts. A new one is created if None.
         """
         self._data_model = data_model
+        self._rollup_service = rollup_service or RollupService(data_model)
         self._colors = [
             QColor("#1f77b4"),  # blue
             QColor("#ff7f0e"),  # orange
@@ -64,6 +70,7 @@ class ChartService:
             QColor("#17becf"),  # teal
         ]
 
+    @span_tracer.trace("ChartService.create_bar_chart", "chart")
     def create_bar_chart(
         self,
         category_column: str,
@@ -71,7 +78,7 @@ class ChartService:
         title: str = "Bar Chart",
         x_axis_title: Optional[str] = None,
         y_axis_title: Optional[str] = None,
-    ) -> QChart:
+    ) -> "QChart":
         """
         Create a bar chart from the data.
 
@@ -88,7 +95,7 @@ class ChartService:
         Raises:
             ValueError: If data is empty or required columns don't exist
         """
-        df = self._data_model.data
+        df = self._chart_data(category_column, value_column)
 
         if df.empty:
             raise ValueError("Cannot create chart from empty data")
@@ -96,6 +103,8 @@ class ChartService:
         if category_column not in df.columns or value_column not in df.columns:
             raise ValueError(f"Columns {category_column} and/or {value_column} not found in data")
 
+        from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QValueAxis
+
         # Group by category and sum values
         grouped_data = df.groupby(category_column)[value_column].sum().reset_index()
 
@@ -154,9 +163,10 @@ class ChartService:
 
         return chart
 
+    @span_tracer.trace("ChartService.create_pie_chart", "chart")
     def create_pie_chart(
         self, category_column: str, value_column: str, title: str = "Pie Chart"
-    ) -> QChart:
+    ) -> "QChart":
         """
         Create a pie chart from the data.
 
@@ -171,7 +181,7 @@ class ChartService:
         Raises:
             ValueError: If data is empty or required columns don't exist
         """
-        df = self._data_model.data
+        df = self._chart_data(category_column, value_column)
 
         if df.empty:
             raise ValueError("Cannot create chart from empty data")
@@ -179,6 +189,8 @@ class ChartService:
         if category_column not in df.columns or value_column not in df.columns:
             raise ValueError(f"Columns {category_column} and/or {value_column} not found in data")
 
+        from PySide6.QtCharts import QChart, QPieSeries
+
         # Group by category and sum values
         grouped_data = df.groupby(category_column)[value_column].sum().reset_index()
 
@@ -215,6 +227,7 @@ class ChartService:
 
         return chart
 
+    @span_tracer.trace("ChartService.create_line_chart", "chart")
     def create_line_chart(
         self,
         x_column: str,
@@ -223,7 +236,7 @@ class ChartService:
         x_axis_title: Optional[str] = None,
         y_axis_title: Optional[str] = None,
         group_by: Optional[str] = None,
-    ) -> QChart:
+    ) -> "QChart":
         """
         Create a line chart from the data.
 
@@ -241,7 +254,7 @@ class ChartService:
         Raises:
             ValueError: If data is empty or required columns don't exist
         """
-        df = self._data_model.data
+        df = self._chart_data(x_column, y_column, group_by)
 
         if df.empty:
             raise ValueError("Cannot create chart from empty data")
@@ -256,6 +269,8 @@ class ChartService:
             except:
                 pass  # If conversion fails, continue with original data
 
+        from PySide6.QtCharts import QChart, QLineSeries, QValueAxis
+
         # Sort by x values for proper line plotting
         df = df.sort_values(by=x_column)
 
@@ -394,7 +409,167 @@ class ChartService:
 
         return chart
 
-    def save_chart(self, chart: QChart, file_path: str) -> bool:
+    def _chart_data(
+        self, key_column: str, value_column: str, group_by: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get the rows a bar, pie or line chart is drawn from.
+
+        In-memory data is returned as is. An out-of-core dataset sums the value
+        column per key (and group) itself, so only the totals are loaded.
+
+        Args:
+            key_column (str): Category or x-axis column
+            value_column (str): Column with the plotted values
+            group_by (str, optional): Column with one line per value
+
+        Returns:
+            pd.DataFrame: The data, or one row per group for a dataset
+
+        Raises:
+            ValueError: If a dataset lacks the key or value column
+        """
+        dataset = getattr(self._data_model, "dataset", None)
+        if not isinstance(dataset, DatasetStore):
+            return self._data_model.data
+
+        columns = dataset.column_names
+        if key_column not in columns or value_column not in columns:
+            raise ValueError(f"Columns {key_column} and/or {value_column} not found in data")
+        keys = [key_column]
+        if group_by and group_by in columns and group_by != key_column:
+            keys.insert(0, group_by)
+        totals = dataset.aggregate(keys, value_column, "sum")
+        df = totals[keys].astype(object)
+        df[value_column] = pd.to_numeric(totals["value"], errors="coerce").fillna(0).astype(float)
+        return df
+
+    @span_tracer.trace("ChartService.create_leaderboard_chart", "chart")
+    def create_leaderboard_chart(
+        self,
+        by: str = "player",
+        metric: str = "score",
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        limit: int = 10,
+        title: str = "Leaderboard",
+    ) -> "QChart":
+        """
+        Create a bar chart of the top players or clans.
+
+        Args:
+            by (str, optional): 'player' or 'clan'. Defaults to "player".
+            metric (str, optional): 'score' or 'count'. Defaults to "score".
+            start (optional): First day of the window. Defaults to the first day of the data.
+            end (optional): Last day of the window. Defaults to the last day of the data.
+            limit (int, optional): Number of bars. Defaults to 10.
+            title (str, optional): Chart title. Defaults to "Leaderboard".
+
+        Returns:
+            QChart: The created bar chart
+
+        Raises:
+            ValueError: If there is no dated data in the window
+        """
+        entries = self._rollup_service.leaderboard(by, metric, start, end, limit)
+        if not entries:
+            raise ValueError("Cannot create chart from empty data")
+
+        from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QValueAxis
+
+        bar_set = QBarSet("Points" if metric == "score" else "Chests")
+        bar_set.setColor(self._colors[0])
+        for _, total in entries:
+            bar_set.append(total)
+        bar_series = QBarSeries()
+        bar_series.append(bar_set)
+
+        chart = QChart()
+        chart.addSeries(bar_series)
+        chart.setTitle(title)
+        chart.setAnimationOptions(QChart.SeriesAnimations)
+
+        axis_x = QBarCategoryAxis()
+        axis_x.append([name for name, _ in entries])
+        axis_x.setTitleText(by.capitalize())
+        axis_y = QValueAxis()
+        axis_y.setRange(0, max(total for _, total in entries) * 1.1)
+        axis_y.setTitleText(bar_set.label())
+
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        bar_series.attachAxis(axis_x)
+        bar_series.attachAxis(axis_y)
+        chart.legend().setVisible(False)
+        return chart
+
+    @span_tracer.trace("ChartService.create_trend_chart", "chart")
+    def create_trend_chart(
+        self,
+        bucket: str = "week",
+        players: Optional[List[str]] = None,
+        metric: str = "score",
+        title: str = "Score Trend",
+    ) -> "QChart":
+        """
+        Create a line chart of total scores per day, week or month.
+
+        Args:
+            bucket (str, optional): 'day', 'week' or 'month'. Defaults to "week".
+            players (List[str], optional): One line per player. Defaults to one line for everyone.
+            metric (str, optional): 'score' or 'count'. Defaults to "score".
+            title (str, optional): Chart title. Defaults to "Score Trend".
+
+        Returns:
+            QChart: The created line chart
+
+        Raises:
+            ValueError: If there is no dated data
+        """
+        if players:
+            lines = {
+                name: self._rollup_service.trend(bucket, player=name, metric=metric)
+                for name in players
+            }
+        else:
+            lines = {"All players": self._rollup_service.trend(bucket, metric=metric)}
+        if all(line.empty for line in lines.values()):
+            raise ValueError("Cannot create chart from empty data")
+
+        from PySide6.QtCharts import QChart, QDateTimeAxis, QLineSeries, QValueAxis
+
+        chart = QChart()
+        chart.setTitle(title)
+        chart.setAnimationOptions(QChart.SeriesAnimations)
+        max_y = 0.0
+        for i, (name, line) in enumerate(lines.items()):
+            series = QLineSeries()
+            series.setName(name)
+            pen = QPen(self._colors[i % len(self._colors)])
+            pen.setWidth(2)
+            series.setPen(pen)
+            for day, total in zip(line.index, line.to_numpy()):
+                series.append(day.value / 1_000_000, float(total))
+            max_y = max(max_y, float(line.max()) if not line.empty else 0.0)
+            chart.addSeries(series)
+
+        axis_x = QDateTimeAxis()
+        axis_x.setFormat("yyyy-MM-dd")
+        axis_x.setTitleText(bucket.capitalize())
+        axis_y = QValueAxis()
+        axis_y.setRange(0, max_y * 1.1 if max_y > 0 else 1.0)
+        axis_y.setTitleText("Points" if metric == "score" else "Chests")
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        for series in chart.series():
+            series.attachAxis(axis_x)
+            series.attachAxis(axis_y)
+
+        chart.legend().setVisible(len(lines) > 1)
+        chart.legend().setAlignment(Qt.AlignBottom)
+        return chart
+
+    def save_chart(self, chart: "QChart", file_path: str) -> bool:
         """
         Save the chart to an image file.
 
@@ -415,6 +590,8 @@ class ChartService:
             raise ValueError("Invalid file path")
 
         try:
+            from PySide6.QtCharts import QChartView
+
             # Create a QChartView with the chart
             chart_view = QChartView(chart)
             chart_view.setRenderHint(QPainter.Antialiasing)
@@ -8,7 +8,7 @@ This service applies correction rules to data using a two-pass algorithm:
 The service also supports selective correction of only invalid cells.
 """
 
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, List, Tuple, Any, Optional
 import pandas as pd
 import numpy as np
 from copy import deepcopy
@@ -18,15 +18,66 @@ from PySide6.QtCore import Signal, QObject
 
 from chestbuddy.core.models.correction_rule import CorrectionRule
 from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.core.models.correction_rule_graph import CorrectionRuleGraph
 from chestbuddy.core.enums.validation_enums import ValidationStatus
 from chestbuddy.core.models.chest_data_model import ChestDataModel
 from chestbuddy.utils.config import ConfigManager
+from chestbuddy.utils.process_pool import BlockContext, ProcessPool, SharedFrame
 from chestbuddy.core.table_state_manager import TableStateManager, CellFullState, CellState
+from chestbuddy.utils.span_tracer import span_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+def _correct_block(context: BlockContext) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Resolve the cells of one row block through the compiled rules.
+
+    Runs in a worker process. Each distinct value is resolved once per worker
+    and column; the block only maps its codes through the resolved tables.
+
+    Args:
+        context: Block of a SharedFrame; the payload is (rule graph, column categories)
+
+    Returns:
+        Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]: Per column, the row
+            positions, corrected values and rule application counts of changed cells
+    """
+    graph, categories = context.payload
+    deltas = {}
+    for column, category in categories.items():
+        uniques = context.uniques[column]
+        tables = context.cache.get(column)
+        if tables is None:
+            # Steps per code (-1 while unresolved) and the resolved values
+            tables = (np.full(len(uniques), -1, dtype=np.int32), np.empty(len(uniques), object))
+            context.cache[column] = tables
+        steps_by_code, target_by_code = tables
+
+        codes = context.codes(column)
+        present = codes >= 0
+        block_codes = np.unique(codes[present])
+        for code in block_codes[steps_by_code[block_codes] < 0]:
+            value = str(uniques[code])
+            target, steps = value, 0
+            if graph.matches(value, category):
+                target, steps = graph.resolve(value, category)
+            steps_by_code[code] = steps
+            target_by_code[code] = target
+
+        changed = present & (steps_by_code[np.where(present, codes, 0)] > 0)
+        positions = np.flatnonzero(changed)
+        if len(positions):
+            changed_codes = codes[positions]
+            deltas[column] = (
+                positions + context.start,
+                target_by_code[changed_codes],
+                steps_by_code[changed_codes],
+            )
+    return deltas
+
+
 class CorrectionService(QObject):
     """
     Service for applying correction rules to data.
@@ -90,6 +141,7 @@ class CorrectionService(QObject):
             self._case_sensitive = config_manager.get_bool("Corrections", "case_sensitive", False)
             logger.info(f"Loaded correction case_sensitive setting: {self._case_sensitive}")
 
+    @span_tracer.trace("CorrectionService.apply_corrections", "correction")
     def apply_corrections(
         self, only_invalid: bool = False, recursive: bool = False
     ) -> Dict[str, int]:
@@ -100,8 +152,10 @@ class CorrectionService(QObject):
         1. First pass applies general category rules to all columns
         2. Second pass applies column-specific rules to their respective columns
 
-        When recursive=True, the corrections are applied repeatedly until no more
-        changes occur or until MAX_ITERATIONS is reached.
+        When recursive=True, the rules are compiled into a CorrectionRuleGraph that
+        follows every correction chain to its final target, and the result is
+        applied in a single pass. Cycles are reported and their values are
+        corrected once, as in a non-recursive pass.
 
         Args:
             only_invalid (bool): If True, only apply corrections to cells marked as invalid
@@ -119,6 +173,9 @@ class CorrectionService(QObject):
                 "iterations": 0,
             }
 
+        if recursive:
+            return self._apply_compiled_corrections(data, only_invalid)
+
         # Initialize statistics tracking
         total_corrections = 0
         corrected_rows = set()
@@ -133,7 +190,7 @@ class CorrectionService(QObject):
             # Make a copy of the data to apply corrections
             corrected_data = data.copy()
 
-            # Get all enabled rules, prioritized (general rules first, then column-specific)
+            # Get all enabled rules in priority order; the passes below pick them by category
             prioritized_rules = self._rule_manager.get_prioritized_rules()
 
             # First pass: Apply general rule corrections
@@ -207,6 +264,202 @@ class CorrectionService(QObject):
 
         return stats
 
+    def compile_rules(self) -> CorrectionRuleGraph:
+        """
+        Compile the enabled rules into a graph with resolved correction chains.
+
+        Returns:
+            CorrectionRuleGraph: The compiled rules
+        """
+        return CorrectionRuleGraph(
+            self._rule_manager.get_prioritized_rules(), case_sensitive=self._case_sensitive
+        )
+
+    @span_tracer.trace("CorrectionService.apply_compiled_corrections", "correction")
+    def _apply_compiled_corrections(self, data: pd.DataFrame, only_invalid: bool) -> Dict[str, int]:
+        """
+        Apply all enabled rules recursively in a single pass over the data.
+
+        Each distinct value of a column is resolved once through the rule graph and
+        the results are mapped back onto the column.
+
+        Args:
+            data (pd.DataFrame): Data to correct
+            only_invalid (bool): If True, only correct cells marked as invalid or correctable
+
+        Returns:
+            Dict[str, int]: Statistics about the corrections applied
+        """
+        graph = self.compile_rules()
+        corrected_data = None
+        total_corrections = 0
+        corrected_rows = set()
+        corrected_cells = 0
+
+        for col_idx, col_name in enumerate(data.columns):
+            category = self._category_mapping.get(col_name, "").lower() or "general"
+            if not graph.has_rules_for(category):
+                continue
+
+            values = data[col_name]
+            present = values.notna().to_numpy()
+            keys = values.astype(str)
+
+            # Resolve each distinct value once
+            resolutions = {}
+            for value in pd.unique(keys[present]):
+                if graph.matches(value, category):
+                    target, steps = graph.resolve(value, category)
+                    if steps:
+                        resolutions[value] = (target, steps)
+            if not resolutions:
+                continue
+
+            changed = present & keys.isin(resolutions).to_numpy()
+            row_positions = np.flatnonzero(changed)
+
+            if only_invalid:
+                row_positions = row_positions[self._invalid_mask(row_positions, col_idx)]
+            if len(row_positions) == 0:
+                continue
+
+            if corrected_data is None:
+                corrected_data = data.copy()
+
+            changed_keys = keys.iloc[row_positions]
+            new_values = changed_keys.map(lambda value: resolutions[value][0])
+            if not pd.api.types.is_object_dtype(corrected_data[col_name].dtype):
+                corrected_data[col_name] = corrected_data[col_name].astype(object)
+            corrected_data.iloc[row_positions, col_idx] = new_values.to_numpy(dtype=object)
+
+            total_corrections += int(changed_keys.map(lambda value: resolutions[value][1]).sum())
+            corrected_cells += len(row_positions)
+            corrected_rows.update(int(row) for row in row_positions)
+
+        if corrected_data is not None:
+            self._data_model.update_data(corrected_data)
+
+        stats = {
+            "total_corrections": total_corrections,
+            "corrected_rows": len(corrected_rows),
+            "corrected_cells": corrected_cells,
+            "iterations": 1,
+            "cycles": len(graph.cycles),
+        }
+        self._correction_history.append({"stats": stats})
+        return stats
+
+    @span_tracer.trace("CorrectionService.apply_corrections_in_parallel", "correction")
+    def apply_corrections_in_parallel(
+        self,
+        only_invalid: bool = False,
+        pool: Optional[ProcessPool] = None,
+        progress_callback: Optional[Callable[[int, int], Any]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Dict[str, int]]:
+        """
+        Apply all enabled rules recursively on a process pool.
+
+        The columns with applicable rules are shared with the workers as
+        dictionary codes and split into row blocks. The compiled rule graph is
+        shipped once per worker, each block returns the positions and values of
+        its corrected cells, and all corrections are written to the data model
+        in one batch. The result matches a recursive apply_corrections().
+
+        Args:
+            only_invalid (bool): If True, only correct cells marked as invalid or correctable
+            pool (ProcessPool): Pool to run on, defaults to the shared pool
+            progress_callback (callable): Called with (finished blocks, total blocks)
+            cancel_check (callable): Returns True to stop; nothing is written then
+
+        Returns:
+            Optional[Dict[str, int]]: Statistics about the corrections applied, with
+                "cancelled" set if the run was stopped, or None if the data is too
+                small for the pool and should be corrected in the calling thread
+        """
+        pool = pool or ProcessPool.instance()
+        data = self._data_model.data
+        if data is None or not pool.should_parallelize(len(data)):
+            return None
+
+        graph = self.compile_rules()
+        categories = {}
+        for col_name in data.columns:
+            category = self._category_mapping.get(col_name, "").lower() or "general"
+            if graph.has_rules_for(category):
+                categories[col_name] = category
+
+        stats = {
+            "total_corrections": 0,
+            "corrected_rows": 0,
+            "corrected_cells": 0,
+            "iterations": 1,
+            "cycles": len(graph.cycles),
+        }
+        if categories:
+            with SharedFrame(data, list(categories)) as frame:
+                results = pool.map_blocks(
+                    _correct_block,
+                    frame,
+                    payload=(graph, categories),
+                    progress_callback=progress_callback,
+                    cancel_check=cancel_check,
+                )
+            if results is None:
+                stats["cancelled"] = True
+                return stats
+
+            rows, cols, values = [], [], []
+            for col_name in categories:
+                col_idx = data.columns.get_loc(col_name)
+                deltas = [block[col_name] for block in results if col_name in block]
+                if not deltas:
+                    continue
+                row_positions = np.concatenate([delta[0] for delta in deltas])
+                new_values = np.concatenate([delta[1] for delta in deltas])
+                steps = np.concatenate([delta[2] for delta in deltas])
+                if only_invalid:
+                    keep = self._invalid_mask(row_positions, col_idx)
+                    row_positions, new_values, steps = (
+                        row_positions[keep],
+                        new_values[keep],
+                        steps[keep],
+                    )
+                rows.append(row_positions)
+                cols.append(np.full(len(row_positions), col_idx, dtype=np.intp))
+                values.append(new_values)
+                stats["total_corrections"] += int(steps.sum())
+
+            if rows:
+                rows = np.concatenate(rows)
+                if len(rows):
+                    self._data_model.apply_cell_values(
+                        rows, np.concatenate(cols), np.concatenate(values)
+                    )
+                stats["corrected_cells"] = len(rows)
+                stats["corrected_rows"] = len(np.unique(rows))
+
+        self._correction_history.append({"stats": stats})
+        logger.info(f"Applied corrections on {pool.workers} processes: {stats}")
+        return stats
+
+    def _invalid_mask(self, row_positions: np.ndarray, col_idx: int) -> np.ndarray:
+        """
+        Select the cells of a column that are marked as invalid or correctable.
+
+        Args:
+            row_positions (np.ndarray): Row positions to check
+            col_idx (int): Column index
+
+        Returns:
+            np.ndarray: Boolean mask over row_positions
+        """
+        allowed = (ValidationStatus.INVALID, ValidationStatus.CORRECTABLE)
+        column_name = self._data_model.column_names[col_idx]
+        column_mask = self._data_model.get_validation_status_mask(column_name, allowed)
+        return column_mask[np.asarray(row_positions, dtype=np.intp)]
+
+    @span_tracer.trace("CorrectionService.apply_single_rule", "correction")
     def apply_single_rule(self, rule: CorrectionRule, only_invalid: bool = False) -> Dict[str, int]:
         """
         Apply a single correction rule to the data.
@@ -269,6 +522,7 @@ class CorrectionService(QObject):
 
         return stats
 
+    @span_tracer.trace("CorrectionService.apply_rule_to_data", "correction")
     def apply_rule_to_data(
         self, rule: CorrectionRule, only_invalid: bool = False, selected_only: List[int] = None
     ) -> List[Tuple[int, int, Any, Any]]:
@@ -313,26 +567,31 @@ class CorrectionService(QObject):
         state_updates = {}
         reset_state = CellFullState(validation_status=CellState.NOT_VALIDATED)
 
-        # Use a copy for multi-cell updates if DataModel updates immediately
-        # If DataModel batches updates, direct modification might be okay.
-        # Assuming direct update via set_cell_value for now.
         successful_applications = 0
-        for row, col, old_value, new_value in corrections_to_apply:
-            try:
-                success = self._data_model.set_cell_value(row, col, new_value)
-                if success:
-                    applied_corrections_info.append((row, col, old_value, new_value))
-                    state_updates[(row, col)] = reset_state
-                    successful_applications += 1
-                else:
-                    logger.warning(
-                        f"Failed to apply correction for rule {rule} at ({row}, {col}) via DataModel."
+        # Stage the cell updates and write them as one batch and one undo step
+        batched = hasattr(self._data_model, "begin_batch")
+        if batched:
+            self._data_model.begin_batch(f"Apply rule {rule.from_value} -> {rule.to_value}")
+        try:
+            for row, col, old_value, new_value in corrections_to_apply:
+                try:
+                    success = self._data_model.set_cell_value(row, col, new_value)
+                    if success:
+                        applied_corrections_info.append((row, col, old_value, new_value))
+                        state_updates[(row, col)] = reset_state
+                        successful_applications += 1
+                    else:
+                        logger.warning(
+                            f"Failed to apply correction for rule {rule} at ({row}, {col}) via DataModel."
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"Error applying correction for rule {rule} at ({row}, {col}): {e}",
+                        exc_info=True,
                     )
-            except Exception as e:
-                logger.error(
-                    f"Error applying correction for rule {rule} at ({row}, {col}): {e}",
-                    exc_info=True,
-                )
+        finally:
+            if batched:
+                self._data_model.commit_batch()
 
         # Update state manager in one batch
         if state_updates and self._state_manager:
@@ -479,6 +738,7 @@ class CorrectionService(QObject):
         """
         return self._case_sensitive
 
+    @span_tracer.trace("CorrectionService.get_cells_with_available_corrections", "correction")
     def get_cells_with_available_corrections(self) -> List[Tuple[int, int]]:
         """
         Get cells that have available correction rules and are currently invalid.
@@ -509,61 +769,65 @@ class CorrectionService(QObject):
             )
             return []
 
-        # Get enabled rules
-        rules = self._rule_manager.get_rules(status="enabled")
-        if not rules:
-            logger.debug("No enabled correction rules available")
-            return []
-
-        # Map column indices to validation status column names
-        col_validation_map = {}
-        for col_idx, col_name in enumerate(data.columns):
-            col_validation_map[col_idx] = f"{col_name}_valid"
-
-        # Check all cells for potential corrections
-        correctable_cells = set()
+        # Check all cells for potential corrections: one vectorized join of each
+        # column against the rule index
+        correctable_cells = []
 
         for col_idx, col_name in enumerate(data.columns):
-            # Get validation status column name
-            validation_col = col_validation_map.get(col_idx)
-
             # Skip if validation status not available for this column
+            validation_col = f"{col_name}_valid"
             if validation_col not in validation_status.columns:
                 continue
 
-            # Get category for this column
+            # Get enabled rules applicable to this column
             col_category = self._get_column_category(col_name)
+            mapping = self._rule_manager.get_correction_mapping(
+                (col_category, "general"), self._case_sensitive
+            )
+            if not mapping:
+                continue
 
-            # Get rules applicable to this column
-            applicable_rules = [
-                r
-                for r in rules
-                if r.category.lower() == col_category or r.category.lower() == "general"
-            ]
+            values = data[col_name]
+            row_count = min(len(values), len(validation_status))
+            values = values.iloc[:row_count]
 
-            # Skip if no applicable rules
-            if not applicable_rules:
-                continue
+            # Only invalid, non-empty cells are candidates
+            invalid = (
+                validation_status[validation_col].iloc[:row_count].to_numpy()
+                == ValidationStatus.INVALID
+            )
+            keys = values.astype(str)
+            if not self._case_sensitive:
+                keys = keys.str.lower()
+            matches = invalid & values.notna().to_numpy() & keys.isin(mapping).to_numpy()
 
-            # Check each cell in this column
-            for row_idx in range(len(data)):
-                # Skip if the cell is not invalid
-                if validation_status.at[row_idx, validation_col] != ValidationStatus.INVALID:
-                    continue
+            correctable_cells.extend((int(row_idx), col_idx) for row_idx in np.flatnonzero(matches))
 
-                cell_value = data.at[row_idx, col_name]
+        if not correctable_cells:
+            logger.debug("No correctable cells found")
 
-                # Skip empty or NaN values
-                if cell_value is None or (isinstance(cell_value, float) and np.isnan(cell_value)):
-                    continue
+        return correctable_cells
 
-                # Check if any rule matches this cell
-                for rule in applicable_rules:
-                    if self._values_match(str(cell_value), str(rule.from_value)):
-                        correctable_cells.add((row_idx, col_idx))
-                        break
+    def has_correction(self, value: Any, column_name: str) -> bool:
+        """
+        Check whether an enabled rule can correct a single value.
 
-        return list(correctable_cells)
+        Args:
+            value: The cell value
+            column_name: Name of the value's column
+
+        Returns:
+            bool: True if a rule for the column's category matches the value
+        """
+        if value is None or pd.isna(value):
+            return False
+        mapping = self._rule_manager.get_correction_mapping(
+            (self._get_column_category(column_name), "general"), self._case_sensitive
+        )
+        if not mapping:
+            return False
+        key = str(value) if self._case_sensitive else str(value).lower()
+        return key in mapping
 
     def _get_column_category(self, column_name: str) -> str:
         """
@@ -692,26 +956,21 @@ class CorrectionService(QObject):
         cell_value_str = str(cell_value)
         col_category = self._get_column_category(col_name)
 
-        # Get enabled rules applicable to this column's category or general
-        rules = self._rule_manager.get_rules(status="enabled")
-        applicable_rules = [
-            r
-            for r in rules
-            if r.category.lower() == col_category or r.category.lower() == "general"
-        ]
+        # Look up enabled rules for this column's category or general in the rule index
+        applicable_rules = self._rule_manager.find_rules(
+            cell_value_str, (col_category, "general"), self._case_sensitive
+        )
 
         for rule in applicable_rules:
-            # Check if the rule's from_value matches the cell value
-            if self._values_match(cell_value_str, str(rule.from_value)):
-                # Add suggestion based on this rule
-                suggestion = {
-                    "original": cell_value_str,
-                    "corrected": rule.to_value,
-                    "rule_id": getattr(rule, "id", None),  # Assuming rule has an ID
-                    "category": rule.category,
-                    # Add confidence score if available/relevant
-                }
-                suggestions.append(suggestion)
+            # Add suggestion based on this rule
+            suggestion = {
+                "original": cell_value_str,
+                "corrected": rule.to_value,
+                "rule_id": getattr(rule, "id", None),  # Assuming rule has an ID
+                "category": rule.category,
+                # Add confidence score if available/relevant
+            }
+            suggestions.append(suggestion)
 
         return suggestions
 
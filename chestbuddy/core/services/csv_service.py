@@ -10,13 +10,17 @@ import io
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Any, Callable
 
+import numpy as np
 import pandas as pd
-import chardet
-from charset_normalizer import detect
-from ftfy import fix_text
+from pandas._libs.parsers import STR_NA_VALUES
 
 from chestbuddy.utils.config import ConfigManager
-from chestbuddy.utils.background_processing import BackgroundWorker, BackgroundTask
+from chestbuddy.utils.background_processing import (
+    BackgroundTask,
+    BackgroundWorker,
+    file_fingerprint,
+)
+from chestbuddy.utils.span_tracer import span_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -49,6 +53,33 @@ BOM_MARKERS = {
     b"\xff\xfe\x00\x00": "utf-32le",  # UTF-32 Little Endian
 }
 
+# Block size of the Arrow CSV reader; progress is reported once per block
+ARROW_BLOCK_SIZE = 4 << 20
+
+# Cells read as missing by both readers: the strings pandas.read_csv treats as NaN
+ARROW_NULL_VALUES = sorted(STR_NA_VALUES)
+
+# pyarrow.csv once imported, False if pyarrow is not installed
+_arrow_csv = None
+
+
+def _load_arrow_csv():
+    """
+    Import pyarrow's CSV reader on first use.
+
+    Returns:
+        The pyarrow.csv module, or None if pyarrow is not installed
+    """
+    global _arrow_csv
+    if _arrow_csv is None:
+        try:
+            import pyarrow.csv as arrow_csv
+        except ImportError:
+            arrow_csv = False
+        _arrow_csv = arrow_csv
+    return _arrow_csv or None
+
+
 # Japanese character sets for detection
 JAPANESE_CHARS = {
     "hiragana": range(0x3040, 0x309F),
@@ -152,6 +183,7 @@ class CSVService:
         """Initialize the CSVService."""
         self._config = ConfigManager()
 
+    @span_tracer.trace("CSVService.read_csv", "io")
     def read_csv(
         self,
         file_path: Union[str, Path],
@@ -357,6 +389,7 @@ class CSVService:
             logger.error(f"Error in read_csv: {e}")
             return None, f"Error processing CSV file. Error: {e}"
 
+    @span_tracer.trace("CSVService.write_csv", "io")
     def write_csv(
         self, file_path: Union[str, Path], data: pd.DataFrame, encoding: str = "utf-8"
     ) -> Tuple[bool, Optional[str]]:
@@ -462,6 +495,10 @@ class CSVService:
                     except UnicodeDecodeError:
                         continue
 
+            # Detection libraries are imported lazily to keep application startup fast
+            import chardet
+            from charset_normalizer import detect
+
             # Try charset_normalizer first (better for international)
             result = detect(raw_data)
             if result and result.get("encoding"):
@@ -521,6 +558,7 @@ class CSVService:
             logger.error(f"Error detecting BOM: {e}")
             return None
 
+    @span_tracer.trace("CSVService.normalize_text", "io")
     def _normalize_dataframe_text(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize text in a DataFrame to fix encoding issues.
@@ -555,7 +593,9 @@ class CSVService:
             The normalized text.
         """
         try:
-            # Use ftfy for general text fixing
+            # Use ftfy for general text fixing (imported lazily, it is slow to import)
+            from ftfy import fix_text
+
             fixed = fix_text(text)
 
             # Special handling for common issues not fully handled by ftfy
@@ -716,7 +756,8 @@ class CSVService:
             encoding: Optional encoding to use (auto-detected if None)
             normalize_text: Whether to normalize text in the CSV
             robust_mode: Whether to use robust mode for reading
-            progress_callback: Optional callback function for progress reporting
+            progress_callback: Optional callback function for progress reporting;
+                returning False cancels the read
 
         Returns:
             A tuple containing (DataFrame, error_message)
@@ -739,6 +780,14 @@ class CSVService:
                 if not encoding:
                     encoding = "utf-8"  # Default to UTF-8 if detection fails
 
+            # Parse with Arrow when available; malformed files use the pandas path below
+            if _load_arrow_csv() is not None:
+                result = self._read_csv_arrow(
+                    file_path, encoding, normalize_text, progress_callback
+                )
+                if result is not None:
+                    return result
+
             # Get file size for progress tracking
             file_size = file_path.stat().st_size
 
@@ -796,7 +845,7 @@ class CSVService:
                     if progress_callback:
                         # Use file position for better progress tracking
                         progress_percent = min(99, int((processed_bytes / file_size) * 100))
-                        if not progress_callback(progress_percent, 100):
+                        if progress_callback(progress_percent, 100) is False:
                             # Callback returned False, indicating cancellation
                             return None, "CSV reading cancelled by progress callback"
 
@@ -819,6 +868,122 @@ class CSVService:
             logger.error(f"Error reading CSV: {e}")
             return None, str(e)
 
+    @span_tracer.trace("CSVService.read_csv_arrow", "io")
+    def _read_csv_arrow(
+        self,
+        file_path: Path,
+        encoding: str,
+        normalize_text: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Optional[Tuple[pd.DataFrame, Optional[str]]]:
+        """
+        Read a CSV file with pyarrow's multithreaded block reader.
+
+        The file is memory-mapped and parsed block by block into dictionary-encoded
+        Arrow string columns, so each distinct value is decoded, normalized and
+        turned into a Python string once. The result matches the pandas path:
+        all columns hold strings, with NaN for empty cells.
+
+        Args:
+            file_path: Path to the CSV file
+            encoding: Encoding of the file
+            normalize_text: Whether to normalize text in the CSV
+            progress_callback: Optional callback receiving (percent, 100) after each block;
+                returning False cancels the read
+
+        Returns:
+            A tuple containing (DataFrame, error_message), or None if the file is
+            malformed and should be read by the pandas path
+        """
+        arrow_csv = _load_arrow_csv()
+        import pyarrow as pa
+
+        # Arrow decodes UTF-8 natively and skips its BOM; other encodings are transcoded
+        is_utf8 = encoding.lower().replace("_", "-") in ("utf-8", "utf8", "utf-8-sig")
+        header_encoding = "utf-8-sig" if is_utf8 else encoding
+        try:
+            with open(file_path, "r", encoding=header_encoding, newline="") as f:
+                columns = next(csv.reader(f), None)
+        except (UnicodeError, csv.Error) as e:
+            logger.info(f"Arrow reader cannot read the header of {file_path.name}: {e}")
+            return None
+        if not columns:
+            return pd.DataFrame(), None
+        if len(set(columns)) != len(columns):
+            # pandas renames duplicate columns, Arrow would keep them
+            return None
+
+        text_type = pa.dictionary(pa.int32(), pa.string())
+        read_options = arrow_csv.ReadOptions(
+            use_threads=True,
+            block_size=ARROW_BLOCK_SIZE,
+            encoding="utf8" if is_utf8 else encoding,
+        )
+        # Arrow's default null markers differ from pandas' (e.g. "None", "<NA>")
+        convert_options = arrow_csv.ConvertOptions(
+            column_types={name: text_type for name in columns},
+            null_values=ARROW_NULL_VALUES,
+            strings_can_be_null=True,
+        )
+
+        file_size = max(file_path.stat().st_size, 1)
+        batches = []
+        try:
+            with pa.memory_map(str(file_path), "r") as source:
+                reader = arrow_csv.open_csv(
+                    source, read_options=read_options, convert_options=convert_options
+                )
+                if progress_callback:
+                    progress_callback(0, 100)
+                for batch in reader:
+                    batches.append(batch)
+                    if progress_callback:
+                        progress_percent = min(99, int(source.tell() / file_size * 100))
+                        if progress_callback(progress_percent, 100) is False:
+                            return None, "CSV reading cancelled by progress callback"
+                schema = reader.schema
+        except (pa.ArrowException, UnicodeError) as e:
+            logger.info(f"Arrow reader rejected {file_path.name}, using pandas: {e}")
+            return None
+
+        table = pa.Table.from_batches(batches, schema=schema).unify_dictionaries()
+        data = {}
+        for name, column in zip(table.column_names, table.columns):
+            data[name] = self._arrow_column_to_object(column, normalize_text)
+        df = pd.DataFrame(data, columns=table.column_names)
+
+        if progress_callback:
+            progress_callback(100, 100)
+        logger.info(f"Read {len(df)} rows from {file_path.name} with the Arrow reader")
+        return df, None
+
+    def _arrow_column_to_object(self, column: Any, normalize_text: bool) -> np.ndarray:
+        """
+        Convert a dictionary-encoded Arrow column to an object array of strings.
+
+        Args:
+            column: ChunkedArray of dictionary-encoded strings with unified dictionaries
+            normalize_text: Whether to normalize the distinct values
+
+        Returns:
+            np.ndarray: Object array with NaN for null values
+        """
+        import pyarrow as pa
+
+        if column.num_chunks == 0:
+            return np.empty(0, dtype=object)
+        if not pa.types.is_dictionary(column.type):
+            column = column.cast(pa.string()).dictionary_encode()
+        array = column.combine_chunks()
+        values = array.dictionary.to_numpy(zero_copy_only=False).astype(object)
+        if normalize_text:
+            values = np.array([self._normalize_text(value) for value in values], dtype=object)
+        # Null cells get code -1, which takes the NaN appended to the values
+        values = np.append(values, np.nan)
+        codes = array.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return values.take(codes)
+
+    @span_tracer.trace("CSVService.read_csv_chunked", "io")
     def read_csv_chunked(
         self,
         file_path: Union[str, Path],
@@ -901,7 +1066,7 @@ class CSVService:
         )
 
         # Create a worker
-        worker = BackgroundWorker()
+        worker = BackgroundWorker(task_type="csv_read")
 
         # Connect the task's progress signal to the callback if provided
         if progress_callback:
@@ -912,8 +1077,13 @@ class CSVService:
             worker.finished.connect(lambda result: finished_callback(result[0], result[1]))
             worker.error.connect(lambda error: finished_callback(None, str(error)))
 
-        # Execute the task
-        worker.execute_task(task)
+        # Execute the task; an identical read still queued elsewhere is shared
+        worker.execute_task(
+            task,
+            fingerprint=file_fingerprint(
+                [file_path], chunk_size, encoding, normalize_text, robust_mode
+            ),
+        )
 
         # Return the worker so the caller can connect to signals or cancel
         return worker
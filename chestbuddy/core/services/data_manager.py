@@ -7,6 +7,7 @@ Usage:
     data_manager.load_csv(file_path)
 """
 
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -16,8 +17,16 @@ import pandas as pd
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QApplication
 
+from chestbuddy.core.storage import DatasetStore, storage_available
 from chestbuddy.utils.config import ConfigManager
-from chestbuddy.utils.background_processing import BackgroundWorker, MultiCSVLoadTask
+from chestbuddy.utils.background_processing import (
+    BackgroundWorker,
+    FunctionTask,
+    MultiCSVLoadTask,
+    file_fingerprint,
+)
+from chestbuddy.utils.task_scheduler import TaskPriority
+from chestbuddy.utils.span_tracer import span_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -43,6 +52,8 @@ class DataManager(QObject):
         - Updates data model with file contents
         - Tracks recent files
         - Maps file columns to data model columns
+        - Imports single files above the Storage/out_of_core_threshold_mb setting
+          to an out-of-core dataset when DuckDB is installed
     """
 
     # Define signals
@@ -80,7 +91,7 @@ class DataManager(QObject):
 
         # Initialize config and background worker
         self._config = ConfigManager()
-        self._worker = BackgroundWorker()
+        self._worker = BackgroundWorker(priority=TaskPriority.INTERACTIVE, task_type="csv_load")
 
         # Connect worker signals
         self._worker.task_completed.connect(self._on_background_task_completed)
@@ -91,6 +102,7 @@ class DataManager(QObject):
         # Set up additional signal connections
         self._connect_signals()
 
+    @span_tracer.trace("DataManager.load_csv", "data")
     def load_csv(self, file_paths: Union[str, List[str]]) -> None:
         """
         Load CSV data from one or more files.
@@ -116,6 +128,12 @@ class DataManager(QObject):
             self.load_error.emit("No files selected for loading")
             return
 
+        # Loading the same unchanged files again joins the load in flight
+        fingerprint = file_fingerprint(file_paths)
+        if self._worker.is_duplicate(fingerprint):
+            logger.info("The same files are already loading, ignoring the repeated request")
+            return
+
         # Store the files to load for progress tracking
         self._files_to_load = file_paths.copy()
         logger.debug(f"Set files_to_load with {len(self._files_to_load)} files")
@@ -141,18 +159,25 @@ class DataManager(QObject):
 
         # Create the task
         try:
-            logger.debug(f"Creating MultiCSVLoadTask for {len(file_paths)} files")
-            task = MultiCSVLoadTask(
-                csv_service=self._csv_service,
-                file_paths=file_paths,
-                chunk_size=100,  # Use smaller chunk size for more granular progress updates
-                normalize_text=True,
-                robust_mode=True,
-            )
+            if self._should_import_dataset(file_paths):
+                dataset_path = self._dataset_path(file_paths[0], fingerprint)
+                logger.debug(f"Creating dataset import task for {dataset_path}")
+                task = FunctionTask(
+                    self._import_dataset, (file_paths[0], dataset_path), task_id="import_dataset"
+                )
+            else:
+                logger.debug(f"Creating MultiCSVLoadTask for {len(file_paths)} files")
+                task = MultiCSVLoadTask(
+                    csv_service=self._csv_service,
+                    file_paths=file_paths,
+                    chunk_size=100,  # Use smaller chunk size for more granular progress updates
+                    normalize_text=True,
+                    robust_mode=True,
+                )
 
-            # Connect progress signals to forward them to the UI
-            task.progress.connect(self._on_load_progress)
-            task.file_progress.connect(self._on_file_progress)
+                # Connect progress signals to forward them to the UI
+                task.progress.connect(self._on_load_progress)
+                task.file_progress.connect(self._on_file_progress)
             task.status_signal.connect(lambda status: logger.debug(f"Task status: {status}"))
 
             # Store the task for potential cancellation
@@ -165,7 +190,7 @@ class DataManager(QObject):
 
             # Execute the task in the background
             logger.debug(f"Executing MultiCSVLoadTask")
-            self._worker.execute_task(task)
+            self._worker.execute_task(task, fingerprint=fingerprint)
         except Exception as e:
             logger.error(f"Error setting up CSV loading task: {e}", exc_info=True)
             # Unblock signals if error occurs
@@ -174,6 +199,73 @@ class DataManager(QObject):
             self.load_error.emit(f"Error setting up CSV loading: {str(e)}")
             self.load_finished.emit(f"Error: {str(e)}")
 
+    def _should_import_dataset(self, file_paths: List[str]) -> bool:
+        """
+        Check whether a load should go to an out-of-core dataset.
+
+        Args:
+            file_paths: Paths of the files to load
+
+        Returns:
+            bool: True for a single file above the size threshold when DuckDB is installed
+        """
+        if len(file_paths) != 1 or not storage_available():
+            return False
+        threshold_mb = self._config.get_int("Storage", "out_of_core_threshold_mb", 0)
+        if threshold_mb <= 0:
+            return False
+        try:
+            size = os.path.getsize(file_paths[0])
+        except OSError:
+            return False
+        return size > threshold_mb * 1024 * 1024
+
+    def _dataset_path(self, file_path: str, fingerprint: Tuple) -> Path:
+        """
+        Get the Parquet file a CSV file is imported to.
+
+        The name includes a digest of the file's fingerprint, so an unchanged
+        file reuses its earlier import and an edited one is imported again.
+
+        Args:
+            file_path: Path of the CSV file
+            fingerprint: The file's fingerprint from file_fingerprint()
+
+        Returns:
+            Path: Location of the dataset
+        """
+        dataset_dir = self._config.get_path("Storage", "dataset_dir") or Path(file_path).parent
+        digest = hashlib.sha1(repr(fingerprint).encode("utf-8")).hexdigest()[:16]
+        return dataset_dir / f"{Path(file_path).stem}-{digest}.parquet"
+
+    @staticmethod
+    def _import_dataset(file_path: str, dataset_path: Path) -> Tuple[bool, Any]:
+        """
+        Open the out-of-core dataset of a CSV file, importing the file first if needed.
+
+        Runs on a worker thread. Text is stored as read; the normalization of
+        the in-memory loader is not applied.
+
+        Args:
+            file_path: Path of the CSV file
+            dataset_path: Parquet file from _dataset_path()
+
+        Returns:
+            Tuple[bool, Any]: (True, DatasetStore) or (False, error message)
+        """
+        from chestbuddy.core.models.chest_data_model import ChestDataModel
+
+        try:
+            if dataset_path.exists():
+                logger.info(f"Reusing imported dataset {dataset_path}")
+                return True, DatasetStore(dataset_path)
+            return True, DatasetStore.import_csv(
+                file_path, dataset_path, canonical_columns=ChestDataModel.EXPECTED_COLUMNS
+            )
+        except Exception as e:
+            logger.error(f"Error importing {file_path} as a dataset: {e}", exc_info=True)
+            return False, f"Error importing {file_path}: {e}"
+
     def cancel_loading(self) -> None:
         """Cancel any ongoing loading operation."""
         logger.info("DataManager.cancel_loading called")
@@ -271,6 +363,7 @@ class DataManager(QObject):
         # Emit finished signal with cancellation message
         self.load_finished.emit("Operation cancelled by user")
 
+    @span_tracer.trace("DataManager.load_multiple_files", "data")
     def _load_multiple_files(self, file_paths: List[str]) -> Tuple[pd.DataFrame, str]:
         """
         Load multiple CSV files and combine them into a single DataFrame.
@@ -326,6 +419,7 @@ class DataManager(QObject):
             logger.error(f"Error combining DataFrames: {e}")
             return None, f"Error combining files: {str(e)}"
 
+    @span_tracer.trace("DataManager.on_csv_load_success", "data")
     def _on_csv_load_success(self, result_tuple: Tuple[pd.DataFrame, str]):
         """
         Handle successful CSV load from background thread.
@@ -437,6 +531,32 @@ class DataManager(QObject):
             self.load_error.emit(f"Error processing CSV data: {str(e)}")
             self.load_finished.emit(f"Error: {str(e)}")
 
+    def _on_dataset_load_success(self, dataset: DatasetStore) -> None:
+        """
+        Attach an imported out-of-core dataset to the data model.
+
+        Args:
+            dataset: The opened dataset
+        """
+        logger.info(f"Dataset loaded with {dataset.row_count} rows")
+        if self._data_model.signalsBlocked():
+            self._data_model.blockSignals(False)
+        if self._current_file_path:
+            self._update_recent_files(self._current_file_path)
+
+        success_message = f"Successfully loaded {dataset.row_count:,} rows of data"
+        self.load_finished.emit(success_message)
+        try:
+            self._data_model.attach_dataset(dataset)
+        except Exception as e:
+            logger.error(f"Error attaching dataset: {e}", exc_info=True)
+            dataset.close()
+            self.load_error.emit(f"Error updating data model: {str(e)}")
+            return
+
+        self.data_loaded.emit()
+        self.load_success.emit(success_message)
+
     def _update_recent_files(self, file_path: str) -> None:
         """
         Update the list of recent files.
@@ -502,6 +622,7 @@ class DataManager(QObject):
 
         return valid_files
 
+    @span_tracer.trace("DataManager.map_columns", "data")
     def _map_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Map DataFrame columns to the expected column names.
@@ -558,6 +679,7 @@ class DataManager(QObject):
 
         return result
 
+    @span_tracer.trace("DataManager.save_csv", "data")
     def save_csv(self, file_path: str) -> bool:
         """
         Save data model to a CSV file.
@@ -625,7 +747,9 @@ class DataManager(QObject):
         # If it's a MultiCSVLoadTask, the result will be from the CSV load operation
         if isinstance(result, tuple) and len(result) == 2:
             success, data_or_error = result
-            if success and isinstance(data_or_error, pd.DataFrame):
+            if success and isinstance(data_or_error, DatasetStore):
+                self._on_dataset_load_success(data_or_error)
+            elif success and isinstance(data_or_error, pd.DataFrame):
                 # Handle successful CSV load
                 self._on_csv_load_success((data_or_error, None))
             else:
@@ -0,0 +1,486 @@
+"""
+query_service.py
+
+Description: Ad-hoc analytical queries over the loaded chest data, run in the background and cached.
+Usage:
+    query_service = QueryService(data_model, csv_service)
+
+    spec = QuerySpec(group_by=("PLAYER", "SOURCE"), value_column="SCORE", time_bucket="week")
+    handle = query_service.submit(spec)
+    handle.finished.connect(show_result)
+    handle.cancel()
+
+    # SQL over the table chest_data, if DuckDB is installed
+    result = query_service.run("SELECT PLAYER, count(*) FROM chest_data GROUP BY 1")
+    query_service.export(result, "report.csv")
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple, Union
+
+import pandas as pd
+from PySide6.QtCore import QObject, Slot
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.csv_service import CSVService
+from chestbuddy.core.storage import DatasetStore
+from chestbuddy.core.storage import dataset_store
+from chestbuddy.utils.span_tracer import span_tracer
+from chestbuddy.utils.task_scheduler import (
+    CancellationToken,
+    TaskHandle,
+    TaskPriority,
+    TaskScheduler,
+)
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+AGGREGATES = ("sum", "count", "mean", "min", "max")
+TIME_BUCKETS = ("day", "week", "month")
+FILTER_MODES = ("Contains", "Equals", "Starts with", "Ends with")
+
+Query = Union["QuerySpec", str]
+
+
+class QueryError(RuntimeError):
+    """Raised when a query cannot be run."""
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """
+    Declarative group / filter / pivot query.
+
+    Attributes:
+        group_by: Columns to group by, in order
+        value_column: Column to aggregate, None to count rows
+        aggregate: One of 'sum', 'count', 'mean', 'min' or 'max'
+        pivot_column: Column whose values become result columns, or None
+        filters: (column, mode, text) filters combined with AND; mode is one
+            of 'Contains', 'Equals', 'Starts with' or 'Ends with'
+        time_bucket: 'day', 'week' or 'month' to group dates by period, or None
+        date_column: Column that time_bucket applies to
+        case_sensitive: Whether filters match case
+    """
+
+    group_by: Tuple[str, ...] = ()
+    value_column: Optional[str] = None
+    aggregate: str = "sum"
+    pivot_column: Optional[str] = None
+    filters: Tuple[Tuple[str, str, str], ...] = ()
+    time_bucket: Optional[str] = None
+    date_column: str = "DATE"
+    case_sensitive: bool = False
+
+
+class QueryTask:
+    """
+    Background task running one query on a snapshot of the data.
+
+    Attributes:
+        task_id (str): Identifier used by the task scheduler
+        token (CancellationToken): Set when the task is cancelled
+    """
+
+    def __init__(self, service: "QueryService", query: Query, source: Any, fingerprint: Hashable):
+        """
+        Initialize the task.
+
+        Args:
+            service: Service executing the query and holding the cache
+            query: QuerySpec or SQL text
+            source: DataFrame snapshot or DatasetStore to query
+            fingerprint: Fingerprint of the data the snapshot was taken from
+        """
+        self.task_id = f"query-{id(self)}"
+        self.token = CancellationToken()
+        self._service = service
+        self._query = query
+        self._source = source
+        self._fingerprint = fingerprint
+
+    def run(self) -> Optional[pd.DataFrame]:
+        """
+        Run the query, or return the cached result.
+
+        Returns:
+            Optional[pd.DataFrame]: The result, None if cancelled
+        """
+        return self._service._execute(self._query, self._source, self._fingerprint, self.token)
+
+    def cancel(self) -> None:
+        """Request cancellation; a running DuckDB query is interrupted."""
+        self.token.cancel()
+
+
+class QueryService(QObject):
+    """
+    Runs ad-hoc analytical queries over the loaded data.
+
+    Queries are either a declarative QuerySpec, evaluated with pandas, or SQL
+    over the table ``chest_data``, evaluated with embedded DuckDB when it is
+    installed. Out-of-core datasets are always queried through DuckDB.
+    Results are cached per data fingerprint and query, so repeating a query
+    on unchanged data returns immediately.
+
+    Attributes:
+        _data_model (ChestDataModel): The data model to query
+        _csv_service (CSVService): Service used to export results
+        _cache (OrderedDict): LRU cache of results keyed by (fingerprint, query)
+
+    Implementation Notes:
+        - Queries run on a snapshot taken when they are submitted, so edits made
+          while a query runs do not affect it
+        - The fingerprint combines a counter of data changes with the data hash;
+          pending change notifications are flushed before it is read
+        - Cancelled DuckDB queries are interrupted; pandas queries stop at the
+          next step
+    """
+
+    def __init__(
+        self,
+        data_model: ChestDataModel,
+        csv_service: Optional[CSVService] = None,
+        scheduler: Optional[TaskScheduler] = None,
+        cache_size: int = 16,
+    ):
+        """
+        Initialize the query service.
+
+        Args:
+            data_model: The data model to query
+            csv_service: Service used to export results, a new one if None
+            scheduler: Scheduler for background queries, the shared one if None
+            cache_size: Number of results kept in the cache
+        """
+        super().__init__()
+        self._data_model = data_model
+        self._csv_service = csv_service or CSVService()
+        self._scheduler = scheduler
+        self._cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[Tuple[Hashable, Query], pd.DataFrame]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+
+        if hasattr(data_model, "data_changed"):
+            data_model.data_changed.connect(self._on_data_changed)
+        if hasattr(data_model, "data_cleared"):
+            data_model.data_cleared.connect(self._on_data_changed)
+
+    @staticmethod
+    def sql_available() -> bool:
+        """
+        Check whether SQL queries can be run.
+
+        Returns:
+            bool: True if DuckDB is installed
+        """
+        return dataset_store.duckdb is not None
+
+    def fingerprint(self) -> Hashable:
+        """
+        Get the fingerprint of the current data.
+
+        Returns:
+            Hashable: Changes whenever the data changes
+        """
+        if hasattr(self._data_model, "flush_notifications"):
+            self._data_model.flush_notifications()
+        dataset = getattr(self._data_model, "dataset", None)
+        if isinstance(dataset, DatasetStore):
+            return (self._generation, str(dataset.path), dataset.row_count)
+        return (self._generation, self._data_model.data_hash)
+
+    def submit(
+        self, query: Query, priority: Union[TaskPriority, int] = TaskPriority.INTERACTIVE
+    ) -> TaskHandle:
+        """
+        Run a query in the background.
+
+        Args:
+            query: QuerySpec or SQL text
+            priority: Scheduling priority
+
+        Returns:
+            TaskHandle: Handle emitting finished(DataFrame), error or cancelled
+        """
+        fingerprint = self.fingerprint()
+        task = QueryTask(self, query, self._snapshot(query, fingerprint), fingerprint)
+        scheduler = self._scheduler or TaskScheduler.instance()
+        return scheduler.submit(
+            task, task_type="query", fingerprint=(fingerprint, query), priority=priority
+        )
+
+    def run(self, query: Query) -> pd.DataFrame:
+        """
+        Run a query in the calling thread.
+
+        Args:
+            query: QuerySpec or SQL text
+
+        Returns:
+            pd.DataFrame: The result
+
+        Raises:
+            QueryError: If the query is invalid or SQL is not available
+        """
+        fingerprint = self.fingerprint()
+        return self._execute(
+            query, self._snapshot(query, fingerprint), fingerprint, CancellationToken()
+        )
+
+    def cached_result(self, query: Query) -> Optional[pd.DataFrame]:
+        """
+        Get the cached result of a query on the current data.
+
+        Args:
+            query: QuerySpec or SQL text
+
+        Returns:
+            Optional[pd.DataFrame]: The cached result, or None
+        """
+        with self._cache_lock:
+            return self._cache.get((self.fingerprint(), query))
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def export(
+        self, result: pd.DataFrame, file_path: Union[str, Path]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Export a query result as CSV.
+
+        Args:
+            result: The query result
+            file_path: Path of the CSV file
+
+        Returns:
+            Tuple[bool, Optional[str]]: Success flag and error message
+        """
+        return self._csv_service.write_csv(file_path, result)
+
+    @Slot(object)
+    def _on_data_changed(self, data_state=None) -> None:
+        """Start a new data generation; cached results of older ones are not reused."""
+        self._generation += 1
+
+    # --- Execution --- #
+
+    def _snapshot(self, query: Query, fingerprint: Hashable) -> Any:
+        """Get the data a query runs on; None if its result is already cached."""
+        with self._cache_lock:
+            if (fingerprint, query) in self._cache:
+                return None
+        dataset = getattr(self._data_model, "dataset", None)
+        if isinstance(dataset, DatasetStore):
+            return dataset
+        return self._data_model.data
+
+    def _execute(
+        self, query: Query, source: Any, fingerprint: Hashable, token: CancellationToken
+    ) -> Optional[pd.DataFrame]:
+        """
+        Run a query on a snapshot, using and filling the cache.
+
+        Args:
+            query: QuerySpec or SQL text
+            source: DataFrame snapshot, DatasetStore, or None if the result is cached
+            fingerprint: Fingerprint of the data the snapshot was taken from
+            token: Cancellation token
+
+        Returns:
+            Optional[pd.DataFrame]: The result, None if cancelled
+        """
+        key = (fingerprint, query)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                logger.debug("Query result served from cache")
+                return cached
+        if source is None:
+            source = self._snapshot(query, None)
+
+        with span_tracer.span("QueryService.execute", "query"):
+            if isinstance(query, QuerySpec) and isinstance(source, pd.DataFrame):
+                result = self._run_spec(source, query, token)
+            else:
+                sql = query if isinstance(query, str) else self._spec_to_sql(query, source)
+                result = self._run_sql(sql, source, token)
+                if isinstance(query, QuerySpec) and result is not None and query.pivot_column:
+                    result = self._pivot(result, query)
+
+        if result is None or token.is_cancelled:
+            return None
+        with self._cache_lock:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        logger.info(f"Query returned {len(result)} rows")
+        return result
+
+    def _run_spec(
+        self, df: pd.DataFrame, spec: QuerySpec, token: CancellationToken
+    ) -> Optional[pd.DataFrame]:
+        """Evaluate a QuerySpec with pandas."""
+        self._check_spec(spec, df.columns)
+
+        for column, mode, text in spec.filters:
+            values = df[column].astype(str)
+            if not spec.case_sensitive:
+                values, text = values.str.lower(), text.lower()
+            if mode == "Contains":
+                mask = values.str.contains(text, regex=False)
+            elif mode == "Starts with":
+                mask = values.str.startswith(text)
+            elif mode == "Ends with":
+                mask = values.str.endswith(text)
+            else:
+                mask = values == text
+            df = df[mask.fillna(False)]
+        if token.is_cancelled:
+            return None
+
+        keys = []
+        for column in spec.group_by:
+            if spec.time_bucket and column == spec.date_column:
+                keys.append(self._bucket_dates(df[column], spec.time_bucket))
+            else:
+                keys.append(df[column])
+        if spec.pivot_column:
+            keys.append(df[spec.pivot_column])
+
+        if spec.value_column is None:
+            values, func = pd.Series(1, index=df.index, name="value"), "sum"
+        elif spec.aggregate == "count":
+            values, func = df[spec.value_column].rename("value"), "count"
+        else:
+            values = pd.to_numeric(df[spec.value_column], errors="coerce").rename("value")
+            func = spec.aggregate
+        if token.is_cancelled:
+            return None
+
+        if keys:
+            result = values.groupby(keys, sort=True, dropna=False).agg(func).reset_index()
+        else:
+            result = pd.DataFrame({"value": [values.agg(func)]})
+        if token.is_cancelled:
+            return None
+        return self._pivot(result, spec) if spec.pivot_column else result
+
+    def _run_sql(self, sql: str, source: Any, token: CancellationToken) -> Optional[pd.DataFrame]:
+        """Evaluate SQL with DuckDB over a DataFrame snapshot or a dataset."""
+        duckdb = dataset_store.duckdb
+        if duckdb is None:
+            raise QueryError("SQL queries require DuckDB (pip install chestbuddy[storage])")
+
+        con = duckdb.connect()
+        token.on_cancel(con.interrupt)
+        try:
+            if isinstance(source, DatasetStore):
+                source_path = source.path / "*.parquet" if source.path.is_dir() else source.path
+                con.execute(
+                    "CREATE VIEW chest_data AS SELECT * EXCLUDE "
+                    f"({dataset_store.ROW_ID}) FROM read_parquet("
+                    f"{dataset_store._literal(source_path)})"
+                )
+            else:
+                # DuckDB scans the frame in place instead of copying it
+                con.register("chest_data", source)
+            return con.execute(sql).df()
+        except Exception as e:
+            if token.is_cancelled:
+                return None
+            raise QueryError(f"Query failed: {e}") from e
+        finally:
+            con.close()
+
+    def _spec_to_sql(self, spec: QuerySpec, source: Any) -> str:
+        """Translate a QuerySpec for a dataset into SQL over chest_data."""
+        columns = source.column_names if isinstance(source, DatasetStore) else source.columns
+        self._check_spec(spec, columns)
+
+        ident = dataset_store._identifier
+        keys = []
+        for column in spec.group_by + ((spec.pivot_column,) if spec.pivot_column else ()):
+            if spec.time_bucket and column == spec.date_column:
+                keys.append(
+                    f"date_trunc('{spec.time_bucket}', TRY_CAST({ident(column)} AS DATE)) "
+                    f"AS {ident(column)}"
+                )
+            else:
+                keys.append(ident(column))
+
+        if spec.value_column is None:
+            measure = "count(*)"
+        elif spec.aggregate == "count":
+            measure = f"count({ident(spec.value_column)})"
+        else:
+            func = "avg" if spec.aggregate == "mean" else spec.aggregate
+            measure = f"{func}(TRY_CAST({ident(spec.value_column)} AS DOUBLE))"
+
+        conditions = []
+        for column, mode, text in spec.filters:
+            value = f"CAST({ident(column)} AS VARCHAR)"
+            if not spec.case_sensitive:
+                value, text = f"lower({value})", text.lower()
+            literal = dataset_store._literal(text)
+            conditions.append(
+                {
+                    "Contains": f"contains({value}, {literal})",
+                    "Starts with": f"starts_with({value}, {literal})",
+                    "Ends with": f"ends_with({value}, {literal})",
+                }.get(mode, f"{value} = {literal}")
+            )
+
+        sql = f"SELECT {', '.join(keys + [f'{measure} AS value'])} FROM chest_data"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if keys:
+            positions = ", ".join(str(i + 1) for i in range(len(keys)))
+            sql += f" GROUP BY {positions} ORDER BY {positions}"
+        return sql
+
+    @staticmethod
+    def _check_spec(spec: QuerySpec, columns) -> None:
+        """Raise QueryError if a QuerySpec does not fit the data."""
+        referenced = list(spec.group_by) + [column for column, _, _ in spec.filters]
+        referenced += [c for c in (spec.value_column, spec.pivot_column) if c]
+        missing = [column for column in referenced if column not in columns]
+        if missing:
+            raise QueryError(f"Unknown columns: {', '.join(missing)}")
+        if spec.aggregate not in AGGREGATES:
+            raise QueryError(f"Unsupported aggregate: {spec.aggregate}")
+        if spec.time_bucket is not None and spec.time_bucket not in TIME_BUCKETS:
+            raise QueryError(f"Unsupported time bucket: {spec.time_bucket}")
+        if any(mode not in FILTER_MODES for _, mode, _ in spec.filters):
+            raise QueryError("Unsupported filter mode")
+
+    @staticmethod
+    def _bucket_dates(dates: pd.Series, bucket: str) -> pd.Series:
+        """Map dates to the start of their day, ISO week or month."""
+        parsed = pd.to_datetime(dates, errors="coerce")
+        if bucket == "day":
+            return parsed.dt.normalize()
+        period = "W-SUN" if bucket == "week" else "M"
+        return parsed.dt.to_period(period).dt.start_time
+
+    @staticmethod
+    def _pivot(result: pd.DataFrame, spec: QuerySpec) -> pd.DataFrame:
+        """Turn the values of the pivot column into result columns."""
+        index = list(spec.group_by)
+        values = result.set_index(index + [spec.pivot_column])["value"]
+        if index:
+            pivoted = values.unstack(spec.pivot_column).reset_index()
+        else:
+            pivoted = values.to_frame().T.reset_index(drop=True)
+        pivoted.columns = [str(column) for column in pivoted.columns]
+        return pivoted
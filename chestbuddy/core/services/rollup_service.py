@@ -0,0 +1,593 @@
+"""
+rollup_service.py
+
+Description: Dense player, clan and chest type score rollups with time-window queries.
+Usage:
+    rollup_service = RollupService(data_model)
+
+    top_players = rollup_service.leaderboard("player", limit=10)
+    weekly_points = rollup_service.trend("week", player="Ann")
+    chests = rollup_service.chest_counts(start="2024-01-01", end="2024-01-31")
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QObject, Signal, Slot
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.storage import DatasetStore
+from chestbuddy.utils.span_tracer import span_tracer
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+DateLike = Any  # str, datetime, pd.Timestamp or np.datetime64
+
+
+class _Codes:
+    """Stable integer codes for the distinct values of a column."""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.names: List[str] = list(values)
+        self.lookup: Dict[str, int] = {name: code for code, name in enumerate(self.names)}
+
+    def code(self, value: str) -> int:
+        """Get the code of a value, adding it if it is new."""
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.names)
+            self.names.append(value)
+            self.lookup[value] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class RollupService(QObject):
+    """
+    Precomputed score and chest count aggregates for leaderboards and trends.
+
+    The rollups are dense NumPy arrays indexed by day, player, clan and chest
+    type. They are built once per load and kept up to date incrementally:
+    edited cells move their rows from their old buckets to their new ones, and
+    rows appended to the data are added. Leaderboards over any date window are
+    answered from cumulative sums over days, so a query costs one subtraction
+    per player or clan.
+
+    Attributes:
+        rollups_changed (Signal): Emitted after the rollups were rebuilt or updated
+        _data_model (ChestDataModel): The data model to aggregate
+
+    Implementation Notes:
+        - Rollups are built on the first query after a load, not on every change
+        - Rows without a valid date are not part of any time bucket and are skipped
+        - Non-numeric scores count as 0 points
+        - Weeks start on Monday
+        - Out-of-core datasets are rolled up from per-group totals computed by
+          the dataset, so their rows are never loaded
+    """
+
+    rollups_changed = Signal()
+
+    DATE_COLUMN = "DATE"
+    PLAYER_COLUMN = "PLAYER"
+    CHEST_COLUMN = "CHEST"
+    CLAN_COLUMN = "CLAN"
+    SCORE_COLUMN = "SCORE"
+    COLUMNS = (DATE_COLUMN, PLAYER_COLUMN, CHEST_COLUMN, CLAN_COLUMN, SCORE_COLUMN)
+
+    # Edits of more rows than this read the rows from a copy of the data
+    CELL_READ_LIMIT = 256
+
+    def __init__(self, data_model: ChestDataModel):
+        """
+        Initialize the rollup service.
+
+        Args:
+            data_model: The data model to aggregate
+        """
+        super().__init__()
+        self._data_model = data_model
+        self._reset()
+
+        if hasattr(data_model, "data_changed"):
+            data_model.data_changed.connect(self._on_data_changed)
+        if hasattr(data_model, "data_cleared"):
+            data_model.data_cleared.connect(self._on_data_cleared)
+
+    def _reset(self) -> None:
+        """Drop all rollups; they are rebuilt on the next query."""
+        self._built = False
+        self._origin = np.datetime64("1970-01-01", "D")
+        self._players = _Codes()
+        self._clans = _Codes()
+        self._chests = _Codes()
+        self._raw = pd.DataFrame(columns=list(self.COLUMNS))
+        self._row_day = np.empty(0, dtype=np.int64)
+        self._row_player = np.empty(0, dtype=np.int64)
+        self._row_clan = np.empty(0, dtype=np.int64)
+        self._row_chest = np.empty(0, dtype=np.int64)
+        self._row_score = np.empty(0, dtype=np.float64)
+        self._chest_counts = np.zeros((0, 0, 0), dtype=np.int32)
+        self._player_score = np.zeros((0, 0), dtype=np.float64)
+        self._player_count = np.zeros((0, 0), dtype=np.int64)
+        self._clan_score = np.zeros((0, 0), dtype=np.float64)
+        self._clan_count = np.zeros((0, 0), dtype=np.int64)
+        self._cumulative: Dict[str, np.ndarray] = {}
+
+    # --- Queries --- #
+
+    @property
+    def players(self) -> List[str]:
+        """Get the players in the rollups."""
+        self._ensure_built()
+        return list(self._players.names)
+
+    @property
+    def clans(self) -> List[str]:
+        """Get the clans in the rollups."""
+        self._ensure_built()
+        return list(self._clans.names)
+
+    @property
+    def chest_types(self) -> List[str]:
+        """Get the chest types in the rollups."""
+        self._ensure_built()
+        return list(self._chests.names)
+
+    def date_range(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Get the first and last day covered by the rollups.
+
+        Returns:
+            Optional[Tuple[pd.Timestamp, pd.Timestamp]]: The days, or None if no row has a date
+        """
+        self._ensure_built()
+        days = self._player_count.shape[0]
+        if days == 0:
+            return None
+        return pd.Timestamp(self._origin), pd.Timestamp(self._origin + (days - 1))
+
+    def leaderboard(
+        self,
+        by: str = "player",
+        metric: str = "score",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        limit: Optional[int] = 10,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank players or clans by total score or chest count in a date window.
+
+        Args:
+            by: 'player' or 'clan'
+            metric: 'score' for total points or 'count' for the number of chests
+            start: First day of the window, None for the first day of the data
+            end: Last day of the window (inclusive), None for the last day of the data
+            limit: Maximum number of entries, None for all
+
+        Returns:
+            List[Tuple[str, float]]: (name, total) pairs, highest first; names
+                without chests in the window are left out
+        """
+        if by not in ("player", "clan") or metric not in ("score", "count"):
+            raise ValueError(f"Unsupported leaderboard: by={by}, metric={metric}")
+        self._ensure_built()
+        first, last = self._day_window(start, end)
+        counts = self._window_totals(f"{by}_count", first, last)
+        totals = counts if metric == "count" else self._window_totals(f"{by}_score", first, last)
+
+        present = np.flatnonzero(counts > 0)
+        order = present[np.argsort(-totals[present], kind="stable")]
+        if limit is not None:
+            order = order[:limit]
+        names = self._players.names if by == "player" else self._clans.names
+        return [(names[code], totals[code].item()) for code in order]
+
+    def chest_counts(
+        self,
+        player: Optional[str] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> Dict[str, int]:
+        """
+        Count chests per chest type in a date window.
+
+        Args:
+            player: Only count this player's chests, None for all players
+            start: First day of the window, None for the first day of the data
+            end: Last day of the window (inclusive), None for the last day of the data
+
+        Returns:
+            Dict[str, int]: Chest count per chest type, most frequent first
+        """
+        self._ensure_built()
+        first, last = self._day_window(start, end)
+        if player is None:
+            counts = self._window_totals("chest_count", first, last)
+        else:
+            code = self._players.lookup.get(player)
+            if code is None:
+                return {}
+            counts = self._chest_counts[first:last, code, :].sum(axis=0)
+        order = np.argsort(-counts, kind="stable")
+        return {self._chests.names[code]: int(counts[code]) for code in order if counts[code] > 0}
+
+    def trend(
+        self,
+        bucket: str = "week",
+        player: Optional[str] = None,
+        clan: Optional[str] = None,
+        metric: str = "score",
+    ) -> pd.Series:
+        """
+        Get total score or chest count per day, week or month.
+
+        Args:
+            bucket: 'day', 'week' or 'month'
+            player: Only include this player, None for everyone
+            clan: Only include this clan (ignored if player is given)
+            metric: 'score' for total points or 'count' for the number of chests
+
+        Returns:
+            pd.Series: Totals indexed by the first day of each bucket
+        """
+        if bucket not in ("day", "week", "month") or metric not in ("score", "count"):
+            raise ValueError(f"Unsupported trend: bucket={bucket}, metric={metric}")
+        self._ensure_built()
+        if player is not None:
+            code = self._players.lookup.get(player)
+            matrix = self._player_score if metric == "score" else self._player_count
+        elif clan is not None:
+            code = self._clans.lookup.get(clan)
+            matrix = self._clan_score if metric == "score" else self._clan_count
+        else:
+            code = None
+            matrix = self._player_score if metric == "score" else self._player_count
+
+        days = matrix.shape[0]
+        if days == 0 or ((player is not None or clan is not None) and code is None):
+            return pd.Series(dtype=matrix.dtype, name=metric)
+        daily = matrix[:, code] if code is not None else matrix.sum(axis=1)
+
+        dates = self._origin + np.arange(days)
+        if bucket == "week":
+            # 1970-01-01 was a Thursday
+            labels = dates - (dates.astype(np.int64) + 3) % 7
+        elif bucket == "month":
+            labels = dates.astype("datetime64[M]").astype("datetime64[D]")
+        else:
+            labels = dates
+        starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+        return pd.Series(
+            np.add.reduceat(daily, starts), index=pd.DatetimeIndex(labels[starts]), name=metric
+        )
+
+    # --- Building --- #
+
+    def _ensure_built(self) -> None:
+        """Build the rollups from the data model if they are not up to date."""
+        if self._built:
+            return
+        dataset = getattr(self._data_model, "dataset", None)
+        if dataset is not None:
+            with span_tracer.span("RollupService.build", "rollup"):
+                self._build_from_dataset(dataset)
+            return
+        if hasattr(self._data_model, "flush_notifications"):
+            self._data_model.flush_notifications()
+        with span_tracer.span("RollupService.build", "rollup"):
+            self._build(self._data_model.data)
+
+    def _build_from_dataset(self, dataset: DatasetStore) -> None:
+        """Build all rollups from the totals of each distinct row of an out-of-core dataset."""
+        keys = [
+            column
+            for column in self.COLUMNS
+            if column != self.SCORE_COLUMN and column in dataset.column_names
+        ]
+        if not keys:
+            self._reset()
+            self._built = True
+            return
+        # Both queries order by the group columns, so their rows line up
+        counts = dataset.aggregate(keys, None, "count")
+        groups = counts[keys].copy()
+        if self.SCORE_COLUMN in dataset.column_names:
+            groups[self.SCORE_COLUMN] = dataset.aggregate(keys, self.SCORE_COLUMN, "sum")[
+                "value"
+            ].to_numpy()
+        self._build(groups, row_counts=counts["value"].to_numpy(dtype=np.int64))
+
+    def _build(self, df: pd.DataFrame, row_counts: Optional[np.ndarray] = None) -> None:
+        """
+        Build all rollups from a DataFrame.
+
+        Args:
+            df: The data to roll up
+            row_counts: Number of data rows each row of df stands for, or None for one each
+        """
+        self._reset()
+        raw = self._relevant_columns(df)
+        self._raw = raw
+
+        days = self._parse_days(raw[self.DATE_COLUMN])
+        valid = ~np.isnat(days)
+        if valid.any():
+            self._origin = days[valid].min()
+        self._row_day = np.where(valid, (days - self._origin).astype(np.int64), -1)
+
+        player_codes, players = pd.factorize(self._labels(raw[self.PLAYER_COLUMN]))
+        clan_codes, clans = pd.factorize(self._labels(raw[self.CLAN_COLUMN]))
+        chest_codes, chests = pd.factorize(self._labels(raw[self.CHEST_COLUMN]))
+        self._players, self._clans, self._chests = _Codes(players), _Codes(clans), _Codes(chests)
+        self._row_player = player_codes.astype(np.int64)
+        self._row_clan = clan_codes.astype(np.int64)
+        self._row_chest = chest_codes.astype(np.int64)
+        self._row_score = self._scores(raw[self.SCORE_COLUMN])
+
+        n_days = int(self._row_day.max()) + 1 if valid.any() else 0
+        n_players, n_clans, n_chests = len(players), len(clans), len(chests)
+        rows = np.flatnonzero(valid)
+        day, player, clan, chest = (
+            self._row_day[rows],
+            self._row_player[rows],
+            self._row_clan[rows],
+            self._row_chest[rows],
+        )
+        score = self._row_score[rows]
+        weights = None if row_counts is None else row_counts[rows]
+
+        player_cell = day * n_players + player
+        clan_cell = day * n_clans + clan
+        chest_cell = player_cell * n_chests + chest
+        self._player_score = np.bincount(
+            player_cell, weights=score, minlength=n_days * n_players
+        ).reshape(n_days, n_players)
+        self._player_count = (
+            np.bincount(player_cell, weights=weights, minlength=n_days * n_players)
+            .astype(np.int64)
+            .reshape(n_days, n_players)
+        )
+        self._clan_score = np.bincount(
+            clan_cell, weights=score, minlength=n_days * n_clans
+        ).reshape(n_days, n_clans)
+        self._clan_count = (
+            np.bincount(clan_cell, weights=weights, minlength=n_days * n_clans)
+            .astype(np.int64)
+            .reshape(n_days, n_clans)
+        )
+        self._chest_counts = (
+            np.bincount(chest_cell, weights=weights, minlength=n_days * n_players * n_chests)
+            .astype(np.int32)
+            .reshape(n_days, n_players, n_chests)
+        )
+        self._built = True
+        logger.info(
+            f"Built rollups: {n_days} days, {n_players} players, {n_clans} clans, "
+            f"{n_chests} chest types"
+        )
+        self.rollups_changed.emit()
+
+    # --- Incremental updates --- #
+
+    @Slot(object)
+    def _on_data_changed(self, data_state=None) -> None:
+        """
+        Update the rollups for a data change.
+
+        Cell edits move the edited rows between buckets. Other changes are
+        checked for appended rows; anything else rebuilds the rollups on the
+        next query.
+
+        Args:
+            data_state: DataState of the change
+        """
+        if not self._built:
+            return
+        if getattr(self._data_model, "dataset", None) is not None:
+            # Datasets are only rolled up as a whole
+            self._built = False
+            return
+        try:
+            changed_ranges = getattr(data_state, "changed_ranges", None)
+            if isinstance(changed_ranges, list):
+                self._update_ranges(changed_ranges)
+            else:
+                self._update_appended()
+        except Exception as e:
+            logger.error(f"Error updating rollups, rebuilding on next query: {e}")
+            self._built = False
+
+    @Slot()
+    def _on_data_cleared(self) -> None:
+        """Drop the rollups when the data is cleared."""
+        self._reset()
+        self.rollups_changed.emit()
+
+    def _update_ranges(self, changed_ranges: List[Tuple[int, int, int, int]]) -> None:
+        """Re-bucket the rows of changed cell ranges that touch rolled-up columns."""
+        column_names = list(self._data_model.column_names)
+        positions = {column_names.index(c) for c in self.COLUMNS if c in column_names}
+        rows = sorted(
+            {
+                row
+                for first_row, first_col, last_row, last_col in changed_ranges
+                if any(first_col <= col <= last_col for col in positions)
+                for row in range(first_row, last_row + 1)
+                if 0 <= row < len(self._row_day)
+            }
+        )
+        if not rows:
+            return
+
+        with span_tracer.span("RollupService.update_rows", "rollup"):
+            row_index = np.asarray(rows, dtype=np.int64)
+            self._apply(row_index, -1)
+            if len(rows) <= self.CELL_READ_LIMIT:
+                values = pd.DataFrame(
+                    [
+                        [self._data_model.get_cell_value(row, column) for column in self.COLUMNS]
+                        for row in rows
+                    ],
+                    columns=list(self.COLUMNS),
+                    index=row_index,
+                )
+            else:
+                values = self._relevant_columns(self._data_model.data).iloc[row_index]
+                values.index = row_index
+            for column in self.COLUMNS:
+                self._raw.loc[row_index, column] = values[column].to_numpy(dtype=object)
+            self._encode(row_index, values)
+            self._apply(row_index, 1)
+        self.rollups_changed.emit()
+
+    def _update_appended(self) -> None:
+        """Add rows appended to the data, or schedule a rebuild for other changes."""
+        df = self._relevant_columns(self._data_model.data)
+        n_old = len(self._raw)
+        if len(df) < n_old or not self._raw.equals(df.iloc[:n_old]):
+            logger.debug("Data changed beyond appended rows, rebuilding rollups on next query")
+            self._built = False
+            self.rollups_changed.emit()
+            return
+        if len(df) == n_old:
+            return
+
+        with span_tracer.span("RollupService.append_rows", "rollup"):
+            new_rows = df.iloc[n_old:]
+            row_index = np.arange(n_old, len(df), dtype=np.int64)
+            self._raw = pd.concat([self._raw, new_rows], ignore_index=True)
+            count = len(row_index)
+            self._row_day = np.concatenate([self._row_day, np.full(count, -1, dtype=np.int64)])
+            self._row_player = np.concatenate([self._row_player, np.zeros(count, dtype=np.int64)])
+            self._row_clan = np.concatenate([self._row_clan, np.zeros(count, dtype=np.int64)])
+            self._row_chest = np.concatenate([self._row_chest, np.zeros(count, dtype=np.int64)])
+            self._row_score = np.concatenate([self._row_score, np.zeros(count)])
+            self._encode(row_index, new_rows.set_axis(row_index))
+            self._apply(row_index, 1)
+        logger.debug(f"Added {count} appended rows to the rollups")
+        self.rollups_changed.emit()
+
+    def _encode(self, rows: np.ndarray, values: pd.DataFrame) -> None:
+        """Store the bucket codes of rows, growing the rollups for new values and days."""
+        days = self._parse_days(values[self.DATE_COLUMN])
+        valid = ~np.isnat(days)
+        if valid.any() and self._player_count.shape[0] == 0:
+            self._origin = days[valid].min()
+        offsets = np.where(valid, (days - self._origin).astype(np.int64), -1)
+
+        shift = -int(offsets[valid].min()) if valid.any() else 0
+        if shift > 0:
+            # Days before the first rolled-up day move the origin back
+            self._origin -= shift
+            offsets[valid] += shift
+            self._row_day[self._row_day >= 0] += shift
+        self._row_day[rows] = offsets
+
+        for codes, column, row_codes in (
+            (self._players, self.PLAYER_COLUMN, self._row_player),
+            (self._clans, self.CLAN_COLUMN, self._row_clan),
+            (self._chests, self.CHEST_COLUMN, self._row_chest),
+        ):
+            row_codes[rows] = [codes.code(label) for label in self._labels(values[column])]
+        self._row_score[rows] = self._scores(values[self.SCORE_COLUMN])
+
+        shift = max(shift, 0)
+        n_days = max(self._player_count.shape[0] + shift, int(offsets.max(initial=-1)) + 1)
+        self._grow(shift, n_days)
+
+    def _grow(self, days_before: int, n_days: int) -> None:
+        """Pad the rollup arrays to the current number of days and distinct values."""
+        n_players, n_clans, n_chests = len(self._players), len(self._clans), len(self._chests)
+
+        def pad(array: np.ndarray, *sizes: int) -> np.ndarray:
+            widths = [(days_before, sizes[0] - array.shape[0] - days_before)]
+            widths += [(0, size - dim) for size, dim in zip(sizes[1:], array.shape[1:])]
+            if all(before == 0 and after == 0 for before, after in widths):
+                return array
+            return np.pad(array, widths)
+
+        self._player_score = pad(self._player_score, n_days, n_players)
+        self._player_count = pad(self._player_count, n_days, n_players)
+        self._clan_score = pad(self._clan_score, n_days, n_clans)
+        self._clan_count = pad(self._clan_count, n_days, n_clans)
+        self._chest_counts = pad(self._chest_counts, n_days, n_players, n_chests)
+
+    def _apply(self, rows: np.ndarray, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) the contributions of rows."""
+        rows = rows[self._row_day[rows] >= 0]
+        if len(rows) == 0:
+            return
+        day, player, clan, chest = (
+            self._row_day[rows],
+            self._row_player[rows],
+            self._row_clan[rows],
+            self._row_chest[rows],
+        )
+        score = self._row_score[rows] * sign
+        np.add.at(self._player_score, (day, player), score)
+        np.add.at(self._player_count, (day, player), sign)
+        np.add.at(self._clan_score, (day, clan), score)
+        np.add.at(self._clan_count, (day, clan), sign)
+        np.add.at(self._chest_counts, (day, player, chest), sign)
+        self._cumulative.clear()
+
+    # --- Helpers --- #
+
+    def _window_totals(self, key: str, first: int, last: int) -> np.ndarray:
+        """Get the totals of a rollup over days [first, last) from its cumulative sums."""
+        cumulative = self._cumulative.get(key)
+        if cumulative is None:
+            if key == "chest_count":
+                matrix = self._chest_counts.sum(axis=1, dtype=np.int64)
+            else:
+                matrix = getattr(self, f"_{key}")
+            cumulative = np.zeros((matrix.shape[0] + 1, matrix.shape[1]), dtype=matrix.dtype)
+            np.cumsum(matrix, axis=0, out=cumulative[1:])
+            self._cumulative[key] = cumulative
+        return cumulative[last] - cumulative[first]
+
+    def _day_window(self, start: Optional[DateLike], end: Optional[DateLike]) -> Tuple[int, int]:
+        """Convert an inclusive date window to a half-open range of day indices."""
+        days = self._player_count.shape[0]
+        first = 0 if start is None else self._day_index(start)
+        last = days if end is None else self._day_index(end) + 1
+        first, last = min(max(first, 0), days), min(max(last, 0), days)
+        return first, max(first, last)
+
+    def _day_index(self, value: DateLike) -> int:
+        """Get the day index of a date."""
+        day = pd.Timestamp(value).to_datetime64().astype("datetime64[D]")
+        return int((day - self._origin).astype(np.int64))
+
+    def _relevant_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Get the rolled-up columns of a frame, with empty values for missing ones."""
+        columns = {
+            column: df[column] if column in df.columns else pd.Series("", index=df.index)
+            for column in self.COLUMNS
+        }
+        return pd.DataFrame(columns).reset_index(drop=True).astype(object)
+
+    @staticmethod
+    def _parse_days(values: pd.Series) -> np.ndarray:
+        """Parse dates to days, parsing each distinct value once."""
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return np.full(len(values), np.datetime64("NaT", "D"))
+        parsed = pd.to_datetime(pd.Index(uniques), errors="coerce").to_numpy("datetime64[D]")
+        return np.where(codes >= 0, parsed[codes], np.datetime64("NaT", "D"))
+
+    @staticmethod
+    def _labels(values: pd.Series) -> pd.Series:
+        """Get the text used to group a column, with an empty label for missing values."""
+        return values.fillna("").astype(str).str.strip()
+
+    @staticmethod
+    def _scores(values: pd.Series) -> np.ndarray:
+        """Get numeric scores, counting values that are not numbers as 0."""
+        return pd.to_numeric(values, errors="coerce").fillna(0).to_numpy(dtype=np.float64)
@@ -0,0 +1,334 @@
+"""
+validation_groups.py
+
+Description: Incrementally maintained duplicate-row groups and outlier bounds for revalidation.
+Usage:
+    index = ValidationGroupIndex()
+    index.build(data)
+
+    # After cells in rows 3 and 7 were edited
+    affected_rows = index.update(data, [3, 7])
+    duplicates = index.duplicate_messages(affected_rows)
+    outliers = index.outlier_messages(data, affected_rows)
+"""
+
+import bisect
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class _ColumnDistribution:
+    """
+    Sorted values of one numeric column, kept up to date under single-row edits.
+
+    Attributes:
+        values (np.ndarray): Value of every row as float, NaN for missing values
+        sorted_values (np.ndarray): Non-missing values in ascending order
+        order (np.ndarray): Row of each entry in sorted_values
+    """
+
+    def __init__(self, column: pd.Series):
+        """
+        Initialize from a column.
+
+        Args:
+            column: The numeric column
+        """
+        self.values = pd.to_numeric(column, errors="coerce").to_numpy(dtype=float, copy=True)
+        present = np.flatnonzero(~np.isnan(self.values))
+        order = np.argsort(self.values[present], kind="stable")
+        self.order = present[order].astype(np.int64)
+        self.sorted_values = self.values[self.order]
+
+    def bounds(self) -> Tuple[float, float]:
+        """
+        Get the outlier bounds, Q1 - 1.5 * IQR and Q3 + 1.5 * IQR.
+
+        Quantiles use linear interpolation like Series.quantile().
+
+        Returns:
+            Tuple[float, float]: Lower and upper bound, NaN if the column has no values
+        """
+        q1 = self._quantile(0.25)
+        q3 = self._quantile(0.75)
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    def outlier_rows(self, bounds: Tuple[float, float]) -> Set[int]:
+        """
+        Get the rows outside the bounds.
+
+        Args:
+            bounds: Lower and upper bound
+
+        Returns:
+            Set[int]: Rows with a value below the lower or above the upper bound
+        """
+        lower, upper = bounds
+        if np.isnan(lower) or np.isnan(upper):
+            return set()
+        below = np.searchsorted(self.sorted_values, lower, side="left")
+        above = np.searchsorted(self.sorted_values, upper, side="right")
+        return set(self.order[:below].tolist()) | set(self.order[above:].tolist())
+
+    def update(self, row: int, value: Any) -> bool:
+        """
+        Replace the value of a row.
+
+        Args:
+            row: The edited row
+            value: The row's new value
+
+        Returns:
+            bool: True if the stored value changed
+        """
+        new_value = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
+        new_value = float(new_value) if pd.notna(new_value) else np.nan
+        old_value = self.values[row]
+        if old_value == new_value or (np.isnan(old_value) and np.isnan(new_value)):
+            return False
+
+        if not np.isnan(old_value):
+            first = np.searchsorted(self.sorted_values, old_value, side="left")
+            last = np.searchsorted(self.sorted_values, old_value, side="right")
+            position = first + int(np.flatnonzero(self.order[first:last] == row)[0])
+            self.sorted_values = np.delete(self.sorted_values, position)
+            self.order = np.delete(self.order, position)
+        if not np.isnan(new_value):
+            position = np.searchsorted(self.sorted_values, new_value, side="right")
+            self.sorted_values = np.insert(self.sorted_values, position, new_value)
+            self.order = np.insert(self.order, position, row)
+        self.values[row] = new_value
+        return True
+
+    def _quantile(self, q: float) -> float:
+        """Linearly interpolated quantile of the sorted values."""
+        count = len(self.sorted_values)
+        if count == 0:
+            return np.nan
+        position = (count - 1) * q
+        low = int(np.floor(position))
+        high = min(low + 1, count - 1)
+        fraction = position - low
+        return float(
+            self.sorted_values[low] + (self.sorted_values[high] - self.sorted_values[low]) * fraction
+        )
+
+
+class ValidationGroupIndex:
+    """
+    Duplicate-row groups and outlier bounds that can be updated row by row.
+
+    The full duplicates and outliers rules look at the whole dataset. This index
+    keeps their intermediate state so that after an edit only the rows whose
+    result can change need to be revalidated.
+
+    Attributes:
+        is_built (bool): Whether the index reflects a dataset
+
+    Implementation Notes:
+        - Rows are grouped by a key of all their values; every row of a group
+          except the first is a duplicate, like DataFrame.duplicated(keep="first")
+        - Numeric columns keep their values sorted, so quartiles are read in
+          constant time and the rows outside the bounds are found by binary search
+        - update() diffs the edited rows against the stored values, so several
+          edits can be applied at once and unchanged rows cost nothing
+    """
+
+    DUPLICATE_MESSAGE = "Duplicate row detected."
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._columns: List[str] = []
+        self._row_count = 0
+        self._row_keys: List[Tuple] = []
+        self._groups: Dict[Tuple, List[int]] = {}
+        self._distributions: Dict[str, _ColumnDistribution] = {}
+        self.is_built = False
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on the next build()."""
+        self._row_keys = []
+        self._groups = {}
+        self._distributions = {}
+        self.is_built = False
+
+    def matches(self, data: pd.DataFrame) -> bool:
+        """
+        Check whether the index was built for data of this shape.
+
+        Args:
+            data: The current data
+
+        Returns:
+            bool: True if the index is built for the same rows and columns
+        """
+        return (
+            self.is_built
+            and self._row_count == len(data)
+            and self._columns == list(data.columns)
+        )
+
+    def build(self, data: pd.DataFrame) -> None:
+        """
+        Build the index from the whole dataset.
+
+        Args:
+            data: The data to index
+        """
+        self._columns = list(data.columns)
+        self._row_count = len(data)
+        self._row_keys = [self._row_key(values) for values in data.itertuples(index=False)]
+        self._groups = {}
+        for row, key in enumerate(self._row_keys):
+            self._groups.setdefault(key, []).append(row)
+        self._distributions = {
+            column: _ColumnDistribution(data[column])
+            for column in data.select_dtypes(include=["number"]).columns
+        }
+        self.is_built = True
+        logger.debug(
+            f"Built validation group index: {len(self._groups)} row groups, "
+            f"{len(self._distributions)} numeric columns"
+        )
+
+    def update(self, data: pd.DataFrame, rows: Iterable[int]) -> Set[int]:
+        """
+        Apply edited rows and find every row whose group result may have changed.
+
+        Args:
+            data: The current data, already containing the edits
+            rows: The edited rows
+
+        Returns:
+            Set[int]: The edited rows plus the members of their old and new
+                duplicate groups and the rows whose outlier result may have changed
+        """
+        rows = sorted(set(rows))
+        affected: Set[int] = set(rows)
+        if not rows:
+            return affected
+
+        # Duplicate groups
+        for row in rows:
+            old_key = self._row_keys[row]
+            new_key = self._row_key(data.iloc[row].tolist())
+            if new_key == old_key:
+                continue
+            old_group = self._groups.get(old_key, [])
+            affected.update(old_group)
+            old_group.remove(row)
+            if not old_group:
+                del self._groups[old_key]
+            new_group = self._groups.setdefault(new_key, [])
+            bisect.insort(new_group, row)
+            affected.update(new_group)
+            self._row_keys[row] = new_key
+
+        # Outlier bounds
+        numeric_columns = set(data.select_dtypes(include=["number"]).columns)
+        for column in numeric_columns | set(self._distributions):
+            distribution = self._distributions.get(column)
+            if column not in numeric_columns or distribution is None:
+                # The column became numeric or stopped being numeric
+                if distribution is not None:
+                    affected |= distribution.outlier_rows(distribution.bounds())
+                    del self._distributions[column]
+                if column in numeric_columns:
+                    distribution = _ColumnDistribution(data[column])
+                    self._distributions[column] = distribution
+                    affected |= distribution.outlier_rows(distribution.bounds())
+                continue
+
+            old_bounds = distribution.bounds()
+            values = data[column]
+            changed = [distribution.update(row, values.iloc[row]) for row in rows]
+            if not any(changed):
+                continue
+            new_bounds = distribution.bounds()
+            if not self._same_bounds(old_bounds, new_bounds):
+                # Messages of all outliers mention the bounds
+                affected |= distribution.outlier_rows(old_bounds)
+                affected |= distribution.outlier_rows(new_bounds)
+        return affected
+
+    def dependent_rows(self, rows: Iterable[int]) -> Set[int]:
+        """
+        Get the rows whose group result depends on some rows in the current index.
+
+        Used when the index had to be rebuilt after an edit, so the previous
+        groups are unknown.
+
+        Args:
+            rows: The edited rows
+
+        Returns:
+            Set[int]: The rows, the members of their duplicate groups and all
+                current outliers
+        """
+        dependent = set(rows)
+        for row in list(dependent):
+            dependent.update(self._groups.get(self._row_keys[row], []))
+        for distribution in self._distributions.values():
+            dependent |= distribution.outlier_rows(distribution.bounds())
+        return dependent
+
+    def duplicate_messages(self, rows: Iterable[int]) -> Dict[int, str]:
+        """
+        Get the duplicates rule result for some rows.
+
+        Args:
+            rows: Rows to check
+
+        Returns:
+            Dict[int, str]: Message for each row that duplicates an earlier row
+        """
+        result = {}
+        for row in rows:
+            group = self._groups.get(self._row_keys[row], [])
+            if group and group[0] != row:
+                result[row] = self.DUPLICATE_MESSAGE
+        return result
+
+    def outlier_messages(self, data: pd.DataFrame, rows: Iterable[int]) -> Dict[int, str]:
+        """
+        Get the outliers rule result for some rows.
+
+        Args:
+            data: The current data
+            rows: Rows to check
+
+        Returns:
+            Dict[int, str]: Messages in the format of the full outliers rule
+        """
+        result: Dict[int, str] = {}
+        rows = list(rows)
+        for column, distribution in self._distributions.items():
+            lower_bound, upper_bound = distribution.bounds()
+            if np.isnan(lower_bound) or np.isnan(upper_bound):
+                continue
+            values = data[column]
+            for row in rows:
+                value = distribution.values[row]
+                if not np.isnan(value) and (value < lower_bound or value > upper_bound):
+                    result[row] = (
+                        result.get(row, "")
+                        + f"Outlier detected in {column}: {values.iloc[row]} "
+                        f"(bounds: {lower_bound:.2f}-{upper_bound:.2f}). "
+                    )
+        return result
+
+    @staticmethod
+    def _row_key(values: Iterable[Any]) -> Tuple:
+        """Build a hashable key of a row, treating all missing values as equal."""
+        return tuple(None if pd.isna(value) else value for value in values)
+
+    @staticmethod
+    def _same_bounds(first: Tuple[float, float], second: Tuple[float, float]) -> bool:
+        """Compare bounds, treating NaN bounds as equal."""
+        return all(a == b or (np.isnan(a) and np.isnan(b)) for a, b in zip(first, second))
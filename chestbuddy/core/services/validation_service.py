@@ -6,22 +6,109 @@ This module provides the ValidationService class for validating chest data.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any, Set
 
 import pandas as pd
 import numpy as np
 from PySide6.QtCore import Signal, QObject
 
 from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.storage import DatasetStore
 from chestbuddy.core.models.validation_list_model import ValidationListModel
 from chestbuddy.utils.config import ConfigManager
+from chestbuddy.utils.process_pool import BlockContext, ProcessPool, SharedFrame
 from chestbuddy.core.enums.validation_enums import ValidationStatus
 from chestbuddy.core.services.correction_service import CorrectionService
+from chestbuddy.core.services.validation_groups import ValidationGroupIndex
+from chestbuddy.utils.span_tracer import span_tracer
+from chestbuddy.utils.signal_tracer import signal_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+def _check_value(check: str, column: str, value: Any, options: Any) -> Optional[str]:
+    """
+    Check one distinct value of a column the way the serial validation rules do.
+
+    Args:
+        check: "missing", "date", "numeric" or "list"
+        column: Column name used in messages
+        value: The value, or None for a missing value
+        options: For "list" checks, (entries, case_sensitive, message prefix)
+
+    Returns:
+        Optional[str]: The error message, or None if the value passes
+    """
+    if check == "missing":
+        if value is None or value == "":
+            return f"Missing value in column: {column}. "
+        return None
+    if value is None or value == "":
+        return None
+    if check == "date":
+        try:
+            pd.to_datetime(value)
+        except Exception:
+            return f"Invalid date format in {column}: {value}. "
+    elif check == "numeric":
+        try:
+            float(value)
+        except Exception:
+            return f"Invalid numeric value in {column}: {value}. "
+    elif check == "list":
+        entries, case_sensitive, message = options
+        key = value if case_sensitive or not isinstance(value, str) else value.lower()
+        if key not in entries:
+            return f"{message}: {value}"
+    return None
+
+
+def _validate_block(context: BlockContext) -> Dict[str, Tuple[np.ndarray, List[str]]]:
+    """
+    Run the row-local validation checks over one row block.
+
+    Runs in a worker process. Each distinct value of a column is checked once
+    per worker; the block only maps its codes through the results.
+
+    Args:
+        context: Block of a SharedFrame; the payload maps rule names to their
+            (column, check, options) checks in column order
+
+    Returns:
+        Dict[str, Tuple[np.ndarray, List[str]]]: Per rule, the row positions of
+            failing rows and their messages
+    """
+    results = {}
+    for rule_name, checks in context.payload.items():
+        messages: Dict[int, str] = {}
+        for column, check, options in checks:
+            uniques = context.uniques[column]
+            # One slot per distinct value plus a last slot for missing values
+            tables = context.cache.get((rule_name, column))
+            if tables is None:
+                slot_count = len(uniques) + 1
+                tables = (np.zeros(slot_count, dtype=np.int8), np.empty(slot_count, object))
+                context.cache[(rule_name, column)] = tables
+            state_by_slot, message_by_slot = tables
+
+            codes = context.codes(column)
+            slots = np.where(codes >= 0, codes, len(uniques))
+            block_slots = np.unique(slots)
+            for slot in block_slots[state_by_slot[block_slots] == 0]:
+                value = uniques[slot] if slot < len(uniques) else None
+                message = _check_value(check, column, value, options)
+                message_by_slot[slot] = message
+                state_by_slot[slot] = 2 if message is not None else 1
+
+            for position in np.flatnonzero(state_by_slot[slots] == 2).tolist():
+                messages[position] = messages.get(position, "") + message_by_slot[slots[position]]
+
+        positions = np.array(sorted(messages), dtype=np.int64)
+        results[rule_name] = (positions + context.start, [messages[p] for p in positions.tolist()])
+    return results
+
+
 class ValidationService(QObject):
     """
     Service for validating chest data.
@@ -34,6 +121,8 @@ class ValidationService(QObject):
     Signals:
         validation_preferences_changed (Signal): Emitted when validation preferences change
         validation_complete (Signal): Emitted when validation status changes with the status DataFrame
+        validation_delta (Signal): Emitted after incremental revalidation with the status
+            DataFrame of the revalidated rows only
         status_message_changed (Signal): Emitted when a general status update message changes
 
     Implementation Notes:
@@ -41,6 +130,11 @@ class ValidationService(QObject):
         - Provides customizable validation rules
         - Works with the ChestDataModel to update validation statuses
         - Uses ValidationListModel for reference list validation
+        - After a full validation, targeted cell edits are revalidated
+          incrementally: row-local rules run on the edited rows only, and a
+          ValidationGroupIndex finds the duplicate-group and outlier rows whose
+          result can change. Rules other than the group rules are assumed to be
+          row-local.
     """
 
     # Define signals
@@ -48,8 +142,32 @@ class ValidationService(QObject):
     validation_complete = Signal(
         object
     )  # Validation status DataFrame, Renamed from validation_changed
+    validation_delta = Signal(object)  # Status DataFrame of revalidated rows
     status_message_changed = Signal(str)  # For general status updates
 
+    # Rules that depend on other rows and are evaluated through the group index
+    GROUP_RULES = ("outliers", "duplicates")
+
+    # Built-in rules that can run on the process pool, with their methods
+    PARALLEL_RULES = {
+        "missing_values": "_check_missing_values",
+        "duplicates": "_check_duplicates",
+        "data_types": "_check_data_types",
+        "player_validation": "_check_players",
+        "chest_type_validation": "_check_chest_types",
+        "source_validation": "_check_sources",
+    }
+
+    # Summary key of each status
+    _SUMMARY_KEYS = {
+        ValidationStatus.VALID: "valid",
+        ValidationStatus.INVALID: "invalid",
+        ValidationStatus.WARNING: "warning",
+        ValidationStatus.NOT_VALIDATED: "not_validated",
+        ValidationStatus.INVALID_ROW: "invalid_row",
+        ValidationStatus.CORRECTABLE: "correctable",
+    }
+
     # Define column names for validation
     PLAYER_COLUMN = "PLAYER"
     CHEST_COLUMN = "CHEST"
@@ -74,11 +192,25 @@ class ValidationService(QObject):
         self._case_sensitive = False
         self._validate_on_import = True
         self._auto_save = True
+        self._flush_delay_ms = 1000
+        self._append_log = True
+        self._incremental = True
         self._config_manager = config_manager
 
+        # State for incremental revalidation of edited cells
+        self._group_index = ValidationGroupIndex()
+        self._has_validated = False
+
+        # Status counts per status column, kept current for constant-time summaries
+        self._status_counts: Optional[Dict[str, Dict[ValidationStatus, int]]] = None
+        self._status_frame: Optional[pd.DataFrame] = None
+
         # Reference to correction service (will be set externally)
         self._correction_service = None
 
+        # Pool for validating large frames, defaults to the shared pool
+        self._process_pool: Optional[ProcessPool] = None
+
         # Load settings from configuration if provided
         if config_manager:
             # Load with detailed logging
@@ -93,6 +225,9 @@ class ValidationService(QObject):
             self._case_sensitive = case_sensitive
             self._validate_on_import = validate_on_import
             self._auto_save = auto_save
+            self._flush_delay_ms = config_manager.get_int("Validation", "flush_delay_ms", 1000)
+            self._append_log = config_manager.get_bool("Validation", "append_log", True)
+            self._incremental = config_manager.get_bool("Validation", "incremental", True)
         else:
             logger.warning("No config_manager provided, using default validation settings")
 
@@ -104,6 +239,13 @@ class ValidationService(QObject):
         # Initialize validation lists
         self._initialize_validation_lists()
 
+        # Revalidate edited cells as the data changes
+        try:
+            self._data_model.data_changed.connect(self._on_data_changed)
+            self._data_model.data_cleared.connect(self._on_data_cleared)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Incremental revalidation not connected: {e}")
+
     def _initialize_default_rules(self) -> None:
         """Initialize the default validation rules."""
         # Add default validation rules
@@ -314,9 +456,9 @@ class ValidationService(QObject):
             source_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Create validation list models
-            self._player_list_model = ValidationListModel(str(player_file), self._case_sensitive)
-            self._chest_type_list_model = ValidationListModel(str(chest_file), self._case_sensitive)
-            self._source_list_model = ValidationListModel(str(source_file), self._case_sensitive)
+            self._player_list_model = self._create_list_model(player_file)
+            self._chest_type_list_model = self._create_list_model(chest_file)
+            self._source_list_model = self._create_list_model(source_file)
 
             logger.info(
                 f"Initialized validation lists: Players ({len(self._player_list_model.get_entries())} entries), "
@@ -330,21 +472,34 @@ class ValidationService(QObject):
                 fallback_dir = Path(__file__).parents[2] / "data" / "validation"
                 fallback_dir.mkdir(parents=True, exist_ok=True)
 
-                self._player_list_model = ValidationListModel(
-                    str(fallback_dir / "players.txt"), self._case_sensitive
-                )
-                self._chest_type_list_model = ValidationListModel(
-                    str(fallback_dir / "chest_types.txt"), self._case_sensitive
-                )
-                self._source_list_model = ValidationListModel(
-                    str(fallback_dir / "sources.txt"), self._case_sensitive
+                self._player_list_model = self._create_list_model(fallback_dir / "players.txt")
+                self._chest_type_list_model = self._create_list_model(
+                    fallback_dir / "chest_types.txt"
                 )
+                self._source_list_model = self._create_list_model(fallback_dir / "sources.txt")
 
                 logger.warning("Created empty validation list models with fallback paths")
             except Exception as inner_e:
                 logger.critical(f"Failed to create fallback validation list models: {inner_e}")
                 raise RuntimeError("Could not initialize validation system") from inner_e
 
+    def _create_list_model(self, file_path: Path) -> ValidationListModel:
+        """
+        Create a validation list model with the configured persistence settings.
+
+        Args:
+            file_path (Path): Path to the list file
+
+        Returns:
+            ValidationListModel: The list model
+        """
+        return ValidationListModel(
+            str(file_path),
+            self._case_sensitive,
+            flush_delay_ms=self._flush_delay_ms,
+            append_log=self._append_log,
+        )
+
     def _resolve_validation_path(self, list_type: str) -> Path:
         """
         Resolve the path to a validation list file.
@@ -421,6 +576,7 @@ class ValidationService(QObject):
             return True
         return False
 
+    @span_tracer.trace("ValidationService.validate_data", "validation")
     def validate_data(
         self, specific_rules: Optional[List[str]] = None
     ) -> Dict[str, Dict[int, str]]:
@@ -442,14 +598,31 @@ class ValidationService(QObject):
         logger.info(f"Starting validation. Running rules: {specific_rules or 'all'}")
         validation_results = {}
         rules_to_run = specific_rules or self._validation_rules.keys()
+
+        dataset = getattr(self._data_model, "dataset", None)
+        if isinstance(dataset, DatasetStore):
+            return self._validate_dataset(dataset, rules_to_run)
         current_df = self._data_model.data  # Get current data once
 
+        # Large frames run their built-in rules on the process pool
+        parallel_results = {}
+        pool = self._process_pool or ProcessPool.instance()
+        if pool.should_parallelize(len(current_df)):
+            try:
+                parallel_results = self._validate_in_parallel(current_df, rules_to_run, pool)
+            except Exception as e:
+                logger.error(f"Parallel validation failed, validating serially: {e}")
+
         for rule_name in rules_to_run:
             if rule_name in self._validation_rules:
                 try:
                     logger.info(f"Running validation rule: {rule_name}")
-                    # Pass current data to the rule function
-                    rule_result = self._validation_rules[rule_name](current_df)
+                    if rule_name in parallel_results:
+                        rule_result = parallel_results[rule_name]
+                    else:
+                        # Pass current data to the rule function
+                        with span_tracer.span(f"ValidationService.{rule_name}", "validation"):
+                            rule_result = self._validation_rules[rule_name](current_df)
                     if rule_result:  # Only store if there are errors
                         validation_results[rule_name] = rule_result
                         logger.info(f"Rule {rule_name} found {len(rule_result)} issues.")
@@ -467,8 +640,326 @@ class ValidationService(QObject):
         # Update the model's validation status
         self._update_validation_status(validation_results)
 
+        # Keep group state for incremental revalidation of later edits
+        if self._incremental:
+            try:
+                self._group_index.build(current_df)
+                self._has_validated = True
+            except Exception as e:
+                logger.error(f"Error building validation group index: {e}")
+                self._group_index.invalidate()
+
+        return validation_results
+
+    @span_tracer.trace("ValidationService.validate_in_parallel", "validation")
+    def _validate_in_parallel(
+        self, data: pd.DataFrame, rules_to_run: Iterable[str], pool: ProcessPool
+    ) -> Dict[str, Dict[int, str]]:
+        """
+        Run the built-in rules over row blocks of the data on a process pool.
+
+        The frame is shared with the workers as dictionary codes and the
+        validation lists are sent once per worker as frozen sets. Row-local
+        rules are evaluated per block and their results assembled in row
+        order. Duplicates depend on other rows and are found in a merge step
+        over the shared codes of all blocks. Outliers and custom rules are
+        left to the caller.
+
+        Args:
+            data: The data to validate
+            rules_to_run: Names of the rules to run
+            pool: The pool to run on
+
+        Returns:
+            Dict[str, Dict[int, str]]: Results of the rules handled here, keyed
+                like the serial rule results
+        """
+        payload = {}
+        handled = []
+        for rule_name in rules_to_run:
+            method = self.PARALLEL_RULES.get(rule_name)
+            # Only rules that still run their built-in check are distributed
+            if method is None or self._validation_rules.get(rule_name) != getattr(self, method):
+                continue
+            handled.append(rule_name)
+            checks = self._parallel_checks(rule_name, data)
+            if checks:
+                payload[rule_name] = checks
+
+        if not handled:
+            return {}
+
+        results = {rule_name: {} for rule_name in handled}
+        with SharedFrame(data, list(data.columns)) as frame:
+            if payload:
+                blocks = pool.map_blocks(_validate_block, frame, payload=payload)
+                for rule_name in payload:
+                    positions = np.concatenate([block[rule_name][0] for block in blocks])
+                    messages = [message for block in blocks for message in block[rule_name][1]]
+                    results[rule_name] = dict(zip(data.index[positions].tolist(), messages))
+
+            if "duplicates" in results:
+                # Equal rows have equal codes in every column
+                duplicates = pd.DataFrame(frame.codes().T).duplicated(keep="first").to_numpy()
+                results["duplicates"] = dict.fromkeys(
+                    data.index[duplicates].tolist(), "Duplicate row detected."
+                )
+
+        logger.info(f"Validated {len(handled)} rules on {pool.workers} processes")
+        return results
+
+    def _parallel_checks(self, rule_name: str, data: pd.DataFrame) -> List[Tuple[str, str, Any]]:
+        """
+        Describe a row-local rule as per-column checks for the worker processes.
+
+        Args:
+            rule_name: Name of a rule in PARALLEL_RULES
+            data: The data to validate
+
+        Returns:
+            List[Tuple[str, str, Any]]: (column, check, options) in column order
+        """
+        columns = [column for column in data.columns if not self._should_skip_column(column)]
+        if rule_name == "missing_values":
+            return [(column, "missing", None) for column in columns]
+        if rule_name == "data_types":
+            types = {"DATE": "date", "SCORE": "numeric"}
+            return [(column, types[column], None) for column in columns if column in types]
+
+        list_checks = {
+            "player_validation": (
+                self._player_list_model,
+                self.PLAYER_COLUMN,
+                "Invalid player name",
+            ),
+            "chest_type_validation": (
+                self._chest_type_list_model,
+                self.CHEST_COLUMN,
+                "Invalid chest type",
+            ),
+            "source_validation": (self._source_list_model, self.SOURCE_COLUMN, "Invalid source"),
+        }
+        model, column, message = list_checks.get(rule_name, (None, None, None))
+        if not model or column not in data.columns:
+            return []
+        case_sensitive = model.is_case_sensitive()
+        entries = model.get_entries()
+        if not case_sensitive:
+            entries = [entry.lower() for entry in entries]
+        return [(column, "list", (frozenset(entries), case_sensitive, message))]
+
+    def _validate_dataset(
+        self, dataset: DatasetStore, rules_to_run: Iterable[str]
+    ) -> Dict[str, Dict[int, str]]:
+        """
+        Validate an out-of-core dataset against the validation lists.
+
+        The list checks run as anti-joins inside the dataset's query engine.
+        Rules that need the whole frame in memory are skipped. The status
+        frame only holds the rows with issues, labelled by row id; counts are
+        available from get_validation_statistics().
+
+        Args:
+            dataset: The dataset attached to the data model
+            rules_to_run: Names of the rules to run
+
+        Returns:
+            A dictionary mapping rule names to dictionaries of row indices
+            and error messages.
+        """
+        list_rules = {
+            "player_validation": ("player", self.PLAYER_COLUMN, "Invalid player name"),
+            "chest_type_validation": ("chest_type", self.CHEST_COLUMN, "Invalid chest type"),
+            "source_validation": ("source", self.SOURCE_COLUMN, "Invalid source"),
+        }
+        validation_results = {}
+        checked_columns = {}
+        for rule_name in rules_to_run:
+            if rule_name not in list_rules:
+                logger.info(f"Skipping rule {rule_name} for out-of-core data.")
+                continue
+            list_type, column, message = list_rules[rule_name]
+            model = self._get_validation_list_model(list_type)
+            if not model or column not in dataset.column_names:
+                continue
+            with span_tracer.span(f"ValidationService.{rule_name}", "validation"):
+                rows = dataset.invalid_row_ids(column, model.entries, model.is_case_sensitive())
+            checked_columns[rule_name] = column
+            if len(rows):
+                validation_results[rule_name] = dict.fromkeys(rows.tolist(), message)
+            logger.info(f"Rule {rule_name} found {len(rows)} issues.")
+
+        self._update_dataset_validation_status(dataset, validation_results, checked_columns)
         return validation_results
 
+    def _update_dataset_validation_status(
+        self,
+        dataset: DatasetStore,
+        validation_results: Dict[str, Dict[int, str]],
+        checked_columns: Dict[str, str],
+    ) -> None:
+        """
+        Publish the results of a dataset validation as a status frame of its invalid rows.
+
+        Args:
+            dataset: The validated dataset
+            validation_results: Dictionary of validation rule results
+            checked_columns: Column checked by each rule that ran
+        """
+        rows = sorted(set().union(*validation_results.values()))
+        status_df = pd.DataFrame(index=pd.Index(rows, dtype=np.int64))
+        checked = set(checked_columns.values())
+        for col in dataset.column_names:
+            status_df[f"{col}_valid"] = col in checked
+            status_df[f"{col}_status"] = (
+                ValidationStatus.VALID if col in checked else ValidationStatus.NOT_VALIDATED
+            )
+            status_df[f"{col}_message"] = ""
+        status_df["_row_status"] = ValidationStatus.VALID
+
+        for rule_name, issues in validation_results.items():
+            column = checked_columns[rule_name]
+            issue_rows = list(issues)
+            status_df.loc[issue_rows, f"{column}_valid"] = False
+            status_df.loc[issue_rows, f"{column}_status"] = ValidationStatus.INVALID
+            status_df.loc[issue_rows, f"{column}_message"] = list(issues.values())
+            status_df.loc[issue_rows, "_row_status"] = ValidationStatus.INVALID
+
+        # The frame does not cover every row, so counts come from the dataset
+        self._reset_status_counts()
+        self._data_model.set_validation_status(status_df)
+        logger.info(f"ValidationService emitting validation_complete for {len(status_df)} rows")
+        signal_tracer.emit(self, "validation_complete", status_df)
+
+    def _on_data_changed(self, data_state=None) -> None:
+        """
+        Revalidate the cells of a data change.
+
+        Changes that carry cell ranges are revalidated incrementally; any other
+        change invalidates the group index so the next full validation rebuilds it.
+
+        Args:
+            data_state: DataState of the change
+        """
+        changed_ranges = getattr(data_state, "changed_ranges", None)
+        if not isinstance(changed_ranges, list):
+            self._group_index.invalidate()
+            self._reset_status_counts()
+            return
+        if not (self._incremental and self._has_validated) or not changed_ranges:
+            return
+
+        cells = [
+            (row, col)
+            for first_row, first_col, last_row, last_col in changed_ranges
+            for row in range(first_row, last_row + 1)
+            for col in range(first_col, last_col + 1)
+        ]
+        try:
+            self.revalidate_cells(cells)
+        except Exception as e:
+            logger.error(f"Error during incremental revalidation: {e}", exc_info=True)
+            self._group_index.invalidate()
+
+    def _on_data_cleared(self) -> None:
+        """Drop the group index and status counts when the data is cleared."""
+        self._group_index.invalidate()
+        self._reset_status_counts()
+        self._has_validated = False
+
+    def revalidate_cells(self, cells: Iterable[Tuple[int, int]]) -> pd.DataFrame:
+        """
+        Revalidate edited cells and the rows of the groups they belong to.
+
+        Row-local rules run on the affected rows only. Duplicate and outlier
+        results come from the group index, which finds the other rows whose
+        result changed because of the edit, e.g. the former duplicate of an
+        edited row or the outliers of a column whose bounds moved.
+
+        Args:
+            cells: (row, column) positions of the edited cells
+
+        Returns:
+            pd.DataFrame: Status DataFrame of the revalidated rows, which is
+                also emitted with validation_delta
+        """
+        data = self._data_model.data
+        rows = {int(row) for row, _ in cells if 0 <= int(row) < len(data)}
+        if data.empty or not rows:
+            return pd.DataFrame()
+
+        with span_tracer.span("ValidationService.revalidate_cells", "validation"):
+            if not self._group_index.matches(data):
+                self._group_index.build(data)
+                affected = self._group_index.dependent_rows(rows)
+            else:
+                affected = self._group_index.update(data, rows)
+            affected_rows = sorted(affected)
+            subset = data.iloc[affected_rows]
+
+            validation_results: Dict[str, Dict[int, str]] = {}
+            for rule_name, rule_function in self._validation_rules.items():
+                try:
+                    if rule_name == "duplicates":
+                        rule_result = self._group_index.duplicate_messages(affected_rows)
+                    elif rule_name == "outliers":
+                        rule_result = self._group_index.outlier_messages(data, affected_rows)
+                    else:
+                        rule_result = rule_function(subset)
+                except Exception as e:
+                    logger.error(f"Error executing validation rule {rule_name}: {e}")
+                    continue
+                if rule_result:
+                    validation_results[rule_name] = {
+                        self._position_to_label(data, row_idx, rule_name): message
+                        for row_idx, message in rule_result.items()
+                    }
+
+            column_names = data.columns.tolist()
+            status_df = self._init_validation_status_df(affected_rows)
+            status_df["_row_status"] = ValidationStatus.VALID
+            invalid_cells = self._apply_validation_results(
+                status_df, validation_results, column_names
+            )
+
+            if self._correction_service is not None and hasattr(
+                self._correction_service, "has_correction"
+            ):
+                for row_idx, col_name in invalid_cells:
+                    if status_df.at[row_idx, f"{col_name}_status"] != ValidationStatus.INVALID:
+                        continue
+                    if self._correction_service.has_correction(
+                        data.at[row_idx, col_name], col_name
+                    ):
+                        status_df.at[row_idx, f"{col_name}_status"] = ValidationStatus.CORRECTABLE
+                        status_df.at[row_idx, f"{col_name}_message"] += " (Corrections available)"
+
+            logger.debug(
+                f"Revalidated {len(rows)} edited rows, {len(affected_rows)} rows affected"
+            )
+            self._merge_status_rows(status_df)
+            signal_tracer.emit(self, "validation_delta", status_df)
+        return status_df
+
+    def _position_to_label(self, data: pd.DataFrame, row_idx: int, rule_name: str) -> Any:
+        """
+        Map a rule result key to a row label of the data.
+
+        Rules run on a row subset return its index labels, the group index
+        returns row positions.
+
+        Args:
+            data: The current data
+            row_idx: Key returned by the rule
+            rule_name: Name of the rule
+
+        Returns:
+            The row label
+        """
+        if rule_name in self.GROUP_RULES:
+            return data.index[row_idx]
+        return row_idx
+
     def _check_players(self, df=None) -> Dict[int, str]:
         """
         Check that player names are in the validation list.
@@ -925,6 +1416,7 @@ class ValidationService(QObject):
         # Emit signal
         self.validation_preferences_changed.emit(preferences)
 
+    @span_tracer.trace("ValidationService.update_validation_status", "validation")
     def _update_validation_status(self, validation_results: Dict[str, Dict[int, str]]) -> None:
         """
         Update the validation status based on validation results.
@@ -953,128 +1445,29 @@ class ValidationService(QObject):
             for rule_name, issues in validation_results.items():
                 logger.debug(f"Rule '{rule_name}' has {len(issues)} issues")
 
-            # Remember cells that we've explicitly marked as invalid
-            explicitly_marked_cells = set()
-
             # Flag cells as invalid based on validation results
-            for rule_name, issues in validation_results.items():
-                for row_idx, message in issues.items():
-                    if row_idx < 0:
-                        logger.warning(
-                            f"Skipping negative row index {row_idx} for rule {rule_name}"
-                        )
-                        continue
-
-                    if "_row_" in message:
-                        # Mark the entire row as invalid
-                        status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID_ROW
-                        # Update valid flags for all columns in this row
-                        for col in column_names:
-                            status_df.at[row_idx, f"{col}_valid"] = False
-                            status_df.at[row_idx, f"{col}_status"] = ValidationStatus.INVALID_ROW
-                            status_df.at[row_idx, f"{col}_message"] = message
-                            explicitly_marked_cells.add((row_idx, col))
-                    else:
-                        # For each column mentioned in the error message, mark it as invalid
-                        affected_column = None
-                        for col in column_names:
-                            if col in message:
-                                affected_column = col
-                                status_df.at[row_idx, f"{col}_valid"] = False
-                                status_df.at[row_idx, f"{col}_status"] = ValidationStatus.INVALID
-                                status_df.at[row_idx, f"{col}_message"] = message
-                                explicitly_marked_cells.add((row_idx, col))
-
-                                # Update row status to indicate at least one issue
-                                if status_df.at[row_idx, "_row_status"] == ValidationStatus.VALID:
-                                    status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID
-
-                        # If we didn't find a column in the message but the message is about validation:
-                        if affected_column is None and any(
-                            vterm in message.lower()
-                            for vterm in ["invalid", "not found", "missing"]
-                        ):
-                            # This is likely from a validation rule - find what column it's for
-                            if "player" in rule_name.lower() or "player" in message.lower():
-                                affected_column = "PLAYER"
-                            elif "chest" in rule_name.lower() or "chest" in message.lower():
-                                affected_column = "CHEST"
-                            elif "source" in rule_name.lower() or "source" in message.lower():
-                                affected_column = "SOURCE"
-
-                            if affected_column:
-                                logger.debug(
-                                    f"Inferred affected column {affected_column} for rule {rule_name} with message: {message}"
-                                )
-                                status_df.at[row_idx, f"{affected_column}_valid"] = False
-                                status_df.at[row_idx, f"{affected_column}_status"] = (
-                                    ValidationStatus.INVALID
-                                )
-                                status_df.at[row_idx, f"{affected_column}_message"] = message
-                                explicitly_marked_cells.add((row_idx, affected_column))
-
-                                # Update row status to indicate at least one issue
-                                if status_df.at[row_idx, "_row_status"] == ValidationStatus.VALID:
-                                    status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID
+            explicitly_marked_cells = self._apply_validation_results(
+                status_df, validation_results, column_names
+            )
 
             # Detect and mark correctable entries
             if self._correction_service is not None:
                 status_df = self._mark_correctable_entries(status_df)
 
-            # Debug: Count status types after processing
-            status_counts = {
-                "valid": 0,
-                "invalid": 0,
-                "correctable": 0,
-                "invalid_row": 0,
-                "not_validated": 0,
-                "other": 0,
-            }
-
-            for col in status_df.columns:
-                if col.endswith("_status"):
-                    for status in status_df[col]:
-                        if status == ValidationStatus.VALID:
-                            status_counts["valid"] += 1
-                        elif status == ValidationStatus.INVALID:
-                            status_counts["invalid"] += 1
-                        elif status == ValidationStatus.CORRECTABLE:
-                            status_counts["correctable"] += 1
-                        elif status == ValidationStatus.INVALID_ROW:
-                            status_counts["invalid_row"] += 1
-                        elif status == ValidationStatus.NOT_VALIDATED:
-                            status_counts["not_validated"] += 1
-                        else:
-                            status_counts["other"] += 1
-
-            logger.debug(f"*** VALIDATION: Final status count in status_df: {status_counts} ***")
-            logger.debug(
-                f"*** VALIDATION: Explicitly marked {len(explicitly_marked_cells)} cells as invalid/correctable ***"
-            )
-
-            # Log a sample of invalid or correctable rows
-            for idx in range(min(5, len(status_df))):
-                row_data = status_df.iloc[idx]
-                row_status = row_data.get("_row_status", "Unknown")
-                if row_status != ValidationStatus.VALID:
-                    logger.debug(f"Sample invalid row {idx}: {row_status}")
-                    for col in column_names:
-                        status_col = f"{col}_status"
-                        if (
-                            status_col in row_data
-                            and row_data[status_col] != ValidationStatus.VALID
-                        ):
-                            logger.debug(f"  - {col}: {row_data[status_col]}")
+            # Count status types once; later summaries read the counts
+            self._track_status_counts(status_df)
+            logger.debug(f"Status counts after validation: {self._summarize_counts()}")
+            logger.debug(f"Explicitly marked {len(explicitly_marked_cells)} cells as invalid")
 
             # Update the validation status in the data model
             self._data_model.set_validation_status(status_df)
 
             # Emit the signal with the final status DataFrame
             logger.info(
-                f"ValidationService emitting validation_complete with status_df:\n{status_df}"
+                f"ValidationService emitting validation_complete with status_df: {status_df.shape}"
             )
             try:
-                self.validation_complete.emit(status_df)
+                signal_tracer.emit(self, "validation_complete", status_df)
                 logger.info("ValidationService validation_complete signal emitted successfully.")
             except Exception as e:
                 logger.error(f"Error emitting validation_complete signal: {e}")
@@ -1082,6 +1475,89 @@ class ValidationService(QObject):
         except Exception as e:
             logger.error(f"Error updating validation status: {e}")
 
+    def _apply_validation_results(
+        self,
+        status_df: pd.DataFrame,
+        validation_results: Dict[str, Dict[int, str]],
+        column_names: List[str],
+    ) -> Set[Tuple[int, str]]:
+        """
+        Flag the cells named by validation rule messages in a status DataFrame.
+
+        Args:
+            status_df: Validation status DataFrame to update in place
+            validation_results: Dictionary of validation rule results
+            column_names: Names of the data columns
+
+        Returns:
+            Set of (row, column name) cells that were flagged
+        """
+        # Remember cells that we've explicitly marked as invalid
+        explicitly_marked_cells = set()
+
+        # Flag cells as invalid based on validation results
+        for rule_name, issues in validation_results.items():
+            for row_idx, message in issues.items():
+                if row_idx < 0:
+                    logger.warning(
+                        f"Skipping negative row index {row_idx} for rule {rule_name}"
+                    )
+                    continue
+
+                if "_row_" in message:
+                    # Mark the entire row as invalid
+                    status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID_ROW
+                    # Update valid flags for all columns in this row
+                    for col in column_names:
+                        status_df.at[row_idx, f"{col}_valid"] = False
+                        status_df.at[row_idx, f"{col}_status"] = ValidationStatus.INVALID_ROW
+                        status_df.at[row_idx, f"{col}_message"] = message
+                        explicitly_marked_cells.add((row_idx, col))
+                else:
+                    # For each column mentioned in the error message, mark it as invalid
+                    affected_column = None
+                    for col in column_names:
+                        if col in message:
+                            affected_column = col
+                            status_df.at[row_idx, f"{col}_valid"] = False
+                            status_df.at[row_idx, f"{col}_status"] = ValidationStatus.INVALID
+                            status_df.at[row_idx, f"{col}_message"] = message
+                            explicitly_marked_cells.add((row_idx, col))
+
+                            # Update row status to indicate at least one issue
+                            if status_df.at[row_idx, "_row_status"] == ValidationStatus.VALID:
+                                status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID
+
+                    # If we didn't find a column in the message but the message is about validation:
+                    if affected_column is None and any(
+                        vterm in message.lower()
+                        for vterm in ["invalid", "not found", "missing"]
+                    ):
+                        # This is likely from a validation rule - find what column it's for
+                        if "player" in rule_name.lower() or "player" in message.lower():
+                            affected_column = "PLAYER"
+                        elif "chest" in rule_name.lower() or "chest" in message.lower():
+                            affected_column = "CHEST"
+                        elif "source" in rule_name.lower() or "source" in message.lower():
+                            affected_column = "SOURCE"
+
+                        if affected_column:
+                            logger.debug(
+                                f"Inferred affected column {affected_column} for rule {rule_name} with message: {message}"
+                            )
+                            status_df.at[row_idx, f"{affected_column}_valid"] = False
+                            status_df.at[row_idx, f"{affected_column}_status"] = (
+                                ValidationStatus.INVALID
+                            )
+                            status_df.at[row_idx, f"{affected_column}_message"] = message
+                            explicitly_marked_cells.add((row_idx, affected_column))
+
+                            # Update row status to indicate at least one issue
+                            if status_df.at[row_idx, "_row_status"] == ValidationStatus.VALID:
+                                status_df.at[row_idx, "_row_status"] = ValidationStatus.INVALID
+
+        return explicitly_marked_cells
+
     def _mark_correctable_entries(self, status_df: pd.DataFrame) -> pd.DataFrame:
         """
         Mark entries that have available corrections as correctable.
@@ -1129,15 +1605,19 @@ class ValidationService(QObject):
 
         return status_df
 
-    def _init_validation_status_df(self) -> pd.DataFrame:
+    def _init_validation_status_df(self, rows: Optional[List[int]] = None) -> pd.DataFrame:
         """
         Initialize a validation status DataFrame.
 
+        Args:
+            rows: Optional row positions to include; all rows if None
+
         Returns:
             DataFrame with validation status columns for each data column
         """
         data_df = self._data_model.data
-        status_df = pd.DataFrame(index=data_df.index)
+        index = data_df.index if rows is None else data_df.index[rows]
+        status_df = pd.DataFrame(index=index)
 
         # Add validation status columns for each data column, defaulting to NOT_VALIDATED
         for col in data_df.columns:
@@ -1184,9 +1664,10 @@ class ValidationService(QObject):
 
         # Update the validation status in the data model
         self._data_model.set_validation_status(status_df)
+        self._track_status_counts(status_df)
 
         # Emit the validation changed signal
-        self.validation_complete.emit(status_df)
+        signal_tracer.emit(self, "validation_complete", status_df)
 
         logger.info(f"Updated validation status with {len(correctable_cells)} correctable cells")
 
@@ -1211,6 +1692,10 @@ class ValidationService(QObject):
             if self._data_model.is_empty:
                 return {"total": 0, "valid": 0, "invalid": 0, "missing": 0}
 
+            dataset = getattr(self._data_model, "dataset", None)
+            if isinstance(dataset, DatasetStore):
+                return self._get_dataset_statistics(dataset)
+
             stats = {"total": 0, "valid": 0, "invalid": 0, "missing": 0}
 
             df = self._data_model.data
@@ -1228,9 +1713,10 @@ class ValidationService(QObject):
                     continue
 
                 # Count missing values
-                missing_count = df[column].isna().sum() + (df[column] == "").sum()
-                stats[f"{field}_missing"] = int(missing_count)
-                stats["missing"] += int(missing_count)
+                present = df[column].notna() & (df[column] != "")
+                missing_count = int(len(df) - present.sum())
+                stats[f"{field}_missing"] = missing_count
+                stats["missing"] += missing_count
 
                 # Count valid values
                 valid_count = 0
@@ -1238,13 +1724,14 @@ class ValidationService(QObject):
 
                 model = self._get_validation_list_model(field)
                 if model:
-                    # Check each non-empty value
-                    non_empty_values = df[df[column].notna() & (df[column] != "")][column]
-                    for value in non_empty_values:
-                        if model.contains(value):
-                            valid_count += 1
-                        else:
-                            invalid_count += 1
+                    # Match all non-empty values against the list at once
+                    values = df.loc[present, column].astype(str)
+                    entries = model.entries
+                    if not model.is_case_sensitive():
+                        values = values.str.lower()
+                        entries = {entry.lower() for entry in entries}
+                    valid_count = int(values.isin(entries).sum())
+                    invalid_count = len(values) - valid_count
 
                 stats[f"{field}_valid"] = valid_count
                 stats[f"{field}_invalid"] = invalid_count
@@ -1256,6 +1743,40 @@ class ValidationService(QObject):
             logger.error(f"Error getting validation statistics: {e}")
             return {"total": 0, "valid": 0, "invalid": 0, "missing": 0}
 
+    def _get_dataset_statistics(self, dataset: DatasetStore) -> Dict[str, int]:
+        """
+        Get validation statistics for an out-of-core dataset.
+
+        The validation lists are joined against the dataset inside its query
+        engine, so only the counts are returned.
+
+        Args:
+            dataset: The dataset attached to the data model
+
+        Returns:
+            Dict[str, int]: Dictionary with validation statistics
+        """
+        stats = {"total": dataset.row_count, "valid": 0, "invalid": 0, "missing": 0}
+        for field, column in [
+            ("player", self.PLAYER_COLUMN),
+            ("chest_type", self.CHEST_COLUMN),
+            ("source", self.SOURCE_COLUMN),
+        ]:
+            if column not in dataset.column_names:
+                continue
+            model = self._get_validation_list_model(field)
+            if model:
+                counts = dataset.list_match_counts(
+                    column, model.entries, model.is_case_sensitive()
+                )
+            else:
+                counts = dataset.list_match_counts(column, [], True)
+                counts = {"valid": 0, "invalid": 0, "missing": counts["missing"]}
+            for key in ("valid", "invalid", "missing"):
+                stats[f"{field}_{key}"] = counts[key]
+                stats[key] += counts[key]
+        return stats
+
     def _get_validation_list_model(self, list_type: str) -> Optional[ValidationListModel]:
         """
         Get the validation list model for the specified list type.
@@ -1280,70 +1801,130 @@ class ValidationService(QObject):
         """
         Get a summary of validation issues.
 
+        The counts are maintained as validation results change, so the summary
+        is read in constant time. Before the first validation they are counted
+        once from the model's validation status.
+
         Returns:
             Dictionary with counts of validation issues by type
         """
         try:
-            validation_status = self._data_model.get_validation_status()
-            if validation_status.empty:
-                return {
-                    "total": 0,
-                    "valid": 0,
-                    "invalid": 0,
-                    "warning": 0,
-                    "not_validated": 0,
-                    "invalid_row": 0,
-                    "correctable": 0,
-                }
-
-            # Initialize counters
-            valid_count = 0
-            invalid_count = 0
-            warning_count = 0
-            not_validated_count = 0
-            invalid_row_count = 0
-            correctable_count = 0
-
-            # Count statuses
-            for col in validation_status.columns:
-                if col.endswith("_status"):
-                    for status in validation_status[col]:
-                        if status == ValidationStatus.VALID:
-                            valid_count += 1
-                        elif status == ValidationStatus.INVALID:
-                            invalid_count += 1
-                        elif status == ValidationStatus.WARNING:
-                            warning_count += 1
-                        elif status == ValidationStatus.NOT_VALIDATED:
-                            not_validated_count += 1
-                        elif status == ValidationStatus.INVALID_ROW:
-                            invalid_row_count += 1
-                        elif status == ValidationStatus.CORRECTABLE:
-                            correctable_count += 1
-
-            # Calculate total issues
-            total_issues = invalid_count + warning_count + invalid_row_count + correctable_count
-
-            return {
-                "total": total_issues,
-                "valid": valid_count,
-                "invalid": invalid_count,
-                "warning": warning_count,
-                "not_validated": not_validated_count,
-                "invalid_row": invalid_row_count,
-                "correctable": correctable_count,
-            }
+            if self._status_counts is None:
+                validation_status = self._data_model.get_validation_status()
+                if validation_status.empty:
+                    return self._summarize_counts({})
+                self._track_status_counts(validation_status)
+            return self._summarize_counts()
         except Exception as e:
             logger.error(f"Error getting validation summary: {e}")
-            return {
-                "total": 0,
-                "valid": 0,
-                "invalid": 0,
-                "warning": 0,
-                "not_validated": 0,
-                "invalid_row": 0,
-                "correctable": 0,
+            return self._summarize_counts({})
+
+    def get_column_summary(self, column_name: str) -> Dict[str, int]:
+        """
+        Get a summary of validation issues of one column.
+
+        Args:
+            column_name: Name of the data column
+
+        Returns:
+            Dictionary with counts of validation issues by type, all zero if
+            the column has not been validated
+        """
+        status_column = f"{column_name}_status"
+        counts = (self._status_counts or {}).get(status_column, {})
+        return self._summarize_counts({status_column: counts})
+
+    def _summarize_counts(
+        self, status_counts: Optional[Dict[str, Dict[ValidationStatus, int]]] = None
+    ) -> Dict[str, int]:
+        """
+        Build a summary from status counts.
+
+        Args:
+            status_counts: Counts per status column, the maintained counts if None
+
+        Returns:
+            Dict[str, int]: Count per summary key plus the total number of issues
+        """
+        if status_counts is None:
+            status_counts = self._status_counts or {}
+        summary = {"total": 0}
+        summary.update({key: 0 for key in self._SUMMARY_KEYS.values()})
+        for counts in status_counts.values():
+            for status, count in counts.items():
+                summary[self._SUMMARY_KEYS[status]] += count
+        summary["total"] = (
+            summary["invalid"]
+            + summary["warning"]
+            + summary["invalid_row"]
+            + summary["correctable"]
+        )
+        return summary
+
+    @staticmethod
+    def _count_statuses(status_df: pd.DataFrame) -> Dict[str, Dict[ValidationStatus, int]]:
+        """
+        Count the statuses of every status column.
+
+        Args:
+            status_df: A validation status DataFrame
+
+        Returns:
+            Dict[str, Dict[ValidationStatus, int]]: Count of each status per column
+        """
+        counts = {}
+        for column in status_df.columns:
+            if not column.endswith("_status"):
+                continue
+            # Enum members compare by identity, so this stays in C
+            values = status_df[column].to_numpy(dtype=object)
+            counts[column] = {
+                status: int(np.count_nonzero(values == status)) for status in ValidationStatus
             }
+        return counts
+
+    def _track_status_counts(self, status_df: pd.DataFrame) -> None:
+        """
+        Count a full validation status and keep its status columns for later deltas.
+
+        Args:
+            status_df: The full validation status DataFrame
+        """
+        self._status_counts = self._count_statuses(status_df)
+        self._status_frame = status_df[list(self._status_counts)].copy()
+
+    def _merge_status_rows(self, status_rows: pd.DataFrame) -> None:
+        """
+        Update the status counts with revalidated rows.
+
+        The counts of the rows' previous statuses are replaced by the counts of
+        their new statuses, so the update costs only the revalidated rows.
+
+        Args:
+            status_rows: Status DataFrame of the revalidated rows
+        """
+        if self._status_counts is None or self._status_frame is None:
+            return
+        columns = list(self._status_counts)
+        if not set(columns) <= set(status_rows.columns) or not status_rows.index.isin(
+            self._status_frame.index
+        ).all():
+            # The rows do not fit the tracked status; count again on demand
+            self._reset_status_counts()
+            return
+
+        previous = self._count_statuses(self._status_frame.loc[status_rows.index, columns])
+        current = self._count_statuses(status_rows[columns])
+        for column in columns:
+            counts = self._status_counts[column]
+            for status in ValidationStatus:
+                counts[status] += current[column][status] - previous[column][status]
+        self._status_frame.loc[status_rows.index, columns] = status_rows[columns]
+
+    def _reset_status_counts(self) -> None:
+        """Drop the status counts; they are counted again when next needed."""
+        self._status_counts = None
+        self._status_frame = None
 
     def export_validation_report(self, file_path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
         """
@@ -6,5 +6,6 @@ This module contains classes for tracking and representing data state.
 
 from chestbuddy.core.state.data_state import DataState
 from chestbuddy.core.state.data_dependency import DataDependency
+from chestbuddy.core.state.change_journal import ChangeJournal, ChangeTransaction
 
-__all__ = ["DataState", "DataDependency"]
+__all__ = ["DataState", "DataDependency", "ChangeJournal", "ChangeTransaction"]
@@ -0,0 +1,540 @@
+"""
+change_journal.py
+
+Description: Records cell edits and corrections as compact columnar deltas for undo/redo.
+Usage:
+    journal = data_model.journal
+    journal.set_state_manager(table_state_manager)
+
+    journal.begin("Apply corrections")
+    data_model.set_cell_value(0, "PLAYER", "John")
+    data_model.set_cell_value(1, "PLAYER", "Jane")
+    journal.commit()
+
+    journal.undo()  # Both cells revert in one step
+    journal.redo()
+"""
+
+import dataclasses
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeTransaction:
+    """
+    One undoable step: the cell deltas recorded between begin() and commit().
+
+    Deltas are stored column-wise in NumPy arrays (positional row, column index,
+    old value, new value) instead of one Python object per changed cell.
+
+    Attributes:
+        label (str): Human readable description shown in the Edit menu
+        timestamp (float): Time the transaction was committed
+        nbytes (int): Estimated memory used by the deltas while loaded
+
+    Implementation Notes:
+        - Deltas are kept in recording order; replaying old values in reverse
+          order restores the first old value of a cell that changed repeatedly
+        - A transaction can be spilled to a pickle file and loaded back on demand
+    """
+
+    def __init__(
+        self,
+        label: str,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+        old_states: Optional[Dict[Tuple[int, int], Any]] = None,
+    ):
+        """
+        Initialize a transaction from recorded deltas.
+
+        Args:
+            label: Description of the change
+            rows: Positional row indices (int64)
+            cols: Column indices (int32)
+            old_values: Values before the change (object)
+            new_values: Values after the change (object)
+            old_states: Cell states before the change, keyed by (row, col); None
+                marks a cell that had no stored state
+        """
+        self.label = label
+        self.timestamp = time.time()
+        self.rows = rows
+        self.cols = cols
+        self.old_values = old_values
+        self.new_values = new_values
+        self.old_states = old_states or {}
+        self._size = len(rows)
+        self._spill_path: Optional[str] = None
+        self.nbytes = self._estimate_nbytes()
+
+    def __len__(self) -> int:
+        """Number of recorded cell deltas."""
+        return self._size
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the deltas currently live on disk."""
+        return self._spill_path is not None
+
+    def spill(self, directory: str) -> None:
+        """
+        Move the deltas to a pickle file and release them from memory.
+
+        Args:
+            directory: Directory to write the spill file to
+        """
+        if self.is_spilled:
+            return
+        fd, path = tempfile.mkstemp(suffix=".delta", dir=directory)
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(
+                (self.rows, self.cols, self.old_values, self.new_values, self.old_states),
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        self._spill_path = path
+        self.rows = self.cols = self.old_values = self.new_values = None
+        self.old_states = {}
+
+    def load(self) -> None:
+        """Load spilled deltas back into memory and remove the spill file."""
+        if not self.is_spilled:
+            return
+        with open(self._spill_path, "rb") as handle:
+            self.rows, self.cols, self.old_values, self.new_values, self.old_states = pickle.load(
+                handle
+            )
+        self.discard()
+
+    def discard(self) -> None:
+        """Remove the spill file, if any."""
+        if self._spill_path is None:
+            return
+        try:
+            os.remove(self._spill_path)
+        except OSError as e:
+            logger.debug(f"Could not remove journal spill file {self._spill_path}: {e}")
+        self._spill_path = None
+
+    def _estimate_nbytes(self) -> int:
+        """Estimate the memory held by the delta arrays and the values they point to."""
+        nbytes = self.rows.nbytes + self.cols.nbytes
+        nbytes += self.old_values.nbytes + self.new_values.nbytes
+        nbytes += sum(sys.getsizeof(value) for value in self.old_values)
+        nbytes += sum(sys.getsizeof(value) for value in self.new_values)
+        nbytes += 200 * len(self.old_states)
+        return nbytes
+
+
+class ChangeJournal(QObject):
+    """
+    Undo/redo history of cell changes in the ChestDataModel.
+
+    The data model records every cell change it makes; callers group related
+    changes into one undoable step with begin()/commit(). Undo and redo write
+    the recorded values back column by column and restore the affected cell
+    states in the TableStateManager, without copying the whole DataFrame.
+
+    Attributes:
+        history_changed (Signal): Emitted when the undo or redo stack changes
+
+    Implementation Notes:
+        - Changes recorded outside begin()/commit() become single-cell steps
+        - Nested begin() calls are merged into the outermost transaction
+        - When the loaded transactions exceed the memory cap, the oldest ones are
+          spilled to a temporary directory and loaded again when undone
+        - Structural changes (loading a file, adding or removing rows) invalidate
+          positional deltas, so the data model clears the journal for them
+    """
+
+    history_changed = Signal()
+
+    DEFAULT_LABEL = "Edit cell"
+
+    def __init__(
+        self,
+        data_model: Any = None,
+        state_manager: Any = None,
+        max_memory_mb: float = 16.0,
+        max_transactions: int = 100,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            data_model: The ChestDataModel that changes are replayed into
+            state_manager: Optional TableStateManager whose cell states are restored
+            max_memory_mb: Memory cap for loaded transactions before spilling to disk
+            max_transactions: Maximum number of undo steps kept
+            spill_dir: Directory for spill files; a temporary one is created on demand
+        """
+        super().__init__()
+        self._data_model = data_model
+        self._state_manager = state_manager
+        self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._max_transactions = max(1, int(max_transactions))
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+
+        self._undo_stack: List[ChangeTransaction] = []
+        self._redo_stack: List[ChangeTransaction] = []
+
+        # Pending transaction
+        self._depth = 0
+        self._label = ""
+        self._chunks: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        self._pending: Tuple[List[int], List[int], List[Any], List[Any]] = ([], [], [], [])
+        self._pending_states: Dict[Tuple[int, int], Any] = {}
+
+        self._replaying = False
+
+    def set_state_manager(self, state_manager: Any) -> None:
+        """
+        Set the TableStateManager whose cell states are captured and restored.
+
+        Args:
+            state_manager: The TableStateManager instance
+        """
+        self._state_manager = state_manager
+
+    @property
+    def max_memory_bytes(self) -> int:
+        """Memory cap for loaded transactions."""
+        return self._max_memory_bytes
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated bytes held by transactions that are not spilled."""
+        return sum(
+            txn.nbytes for txn in self._undo_stack + self._redo_stack if not txn.is_spilled
+        )
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of transactions currently spilled to disk."""
+        return sum(1 for txn in self._undo_stack + self._redo_stack if txn.is_spilled)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether begin() has been called without a matching commit()."""
+        return self._depth > 0
+
+    @property
+    def is_replaying(self) -> bool:
+        """Whether an undo or redo is currently being applied."""
+        return self._replaying
+
+    def can_undo(self) -> bool:
+        """Whether there is a step to undo."""
+        return bool(self._undo_stack)
+
+    def can_redo(self) -> bool:
+        """Whether there is a step to redo."""
+        return bool(self._redo_stack)
+
+    def undo_label(self) -> str:
+        """Label of the step undo() would revert, or an empty string."""
+        return self._undo_stack[-1].label if self._undo_stack else ""
+
+    def redo_label(self) -> str:
+        """Label of the step redo() would reapply, or an empty string."""
+        return self._redo_stack[-1].label if self._redo_stack else ""
+
+    def begin(self, label: str = DEFAULT_LABEL) -> None:
+        """
+        Start grouping recorded changes into one undoable step.
+
+        Args:
+            label: Description of the step; ignored for nested calls
+        """
+        if self._depth == 0:
+            self._label = label
+        self._depth += 1
+
+    def record(self, row: int, col: int, old_value: Any, new_value: Any) -> None:
+        """
+        Record a single cell change.
+
+        Args:
+            row: Positional row index
+            col: Column index
+            old_value: Value before the change
+            new_value: Value after the change
+        """
+        if self._replaying:
+            return
+        auto_commit = self._depth == 0
+        if auto_commit:
+            self.begin(self.DEFAULT_LABEL)
+        rows, cols, old_values, new_values = self._pending
+        rows.append(int(row))
+        cols.append(int(col))
+        old_values.append(old_value)
+        new_values.append(new_value)
+        self._capture_state(int(row), int(col))
+        if auto_commit:
+            self.commit()
+
+    def record_many(
+        self,
+        rows: Sequence[int],
+        cols: Sequence[int],
+        old_values: Sequence[Any],
+        new_values: Sequence[Any],
+    ) -> None:
+        """
+        Record a block of cell changes given as parallel arrays.
+
+        Args:
+            rows: Positional row indices
+            cols: Column indices
+            old_values: Values before the change
+            new_values: Values after the change
+        """
+        if self._replaying or len(rows) == 0:
+            return
+        auto_commit = self._depth == 0
+        if auto_commit:
+            self.begin(self.DEFAULT_LABEL)
+        self._flush_pending()
+        chunk = (
+            np.asarray(rows, dtype=np.int64),
+            np.asarray(cols, dtype=np.int32),
+            _as_object_array(old_values),
+            _as_object_array(new_values),
+        )
+        self._chunks.append(chunk)
+        if self._state_manager is not None:
+            for row, col in zip(chunk[0].tolist(), chunk[1].tolist()):
+                self._capture_state(row, col)
+        if auto_commit:
+            self.commit()
+
+    def commit(self) -> Optional[ChangeTransaction]:
+        """
+        Close the current step and push it onto the undo stack.
+
+        Returns:
+            Optional[ChangeTransaction]: The committed transaction, or None if the
+            call closed a nested level or nothing was recorded
+        """
+        if self._depth == 0:
+            logger.warning("ChangeJournal.commit called without begin")
+            return None
+        self._depth -= 1
+        if self._depth > 0:
+            return None
+
+        transaction = self._take_pending()
+        if transaction is None:
+            return None
+
+        self._undo_stack.append(transaction)
+        for txn in self._redo_stack:
+            txn.discard()
+        self._redo_stack.clear()
+        self._enforce_limits()
+        logger.debug(f"Journal committed '{transaction.label}' with {len(transaction)} changes")
+        self.history_changed.emit()
+        return transaction
+
+    def rollback(self) -> None:
+        """Revert and discard the changes recorded since the outermost begin()."""
+        if self._depth == 0:
+            return
+        self._depth = 0
+        transaction = self._take_pending()
+        if transaction is not None:
+            self._replay(transaction, undo=True)
+            logger.debug(f"Journal rolled back '{transaction.label}'")
+
+    def undo(self) -> bool:
+        """
+        Revert the most recent step.
+
+        Returns:
+            bool: True if a step was undone
+        """
+        if not self._undo_stack or self._depth > 0:
+            return False
+        transaction = self._undo_stack.pop()
+        transaction.load()
+        self._replay(transaction, undo=True)
+        self._redo_stack.append(transaction)
+        self._enforce_limits()
+        logger.info(f"Undo: {transaction.label} ({len(transaction)} cells)")
+        self.history_changed.emit()
+        return True
+
+    def redo(self) -> bool:
+        """
+        Reapply the most recently undone step.
+
+        Returns:
+            bool: True if a step was redone
+        """
+        if not self._redo_stack or self._depth > 0:
+            return False
+        transaction = self._redo_stack.pop()
+        transaction.load()
+        self._replay(transaction, undo=False)
+        self._undo_stack.append(transaction)
+        self._enforce_limits()
+        logger.info(f"Redo: {transaction.label} ({len(transaction)} cells)")
+        self.history_changed.emit()
+        return True
+
+    def clear(self) -> None:
+        """Drop all history, including a pending transaction and spill files."""
+        had_history = bool(self._undo_stack or self._redo_stack)
+        for txn in self._undo_stack + self._redo_stack:
+            txn.discard()
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._depth = 0
+        self._take_pending()
+        if self._owns_spill_dir and self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+            self._owns_spill_dir = False
+        if had_history:
+            self.history_changed.emit()
+
+    def _capture_state(self, row: int, col: int) -> None:
+        """Remember a cell's state before its first change in the pending transaction."""
+        if self._state_manager is None or (row, col) in self._pending_states:
+            return
+        state = self._state_manager.get_full_cell_state(row, col)
+        if state is not None and dataclasses.is_dataclass(state):
+            state = dataclasses.replace(
+                state, correction_suggestions=list(state.correction_suggestions or [])
+            )
+        self._pending_states[(row, col)] = state
+
+    def _flush_pending(self) -> None:
+        """Convert the scalar pending lists into an array chunk."""
+        rows, cols, old_values, new_values = self._pending
+        if not rows:
+            return
+        self._chunks.append(
+            (
+                np.asarray(rows, dtype=np.int64),
+                np.asarray(cols, dtype=np.int32),
+                _as_object_array(old_values),
+                _as_object_array(new_values),
+            )
+        )
+        self._pending = ([], [], [], [])
+
+    def _take_pending(self) -> Optional[ChangeTransaction]:
+        """Build a transaction from the pending deltas and reset the pending state."""
+        self._flush_pending()
+        chunks, states, label = self._chunks, self._pending_states, self._label
+        self._chunks, self._pending_states, self._label = [], {}, ""
+        if not chunks:
+            return None
+        return ChangeTransaction(
+            label or self.DEFAULT_LABEL,
+            np.concatenate([chunk[0] for chunk in chunks]),
+            np.concatenate([chunk[1] for chunk in chunks]),
+            np.concatenate([chunk[2] for chunk in chunks]),
+            np.concatenate([chunk[3] for chunk in chunks]),
+            states,
+        )
+
+    def _replay(self, transaction: ChangeTransaction, undo: bool) -> None:
+        """
+        Write a transaction's values into the data model and update cell states.
+
+        Args:
+            transaction: The loaded transaction
+            undo: True to restore old values, False to reapply new values
+        """
+        if undo:
+            rows = transaction.rows[::-1]
+            cols = transaction.cols[::-1]
+            values = transaction.old_values[::-1]
+        else:
+            rows, cols, values = transaction.rows, transaction.cols, transaction.new_values
+
+        self._replaying = True
+        try:
+            if self._data_model is not None:
+                self._data_model.apply_cell_values(rows, cols, values, record=False)
+            if self._state_manager is not None:
+                self._replay_states(transaction, undo)
+        finally:
+            self._replaying = False
+
+    def _replay_states(self, transaction: ChangeTransaction, undo: bool) -> None:
+        """
+        Restore cell states after a replay.
+
+        Undo restores the states captured before the change. Redo clears the
+        states of the touched cells, since their values need revalidation.
+        """
+        from chestbuddy.core.table_state_manager import CellFullState
+
+        cells = set(zip(transaction.rows.tolist(), transaction.cols.tolist()))
+        changes = {}
+        for cell in cells:
+            state = transaction.old_states.get(cell) if undo else None
+            if state is None:
+                state = CellFullState()
+            else:
+                state = dataclasses.replace(
+                    state, correction_suggestions=list(state.correction_suggestions or [])
+                )
+            changes[cell] = state
+        if changes:
+            self._state_manager.update_states(changes)
+
+    def _enforce_limits(self) -> None:
+        """Drop steps beyond the count limit and spill the oldest ones above the memory cap."""
+        while len(self._undo_stack) > self._max_transactions:
+            self._undo_stack.pop(0).discard()
+
+        usage = self.memory_usage
+        if usage <= self._max_memory_bytes:
+            return
+        # Keep the newest undo step loaded so the common case never touches disk
+        for txn in self._undo_stack[:-1]:
+            if usage <= self._max_memory_bytes:
+                break
+            if txn.is_spilled:
+                continue
+            try:
+                txn.spill(self._ensure_spill_dir())
+                usage -= txn.nbytes
+            except OSError as e:
+                logger.error(f"Could not spill journal transaction '{txn.label}': {e}")
+                break
+
+    def _ensure_spill_dir(self) -> str:
+        """Return the spill directory, creating a temporary one if needed."""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="chestbuddy_journal_")
+            self._owns_spill_dir = True
+        return self._spill_dir
+
+
+def _as_object_array(values: Sequence[Any]) -> np.ndarray:
+    """Build a 1-D object array without NumPy unpacking nested sequences."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values) if not isinstance(values, np.ndarray) else values
+    return array
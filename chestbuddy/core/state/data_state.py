@@ -20,8 +20,9 @@ import time
 import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,8 @@ class DataState:
         _last_updated (float): Timestamp of last update
         _column_stats (Dict[str, Dict[str, Any]]): Statistics for each column
         _hash_value (str): Hash of the data state for quick comparison
+        _changed_ranges (Optional[List[Tuple[int, int, int, int]]]): Cell ranges
+            touched by the change that produced this state, or None if unknown
 
     Implementation Notes:
         - More efficient than serializing entire DataFrames
@@ -61,6 +64,7 @@ class DataState:
         self._last_updated: float = time.time()
         self._column_stats: Dict[str, Dict[str, Any]] = {}
         self._hash_value: str = ""
+        self._changed_ranges: Optional[List[Tuple[int, int, int, int]]] = None
 
         # Initialize state from data if provided
         if data is not None:
@@ -76,6 +80,7 @@ class DataState:
         self._row_count = len(data)
         self._column_names = list(data.columns)
         self._last_updated = time.time()
+        self._changed_ranges = None
 
         # Calculate column statistics for change detection
         self._calculate_column_stats(data)
@@ -255,6 +260,54 @@ class DataState:
         """
         return self._last_updated
 
+    @property
+    def changed_ranges(self) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        Get the cell ranges touched by the change that produced this state.
+
+        Returns:
+            List of (first_row, first_col, last_row, last_col) ranges, inclusive,
+            or None if any cell may have changed
+        """
+        return self._changed_ranges
+
+    def set_changed_ranges(self, ranges: Optional[List[Tuple[int, int, int, int]]]) -> None:
+        """
+        Set the cell ranges touched by the change that produced this state.
+
+        Args:
+            ranges: (first_row, first_col, last_row, last_col) ranges, or None if unknown
+        """
+        self._changed_ranges = list(ranges) if ranges is not None else None
+
+    @staticmethod
+    def ranges_from_cells(rows: np.ndarray, cols: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """
+        Group cell positions into ranges of consecutive rows within a column.
+
+        Args:
+            rows: Row positions
+            cols: Column positions, parallel to rows
+
+        Returns:
+            List of (first_row, col, last_row, col) ranges, ordered by column and row
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        order = np.lexsort((rows, cols))
+        rows, cols = rows[order], cols[order]
+        # A new range starts where the column changes or the rows are not consecutive
+        starts = np.flatnonzero(
+            np.concatenate(([True], (np.diff(cols) != 0) | (np.diff(rows) > 1)))
+        )
+        ends = np.concatenate((starts[1:], [len(rows)])) - 1
+        return [
+            (int(rows[start]), int(cols[start]), int(rows[end]), int(cols[start]))
+            for start, end in zip(starts, ends)
+        ]
+
     def get_column_stats(self, column: str) -> Dict[str, Any]:
         """
         Get statistics for a specific column.
@@ -0,0 +1,13 @@
+"""
+Storage package initialization file.
+
+This module contains optional storage backends for data that does not fit in memory.
+"""
+
+from chestbuddy.core.storage.dataset_store import (
+    DatasetStore,
+    StorageUnavailableError,
+    storage_available,
+)
+
+__all__ = ["DatasetStore", "StorageUnavailableError", "storage_available"]
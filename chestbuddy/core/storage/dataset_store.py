@@ -0,0 +1,546 @@
+"""
+dataset_store.py
+
+Description: Out-of-core chest data stored as Parquet and queried through embedded DuckDB.
+Usage:
+    from chestbuddy.core.storage import DatasetStore, storage_available
+
+    if storage_available():
+        store = DatasetStore.import_csv("history.csv", "history.parquet")
+        data_model.attach_dataset(store)
+
+        first_page = store.rows(0, 100)
+        totals = store.aggregate("PLAYER", "SCORE", "sum")
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # Optional dependency, see the "storage" extra
+    duckdb = None
+
+try:
+    # Lets DuckDB return Arrow-backed frames instead of object columns
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+ROW_ID = "_row_id"
+
+_AGGREGATES = {"sum", "count", "avg", "min", "max"}
+_FILTER_MODES = {"Contains", "Equals", "Starts with", "Ends with"}
+
+
+class StorageUnavailableError(RuntimeError):
+    """Raised when the out-of-core backend is used without DuckDB installed."""
+
+
+def storage_available() -> bool:
+    """
+    Check whether the out-of-core backend can be used.
+
+    Returns:
+        bool: True if DuckDB is installed
+    """
+    return duckdb is not None
+
+
+def _identifier(name: str) -> str:
+    """Quote a column name for use in SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(value: Union[str, Path]) -> str:
+    """Quote a string, such as a file path, as a SQL literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class DatasetStore:
+    """
+    Read access to a Parquet dataset through an embedded DuckDB connection.
+
+    Rows are addressed by a ``_row_id`` column written at import time, so row
+    positions are stable and a window of rows can be read without scanning
+    the whole dataset. Windows are fetched in fixed-size pages that are kept
+    in a small LRU cache for the table view. Filters, aggregates, sorting and
+    validation list checks run inside DuckDB and only return their results.
+
+    Attributes:
+        path (Path): Parquet file or directory of Parquet files
+        page_size (int): Number of rows fetched per page
+
+    Implementation Notes:
+        - The DuckDB connection is shared and guarded by a lock, so the store
+          can be queried from background tasks
+        - With pyarrow installed, pages use Arrow-backed dtypes instead of
+          Python objects for text columns
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        page_size: int = 5000,
+        max_pages: int = 8,
+        memory_limit: Optional[str] = None,
+    ):
+        """
+        Open a Parquet dataset.
+
+        Args:
+            path: Parquet file or directory of Parquet files with a _row_id column
+            page_size: Number of rows fetched per page
+            max_pages: Number of pages kept in memory
+            memory_limit: DuckDB memory limit such as "2GB", or None for its default
+
+        Raises:
+            StorageUnavailableError: If DuckDB is not installed
+            ValueError: If the dataset has no _row_id column
+        """
+        if duckdb is None:
+            raise StorageUnavailableError(
+                "The out-of-core backend requires DuckDB (pip install chestbuddy[storage])"
+            )
+
+        self.path = Path(path)
+        self.page_size = max(1, page_size)
+        self._max_pages = max(1, max_pages)
+        self._pages: "OrderedDict[int, pd.DataFrame]" = OrderedDict()
+        self._sort_orders: "OrderedDict[Tuple[Tuple[str, bool], ...], np.ndarray]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._con = duckdb.connect()
+        if memory_limit:
+            self._con.execute(f"SET memory_limit = {_literal(memory_limit)}")
+
+        source = self.path / "*.parquet" if self.path.is_dir() else self.path
+        self._con.execute(
+            f"CREATE VIEW chest_data AS SELECT * FROM read_parquet({_literal(source)})"
+        )
+
+        columns = [row[0] for row in self._con.execute("DESCRIBE chest_data").fetchall()]
+        if ROW_ID not in columns:
+            self._con.close()
+            raise ValueError(f"Dataset {self.path} has no {ROW_ID} column")
+        self._columns = [column for column in columns if column != ROW_ID]
+        self._row_count = int(self._con.execute("SELECT count(*) FROM chest_data").fetchone()[0])
+        logger.info(
+            f"Opened dataset {self.path}: {self._row_count} rows, {len(self._columns)} columns"
+        )
+
+    @classmethod
+    def import_csv(
+        cls,
+        csv_path: Union[str, Path],
+        dataset_path: Union[str, Path],
+        row_group_size: int = 100_000,
+        canonical_columns: Sequence[str] = (),
+        **kwargs: Any,
+    ) -> "DatasetStore":
+        """
+        Convert a CSV file to a Parquet dataset and open it.
+
+        The conversion streams through DuckDB, so the CSV never has to fit
+        in memory. All columns are read as text, like the pandas CSV reader.
+        The file is written under a temporary name and renamed when complete,
+        so an interrupted import never leaves a partial dataset behind.
+
+        Args:
+            csv_path: CSV file to import
+            dataset_path: Parquet file to write
+            row_group_size: Rows per Parquet row group
+            canonical_columns: Column names to use for CSV columns whose name
+                matches one of them ignoring case
+            **kwargs: Passed on to DatasetStore
+
+        Returns:
+            DatasetStore: The opened dataset
+
+        Raises:
+            StorageUnavailableError: If DuckDB is not installed
+        """
+        if duckdb is None:
+            raise StorageUnavailableError(
+                "The out-of-core backend requires DuckDB (pip install chestbuddy[storage])"
+            )
+
+        dataset_path = Path(dataset_path)
+        dataset_path.parent.mkdir(parents=True, exist_ok=True)
+        source = f"read_csv_auto({_literal(csv_path)}, all_varchar = true)"
+        renames = {str(column).upper(): str(column) for column in canonical_columns}
+        partial_path = dataset_path.with_name(dataset_path.name + ".partial")
+        con = duckdb.connect()
+        try:
+            columns = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+            select = ", ".join(
+                f"{_identifier(column)} AS {_identifier(renames.get(column.upper(), column))}"
+                for column in columns
+            )
+            con.execute(
+                f"COPY (SELECT row_number() OVER () - 1 AS {ROW_ID}, {select} FROM {source}) "
+                f"TO {_literal(partial_path)} "
+                f"(FORMAT PARQUET, ROW_GROUP_SIZE {int(row_group_size)})"
+            )
+            partial_path.replace(dataset_path)
+        finally:
+            con.close()
+            partial_path.unlink(missing_ok=True)
+        logger.info(f"Imported {csv_path} into {dataset_path}")
+        return cls(dataset_path, **kwargs)
+
+    # --- Shape --- #
+
+    @property
+    def row_count(self) -> int:
+        """
+        Get the number of rows in the dataset.
+
+        Returns:
+            int: Number of rows
+        """
+        return self._row_count
+
+    @property
+    def column_names(self) -> List[str]:
+        """
+        Get the column names of the dataset.
+
+        Returns:
+            List[str]: Column names without the internal row id
+        """
+        return list(self._columns)
+
+    def close(self) -> None:
+        """Close the DuckDB connection and drop cached pages."""
+        with self._lock:
+            self._pages.clear()
+            self._sort_orders.clear()
+            self._con.close()
+
+    # --- Windowed row access --- #
+
+    def page(self, page_number: int) -> pd.DataFrame:
+        """
+        Get one page of rows, from the cache if possible.
+
+        Args:
+            page_number: Zero-based page number
+
+        Returns:
+            pd.DataFrame: Rows of the page, indexed by row id
+        """
+        with self._lock:
+            cached = self._pages.get(page_number)
+            if cached is not None:
+                self._pages.move_to_end(page_number)
+                return cached
+
+            start = page_number * self.page_size
+            frame = self._query(
+                f"SELECT * FROM chest_data WHERE {ROW_ID} >= ? AND {ROW_ID} < ? ORDER BY {ROW_ID}",
+                [start, start + self.page_size],
+            ).set_index(ROW_ID)
+            self._pages[page_number] = frame
+            while len(self._pages) > self._max_pages:
+                self._pages.popitem(last=False)
+            return frame
+
+    def rows(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        Get a window of rows.
+
+        Args:
+            start: First row
+            stop: Row after the last row
+
+        Returns:
+            pd.DataFrame: The rows, indexed by row id
+        """
+        start = max(0, start)
+        stop = min(stop, self._row_count)
+        if stop <= start:
+            return pd.DataFrame(columns=self._columns)
+        first, last = start // self.page_size, (stop - 1) // self.page_size
+        pages = [self.page(number) for number in range(first, last + 1)]
+        frame = pages[0] if len(pages) == 1 else pd.concat(pages)
+        return frame.loc[start : stop - 1]
+
+    def value_at(self, row: int, column: Union[int, str]) -> Any:
+        """
+        Get the value of one cell.
+
+        Args:
+            row: Row position
+            column: Column position or name
+
+        Returns:
+            Any: The cell value, or None if the cell does not exist
+        """
+        if not 0 <= row < self._row_count:
+            return None
+        name = self._columns[column] if isinstance(column, int) else column
+        frame = self.page(row // self.page_size)
+        try:
+            value = frame.at[row, name]
+        except KeyError:
+            return None
+        return None if pd.isna(value) else value
+
+    # --- Pushed-down queries --- #
+
+    def sorted_row_ids(self, keys: Sequence[Tuple[Union[int, str], bool]]) -> np.ndarray:
+        """
+        Get the row order for a multi-column sort.
+
+        Ties keep their row order and missing values sort last. Recent
+        orders are cached.
+
+        Args:
+            keys: (column, ascending) pairs, most significant first
+
+        Returns:
+            np.ndarray: Row id for each sorted position
+        """
+        named = tuple(
+            (self._columns[col] if isinstance(col, int) else col, bool(ascending))
+            for col, ascending in keys
+        )
+        with self._lock:
+            cached = self._sort_orders.get(named)
+            if cached is not None:
+                self._sort_orders.move_to_end(named)
+                return cached
+
+        terms = [
+            f"{_identifier(self._column(name))} {'ASC' if ascending else 'DESC'} NULLS LAST"
+            for name, ascending in named
+        ]
+        order_by = ", ".join(terms + [ROW_ID])
+        order = self._fetch_ids(f"SELECT {ROW_ID} FROM chest_data ORDER BY {order_by}")
+
+        with self._lock:
+            self._sort_orders[named] = order
+            while len(self._sort_orders) > self._max_pages:
+                self._sort_orders.popitem(last=False)
+        return order
+
+    def filter_row_ids(
+        self, column: str, text: str, mode: str = "Contains", case_sensitive: bool = False
+    ) -> np.ndarray:
+        """
+        Get the rows whose column matches a text filter.
+
+        Args:
+            column: Column to filter on
+            text: Text to match
+            mode: 'Contains', 'Equals', 'Starts with' or 'Ends with'
+            case_sensitive: Whether the match is case sensitive
+
+        Returns:
+            np.ndarray: Matching row ids in row order
+        """
+        condition, params = self._filter_condition(column, text, mode, case_sensitive)
+        return self._fetch_ids(
+            f"SELECT {ROW_ID} FROM chest_data WHERE {condition} ORDER BY {ROW_ID}", params
+        )
+
+    def filter_rows(
+        self,
+        column: str,
+        text: str,
+        mode: str = "Contains",
+        case_sensitive: bool = False,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Get the rows whose column matches a text filter.
+
+        Args:
+            column: Column to filter on
+            text: Text to match
+            mode: 'Contains', 'Equals', 'Starts with' or 'Ends with'
+            case_sensitive: Whether the match is case sensitive
+            limit: Maximum number of rows to return, or None for all matches
+
+        Returns:
+            pd.DataFrame: The first matching rows, indexed by row id
+        """
+        condition, params = self._filter_condition(column, text, mode, case_sensitive)
+        sql = f"SELECT * FROM chest_data WHERE {condition} ORDER BY {ROW_ID}"
+        if limit is not None:
+            sql += f" LIMIT {max(0, int(limit))}"
+        return self._query(sql, params).set_index(ROW_ID)
+
+    def aggregate(
+        self,
+        group_by: Union[str, Sequence[str]],
+        value_column: Optional[str] = None,
+        func: str = "sum",
+    ) -> pd.DataFrame:
+        """
+        Aggregate a column per group.
+
+        Args:
+            group_by: Column or columns to group by
+            value_column: Column to aggregate, or None to count rows
+            func: 'sum', 'count', 'avg', 'min' or 'max'
+
+        Returns:
+            pd.DataFrame: One row per group with the group columns and "value"
+        """
+        func = func.lower()
+        if func not in _AGGREGATES:
+            raise ValueError(f"Unsupported aggregate: {func}")
+        groups = [group_by] if isinstance(group_by, str) else list(group_by)
+        group_sql = ", ".join(_identifier(self._column(column)) for column in groups)
+
+        if value_column is None:
+            measure = "count(*)"
+        else:
+            target = _identifier(self._column(value_column))
+            if func != "count":
+                target = f"TRY_CAST({target} AS DOUBLE)"
+            measure = f"{func}({target})"
+        return self._query(
+            f"SELECT {group_sql}, {measure} AS value FROM chest_data "
+            f"GROUP BY {group_sql} ORDER BY {group_sql}"
+        )
+
+    def unique_values(self, column: str) -> List[str]:
+        """
+        Get the distinct non-missing values of a column.
+
+        Args:
+            column: Column name
+
+        Returns:
+            List[str]: Distinct values as text
+        """
+        name = _identifier(self._column(column))
+        with self._lock:
+            rows = self._con.execute(
+                f"SELECT DISTINCT CAST({name} AS VARCHAR) FROM chest_data "
+                f"WHERE {name} IS NOT NULL ORDER BY 1"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_match_counts(
+        self, column: str, entries: Iterable[str], case_sensitive: bool = True
+    ) -> Dict[str, int]:
+        """
+        Count how many values of a column are in a validation list.
+
+        Args:
+            column: Column to check
+            entries: Validation list entries
+            case_sensitive: Whether values must match the case of the entries
+
+        Returns:
+            Dict[str, int]: "valid", "invalid" and "missing" counts
+        """
+        value = self._list_value(column, case_sensitive)
+        with self._lock:
+            self._register_entries(entries, case_sensitive)
+            try:
+                missing, valid, total = self._con.execute(
+                    f"SELECT count(*) FILTER (WHERE {value} IS NULL OR {value} = ''), "
+                    f"count(*) FILTER (WHERE {value} IN (SELECT value FROM list_entries)), "
+                    f"count(*) FROM chest_data"
+                ).fetchone()
+            finally:
+                self._con.unregister("list_entries")
+        missing, valid = int(missing), int(valid)
+        return {"valid": valid, "invalid": int(total) - missing - valid, "missing": missing}
+
+    def invalid_row_ids(
+        self, column: str, entries: Iterable[str], case_sensitive: bool = True
+    ) -> np.ndarray:
+        """
+        Get the rows whose non-empty value is not in a validation list.
+
+        Args:
+            column: Column to check
+            entries: Validation list entries
+            case_sensitive: Whether values must match the case of the entries
+
+        Returns:
+            np.ndarray: Row ids of invalid values in row order
+        """
+        value = self._list_value(column, case_sensitive, alias="d")
+        with self._lock:
+            self._register_entries(entries, case_sensitive)
+            try:
+                return self._fetch_ids(
+                    f"SELECT d.{ROW_ID} FROM chest_data d "
+                    f"ANTI JOIN list_entries e ON {value} = e.value "
+                    f"WHERE {value} <> '' ORDER BY d.{ROW_ID}"
+                )
+            finally:
+                self._con.unregister("list_entries")
+
+    # --- Helpers --- #
+
+    def _column(self, name: str) -> str:
+        """Check that a column exists and return its name."""
+        if name not in self._columns:
+            raise KeyError(f"Column {name} does not exist in the dataset")
+        return name
+
+    def _list_value(self, column: str, case_sensitive: bool, alias: str = "") -> str:
+        """SQL expression for a column value as compared against a validation list."""
+        prefix = f"{alias}." if alias else ""
+        value = f"CAST({prefix}{_identifier(self._column(column))} AS VARCHAR)"
+        return value if case_sensitive else f"lower({value})"
+
+    def _filter_condition(
+        self, column: str, text: str, mode: str, case_sensitive: bool
+    ) -> Tuple[str, list]:
+        """Build the WHERE condition and parameters of a text filter."""
+        if mode not in _FILTER_MODES:
+            logger.warning(f"Unknown filter mode: {mode}, defaulting to 'Equals'")
+            mode = "Equals"
+        value = f"CAST({_identifier(self._column(column))} AS VARCHAR)"
+        if not case_sensitive:
+            value, text = f"lower({value})", text.lower()
+        condition = {
+            "Contains": f"contains({value}, ?)",
+            "Equals": f"{value} = ?",
+            "Starts with": f"starts_with({value}, ?)",
+            "Ends with": f"ends_with({value}, ?)",
+        }[mode]
+        return condition, [text]
+
+    def _register_entries(self, entries: Iterable[str], case_sensitive: bool) -> None:
+        """Expose validation list entries to DuckDB as the list_entries table."""
+        values = [str(entry) for entry in entries]
+        if not case_sensitive:
+            values = [value.lower() for value in values]
+        self._con.register("list_entries", pd.DataFrame({"value": values}, dtype=object))
+
+    def _query(self, sql: str, params: Optional[list] = None) -> pd.DataFrame:
+        """Run a query and return its result as a DataFrame."""
+        with self._lock:
+            result = self._con.execute(sql, params or [])
+            if pyarrow is None:
+                return result.df()
+            if hasattr(result, "to_arrow_table"):
+                table = result.to_arrow_table()
+            else:  # DuckDB before 1.4
+                table = result.fetch_arrow_table()
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _fetch_ids(self, sql: str, params: Optional[list] = None) -> np.ndarray:
+        """Run a query returning row ids and return them as an array."""
+        with self._lock:
+            rows = self._con.execute(sql, params or []).fetchnumpy()
+        return np.asarray(rows[ROW_ID], dtype=np.int64)
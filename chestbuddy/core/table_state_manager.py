@@ -6,17 +6,24 @@ Usage:
     manager = TableStateManager(data_model)
     manager.set_cell_state(0, 1, CellState.INVALID)
     manager.process_in_batches(process_func, total_rows, progress_callback)
+
+    # Aggregate counts are maintained on every change and read in constant time
+    invalid_rows = manager.issue_row_count()
 """
 
 import logging
 import time
+from collections import Counter, defaultdict
 from enum import Enum
-from typing import Dict, List, Tuple, Callable, Any, Set, Optional
+from typing import Dict, List, Tuple, Callable, Any, KeysView, Set, Optional
 import pandas as pd
 from PySide6.QtCore import QObject, Signal, Slot, Qt
 from PySide6.QtWidgets import QApplication
 from dataclasses import dataclass, field
 from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.utils.log_pipeline import hot_path
+from chestbuddy.utils.span_tracer import span_tracer
+from chestbuddy.utils.signal_tracer import signal_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -65,6 +72,12 @@ class TableStateManager(QObject):
     Attributes:
         state_changed (Signal): Emitted when cell states change
         BATCH_SIZE (int): Number of rows to process in each batch
+        ISSUE_STATES (frozenset): States that count a row as having an issue
+
+    Implementation Notes:
+        - Cell counts per state, per column and the rows holding each state are
+          updated with every stored state change, so summaries never scan the
+          cells; cells in the default NORMAL state are not counted
     """
 
     # Signals
@@ -73,6 +86,9 @@ class TableStateManager(QObject):
     # Default batch size
     BATCH_SIZE = 100
 
+    # States that mark a row as having a validation issue
+    ISSUE_STATES = frozenset({CellState.INVALID, CellState.CORRECTABLE})
+
     def __init__(self, data_model):
         """
         Initialize the TableStateManager with a data model.
@@ -86,6 +102,7 @@ class TableStateManager(QObject):
         self._cell_states: Dict[Tuple[int, int], CellFullState] = {}
         # _cell_details is now part of CellFullState
         # self._cell_details = {}
+        self._reset_counters()
         self._headers_map = self._create_headers_map()
         logger.debug("TableStateManager initialized")
 
@@ -149,12 +166,16 @@ class TableStateManager(QObject):
         """DEPRECATED - Use update_states. Sets only the validation status part of the state."""
         logger.warning("set_cell_state is deprecated, use update_states for full state management.")
         key = (row, col)
-        current_full_state = self._cell_states.get(key, CellFullState())
+        stored_state = self._cell_states.get(key)
+        current_full_state = stored_state or CellFullState()
         if current_full_state.validation_status != state:
+            self._count_change(
+                key, stored_state.validation_status if stored_state else None, state
+            )
             current_full_state.validation_status = state
             self._cell_states[key] = current_full_state
-            self.state_changed.emit({key})
-            logger.debug(f"Cell ({row}, {col}) validation state set to {state.name}")
+            signal_tracer.emit(self, "state_changed", {key})
+            hot_path.debug(logger, "Cell (%d, %d) validation state set to %s", row, col, state.name)
 
     def get_cell_state(self, row: int, col: int) -> CellState:
         """Gets only the validation status part of the cell's state."""
@@ -170,8 +191,8 @@ class TableStateManager(QObject):
         if current_full_state.error_details != detail:
             current_full_state.error_details = detail
             self._cell_states[key] = current_full_state
-            self.state_changed.emit({key})
-            logger.debug(f"Cell ({row}, {col}) details set.")
+            signal_tracer.emit(self, "state_changed", {key})
+            hot_path.debug(logger, "Cell (%d, %d) details set.", row, col)
 
     def get_cell_details(self, row: int, col: int) -> str:
         """Gets only the error details part of the cell's state."""
@@ -189,6 +210,19 @@ class TableStateManager(QObject):
         # For performance, returning direct reference might be okay if callers are trusted.
         return self._cell_states.get((row, col))
 
+    def stored_cells(self) -> KeysView[Tuple[int, int]]:
+        """
+        Get the cells that have an explicitly stored state.
+
+        Cells without a stored state are in the default NORMAL state, so adapters
+        only need to compare these cells and cells with a non-default new state.
+
+        Returns:
+            KeysView[Tuple[int, int]]: (row, col) keys of the stored states
+        """
+        return self._cell_states.keys()
+
+    @span_tracer.trace("TableStateManager.update_states", "state")
     def update_states(self, changes: Dict[Tuple[int, int], CellFullState]) -> None:
         """
         Updates the state for multiple cells at once.
@@ -204,11 +238,17 @@ class TableStateManager(QObject):
         """
         affected_cells: Set[Tuple[int, int]] = set()
         for key, change_state in changes.items():
-            current_state = self._cell_states.get(key, CellFullState())
+            stored_state = self._cell_states.get(key)
+            current_state = stored_state or CellFullState()
             changed = False
 
             # Merge validation status if provided in change
             if change_state.validation_status != current_state.validation_status:
+                self._count_change(
+                    key,
+                    stored_state.validation_status if stored_state else None,
+                    change_state.validation_status,
+                )
                 current_state.validation_status = change_state.validation_status
                 changed = True
 
@@ -233,38 +273,31 @@ class TableStateManager(QObject):
             #        affected_cells.add(key) # Still needs UI update
 
         if affected_cells:
-            logger.debug(f"Updated state for {len(affected_cells)} cells.")
-            # DEBUG: Log the state dictionary and affected cells
-            print(f"DEBUG [TableStateManager]: _cell_states = {self._cell_states}")
-            print(f"DEBUG [TableStateManager]: affected_cells = {affected_cells}")
-            # --- Add explicit print before emit --- #
-            print(
-                f"---> TableStateManager: Emitting state_changed with {len(affected_cells)} affected cells."
-            )
-            # ---------------------------------------- #
-            self.state_changed.emit(affected_cells)
+            hot_path.debug(logger, "Updated state for %d cells.", len(affected_cells))
+            signal_tracer.emit(self, "state_changed", affected_cells)
         else:
-            logger.debug("No state changes detected in update_states call.")
+            hot_path.debug(logger, "No state changes detected in update_states call.")
 
     def reset_cell_states(self) -> None:
         """Reset all cell states to default."""
         # Get all previously affected cells to notify UI
         affected_cells = set(self._cell_states.keys())
         self._cell_states = {}
+        self._reset_counters()
         # self._cell_details = {} # Removed
         logger.debug("All cell states reset")
         if affected_cells:
-            self.state_changed.emit(affected_cells)
+            signal_tracer.emit(self, "state_changed", affected_cells)
 
     def reset_cell_state(self, row: int, col: int) -> None:
         """Reset a specific cell state to default."""
         key = (row, col)
         if key in self._cell_states:
-            del self._cell_states[key]
+            self._count_change(key, self._cell_states.pop(key).validation_status, None)
             # if key in self._cell_details: # Removed
             #     del self._cell_details[key]
-            logger.debug(f"Cell ({row}, {col}) state reset")
-            self.state_changed.emit({key})
+            hot_path.debug(logger, "Cell (%d, %d) state reset", row, col)
+            signal_tracer.emit(self, "state_changed", {key})
 
     def reset_rows(self, rows: List[int]) -> None:
         """
@@ -275,13 +308,13 @@ class TableStateManager(QObject):
         for key in list(self._cell_states.keys()):  # Iterate over a copy of keys
             row, _ = key
             if row in rows_set:
-                del self._cell_states[key]
+                self._count_change(key, self._cell_states.pop(key).validation_status, None)
                 affected_cells.add(key)
                 # if key in self._cell_details: # Removed
                 #     del self._cell_details[key]
-        logger.debug(f"Reset states for rows: {rows}")
+        hot_path.debug(logger, "Reset states for %d rows", len(rows))
         if affected_cells:
-            self.state_changed.emit(affected_cells)
+            signal_tracer.emit(self, "state_changed", affected_cells)
 
     def get_cells_by_state(self, state: CellState) -> List[Tuple[int, int]]:
         """
@@ -299,6 +332,123 @@ class TableStateManager(QObject):
             if full_state.validation_status == state
         ]
 
+    def count_cells(self, state: CellState) -> int:
+        """
+        Get the number of cells in a state.
+
+        Args:
+            state: The state to count, other than NORMAL
+
+        Returns:
+            int: Number of cells with the state
+        """
+        return self._state_counts[state]
+
+    def column_state_counts(self, col: int) -> Dict[CellState, int]:
+        """
+        Get the number of cells per state in a column.
+
+        Args:
+            col: Column index
+
+        Returns:
+            Dict[CellState, int]: Cell count of each state present in the column
+        """
+        return dict(self._column_state_counts.get(col, {}))
+
+    def count_rows(self, state: CellState) -> int:
+        """
+        Get the number of rows with at least one cell in a state.
+
+        Args:
+            state: The state to look for, other than NORMAL
+
+        Returns:
+            int: Number of rows with the state
+        """
+        return len(self._row_state_counts.get(state, ()))
+
+    def issue_row_count(self) -> int:
+        """
+        Get the number of rows with at least one invalid or correctable cell.
+
+        Returns:
+            int: Number of rows with an issue
+        """
+        return len(self._issue_row_counts)
+
+    def issue_rows(self) -> List[int]:
+        """
+        Get the rows with at least one invalid or correctable cell.
+
+        Returns:
+            List[int]: Sorted row indices
+        """
+        return sorted(self._issue_row_counts)
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Get the aggregate counts of the stored states.
+
+        Returns:
+            Dict[str, int]: Cell counts per state name in lower case, plus
+                "issue_rows" and "corrected_rows"
+        """
+        summary = {
+            state.name.lower(): self._state_counts[state]
+            for state in CellState
+            if state is not CellState.NORMAL
+        }
+        summary["issue_rows"] = len(self._issue_row_counts)
+        summary["corrected_rows"] = self.count_rows(CellState.CORRECTED)
+        return summary
+
+    def _reset_counters(self) -> None:
+        """Clear all aggregate counters."""
+        self._state_counts: Counter = Counter()
+        self._column_state_counts: Dict[int, Counter] = defaultdict(Counter)
+        self._row_state_counts: Dict[CellState, Counter] = defaultdict(Counter)
+        self._issue_row_counts: Counter = Counter()
+
+    def _count_change(
+        self,
+        key: Tuple[int, int],
+        old_state: Optional[CellState],
+        new_state: Optional[CellState],
+    ) -> None:
+        """
+        Move a cell between the aggregate counters.
+
+        Args:
+            key: (row, col) of the cell
+            old_state: State before the change, None if no state was stored
+            new_state: State after the change, None if the state is removed
+        """
+        if old_state is new_state:
+            return
+        row, col = key
+        if old_state is not None and old_state is not CellState.NORMAL:
+            self._decrement(self._state_counts, old_state)
+            self._decrement(self._column_state_counts[col], old_state)
+            self._decrement(self._row_state_counts[old_state], row)
+            if old_state in self.ISSUE_STATES:
+                self._decrement(self._issue_row_counts, row)
+        if new_state is not None and new_state is not CellState.NORMAL:
+            self._state_counts[new_state] += 1
+            self._column_state_counts[col][new_state] += 1
+            self._row_state_counts[new_state][row] += 1
+            if new_state in self.ISSUE_STATES:
+                self._issue_row_counts[row] += 1
+
+    @staticmethod
+    def _decrement(counter: Counter, key: Any) -> None:
+        """Decrement a count, removing the key when it reaches zero."""
+        count = counter.get(key, 0) - 1
+        if count > 0:
+            counter[key] = count
+        else:
+            counter.pop(key, None)
+
     def process_in_batches(
         self,
         process_func: Callable[[int], Any],
@@ -331,9 +481,12 @@ class TableStateManager(QObject):
             batch_end = min(batch_start + self.BATCH_SIZE, total_rows)
             batch_size = batch_end - batch_start
 
-            logger.debug(
-                f"Processing batch {batch_start // self.BATCH_SIZE + 1}: "
-                f"rows {batch_start} to {batch_end - 1}"
+            hot_path.debug(
+                logger,
+                "Processing batch %d: rows %d to %d",
+                batch_start // self.BATCH_SIZE + 1,
+                batch_start,
+                batch_end - 1,
             )
 
             # Process each row in the batch
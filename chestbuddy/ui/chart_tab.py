@@ -200,7 +200,7 @@ class ChartTab(QWidget):
         self.group_by_combo.setEnabled(is_line_chart)
 
         # Create a new chart if possible
-        if self.data_model.data is not None and not self.data_model.data.empty:
+        if not self.data_model.is_empty:
             self._create_chart()
 
     def _on_data_changed(self):
@@ -225,10 +225,9 @@ class ChartTab(QWidget):
         self.group_by_combo.clear()
         self.group_by_combo.addItem("None")  # Always keep None as an option
 
-        # Get dataframe columns
-        df = self.data_model.data
-        if df is not None and not df.empty:
-            columns = df.columns.tolist()
+        # Get model columns; an attached dataset has no in-memory frame
+        if not self.data_model.is_empty:
+            columns = self.data_model.column_names
 
             # Add columns to combos
             self.x_axis_combo.addItems(columns)
@@ -268,9 +267,7 @@ class ChartTab(QWidget):
             This method is primarily for testing. It avoids UI operations
             that might cause access violations in tests.
         """
-        df = self.data_model.data
-
-        if df is None or df.empty:
+        if self.data_model.is_empty:
             return None
 
         try:
@@ -313,9 +310,7 @@ class ChartTab(QWidget):
 
     def _create_chart(self):
         """Create a chart based on current selections."""
-        df = self.data_model.data
-
-        if df is None or df.empty:
+        if self.data_model.is_empty:
             return
 
         try:
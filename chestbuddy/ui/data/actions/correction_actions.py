@@ -69,7 +69,7 @@ class ApplyCorrectionAction(AbstractContextAction):
                     # context.correction_adapter.apply_correction_from_ui(index.row(), index.column(), suggestion)
                     # Calling service directly for now, assuming adapter connection works elsewhere
                     context.correction_service.apply_ui_correction(
-                        index.row(),
+                        context.data_row(index),
                         index.column(),
                         suggestion.corrected_value
                         if hasattr(suggestion, "corrected_value")
@@ -5,6 +5,7 @@ Connects the CorrectionService to the TableStateManager for correction states.
 """
 
 from PySide6.QtCore import QObject, Slot
+import logging
 import typing
 from typing import Any
 
@@ -12,6 +13,9 @@ from typing import Any
 from chestbuddy.core.services import CorrectionService
 from chestbuddy.core.table_state_manager import TableStateManager, CellFullState, CellState
 from chestbuddy.core.enums.validation_enums import ValidationStatus
+from chestbuddy.utils.log_pipeline import hot_path
+
+logger = logging.getLogger(__name__)
 
 # Placeholder types for clarity
 # CorrectionService = typing.NewType("CorrectionService", QObject)
@@ -56,13 +60,13 @@ class CorrectionAdapter(QObject):
             self._correction_service.correction_suggestions_available.connect(
                 self._on_corrections_available
             )
-            print("Successfully connected correction_suggestions_available signal.")  # Debug print
+            logger.debug("Successfully connected correction_suggestions_available signal.")
         except AttributeError:
-            print(
-                f"Error: CorrectionService object has no signal 'correction_suggestions_available'"
-            )  # Debug print
+            logger.error(
+                "CorrectionService object has no signal 'correction_suggestions_available'"
+            )
         except Exception as e:
-            print(f"Error connecting correction_suggestions_available signal: {e}")  # Debug print
+            logger.error(f"Error connecting correction_suggestions_available signal: {e}")
 
     @Slot(object)
     def _on_corrections_available(self, correction_suggestions: dict):
@@ -71,51 +75,55 @@ class CorrectionAdapter(QObject):
 
         Processes the suggestions (expected dict: {(row, col): [suggestion1, ...]}) and updates
         the TableStateManager, marking cells as CORRECTABLE and preserving existing validation info.
+        Cells that already hold the same suggestions are not sent again.
 
         Args:
             correction_suggestions: Dictionary mapping (row, col) tuples to lists of suggestions.
         """
-        print(
-            f"CorrectionAdapter received correction_suggestions_available: {type(correction_suggestions)}"
-        )
         if not correction_suggestions or not isinstance(correction_suggestions, dict):
-            print("No correction suggestions received or not a dict, skipping update.")
+            hot_path.debug(
+                logger, "No correction suggestions received or not a dict, skipping update."
+            )
             return
 
         state_changes: typing.Dict[typing.Tuple[int, int], CellFullState] = {}
+        get_state = self._table_state_manager.get_full_cell_state
 
         for (row, col), suggestions in correction_suggestions.items():
             if not suggestions:
                 continue  # Skip if suggestions list is empty
 
-            key = (row, col)
             # Fetch existing state to merge, preserving validation info
-            existing_state = (
-                self._table_state_manager.get_full_cell_state(row, col) or CellFullState()
-            )
-
-            # Create update object: Mark as CORRECTABLE and store suggestions
-            # Keep existing validation details
-            change_state = CellFullState(
+            existing_state = get_state(row, col)
+            if (
+                existing_state is not None
+                and existing_state.validation_status == CellState.CORRECTABLE
+                and existing_state.correction_suggestions == suggestions
+            ):
+                continue
+
+            # Mark as CORRECTABLE and store suggestions, keeping existing validation details
+            state_changes[(row, col)] = CellFullState(
                 validation_status=CellState.CORRECTABLE,
-                error_details=existing_state.error_details,  # Preserve validation details
+                error_details=existing_state.error_details if existing_state else None,
                 correction_suggestions=suggestions,
             )
-            state_changes[key] = change_state
 
         # Update TableStateManager using the update_states method
         try:
             if state_changes:
                 self._table_state_manager.update_states(state_changes)
-                print(
-                    f"Sent {len(state_changes)} correction state updates to TableStateManager."
-                )  # Debug
+                hot_path.debug(
+                    logger,
+                    "Sent %d correction state updates to TableStateManager.",
+                    len(state_changes),
+                )
             else:
-                print("No correction state changes detected.")  # Debug
+                hot_path.debug(logger, "No correction state changes detected.")
         except AttributeError as e:
-            print(f"Error: TableStateManager missing method or attribute: {e}")  # Debug
+            logger.error(f"TableStateManager missing method or attribute: {e}")
         except Exception as e:
-            print(f"Error updating TableStateManager with correction state updates: {e}")  # Debug
+            logger.error(f"Error updating TableStateManager with correction state updates: {e}")
 
     @Slot(int, int, object)  # Assuming object for suggestion type
     def apply_correction_from_ui(self, row: int, col: int, corrected_value: Any):
@@ -153,18 +161,13 @@ class CorrectionAdapter(QObject):
             self._correction_service.correction_suggestions_available.disconnect(
                 self._on_corrections_available
             )
-            print(
-                "Successfully disconnected correction_suggestions_available signal."
-            )  # Debug print
+            logger.debug("Successfully disconnected correction_suggestions_available signal.")
         except RuntimeError:
-            print(
-                "Correction signal already disconnected or connection failed initially."
-            )  # Debug print
+            logger.debug("Correction signal already disconnected or connection failed initially.")
         except AttributeError:
-            print(
-                f"Error disconnecting: CorrectionService object has no signal 'correction_suggestions_available'"
-            )  # Debug print
+            logger.error(
+                "Error disconnecting: CorrectionService object has no signal "
+                "'correction_suggestions_available'"
+            )
         except Exception as e:
-            print(
-                f"Error disconnecting correction_suggestions_available signal: {e}"
-            )  # Debug print
+            logger.error(f"Error disconnecting correction_suggestions_available signal: {e}")
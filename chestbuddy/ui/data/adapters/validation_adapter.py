@@ -5,6 +5,7 @@ Connects the ValidationService to the TableStateManager.
 """
 
 from PySide6.QtCore import QObject, Slot
+import numpy as np
 import pandas as pd
 import typing
 import logging
@@ -27,8 +28,31 @@ class ValidationAdapter(QObject):
     """
     Listens for validation results from ValidationService and updates
     the TableStateManager accordingly.
+
+    Implementation Notes:
+        - Status columns are translated with a lookup array instead of per-cell
+          if/elif chains
+        - Only cells with a non-default new state or a stored state are compared,
+          and only the changed ones are passed to update_states()
     """
 
+    # ValidationStatus -> index into _CELL_STATES; 0 (NORMAL) for missing or unknown values
+    _CELL_STATES = np.array(
+        [CellState.NORMAL, CellState.VALID, CellState.INVALID, CellState.CORRECTABLE],
+        dtype=object,
+    )
+    _STATUS_CODES = {
+        ValidationStatus.NOT_VALIDATED: 0,
+        ValidationStatus.WARNING: 0,
+        ValidationStatus.VALID: 1,
+        ValidationStatus.INVALID: 2,
+        ValidationStatus.INVALID_ROW: 2,
+        ValidationStatus.CORRECTABLE: 3,
+    }
+    _DEFAULT_STATE = CellFullState(
+        validation_status=CellState.NORMAL, error_details="", correction_suggestions=[]
+    )
+
     def __init__(
         self,
         validation_service: ValidationService,
@@ -63,12 +87,22 @@ class ValidationAdapter(QObject):
         except Exception as e:
             logger.error(f"Error connecting validation_complete signal: {e}")
 
+        # Incremental revalidation results carry only the affected rows
+        try:
+            self._validation_service.validation_delta.connect(self._on_validation_complete)
+        except AttributeError:
+            logger.debug("ValidationService has no signal 'validation_delta'")
+        except Exception as e:
+            logger.error(f"Error connecting validation_delta signal: {e}")
+
     @Slot(object)
     def _on_validation_complete(self, validation_results: pd.DataFrame) -> None:
         """
         Slot to handle the validation_complete signal from ValidationService.
 
-        Processes the validation results DataFrame (status_df) and updates the TableStateManager.
+        Translates the status columns of the validation results DataFrame (status_df)
+        to cell states and sends the cells whose state changed to the TableStateManager
+        in one update_states() call.
         """
         if not isinstance(validation_results, pd.DataFrame):
             logger.error(
@@ -81,8 +115,6 @@ class ValidationAdapter(QObject):
         logger.info(f"ValidationAdapter received validation_complete: Rows={len(status_df)}")
 
         try:
-            logger.debug("Incoming validation status DataFrame:\n%s", status_df.to_string())
-
             # Ensure headers map is available from the state manager
             self._headers_map = self._table_state_manager.headers_map
             if not self._headers_map:
@@ -92,91 +124,120 @@ class ValidationAdapter(QObject):
                 )
                 return
 
+            stored_by_column = self._stored_rows_by_column()
             new_states: typing.Dict[typing.Tuple[int, int], CellFullState] = {}
 
-            # Iterate through the rows (index) of the status DataFrame
-            for row_idx in status_df.index:
-                # Iterate through the original data columns using the headers map
-                for base_col_name, col_idx in self._headers_map.items():
-                    status_col = f"{base_col_name}_status"
-                    message_col = f"{base_col_name}_message"
-
-                    # Check if status and message columns exist for this base column
-                    if status_col in status_df.columns and message_col in status_df.columns:
-                        status_value = status_df.at[row_idx, status_col]
-                        message_value = status_df.at[row_idx, message_col]
-
-                        # --- Map ValidationStatus to CellState ---
-                        cell_state_status = CellState.NORMAL  # Default state is NORMAL
-                        if isinstance(status_value, ValidationStatus):
-                            if status_value == ValidationStatus.VALID:
-                                cell_state_status = CellState.VALID
-                            elif status_value == ValidationStatus.INVALID:
-                                cell_state_status = CellState.INVALID
-                            elif status_value == ValidationStatus.CORRECTABLE:
-                                cell_state_status = CellState.CORRECTABLE
-                            elif status_value == ValidationStatus.NOT_VALIDATED:
-                                cell_state_status = CellState.NORMAL
-                            elif status_value == ValidationStatus.INVALID_ROW:
-                                cell_state_status = CellState.INVALID
-                        elif not pd.isna(status_value):
-                            # Handle cases where status might be non-enum but not NaN (e.g., old format?)
-                            logger.warning(
-                                f"Unexpected status type {type(status_value)} for {base_col_name} at row {row_idx}. Value: {status_value}. Setting to NORMAL."
-                            )
-                            cell_state_status = CellState.NORMAL
-                        # --- End Mapping ---
-
-                        error_details = str(message_value) if pd.notna(message_value) else ""
-
-                        # --- Create Full State, Preserving Suggestions --- #
-                        # Get current state ONLY to retrieve existing suggestions
-                        current_state = self._table_state_manager.get_full_cell_state(
-                            row_idx, col_idx
-                        )
-                        existing_suggestions = (
+            for base_col_name, col_idx in self._headers_map.items():
+                status_col = f"{base_col_name}_status"
+                message_col = f"{base_col_name}_message"
+
+                # Check if status and message columns exist for this base column
+                if status_col not in status_df.columns or message_col not in status_df.columns:
+                    continue
+
+                codes = self._status_codes(status_df[status_col])
+                messages = status_df[message_col].to_numpy(dtype=object)
+                with_message = messages != ""
+                if with_message.any():
+                    # Missing messages count as empty
+                    missing = pd.isna(messages[with_message])
+                    messages = messages.copy()
+                    messages[np.flatnonzero(with_message)[missing]] = ""
+                    with_message[np.flatnonzero(with_message)[missing]] = False
+
+                # Cells left NORMAL without a message only change if a state is stored
+                candidates = (codes != 0) | with_message
+                stored_rows = stored_by_column.get(col_idx) if stored_by_column else None
+                if stored_by_column is None:
+                    candidates[:] = True
+                elif stored_rows:
+                    candidates |= status_df.index.isin(stored_rows)
+
+                rows = status_df.index.to_numpy()
+                for position in np.flatnonzero(candidates):
+                    row_idx = int(rows[position])
+                    current_state = self._table_state_manager.get_full_cell_state(
+                        row_idx, col_idx
+                    )
+                    # Preserve existing suggestions
+                    new_cell_state = CellFullState(
+                        validation_status=self._CELL_STATES[codes[position]],
+                        error_details=str(messages[position]),
+                        correction_suggestions=(
                             current_state.correction_suggestions if current_state else []
-                        )
-
-                        # Create the new full state based ONLY on validation results + existing suggestions
-                        new_cell_state = CellFullState(
-                            validation_status=cell_state_status,
-                            error_details=error_details,
-                            correction_suggestions=existing_suggestions,  # Preserve suggestions
-                        )
-                        new_states[(row_idx, col_idx)] = new_cell_state
-                        # --- End State Creation ---
-
-            final_new_states_count = len(new_states)
-            logger.debug(
-                f"Processed validation results. Final states to update: {final_new_states_count}"
-            )
+                        ),
+                    )
+                    if current_state is None:
+                        if new_cell_state == self._DEFAULT_STATE:
+                            continue
+                    elif (
+                        current_state.validation_status == new_cell_state.validation_status
+                        and (current_state.error_details or "") == new_cell_state.error_details
+                    ):
+                        continue
+                    new_states[(row_idx, col_idx)] = new_cell_state
 
-            # Update the TableStateManager with ALL processed states
-            # Let the state manager determine actual changes and emit signals
             if new_states:
-                logger.info(
-                    f"---> ValidationAdapter: Calling update_states with {len(new_states)} states."
-                )  # DEBUG
-                # DEBUG: Log a sample state
-                if new_states:
-                    sample_key = next(iter(new_states))
-                    logger.debug(
-                        f"---> ValidationAdapter: Sample state for {sample_key}: {new_states[sample_key]}"
-                    )
-                # --- END DEBUG ---
+                logger.debug(f"ValidationAdapter: Sending {len(new_states)} changed cell states.")
                 self._table_state_manager.update_states(new_states)
-                logger.info(
-                    f"<--- ValidationAdapter: update_states call finished. Sent {len(new_states)} states to TableStateManager."
-                )  # DEBUG
             else:
-                logger.info("No validation states generated to send to TableStateManager.")
+                logger.debug("No validation state changes to send to TableStateManager.")
 
         except Exception as e:
             logger.error(
                 f"Error processing validation results in ValidationAdapter: {e}", exc_info=True
             )
 
+    @classmethod
+    def _status_codes(cls, statuses: pd.Series) -> np.ndarray:
+        """
+        Map a column of ValidationStatus values to indices into _CELL_STATES.
+
+        Args:
+            statuses: ValidationStatus values; missing or unknown values map to NORMAL
+
+        Returns:
+            np.ndarray: Lookup index of the CellState of every value, 0 for NORMAL
+        """
+        # Enum members compare by identity, which avoids hashing every value
+        values = statuses.to_numpy(dtype=object)
+        codes = np.zeros(len(values), dtype=np.int64)
+        # Statuses are compared most common first, each against the values not yet matched
+        remaining = np.arange(len(values))
+        for status, code in cls._STATUS_CODES.items():
+            if not len(remaining):
+                break
+            matches = values[remaining] == status
+            codes[remaining[matches]] = code
+            remaining = remaining[~matches]
+        unknown = np.zeros(len(values), dtype=bool)
+        unknown[remaining] = pd.notna(values[remaining])
+        if unknown.any():
+            logger.warning(
+                f"Unexpected status values in {statuses.name}, e.g."
+                f" {statuses[unknown].iloc[0]!r}. Setting to NORMAL."
+            )
+        return codes
+
+    def _stored_rows_by_column(self) -> typing.Optional[typing.Dict[int, typing.List[int]]]:
+        """
+        Group the cells with a stored state by column.
+
+        Returns:
+            Rows with a stored state per column, or None if the state manager
+            cannot list its stored cells
+        """
+        try:
+            stored_cells = self._table_state_manager.stored_cells()
+        except AttributeError:
+            return None
+        if not isinstance(stored_cells, typing.Iterable) or isinstance(stored_cells, str):
+            return None
+        by_column: typing.Dict[int, typing.List[int]] = {}
+        for row, col in stored_cells:
+            by_column.setdefault(col, []).append(row)
+        return by_column
+
     def disconnect_signals(self):
         """Disconnect signals to prevent issues during cleanup."""
         try:
@@ -192,3 +253,10 @@ class ValidationAdapter(QObject):
             )
         except Exception as e:
             logger.error(f"Error disconnecting validation_complete signal: {e}")
+
+        try:
+            self._validation_service.validation_delta.disconnect(self._on_validation_complete)
+        except (RuntimeError, AttributeError):
+            logger.debug("Signal validation_delta already disconnected or not available.")
+        except Exception as e:
+            logger.error(f"Error disconnecting validation_delta signal: {e}")
@@ -34,6 +34,17 @@ class ActionContext:
 
     # Consider adding config_manager etc. as needed
 
+    def data_row(self, index: QModelIndex) -> int:
+        """
+        Map the row of a model index to the row of the underlying data.
+
+        The DataViewModel may present rows in sorted order, while the source
+        DataFrame and the state manager are addressed by data row.
+        """
+        if isinstance(self.model, DataViewModel):
+            return self.model.source_row(index.row())
+        return index.row()
+
     # Helper to get cell state (using Optional chaining in case model/state_manager is None)
     def get_cell_state(
         self, index: QModelIndex
@@ -49,7 +60,9 @@ class ActionContext:
             try:
                 # Import CellFullState if not already imported
                 # from chestbuddy.core.table_state_manager import CellFullState
-                return self.state_manager.get_full_cell_state(index.row(), index.column())
+                return self.state_manager.get_full_cell_state(
+                    self.data_row(index), index.column()
+                )
             except AttributeError:
                 print("Warning: state_manager missing get_full_cell_state method")
                 return None
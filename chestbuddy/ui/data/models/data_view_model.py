@@ -13,7 +13,11 @@ import logging
 import numpy as np
 
 from chestbuddy.core.models import ChestDataModel  # Assuming this is the source model
+from chestbuddy.core.storage import DatasetStore
 from chestbuddy.core.table_state_manager import TableStateManager, CellState, CellFullState
+from chestbuddy.ui.data.models.sort_index import SortIndex
+from chestbuddy.utils.log_pipeline import hot_path
+from chestbuddy.utils.span_tracer import span_tracer
 
 # Placeholder for ChestDataModel and TableStateManager if needed
 # from chestbuddy.core.models import ChestDataModel
@@ -66,20 +70,25 @@ class DataViewModel(QAbstractTableModel):
 
         # Ensure the source model is valid before accessing properties
         if not self._source_model:
-            print("Warning: DataViewModel initialized with None source model.")
+            logger.warning("DataViewModel initialized with None source model.")
             # Handle appropriately, maybe raise an error or set defaults
 
         # Ensure the state manager is valid before accessing properties
         if not self._state_manager:
-            print("Warning: DataViewModel initialized with None state manager.")
+            logger.warning("DataViewModel initialized with None state manager.")
             # Handle appropriately
 
         self._connect_source_model_signals()
         self._connect_state_manager_signals()  # Connect to state manager
 
-        # Sort state
+        # Sort state: the data is never reordered, rows are mapped through a permutation
         self._sort_column = -1
         self._sort_order = Qt.AscendingOrder
+        self._sort_keys: typing.List[typing.Tuple[int, bool]] = []
+        self._sort_index = SortIndex()
+        self._row_order: typing.Optional[np.ndarray] = None  # view row -> data row
+        self._view_rows: typing.Optional[np.ndarray] = None  # data row -> view row
+        self._sort_index_rows = 0
 
     def _connect_source_model_signals(self):
         """Connect signals from the source ChestDataModel."""
@@ -92,9 +101,9 @@ class DataViewModel(QAbstractTableModel):
                     pass  # Signal was not connected
                 self._source_model.data_changed.connect(self._on_source_data_changed)
             except Exception as e:
-                print(f"Error connecting source model data_changed signal: {e}")  # Debug
+                logger.error(f"Error connecting source model data_changed signal: {e}")
         else:
-            print("Source model does not have data_changed signal or is None.")  # Debug
+            logger.warning("Source model does not have data_changed signal or is None.")
 
     def _connect_state_manager_signals(self):
         """Connect signals from the TableStateManager."""
@@ -111,9 +120,9 @@ class DataViewModel(QAbstractTableModel):
                 # Connect the signal
                 self._state_manager.state_changed.connect(self._on_state_manager_state_changed)
             except Exception as e:
-                print(f"Error connecting state_manager state_changed signal: {e}")  # Debug
+                logger.error(f"Error connecting state_manager state_changed signal: {e}")
         else:
-            print("State manager is None or does not have state_changed signal.")  # Debug
+            logger.warning("State manager is None or does not have state_changed signal.")
 
     def source_model(self) -> ChestDataModel:
         """
@@ -145,6 +154,10 @@ class DataViewModel(QAbstractTableModel):
         Returns:
             int: The number of rows.
         """
+        dataset = self._dataset()
+        if dataset is not None and not parent.isValid():
+            return dataset.row_count
+
         # Use the length of the internal DataFrame
         if (
             not parent.isValid()
@@ -155,7 +168,7 @@ class DataViewModel(QAbstractTableModel):
             try:
                 return len(self._source_model._data)
             except Exception as e:
-                print(f"Error getting row count from source model: {e}")
+                logger.error(f"Error getting row count from source model: {e}")
                 return 0
         return 0
 
@@ -179,7 +192,7 @@ class DataViewModel(QAbstractTableModel):
             try:
                 return len(self._source_model.column_names)
             except Exception as e:
-                print(f"Error getting column count from source model: {e}")
+                logger.error(f"Error getting column count from source model: {e}")
                 return 0
         return 0
 
@@ -187,11 +200,19 @@ class DataViewModel(QAbstractTableModel):
         if not index.isValid() or not self._source_model or not self._state_manager:
             return None
 
-        row = index.row()
+        row = self.source_row(index.row())
         col = index.column()
 
         try:
             if role == Qt.DisplayRole or role == Qt.EditRole:
+                dataset = self._dataset()
+                if dataset is not None:
+                    # Out-of-core data is read through the dataset's page cache
+                    value = dataset.value_at(row, col)
+                    if isinstance(value, np.generic):
+                        value = value.item()
+                    return "" if value is None or value is pd.NA else str(value)
+
                 # Access data directly from the source model's DataFrame
                 # Assuming ChestDataModel has a way to get value by row/col index
                 # Option 1: Direct access (if _data is accessible and reliable)
@@ -272,15 +293,21 @@ class DataViewModel(QAbstractTableModel):
                 return "\n".join(tooltip_parts) if tooltip_parts else None
 
         except IndexError:
-            print(f"IndexError in DataViewModel.data(): Index ({row},{col}) out of bounds.")
+            hot_path.debug(logger, "DataViewModel.data(): index (%d,%d) out of bounds", row, col)
             return None
         except AttributeError as ae:
-            print(
-                f"AttributeError in DataViewModel.data() for index ({row},{col}), role {role}: {ae}"
-            )  # Debug attribute errors
+            logger.error(
+                "AttributeError in DataViewModel.data() for index (%d,%d), role %s: %s",
+                row,
+                col,
+                role,
+                ae,
+            )
             return None
         except Exception as e:
-            print(f"Error in DataViewModel.data(): {e} for index ({row},{col}), role {role}")
+            logger.error(
+                "Error in DataViewModel.data(): %s for index (%d,%d), role %s", e, row, col, role
+            )
             return None
 
         return None  # Role not handled
@@ -307,12 +334,10 @@ class DataViewModel(QAbstractTableModel):
                 ):
                     return self._source_model.column_names[section]
                 else:
-                    print(
-                        f"Warning: Cannot get header data for section {section}. Source model columns: {getattr(self._source_model, 'column_names', 'N/A')}"
-                    )
+                    hot_path.debug(logger, "Cannot get header data for section %d", section)
                     return None
             except Exception as e:
-                print(f"Error in DataViewModel.headerData(): {e} for section {section}")
+                logger.error(f"Error in DataViewModel.headerData(): {e} for section {section}")
                 return None
 
         # Handle vertical header if needed (row numbers)
@@ -365,16 +390,25 @@ class DataViewModel(QAbstractTableModel):
         ):
             return False
 
-        success = self._source_model.setData(index, value, role)
+        success = self._source_model.setData(self.map_to_data(index), value, role)
         if success:
             self.dataChanged.emit(index, index, [role])
             # Potentially trigger re-validation or state update here
         return success
 
-    @Slot()
-    def _on_source_data_changed(self):
-        """Slot called when the underlying source model changes."""
-        print("DataViewModel received source data_changed")  # Debug
+    @Slot(object)
+    def _on_source_data_changed(self, data_state=None):
+        """
+        Slot called when the underlying source model changes.
+
+        Cached sort orders are dropped for the columns the change touched and
+        the current sort is applied again before the views are reset.
+
+        Args:
+            data_state: DataState describing the change, if the source provides one
+        """
+        hot_path.debug(logger, "DataViewModel received source data_changed")
+        self._invalidate_sort(data_state)
         # This might be too coarse, leading to full view updates.
         # Consider more granular updates if possible from source model.
         # A common pattern is to emit layoutChanged only if dimensions change,
@@ -382,11 +416,13 @@ class DataViewModel(QAbstractTableModel):
         # For now, let's assume the source signals provide enough info
         # or we stick with resetting.
         # IMPORTANT: Check if source_model emits signals BEFORE data is ready.
-        self.beginResetModel()  # Signals that the model is about to be reset
-        # The actual data update is assumed to happen in the source model
-        # and we just need to notify the view(s) that it has happened.
-        self.endResetModel()  # Signals that the model has been reset
-        print("DataViewModel finished model reset.")  # Debug
+        with span_tracer.span("DataViewModel.reset", "model"):
+            self.beginResetModel()  # Signals that the model is about to be reset
+            # The actual data update is assumed to happen in the source model
+            # and we just need to notify the view(s) that it has happened.
+            self._apply_sort_keys()
+            self.endResetModel()  # Signals that the model has been reset
+        hot_path.debug(logger, "DataViewModel finished model reset.")
 
     @Slot(set)  # Expecting a set of (row, col) tuples
     def _on_state_manager_state_changed(self, changed_indices: set):
@@ -394,13 +430,16 @@ class DataViewModel(QAbstractTableModel):
         Slot called when the TableStateManager reports state changes.
         Emits dataChanged for the affected cells/roles.
         """
-        print(f"DataViewModel received state_changed for {len(changed_indices)} indices.")  # Debug
+        hot_path.debug(
+            logger, "DataViewModel received state_changed for %d indices.", len(changed_indices)
+        )
         if not changed_indices:
             return
 
-        # Determine the bounding box of changes for signal emission
-        min_row = min(r for r, c in changed_indices)
-        max_row = max(r for r, c in changed_indices)
+        # Determine the bounding box of changes for signal emission, in view rows
+        rows = [self.view_row(r) for r, c in changed_indices]
+        min_row = min(rows)
+        max_row = max(rows)
         min_col = min(c for r, c in changed_indices)
         max_col = max(c for r, c in changed_indices)
 
@@ -418,58 +457,198 @@ class DataViewModel(QAbstractTableModel):
             self.CorrectionSuggestionsRole,
         ]
         self.dataChanged.emit(top_left, bottom_right, affected_roles)
-        print(
-            f"Emitted dataChanged for range ({min_row},{min_col}) to ({max_row},{max_col})"
-        )  # Debug
+        hot_path.debug(
+            logger,
+            "Emitted dataChanged for range (%d,%d) to (%d,%d)",
+            min_row,
+            min_col,
+            max_row,
+            max_col,
+        )
 
     # --- Direct access to state details (can be used by delegates/view) ---
     def get_cell_details(self, row: int, col: int) -> typing.Optional[str]:
         """Get error details for a cell directly from the state manager."""
-        full_state = self._state_manager.get_full_cell_state(row, col)
+        full_state = self._state_manager.get_full_cell_state(self.source_row(row), col)
         return full_state.error_details if full_state else None
 
     def get_correction_suggestions(
         self, row: int, col: int
     ) -> typing.Optional[typing.List[CorrectionSuggestion]]:
-        """Get correction suggestions for a cell directly from the state manager."""
-        full_state = self._state_manager.get_full_cell_state(row, col)
+        """Get correction suggestions for a cell (view row) from the state manager."""
+        full_state = self._state_manager.get_full_cell_state(self.source_row(row), col)
         return full_state.correction_suggestions if full_state else []
 
     # --- Sorting --- #
     def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
         """
-        Sort the model by the specified column and order.
-        Delegates sorting to the source model if it supports it.
+        Sort the view by the specified column and order.
+
+        The source data is not reordered. Rows are presented through a cached
+        permutation, so cell states stay attached to their data rows and
+        switching back to a recently used sort is instant.
+
+        Args:
+            column (int): The column to sort by.
+            order (Qt.SortOrder): The sort order.
         """
-        print(f"DataViewModel sort called: column={column}, order={order}")  # Debug
-        if not self._source_model or not hasattr(self._source_model, "sort_data"):
-            print("Source model does not support sorting.")  # Debug
-            super().sort(column, order)  # Fallback to default (likely no-op)
+        logger.debug(f"DataViewModel sort called: column={column}, order={order}")
+        if self.headerData(column, Qt.Horizontal, Qt.DisplayRole) is None:
+            logger.warning(f"Invalid column index {column} for sorting.")
             return
+        self.sort_by_columns([(column, order == Qt.AscendingOrder)])
+
+    def sort_by_columns(self, keys: typing.Sequence[typing.Tuple[int, bool]]) -> None:
+        """
+        Sort the view by several columns.
+
+        Rows with equal keys keep their data order, so sorting is stable.
 
-        # Get column name from header data for source model's sort method
-        column_name = self.headerData(column, Qt.Horizontal, Qt.DisplayRole)
-        if column_name is None:
-            print(f"Warning: Invalid column index {column} for sorting.")  # Debug
+        Args:
+            keys (Sequence[Tuple[int, bool]]): (column, ascending) pairs,
+                most significant first. An empty sequence restores data order.
+        """
+        keys = [(int(col), bool(ascending)) for col, ascending in keys]
+        column_count = self.columnCount()
+        if any(not 0 <= col < column_count for col, _ in keys):
+            logger.warning(f"Invalid sort columns {keys} for {column_count} columns.")
             return
 
-        self._sort_column = column
-        self._sort_order = order
+        with span_tracer.span("DataViewModel.sort", "model"):
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            data_rows = [self.source_row(index.row()) for index in persistent]
 
-        print(f"Sorting by column: {column_name}, order: {order}")  # Debug
+            self._sort_keys = keys
+            self._apply_sort_keys()
 
-        self.layoutAboutToBeChanged.emit()
-        try:
-            # Call the source model's sorting method
-            self._source_model.sort_data(
-                column_name=column_name, ascending=(order == Qt.AscendingOrder)
+            self.changePersistentIndexList(
+                persistent,
+                [
+                    self.index(self.view_row(row), index.column())
+                    for row, index in zip(data_rows, persistent)
+                ],
             )
-            print("Source model sort_data called successfully.")  # Debug
-        except Exception as e:
-            print(f"Error during source model sort: {e}")  # Debug
-        finally:
             self.layoutChanged.emit()
-            print("Layout changed signal emitted after sort.")  # Debug
+
+        if keys:
+            self._sort_column = keys[0][0]
+            self._sort_order = Qt.AscendingOrder if keys[0][1] else Qt.DescendingOrder
+        else:
+            self._sort_column = -1
+            self._sort_order = Qt.AscendingOrder
+
+    def clear_sort(self) -> None:
+        """Show the rows in data order again."""
+        self.sort_by_columns([])
+
+    def sort_keys(self) -> typing.List[typing.Tuple[int, bool]]:
+        """
+        Returns the active sort keys.
+
+        Returns:
+            List[Tuple[int, bool]]: (column, ascending) pairs, most significant first.
+        """
+        return list(self._sort_keys)
+
+    def source_row(self, view_row: int) -> int:
+        """
+        Map a row of this model to the row of the underlying data.
+
+        Args:
+            view_row (int): Row as displayed.
+
+        Returns:
+            int: Row in the source DataFrame and the table state manager.
+        """
+        if self._row_order is None or not 0 <= view_row < len(self._row_order):
+            return view_row
+        return int(self._row_order[view_row])
+
+    def view_row(self, source_row: int) -> int:
+        """
+        Map a row of the underlying data to the row shown by this model.
+
+        Args:
+            source_row (int): Row in the source DataFrame.
+
+        Returns:
+            int: Row as displayed.
+        """
+        if self._view_rows is None or not 0 <= source_row < len(self._view_rows):
+            return source_row
+        return int(self._view_rows[source_row])
+
+    def map_to_data(self, index: QModelIndex) -> QModelIndex:
+        """
+        Get an index whose row and column address the underlying data.
+
+        Use this before passing an index of this model to code that reads
+        the DataFrame or the table state manager by row number.
+
+        Args:
+            index (QModelIndex): An index of this model.
+
+        Returns:
+            QModelIndex: Index with the data row, or the same index when unsorted.
+        """
+        if self._row_order is None or not index.isValid():
+            return index
+        return self.index(self.source_row(index.row()), index.column())
+
+    def _dataset(self) -> typing.Optional[DatasetStore]:
+        """Get the out-of-core dataset of the source model, if one is attached."""
+        dataset = getattr(self._source_model, "dataset", None)
+        return dataset if isinstance(dataset, DatasetStore) else None
+
+    def _source_frame(self) -> typing.Optional[pd.DataFrame]:
+        """Get the source DataFrame, or None if the source does not hold one."""
+        data = getattr(self._source_model, "_data", None)
+        return data if isinstance(data, pd.DataFrame) else None
+
+    def _apply_sort_keys(self) -> None:
+        """Recompute the row mapping for the active sort keys."""
+        dataset = self._dataset()
+        if dataset is not None and self._sort_keys:
+            # Sorting out-of-core data runs inside the dataset's engine
+            self._set_row_order(dataset.sorted_row_ids(self._sort_keys))
+            return
+
+        df = self._source_frame()
+        if df is not None and any(col >= len(df.columns) for col, _ in self._sort_keys):
+            self._sort_keys = []
+        if df is None or not self._sort_keys:
+            self._row_order = None
+            self._view_rows = None
+            return
+
+        self._set_row_order(self._sort_index.permutation(df, self._sort_keys))
+
+    def _set_row_order(self, order: np.ndarray) -> None:
+        """Store a view-to-data row permutation and its inverse."""
+        view_rows = np.empty_like(order)
+        view_rows[order] = np.arange(len(order), dtype=order.dtype)
+        self._row_order = order
+        self._view_rows = view_rows
+
+    def _invalidate_sort(self, data_state=None) -> None:
+        """
+        Drop cached sort orders affected by a source change.
+
+        Args:
+            data_state: DataState of the change; without known changed ranges or
+                when the row count changed, every cached order is dropped
+        """
+        ranges = getattr(data_state, "changed_ranges", None)
+        df = self._source_frame()
+        row_count = len(df) if df is not None else 0
+        if not isinstance(ranges, list) or row_count != self._sort_index_rows:
+            self._sort_index.invalidate()
+        else:
+            self._sort_index.invalidate(
+                {col for _, first, _, last in ranges for col in range(first, last + 1)}
+            )
+        self._sort_index_rows = row_count
 
     def current_sort_column(self) -> int:
         """
@@ -0,0 +1,134 @@
+"""
+sort_index.py
+
+Description: Cached, stable, multi-key sort permutations over a DataFrame.
+Usage:
+    sort_index = SortIndex()
+    order = sort_index.permutation(df, [(0, True), (2, False)])
+    first_row = df.iloc[order[0]]
+
+    # After cells in column 2 change
+    sort_index.invalidate([2])
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+SortKey = Tuple[int, bool]  # (column position, ascending)
+
+
+class SortIndex:
+    """
+    Computes row permutations that sort a DataFrame without reordering it.
+
+    A permutation maps view rows to data rows: ``order[view_row] == data_row``.
+    Each column is ranked once with ``pd.factorize`` and the ranks are kept,
+    so sorting by a new combination of known columns is a single ``np.lexsort``.
+    Recently used permutations are cached, so switching back to a previous
+    sort costs a dictionary lookup.
+
+    Attributes:
+        max_entries (int): Number of permutations kept in the cache
+
+    Implementation Notes:
+        - Sorting is stable: rows with equal keys keep their data order
+        - Missing values sort last in both directions
+        - Columns with values that cannot be compared are ranked by their text
+    """
+
+    def __init__(self, max_entries: int = 8):
+        """
+        Initialize the sort index.
+
+        Args:
+            max_entries: Number of permutations kept in the cache
+        """
+        self.max_entries = max(1, max_entries)
+        self._ranks: Dict[int, np.ndarray] = {}
+        self._permutations: "OrderedDict[Tuple[SortKey, ...], np.ndarray]" = OrderedDict()
+
+    def permutation(self, df: pd.DataFrame, keys: Sequence[SortKey]) -> np.ndarray:
+        """
+        Get the permutation that sorts the frame by the given keys.
+
+        Args:
+            df: The data to sort; it is not modified
+            keys: (column position, ascending) pairs, most significant first
+
+        Returns:
+            np.ndarray: Data row for each view row
+        """
+        cache_key = tuple((int(col), bool(ascending)) for col, ascending in keys)
+        cached = self._permutations.get(cache_key)
+        if cached is not None and len(cached) == len(df):
+            self._permutations.move_to_end(cache_key)
+            return cached
+
+        if not cache_key:
+            order = np.arange(len(df), dtype=np.int64)
+        else:
+            # np.lexsort treats its last key as the primary one
+            sort_keys = [self._key(df, col, ascending) for col, ascending in reversed(cache_key)]
+            order = np.lexsort(sort_keys).astype(np.int64, copy=False)
+
+        self._permutations[cache_key] = order
+        while len(self._permutations) > self.max_entries:
+            self._permutations.popitem(last=False)
+        return order
+
+    def invalidate(self, columns: Optional[Iterable[int]] = None) -> None:
+        """
+        Forget ranks and permutations that depend on changed columns.
+
+        Args:
+            columns: Positions of the changed columns, or None to clear everything
+        """
+        if columns is None:
+            self._ranks.clear()
+            self._permutations.clear()
+            return
+
+        changed = set(columns)
+        for col in changed:
+            self._ranks.pop(col, None)
+        stale = [key for key in self._permutations if any(col in changed for col, _ in key)]
+        for key in stale:
+            del self._permutations[key]
+        if stale:
+            logger.debug(f"Dropped {len(stale)} cached sort orders for columns {sorted(changed)}")
+
+    def _key(self, df: pd.DataFrame, col: int, ascending: bool) -> np.ndarray:
+        """Get integer sort keys for a column in the requested direction."""
+        ranks = self._ranks.get(col)
+        if ranks is None or len(ranks) != len(df):
+            ranks = self._rank(df.iloc[:, col])
+            self._ranks[col] = ranks
+        if ascending:
+            return np.where(ranks < 0, np.iinfo(np.int64).max, ranks)
+        return np.where(ranks < 0, 1, -ranks)
+
+    @staticmethod
+    def _rank(series: pd.Series) -> np.ndarray:
+        """
+        Rank the values of a column, with -1 for missing values.
+
+        Args:
+            series: The column to rank
+
+        Returns:
+            np.ndarray: Dense rank of each value in ascending order
+        """
+        try:
+            codes, _ = pd.factorize(series, sort=True)
+        except TypeError:
+            # Mixed types such as str and int cannot be ordered directly
+            text = series.astype(str).where(series.notna())
+            codes, _ = pd.factorize(text, sort=True)
+        return codes.astype(np.int64, copy=False)
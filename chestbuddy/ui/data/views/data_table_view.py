@@ -66,7 +66,7 @@ class DataTableView(QWidget):
         - Utilizes CorrectionDelegate for visualizing correction suggestions and showing correction menus.
         - Connects to CorrectionDelegate signals (`correction_selected`, `apply_first_correction_requested`).
         - Handles delegate signals via slots (`_on_correction_delegate_selected`, `_on_apply_first_correction_requested`).
-        - Emits view-level signals (`correction_action_triggered`, `correction_apply_requested`) with SOURCE model indices.
+        - Emits view-level signals (`correction_action_triggered`, `correction_apply_requested`) with SOURCE model indices addressing data rows (unaffected by sorting).
         - Provides context menus for cell and header interactions.
         - Manages column visibility via ColumnModel.
 
@@ -353,6 +353,12 @@ class DataTableView(QWidget):
                     f"Warning: Initializing visibility - index {idx} for '{name}' out of bounds ({model.columnCount()} cols)"
                 )
 
+    def _data_index(self, source_index: QModelIndex) -> QModelIndex:
+        """Map a DataViewModel index to the row of the underlying data for listeners."""
+        if isinstance(self._source_model, DataViewModel):
+            return self._source_model.map_to_data(source_index)
+        return source_index
+
     # --- Slot for Correction Request --- #
     @Slot(QModelIndex)
     def _on_apply_first_correction_requested(self, proxy_index: QModelIndex):
@@ -375,7 +381,7 @@ class DataTableView(QWidget):
                 f" Emitting correction_apply_requested."
             )  # Debug
             # Emit the new signal with the source index and the suggestion object
-            self.correction_apply_requested.emit(source_index, first_suggestion)
+            self.correction_apply_requested.emit(self._data_index(source_index), first_suggestion)
         else:
             print(
                 f"Slot received apply_first_correction_requested for index {source_index.row()},{source_index.column()} but no suggestions found."
@@ -419,7 +425,7 @@ class DataTableView(QWidget):
                 f"Correction selected: delegate=({delegate_index.row()},{delegate_index.column()}), "
                 f"source=({source_index.row()},{source_index.column()}), suggestion={suggestion}"
             )
-            self.correction_action_triggered.emit(source_index, suggestion)
+            self.correction_action_triggered.emit(self._data_index(source_index), suggestion)
         else:
             logger.warning(
                 f"_on_correction_delegate_selected failed to map delegate index {delegate_index} to source."
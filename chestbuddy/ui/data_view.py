@@ -1282,33 +1282,40 @@ class DataView(QWidget):
         selected_indexes = self._table_view.selectedIndexes()
 
         if selected_indexes:
-            # Multiple cells selected, paste to all of them
-            for sel_index in selected_indexes:
-                # Map to source index for model update
-                source_index = self._proxy_model.mapToSource(sel_index)
-
-                # Set the value in the source model
-                self._table_model.setData(source_index, text, Qt.EditRole)
-
-                # Also update the data model directly to ensure it's updated properly
-                try:
-                    # Get the row in the original model
-                    source_row = source_index.row()
-                    source_col = source_index.column()
-
-                    if (
-                        0 <= source_row < self._table_model.rowCount()
-                        and 0 <= source_col < self._table_model.columnCount()
-                    ):
-                        # Get the actual row index in the data model if we're using filtered data
-                        actual_row = source_row
-                        if self._filtered_rows and source_row < len(self._filtered_rows):
-                            actual_row = self._filtered_rows[source_row]
-
-                        column_name = self._data_model.column_names[source_col]
-                        self._data_model.update_cell(actual_row, column_name, text)
-                except Exception as e:
-                    logger.error(f"Error updating data model directly: {e}")
+            # Multiple cells selected, paste to all of them in one batch
+            batched = hasattr(self._data_model, "begin_batch")
+            if batched:
+                self._data_model.begin_batch("Paste")
+            try:
+                for sel_index in selected_indexes:
+                    # Map to source index for model update
+                    source_index = self._proxy_model.mapToSource(sel_index)
+
+                    # Set the value in the source model
+                    self._table_model.setData(source_index, text, Qt.EditRole)
+
+                    # Also update the data model directly to ensure it's updated properly
+                    try:
+                        # Get the row in the original model
+                        source_row = source_index.row()
+                        source_col = source_index.column()
+
+                        if (
+                            0 <= source_row < self._table_model.rowCount()
+                            and 0 <= source_col < self._table_model.columnCount()
+                        ):
+                            # Get the actual row index if we're using filtered data
+                            actual_row = source_row
+                            if self._filtered_rows and source_row < len(self._filtered_rows):
+                                actual_row = self._filtered_rows[source_row]
+
+                            column_name = self._data_model.column_names[source_col]
+                            self._data_model.update_cell(actual_row, column_name, text)
+                    except Exception as e:
+                        logger.error(f"Error updating data model directly: {e}")
+            finally:
+                if batched:
+                    self._data_model.commit_batch()
 
             logger.info(f"Pasted value to {len(selected_indexes)} selected cells")
         elif index.isValid():
@@ -1519,42 +1526,50 @@ class DataView(QWidget):
         has_tabs = "\t" in clipboard_text
         has_newlines = "\n" in clipboard_text
 
-        # If we have structured data, handle as a grid paste
-        if has_tabs or has_newlines:
-            self._paste_structured_data(clipboard_text, selected_indexes)
-        else:
-            # Simple paste to all selected cells
-            logger.info(f"Pasting '{clipboard_text}' to {len(selected_indexes)} selected cells")
-
-            # Set the value for each selected cell
-            for sel_index in selected_indexes:
-                # Map to source index for model update
-                source_index = self._proxy_model.mapToSource(sel_index)
-
-                # Set the value in the source model
-                self._table_model.setData(source_index, clipboard_text, Qt.EditRole)
-
-                # Also update the data model directly
-                try:
-                    # Get the row in the original model
-                    source_row = source_index.row()
-                    source_col = source_index.column()
-
-                    if (
-                        0 <= source_row < self._table_model.rowCount()
-                        and 0 <= source_col < self._table_model.columnCount()
-                    ):
-                        # Get the actual row index if we're using filtered data
-                        actual_row = source_row
-                        if self._filtered_rows and source_row < len(self._filtered_rows):
-                            actual_row = self._filtered_rows[source_row]
-
-                        column_name = self._data_model.column_names[source_col]
-                        self._data_model.update_cell(actual_row, column_name, clipboard_text)
-                except Exception as e:
-                    logger.error(f"Error updating data model directly: {e}")
-
-            self._status_label.setText(f"Pasted to {len(selected_indexes)} selected cells")
+        # Stage the pasted cells and write them as one batch and one undo step
+        batched = hasattr(self._data_model, "begin_batch")
+        if batched:
+            self._data_model.begin_batch("Paste")
+        try:
+            # If we have structured data, handle as a grid paste
+            if has_tabs or has_newlines:
+                self._paste_structured_data(clipboard_text, selected_indexes)
+            else:
+                # Simple paste to all selected cells
+                logger.info(f"Pasting '{clipboard_text}' to {len(selected_indexes)} selected cells")
+
+                # Set the value for each selected cell
+                for sel_index in selected_indexes:
+                    # Map to source index for model update
+                    source_index = self._proxy_model.mapToSource(sel_index)
+
+                    # Set the value in the source model
+                    self._table_model.setData(source_index, clipboard_text, Qt.EditRole)
+
+                    # Also update the data model directly
+                    try:
+                        # Get the row in the original model
+                        source_row = source_index.row()
+                        source_col = source_index.column()
+
+                        if (
+                            0 <= source_row < self._table_model.rowCount()
+                            and 0 <= source_col < self._table_model.columnCount()
+                        ):
+                            # Get the actual row index if we're using filtered data
+                            actual_row = source_row
+                            if self._filtered_rows and source_row < len(self._filtered_rows):
+                                actual_row = self._filtered_rows[source_row]
+
+                            column_name = self._data_model.column_names[source_col]
+                            self._data_model.update_cell(actual_row, column_name, clipboard_text)
+                    except Exception as e:
+                        logger.error(f"Error updating data model directly: {e}")
+
+                self._status_label.setText(f"Pasted to {len(selected_indexes)} selected cells")
+        finally:
+            if batched:
+                self._data_model.commit_batch()
 
     def eventFilter(self, watched, event):
         """
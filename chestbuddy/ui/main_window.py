@@ -12,7 +12,7 @@ import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Set, Tuple
+from typing import Callable, Dict, List, Optional, Union, Any, Set, Tuple
 
 from PySide6.QtCore import (
     Qt,
@@ -45,6 +45,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction, QIcon, QKeySequence, QCloseEvent
 
 from chestbuddy.core.models import ChestDataModel
+from chestbuddy.core.state.change_journal import ChangeJournal
 from chestbuddy.core.services import CSVService, ValidationService, CorrectionService, ChartService
 from chestbuddy.core.controllers import (
     FileOperationsController,
@@ -60,10 +61,8 @@ from chestbuddy.ui.resources.resource_manager import ResourceManager
 from chestbuddy.ui.widgets.sidebar_navigation import SidebarNavigation, NavigationSection
 from chestbuddy.ui.widgets.status_bar import StatusBar
 from chestbuddy.ui.views.base_view import BaseView
-from chestbuddy.ui.views.dashboard_view import DashboardView
+from chestbuddy.ui.views.dashboard_view import DashboardView, validation_status_text
 from chestbuddy.ui.views.data_view_adapter import DataViewAdapter
-from chestbuddy.ui.views.validation_view_adapter import ValidationViewAdapter
-from chestbuddy.ui.views.chart_view import ChartView
 from chestbuddy.ui.widgets import ProgressDialog, ProgressBar
 from chestbuddy.ui.data_view import DataView
 from chestbuddy.ui.data.views.data_table_view import DataTableView
@@ -71,6 +70,7 @@ from chestbuddy.ui.data.delegates.correction_delegate import CorrectionDelegate
 from chestbuddy.core.controllers.correction_controller import CorrectionController
 from chestbuddy.utils.service_locator import ServiceLocator
 from chestbuddy.utils.config import ConfigManager
+from chestbuddy.utils.span_tracer import span_tracer
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -536,7 +536,7 @@ class MainWindow(QMainWindow):
 
         # Initialize view state controller with UI components
         self._view_state_controller.set_ui_components(
-            self._views, self._sidebar, self._content_stack
+            self._views, self._sidebar, self._content_stack, self._view_factories
         )
 
         # Connect view state controller signals
@@ -625,16 +625,37 @@ class MainWindow(QMainWindow):
                 "Could not connect CorrectionDelegate signal: TableView, Delegate, or Controller not found/valid."
             )
 
-        # Create Validation view
+        # Validation, Correction, Charts, Reports and Settings are created on first navigation
+        self._view_factories: Dict[str, Callable[[], QWidget]] = {
+            "Validation": self._create_validation_view,
+            "Correction": self._create_correction_view,
+            "Charts": self._create_chart_view,
+            "Reports": self._create_query_view,
+            "Settings": self._create_settings_view,
+        }
+
+        # Set services in the data view controller
+        self._data_view_controller.set_services(
+            validation_service=self._validation_service, correction_service=self._correction_service
+        )
+        logger.info("Services set in data view controller")
+
+        # TODO: Add placeholder views for other sections
+        # For Help if needed
+
+    def _create_validation_view(self) -> QWidget:
+        """Create the Validation view."""
+        from chestbuddy.ui.views.validation_view_adapter import ValidationViewAdapter
+
         validation_view = ValidationViewAdapter(
             data_model=self._data_model, validation_service=self._validation_service
         )
         # Set up the validation view to use the data view controller
         validation_view.set_controller(self._data_view_controller)
-        self._content_stack.addWidget(validation_view)
-        self._views["Validation"] = validation_view
+        return self._wire_lazy_view(validation_view)
 
-        # Create Correction view - use our new implementation
+    def _create_correction_view(self) -> QWidget:
+        """Create the Correction view."""
         from chestbuddy.ui.views.correction_view import CorrectionView
 
         correction_view = CorrectionView(
@@ -642,40 +663,60 @@ class MainWindow(QMainWindow):
         )
         # Set up the view to use both controllers
         correction_view.set_controller(self._data_view_controller)
+        correction_controller = ServiceLocator.get("correction_controller")
         if correction_controller:
             correction_view.set_correction_controller(correction_controller)
         else:
             logger.warning("Correction controller not available from app")
+        return self._wire_lazy_view(correction_view)
 
-        self._content_stack.addWidget(correction_view)
-        self._views["Correction"] = correction_view
+    def _create_chart_view(self) -> QWidget:
+        """Create the Analysis/Charts view."""
+        from chestbuddy.ui.views.chart_view import ChartView
 
-        # Create Analysis/Charts view
         chart_view = ChartView(data_model=self._data_model, chart_service=self._chart_service)
         # Set up the chart view to use the data view controller
         chart_view.set_controller(self._data_view_controller)
-        self._content_stack.addWidget(chart_view)
-        self._views["Charts"] = chart_view
+        return self._wire_lazy_view(chart_view)
+
+    def _create_query_view(self) -> QWidget:
+        """Create the Reports view."""
+        from chestbuddy.core.services.query_service import QueryService
+        from chestbuddy.ui.views.query_view import QueryView
+
+        if ServiceLocator.has_service("query_service"):
+            query_service = ServiceLocator.get("query_service")
+        else:
+            query_service = QueryService(self._data_model, self._csv_service)
+            ServiceLocator.register("query_service", query_service)
+        query_view = QueryView(data_model=self._data_model, query_service=query_service)
+        query_view.set_controller(self._data_view_controller)
+        return self._wire_lazy_view(query_view)
 
-        # Create Settings view
-        from chestbuddy.ui.views import SettingsViewAdapter
+    def _create_settings_view(self) -> QWidget:
+        """Create the Settings view."""
+        from chestbuddy.ui.views.settings_view_adapter import SettingsViewAdapter
 
         settings_view = SettingsViewAdapter(config_manager=self._config_manager)
         settings_view.settings_changed.connect(self._on_settings_changed)
         settings_view.config_reset.connect(self._on_config_reset)
         settings_view.config_imported.connect(self._on_config_imported)
         settings_view.config_exported.connect(self._on_config_exported)
-        self._content_stack.addWidget(settings_view)
-        self._views["Settings"] = settings_view
+        return self._wire_lazy_view(settings_view)
 
-        # Set services in the data view controller
-        self._data_view_controller.set_services(
-            validation_service=self._validation_service, correction_service=self._correction_service
-        )
-        logger.info("Services set in data view controller")
+    def _wire_lazy_view(self, view: QWidget) -> QWidget:
+        """
+        Apply the connections every view receives, for views created after startup.
 
-        # TODO: Add placeholder views for other sections
-        # For Reports, Help if needed
+        Args:
+            view: The newly created view
+
+        Returns:
+            QWidget: The same view, for chaining in view factories
+        """
+        if hasattr(view, "import_requested"):
+            view.import_requested.connect(self._on_import_requested)
+        return view
 
     def _init_menus(self) -> None:
         """Initialize the application menus."""
@@ -718,6 +759,28 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        # Edit menu
+        edit_menu = self.menuBar().addMenu("&Edit")
+
+        # Undo action
+        self._undo_action = QAction("&Undo", self)
+        self._undo_action.setShortcut(QKeySequence.Undo)
+        self._undo_action.setStatusTip("Undo the last edit or correction")
+        self._undo_action.triggered.connect(self._undo)
+        edit_menu.addAction(self._undo_action)
+
+        # Redo action
+        self._redo_action = QAction("&Redo", self)
+        self._redo_action.setShortcut(QKeySequence.Redo)
+        self._redo_action.setStatusTip("Redo the last undone edit or correction")
+        self._redo_action.triggered.connect(self._redo)
+        edit_menu.addAction(self._redo_action)
+
+        journal = getattr(self._data_model, "journal", None)
+        if isinstance(journal, ChangeJournal):
+            journal.history_changed.connect(self._update_undo_actions)
+        self._update_undo_actions()
+
         # Data menu
         data_menu = self.menuBar().addMenu("&Data")
 
@@ -739,6 +802,23 @@ class MainWindow(QMainWindow):
         self._export_validation_action.triggered.connect(self._export_validation_issues)
         data_menu.addAction(self._export_validation_action)
 
+        # Debug menu
+        debug_menu = self.menuBar().addMenu("De&bug")
+
+        # Span tracing toggle
+        self._trace_action = QAction("Enable &Span Tracing", self)
+        self._trace_action.setCheckable(True)
+        self._trace_action.setChecked(span_tracer.enabled)
+        self._trace_action.setStatusTip("Record timing spans for services and models")
+        self._trace_action.toggled.connect(self._toggle_span_tracing)
+        debug_menu.addAction(self._trace_action)
+
+        # Export trace action
+        self._export_trace_action = QAction("&Export Trace...", self)
+        self._export_trace_action.setStatusTip("Export recorded spans as a Chrome trace file")
+        self._export_trace_action.triggered.connect(self._export_span_trace)
+        debug_menu.addAction(self._export_trace_action)
+
         # Help menu
         help_menu = self.menuBar().addMenu("&Help")
 
@@ -939,10 +1019,8 @@ class MainWindow(QMainWindow):
             if has_data:
                 # Update dashboard stats
                 dashboard_view.update_stats(
-                    dataset_rows=len(self._data_model.data),
-                    validation_status="Not Validated"
-                    if self._data_model.get_validation_status().empty
-                    else f"{len(self._data_model.get_validation_status())} issues",
+                    dataset_rows=self._data_model.row_count,
+                    validation_status=validation_status_text(),
                     corrections=self._data_model.get_correction_row_count(),
                     last_import=datetime.now().strftime("%Y-%m-%d %H:%M") if has_data else "Never",
                 )
@@ -1054,8 +1132,7 @@ class MainWindow(QMainWindow):
             elif section == "Analysis":
                 self._view_state_controller.set_active_view("Charts")
             elif section == "Reports":
-                # TODO: Handle reports view
-                pass
+                self._view_state_controller.set_active_view("Reports")
             elif section == "Settings":
                 # TODO: Handle settings view
                 pass
@@ -1080,8 +1157,7 @@ class MainWindow(QMainWindow):
         elif action == "analyze":
             self._view_state_controller.set_active_view("Charts")
         elif action == "report":
-            # TODO: Handle report generation
-            pass
+            self._view_state_controller.set_active_view("Reports")
 
     @Slot(str)
     def _on_recent_file_selected(self, file_path: str) -> None:
@@ -1348,6 +1424,74 @@ class MainWindow(QMainWindow):
             """,
         )
 
+    def _undo(self) -> None:
+        """Undo the last step recorded in the data model's journal."""
+        journal = getattr(self._data_model, "journal", None)
+        if isinstance(journal, ChangeJournal) and journal.can_undo():
+            label = journal.undo_label()
+            journal.undo()
+            self._status_bar.set_status(f"Undone: {label}")
+
+    def _redo(self) -> None:
+        """Redo the last undone step in the data model's journal."""
+        journal = getattr(self._data_model, "journal", None)
+        if isinstance(journal, ChangeJournal) and journal.can_redo():
+            label = journal.redo_label()
+            journal.redo()
+            self._status_bar.set_status(f"Redone: {label}")
+
+    def _update_undo_actions(self) -> None:
+        """Enable the undo/redo actions and show the labels of the next steps."""
+        journal = getattr(self._data_model, "journal", None)
+        if not isinstance(journal, ChangeJournal):
+            self._undo_action.setEnabled(False)
+            self._redo_action.setEnabled(False)
+            return
+        self._undo_action.setEnabled(journal.can_undo())
+        self._redo_action.setEnabled(journal.can_redo())
+        self._undo_action.setText(
+            f"&Undo {journal.undo_label()}" if journal.can_undo() else "&Undo"
+        )
+        self._redo_action.setText(
+            f"&Redo {journal.redo_label()}" if journal.can_redo() else "&Redo"
+        )
+
+    def _toggle_span_tracing(self, enabled: bool) -> None:
+        """
+        Enable or disable span tracing.
+
+        Args:
+            enabled: Whether spans should be recorded
+        """
+        if enabled:
+            span_tracer.enable()
+            self._status_bar.set_status("Span tracing enabled")
+        else:
+            span_tracer.disable()
+            self._status_bar.set_status("Span tracing disabled")
+
+    def _export_span_trace(self) -> None:
+        """Export the recorded spans to a Chrome trace JSON file."""
+        if not span_tracer.get_spans():
+            QMessageBox.information(
+                self,
+                "No trace data",
+                "No spans have been recorded. Enable span tracing first.",
+            )
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "chestbuddy_trace.json", "Trace Files (*.json);;All Files (*)"
+        )
+
+        if file_path:
+            try:
+                span_tracer.export_chrome_trace(file_path)
+                self._status_bar.set_status(f"Exported trace to {os.path.basename(file_path)}")
+            except Exception as e:
+                logger.error(f"Error exporting trace: {e}")
+                QMessageBox.critical(self, "Error", f"Error exporting trace: {str(e)}")
+
     def _export_validation_issues(self) -> None:
         """Export validation issues to a file."""
         if self._data_model.is_empty or not self._validation_service.has_validation_results():
@@ -1434,10 +1578,19 @@ class MainWindow(QMainWindow):
         if hasattr(self, "_data_model") and self._data_model:
             if not self._data_model.is_empty:
                 # Get row count
-                row_count = len(self._data_model.data)
+                row_count = self._data_model.row_count
+                message = f"Data loaded: {row_count:,} rows"
+
+                # Rows with issues come from counters kept by the state manager
+                if self._table_state_manager is not None and hasattr(
+                    self._table_state_manager, "issue_row_count"
+                ):
+                    issue_rows = self._table_state_manager.issue_row_count()
+                    if isinstance(issue_rows, int) and issue_rows:
+                        message += f", {issue_rows:,} with issues"
 
                 # Delegate to UI state controller
-                self._ui_state_controller.update_status_message(f"Data loaded: {row_count:,} rows")
+                self._ui_state_controller.update_status_message(message)
             else:
                 # Delegate to UI state controller
                 self._ui_state_controller.update_status_message("No data loaded")
@@ -2,50 +2,68 @@
 CorrectionRuleTableModel.
 
 This module implements a table model for the correction rules in the ChestBuddy application.
-It provides a model for displaying correction rules in a tabular format with 5 columns:
-Order, From, To, Category, and Status.
+It provides a model for displaying correction rules in a tabular format with 4 columns:
+From, To, Category, and Status, and a proxy model that applies the category, status
+and search filters of the rule view.
 """
 
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Set, Tuple
 import logging
 
-from PySide6.QtCore import Qt, QModelIndex, QAbstractTableModel, Signal, QObject
+from PySide6.QtCore import (
+    Qt,
+    QModelIndex,
+    QAbstractTableModel,
+    QObject,
+    QSortFilterProxyModel,
+)
 
-from chestbuddy.core.controllers.correction_controller import CorrectionController
 from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.utils.span_tracer import span_tracer
 
 
 class CorrectionRuleTableModel(QAbstractTableModel):
     """
-    Table model for correction rules.
-
-    This model provides data for displaying correction rules in a table view.
-    It handles the interaction with the correction controller to get rule data.
+    Table model over the full, unfiltered list of correction rules.
+
+    Rows correspond to positions in the controller's rule list, so a row number
+    is also the rule index used by the controller. Filtering is done by
+    CorrectionRuleFilterProxyModel.
+
+    Implementation Notes:
+        - sync() compares the controller's list with the last snapshot and emits
+          dataChanged, rowsMoved, rowsInserted or rowsRemoved for single-rule
+          operations; anything else falls back to a model reset
+        - A lowercase search key ("from\\x00to") is kept per row and updated
+          together with the rows, so the proxy never re-reads rule attributes
+          while filtering
     """
 
-    def __init__(self, controller: CorrectionController, parent: Optional[QObject] = None):
+    HEADERS = ["From", "To", "Category", "Status"]
+    CYCLE_TOOLTIP = "This rule is part of a correction cycle"
+
+    def __init__(self, controller, parent: Optional[QObject] = None):
         """
         Initialize the model.
 
         Args:
-            controller: Controller for accessing correction rules
+            controller: Controller for accessing correction rules, or None for an empty model
             parent: Parent object
         """
         super().__init__(parent)
         self._logger = logging.getLogger(__name__)
         self._controller = controller
-        self._rules = []
-        self._category_filter = ""
-        self._status_filter = ""
-        self._search_filter = ""
-        self._headers = ["Order", "From", "To", "Category", "Status"]
+        self._rules: List[CorrectionRule] = []
+        self._snapshots: List[Tuple[str, str, str, str]] = []
+        self._search_keys: List[str] = []
+        self._cycle_rules: Set[int] = set()
 
         # Connect to controller signals
         if hasattr(self._controller, "rules_changed"):
-            self._controller.rules_changed.connect(self._on_rules_changed)
+            self._controller.rules_changed.connect(self.sync)
 
         # Initial data load
-        self._refresh_data()
+        self.sync()
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """
@@ -69,11 +87,11 @@ class CorrectionRuleTableModel(QAbstractTableModel):
             parent: Parent index (unused for table models)
 
         Returns:
-            int: Number of columns (5)
+            int: Number of columns (4)
         """
         if parent.isValid():
             return 0
-        return len(self._headers)
+        return len(self.HEADERS)
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
         """
@@ -81,7 +99,7 @@ class CorrectionRuleTableModel(QAbstractTableModel):
 
         Args:
             index: Model index to get data for
-            role: Data role (display, decoration, etc.)
+            role: Data role (display, foreground, etc.)
 
         Returns:
             Any: Data for the specified index and role
@@ -89,34 +107,23 @@ class CorrectionRuleTableModel(QAbstractTableModel):
         if not index.isValid() or index.row() >= len(self._rules):
             return None
 
-        rule = self._rules[index.row()]
+        row = index.row()
         column = index.column()
 
         if role == Qt.DisplayRole:
-            if column == 0:  # Order
-                return str(rule.order)
-            elif column == 1:  # From
-                return rule.from_value
-            elif column == 2:  # To
-                return rule.to_value
-            elif column == 3:  # Category
-                return rule.category
-            elif column == 4:  # Status
-                return rule.status.capitalize()
-
-        elif role == Qt.TextAlignmentRole:
-            if column == 0:  # Order
-                return int(Qt.AlignRight | Qt.AlignVCenter)
-            else:
-                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            return self._snapshots[row][column]
 
         elif role == Qt.ForegroundRole:
-            if column == 4:  # Status
-                return Qt.green if rule.status == "enabled" else Qt.red
+            if id(self._rules[row]) in self._cycle_rules:
+                return Qt.red
+
+        elif role == Qt.ToolTipRole:
+            if id(self._rules[row]) in self._cycle_rules:
+                return self.CYCLE_TOOLTIP
 
         elif role == Qt.UserRole:
-            # Return the rule index for selection handling
-            return index.row()
+            # The rule's index in the controller's list
+            return row
 
         return None
 
@@ -133,8 +140,8 @@ class CorrectionRuleTableModel(QAbstractTableModel):
             Any: Header data
         """
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            if 0 <= section < len(self._headers):
-                return self._headers[section]
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
 
         return None
 
@@ -153,19 +160,10 @@ class CorrectionRuleTableModel(QAbstractTableModel):
 
         return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
-    def set_filters(self, category: str = "", status: str = "", search: str = ""):
-        """
-        Set filters for the model.
-
-        Args:
-            category: Category filter string
-            status: Status filter string
-            search: Search filter string
-        """
-        self._category_filter = category
-        self._status_filter = status
-        self._search_filter = search
-        self._refresh_data()
+    @property
+    def rules(self) -> List[CorrectionRule]:
+        """The rules as of the last sync, in controller order."""
+        return self._rules
 
     def get_rule(self, row: int) -> Optional[CorrectionRule]:
         """
@@ -181,35 +179,204 @@ class CorrectionRuleTableModel(QAbstractTableModel):
             return self._rules[row]
         return None
 
-    def get_rule_index(self, row: int) -> int:
+    def search_key(self, row: int) -> str:
         """
-        Get the controller index for a rule by row index.
+        Get the lowercase search key of a row.
 
         Args:
-            row: Row index in the filtered model
+            row: Row index
 
         Returns:
-            int: Index of the rule in the controller, or -1 if invalid
+            str: The from and to values, lowercased and joined by a NUL character
         """
-        if 0 <= row < len(self._rules):
-            # Find the rule in the controller's full list
-            rule = self._rules[row]
-            all_rules = self._controller.get_rules()
-            for i, r in enumerate(all_rules):
-                if r == rule:
-                    return i
-        return -1
-
-    def _refresh_data(self):
-        """Refresh model data from the controller."""
-        self.beginResetModel()
-        self._rules = self._controller.get_rules(
-            category=self._category_filter,
-            status=self._status_filter,
-            search_term=self._search_filter,
+        return self._search_keys[row]
+
+    def set_cycle_rules(self, rules: List[CorrectionRule]) -> None:
+        """
+        Highlight the rules that take part in a correction cycle.
+
+        Args:
+            rules: Rules on a detected cycle
+        """
+        cycle_rules = {id(rule) for rule in rules}
+        if cycle_rules == self._cycle_rules:
+            return
+        changed = cycle_rules ^ self._cycle_rules
+        self._cycle_rules = cycle_rules
+        for row, rule in enumerate(self._rules):
+            if id(rule) in changed:
+                self._emit_row_changed(row)
+
+    def sync(self) -> None:
+        """Bring the model in line with the controller's rule list."""
+        with span_tracer.span("CorrectionRuleTableModel.sync", "model"):
+            new_rules = list(self._controller.get_rules()) if self._controller else []
+            if not self._apply_incremental(new_rules):
+                self.beginResetModel()
+                self._rules = new_rules
+                self._snapshots = [self._snapshot(rule) for rule in new_rules]
+                self._search_keys = [self._search_key(rule) for rule in new_rules]
+                self.endResetModel()
+
+    def _apply_incremental(self, new_rules: List[CorrectionRule]) -> bool:
+        """
+        Apply a single-rule difference with fine-grained signals.
+
+        Args:
+            new_rules: The controller's current rule list
+
+        Returns:
+            bool: True if the difference was applied, False if a reset is needed
+        """
+        old_rules = self._rules
+        old_count, new_count = len(old_rules), len(new_rules)
+
+        if new_count == old_count:
+            mismatches = [i for i in range(old_count) if old_rules[i] is not new_rules[i]]
+            if not mismatches:
+                # Same rules in the same order; rules may have been edited in place
+                for row, rule in enumerate(new_rules):
+                    if self._snapshot(rule) != self._snapshots[row]:
+                        self._replace_row(row, rule)
+                return True
+
+            low, high = mismatches[0], mismatches[-1]
+            if old_rules[low] is new_rules[high] and self._same(
+                old_rules[low + 1 : high + 1], new_rules[low:high]
+            ):
+                self._move_row(low, high)
+                return True
+            if new_rules[low] is old_rules[high] and self._same(
+                new_rules[low + 1 : high + 1], old_rules[low:high]
+            ):
+                self._move_row(high, low)
+                return True
+            if len(mismatches) == 1:
+                self._replace_row(low, new_rules[low])
+                return True
+            return False
+
+        if abs(new_count - old_count) != 1:
+            return False
+
+        shorter, longer = (old_rules, new_rules) if new_count > old_count else (new_rules, old_rules)
+        position = next(
+            (i for i in range(len(shorter)) if shorter[i] is not longer[i]), len(shorter)
+        )
+        if not self._same(shorter[position:], longer[position + 1 :]):
+            return False
+
+        if new_count > old_count:
+            rule = new_rules[position]
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._rules.insert(position, rule)
+            self._snapshots.insert(position, self._snapshot(rule))
+            self._search_keys.insert(position, self._search_key(rule))
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rules[position]
+            del self._snapshots[position]
+            del self._search_keys[position]
+            self.endRemoveRows()
+        return True
+
+    def _move_row(self, source: int, target: int) -> None:
+        """Move one row, emitting rowsMoved."""
+        # Qt expects the destination as the row index before the move
+        destination = target + 1 if target > source else target
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), destination)
+        for items in (self._rules, self._snapshots, self._search_keys):
+            items.insert(target, items.pop(source))
+        self.endMoveRows()
+
+    def _replace_row(self, row: int, rule: CorrectionRule) -> None:
+        """Store a new or edited rule at a row and emit dataChanged for it."""
+        self._rules[row] = rule
+        self._snapshots[row] = self._snapshot(rule)
+        self._search_keys[row] = self._search_key(rule)
+        self._emit_row_changed(row)
+
+    def _emit_row_changed(self, row: int) -> None:
+        """Emit dataChanged for every column of a row."""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    @staticmethod
+    def _same(first: List[CorrectionRule], second: List[CorrectionRule]) -> bool:
+        """Check that two rule lists contain the same objects in the same order."""
+        return len(first) == len(second) and all(a is b for a, b in zip(first, second))
+
+    @staticmethod
+    def _snapshot(rule: CorrectionRule) -> Tuple[str, str, str, str]:
+        """Capture the displayed values of a rule."""
+        return (
+            str(rule.from_value),
+            str(rule.to_value),
+            str(rule.category),
+            str(rule.status),
         )
-        self.endResetModel()
 
-    def _on_rules_changed(self):
-        """Handle rules changed signal from controller."""
-        self._refresh_data()
+    @staticmethod
+    def _search_key(rule: CorrectionRule) -> str:
+        """Build the lowercase search key of a rule."""
+        return f"{rule.from_value or ''}\x00{rule.to_value or ''}".lower()
+
+
+class CorrectionRuleFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model applying the rule view's category, status and search filters.
+
+    Implementation Notes:
+        - The search term is matched against the source model's precomputed
+          lowercase search keys, so filtering does no per-row string building
+        - Filter changes that leave the filters unchanged do not re-filter
+        - Source row changes are filtered incrementally by QSortFilterProxyModel
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the proxy model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._category = ""
+        self._status = ""
+        self._search = ""
+
+    def set_filters(self, category: str = "", status: str = "", search: str = "") -> None:
+        """
+        Set the filters.
+
+        Args:
+            category: Category to show, or an empty string for all
+            status: Status to show (case-insensitive), or an empty string for all
+            search: Text the from or to value must contain (case-insensitive)
+        """
+        filters = (category or "", (status or "").lower(), (search or "").lower())
+        if filters == (self._category, self._status, self._search):
+            return
+        self._category, self._status, self._search = filters
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """
+        Check whether a source row passes the filters.
+
+        Args:
+            source_row: Row in the source model
+            source_parent: Parent index (unused for table models)
+
+        Returns:
+            bool: True if the row should be shown
+        """
+        model = self.sourceModel()
+        rule = model.get_rule(source_row)
+        if rule is None:
+            return False
+        if self._category and rule.category != self._category:
+            return False
+        if self._status and str(rule.status).lower() != self._status:
+            return False
+        return not self._search or self._search in model.search_key(source_row)
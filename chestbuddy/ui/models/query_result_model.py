@@ -0,0 +1,123 @@
+"""
+query_result_model.py
+
+Description: Table model over a query result that exposes its rows page by page.
+Usage:
+    result_model = QueryResultModel()
+    table_view.setModel(result_model)
+    result_model.set_result(query_service.run(spec))
+"""
+
+import logging
+from typing import Any, Optional
+
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+logger = logging.getLogger(__name__)
+
+
+class QueryResultModel(QAbstractTableModel):
+    """
+    Virtual table over a query result DataFrame.
+
+    Rows are made visible one page at a time through Qt's incremental
+    fetching: the view asks for more rows as it is scrolled, so large results
+    are shown immediately and only visible cells are ever formatted.
+
+    Attributes:
+        PAGE_SIZE (int): Number of rows made visible per fetch
+
+    Implementation Notes:
+        - The result frame is read-only; cells are formatted on request
+        - Missing values are shown as empty cells
+    """
+
+    PAGE_SIZE = 500
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the result model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._result = pd.DataFrame()
+        self._loaded_rows = 0
+
+    def set_result(self, result: Optional[pd.DataFrame]) -> None:
+        """
+        Show a new query result, starting with its first page.
+
+        Args:
+            result: The result to show, or None to clear the table
+        """
+        self.beginResetModel()
+        self._result = result if result is not None else pd.DataFrame()
+        self._loaded_rows = min(len(self._result), self.PAGE_SIZE)
+        self.endResetModel()
+
+    @property
+    def result(self) -> pd.DataFrame:
+        """
+        Get the complete result shown by the model.
+
+        Returns:
+            pd.DataFrame: The result, including rows not fetched yet
+        """
+        return self._result
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of rows fetched so far."""
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of result columns."""
+        return 0 if parent.isValid() else len(self._result.columns)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Check whether rows remain to be fetched."""
+        return not parent.isValid() and self._loaded_rows < len(self._result)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Make the next page of rows visible."""
+        if parent.isValid():
+            return
+        remaining = len(self._result) - self._loaded_rows
+        count = min(remaining, self.PAGE_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Get the formatted value of a result cell."""
+        if not index.isValid() or index.row() >= self._loaded_rows:
+            return None
+        if role == Qt.DisplayRole:
+            value = self._result.iat[index.row(), index.column()]
+            if value is None or (not isinstance(value, (list, tuple)) and pd.isna(value)):
+                return ""
+            if isinstance(value, float):
+                return f"{value:,.2f}" if not value.is_integer() else f"{value:,.0f}"
+            if isinstance(value, pd.Timestamp):
+                return value.strftime("%Y-%m-%d")
+            return str(value)
+        if role == Qt.TextAlignmentRole:
+            if pd.api.types.is_numeric_dtype(self._result.dtypes.iloc[index.column()]):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        """Get column names and row numbers."""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and 0 <= section < len(self._result.columns):
+            return str(self._result.columns[section])
+        if orientation == Qt.Vertical:
+            return str(section + 1)
+        return None
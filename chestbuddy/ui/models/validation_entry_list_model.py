@@ -0,0 +1,239 @@
+"""
+validation_entry_list_model.py
+
+Description: List model over a ValidationListModel's entries with incremental search.
+Usage:
+    list_model = ValidationEntryListModel(validation_list_model)
+    list_view.setModel(list_model)
+
+    list_model.set_filter("jo")   # Scans only entries containing the rarest character
+    list_model.set_filter("joh")  # Narrows the previous matches
+"""
+
+import bisect
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from chestbuddy.core.models.validation_list_model import ValidationListModel
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationEntryListModel(QAbstractListModel):
+    """
+    Virtual list of validation entries, sorted and filtered by a search string.
+
+    Rows are the entries matching the current filter, in sorted order. No
+    per-entry item objects are created; the view only asks for visible rows.
+
+    Attributes:
+        MAX_INCREMENTAL_CHANGES (int): Entry changes above which a sync resets the model
+
+    Implementation Notes:
+        - A character index maps every character to the entries containing it, so
+          a new search only scans the entries containing its rarest character
+        - A search that extends the previous one filters the current rows and
+          removes the non-matching ones as contiguous row ranges
+        - Entry changes are merged into the sorted list and emitted as targeted
+          row insertions and removals
+    """
+
+    MAX_INCREMENTAL_CHANGES = 256
+
+    def __init__(self, source: ValidationListModel, parent: Optional[QObject] = None):
+        """
+        Initialize the list model.
+
+        Args:
+            source: The validation list providing the entries
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._source = source
+        self._case_sensitive = source.is_case_sensitive()
+        self._entries: Set[str] = set()
+        self._char_index: Dict[str, Set[str]] = {}
+        self._filter = ""
+        self._rows: List[str] = []
+        self._row_keys: List[str] = []
+
+        self._source.entries_changed.connect(self.sync)
+        self._rebuild()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Get the number of visible entries.
+
+        Args:
+            parent: Parent index (unused for list models)
+
+        Returns:
+            int: Number of entries matching the filter
+        """
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
+        """
+        Get data for a row.
+
+        Args:
+            index: Model index
+            role: Data role
+
+        Returns:
+            Any: The entry text for display and edit roles, otherwise None
+        """
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            return self._rows[index.row()]
+        return None
+
+    @property
+    def filter_text(self) -> str:
+        """The current search string."""
+        return self._filter
+
+    def entry(self, row: int) -> Optional[str]:
+        """
+        Get the entry shown at a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Optional[str]: The entry, or None if the row is out of range
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def set_filter(self, text: str) -> None:
+        """
+        Show only entries containing the search string.
+
+        Args:
+            text: The search string; empty shows all entries
+        """
+        text = text or ""
+        if text == self._filter:
+            return
+
+        previous = self._key(self._filter)
+        query = self._key(text)
+        self._filter = text
+
+        if previous and previous in query:
+            # Narrowing: anything containing the new query contains the previous one
+            keep = [query in key for key in self._row_keys]
+            self._remove_rows_where(keep)
+            return
+
+        self.beginResetModel()
+        self._set_rows(self._match(query))
+        self.endResetModel()
+
+    def sync(self) -> None:
+        """Apply changes of the source entries as row insertions and removals."""
+        new_entries = set(self._source.entries)
+        case_sensitive = self._source.is_case_sensitive()
+        added = new_entries - self._entries
+        removed = self._entries - new_entries
+
+        if case_sensitive != self._case_sensitive or (
+            len(added) + len(removed) > self.MAX_INCREMENTAL_CHANGES
+        ):
+            self._case_sensitive = case_sensitive
+            self.beginResetModel()
+            self._rebuild()
+            self.endResetModel()
+            return
+
+        query = self._key(self._filter)
+        for entry in sorted(removed, reverse=True):
+            self._unindex(entry)
+            row = self._find_row(entry)
+            if row is not None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                del self._row_keys[row]
+                self.endRemoveRows()
+
+        for entry in sorted(added):
+            self._index(entry)
+            key = self._key(entry)
+            if query and query not in key:
+                continue
+            row = bisect.bisect_left(self._rows, entry)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, entry)
+            self._row_keys.insert(row, key)
+            self.endInsertRows()
+
+    def _rebuild(self) -> None:
+        """Rebuild the character index and the visible rows from the source."""
+        self._entries = set()
+        self._char_index = {}
+        for entry in self._source.entries:
+            self._index(entry)
+        self._set_rows(self._match(self._key(self._filter)))
+
+    def _index(self, entry: str) -> None:
+        """Add an entry to the character index."""
+        self._entries.add(entry)
+        for char in set(self._key(entry)):
+            self._char_index.setdefault(char, set()).add(entry)
+
+    def _unindex(self, entry: str) -> None:
+        """Remove an entry from the character index."""
+        self._entries.discard(entry)
+        for char in set(self._key(entry)):
+            bucket = self._char_index.get(char)
+            if bucket is not None:
+                bucket.discard(entry)
+                if not bucket:
+                    del self._char_index[char]
+
+    def _match(self, query: str) -> List[str]:
+        """Find all entries containing the query, using the rarest character's bucket."""
+        if not query:
+            return sorted(self._entries)
+        buckets = [self._char_index.get(char, set()) for char in set(query)]
+        candidates = min(buckets, key=len)
+        return sorted(entry for entry in candidates if query in self._key(entry))
+
+    def _set_rows(self, rows: List[str]) -> None:
+        """Replace the visible rows."""
+        self._rows = rows
+        self._row_keys = [self._key(entry) for entry in rows]
+
+    def _remove_rows_where(self, keep: List[bool]) -> None:
+        """Remove the rows not kept, one contiguous range at a time from the bottom."""
+        row = len(keep) - 1
+        while row >= 0:
+            if keep[row]:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and not keep[row]:
+                row -= 1
+            first = row + 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            del self._row_keys[first : last + 1]
+            self.endRemoveRows()
+
+    def _find_row(self, entry: str) -> Optional[int]:
+        """Find the row of a visible entry by binary search."""
+        row = bisect.bisect_left(self._rows, entry)
+        if row < len(self._rows) and self._rows[row] == entry:
+            return row
+        return None
+
+    def _key(self, text: str) -> str:
+        """Normalize text for matching according to the list's case sensitivity."""
+        return text if self._case_sensitive else text.lower()
@@ -27,7 +27,7 @@ Usage:
 
 import time
 from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
-from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal, Slot
 
 from chestbuddy.ui.interfaces import IUpdatable
 from chestbuddy.core.state.data_state import DataState
@@ -56,6 +56,18 @@ class UpdateManager(QObject):
         batch_update_completed (Signal): Signal emitted when a batch update completes
         data_state_updated (Signal): Signal emitted when the data state is updated
         component_update_from_data (Signal): Signal emitted when a component is updated due to data changes
+
+    Implementation Notes:
+        - A single timer drives all updates. Each tick runs the due updates in
+          priority order (visible components first, then by priority value, then
+          by scheduling order) until the frame budget is used up, and re-arms the
+          timer immediately for whatever is left so the event loop can paint
+        - A component counts as hidden when it is a widget whose window is shown
+          but which itself is not (e.g. an inactive page of a stacked widget).
+          Hidden components are marked dirty instead of updated and refreshed
+          as soon as they receive a Show event
+        - At least one update runs per tick, so a single slow update only
+          overruns the budget once
     """
 
     update_scheduled = Signal(object)  # Component that needs update
@@ -65,30 +77,59 @@ class UpdateManager(QObject):
     data_state_updated = Signal(object)  # The new data state
     component_update_from_data = Signal(object)  # Component updated due to data change
 
-    def __init__(self, parent: Optional[QObject] = None):
-        """Initialize the update manager."""
+    DEFAULT_FRAME_BUDGET_MS = 8.0
+
+    def __init__(
+        self, parent: Optional[QObject] = None, frame_budget_ms: float = DEFAULT_FRAME_BUDGET_MS
+    ):
+        """
+        Initialize the update manager.
+
+        Args:
+            parent: Parent object
+            frame_budget_ms: Time in milliseconds a single tick may spend on updates
+        """
         super().__init__(parent)
-        self._timers: Dict[IUpdatable, QTimer] = {}
         self._pending_updates: Set[IUpdatable] = set()
+        self._due_times: Dict[IUpdatable, float] = {}
+        self._priorities: Dict[IUpdatable, int] = {}
+        self._sequence: Dict[IUpdatable, int] = {}
+        self._next_sequence: int = 0
+        self._dirty_components: Set[IUpdatable] = set()
         self._debounce_intervals: Dict[IUpdatable, int] = {}
         self._dependencies: Dict[IUpdatable, Set[IUpdatable]] = {}
         self._update_batch_in_progress: bool = False
-        self._batch_timer = QTimer(self)
-        self._batch_timer.setSingleShot(True)
-        self._batch_timer.timeout.connect(self._process_batch)
+        self._batch_requested: bool = False
+        self._frame_budget_ms = frame_budget_ms
+
+        # Single timer driving all scheduled updates
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setSingleShot(True)
+        self._tick_timer.timeout.connect(self._on_tick)
 
         # Data dependency tracking
         self._data_dependencies: Dict[IUpdatable, DataDependency] = {}
         self._current_data_state: Optional[DataState] = None
         self._previous_data_state: Optional[DataState] = None
 
-    def schedule_update(self, component: T, debounce_ms: int = 50) -> None:
+    @property
+    def frame_budget_ms(self) -> float:
+        """Time in milliseconds a single tick may spend on updates."""
+        return self._frame_budget_ms
+
+    @frame_budget_ms.setter
+    def frame_budget_ms(self, value: float) -> None:
+        """Set the per-tick time budget in milliseconds."""
+        self._frame_budget_ms = max(0.0, float(value))
+
+    def schedule_update(self, component: T, debounce_ms: int = 50, priority: int = 0) -> None:
         """
         Schedule an update for a component with debouncing.
 
         Args:
             component: The component to update
             debounce_ms: Debounce interval in milliseconds
+            priority: Ordering among due updates of equal visibility (lower runs first)
         """
         if not isinstance(component, IUpdatable):
             logger.warning(f"Component {component} is not updatable")
@@ -97,21 +138,16 @@ class UpdateManager(QObject):
         # Store debounce interval for this component
         self._debounce_intervals[component] = debounce_ms
 
-        # Check if there's already a timer for this component
-        if component in self._timers:
-            # Timer exists, restart it
-            self._timers[component].stop()
-            self._timers[component].start(debounce_ms)
-        else:
-            # Create a new timer
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: self._update_component(component))
-            self._timers[component] = timer
-            timer.start(debounce_ms)
+        # (Re)start the debounce period for this component
+        self._due_times[component] = self._now_ms() + debounce_ms
+        self._priorities[component] = priority
+        if component not in self._pending_updates:
+            self._sequence[component] = self._next_sequence
+            self._next_sequence += 1
 
         # Add to pending updates
         self._pending_updates.add(component)
+        self._arm_timer()
 
         # Emit signal
         self.update_scheduled.emit(component)
@@ -129,8 +165,8 @@ class UpdateManager(QObject):
         for component in components:
             self.schedule_update(component, debounce_ms)
 
-        # Start batch timer
-        self._batch_timer.start(debounce_ms)
+        # Report the next tick as a batch
+        self._batch_requested = True
 
     def register_dependency(self, parent: T, child: T) -> None:
         """
@@ -179,17 +215,31 @@ class UpdateManager(QObject):
         """
         return len(self._pending_updates) > 0
 
+    def is_dirty(self, component: T) -> bool:
+        """
+        Check if a component was skipped while hidden and awaits a refresh.
+
+        Args:
+            component: The component to check
+
+        Returns:
+            bool: True if the component will be updated when it is shown
+        """
+        return component in self._dirty_components
+
     def cancel_updates(self) -> None:
         """Cancel all pending updates."""
         try:
-            for timer in list(self._timers.values()):
-                try:
-                    timer.stop()
-                except RuntimeError:
-                    # Timer might have already been deleted
-                    pass
+            try:
+                self._tick_timer.stop()
+            except RuntimeError:
+                # Timer might have already been deleted
+                pass
 
             self._pending_updates.clear()
+            self._due_times.clear()
+            for component in list(self._dirty_components):
+                self._clear_dirty(component)
             logger.debug("All updates cancelled")
         except Exception as e:
             logger.error(f"Error cancelling updates: {e}")
@@ -201,11 +251,163 @@ class UpdateManager(QObject):
         Args:
             component: The component to cancel updates for
         """
-        if component in self._timers:
-            self._timers[component].stop()
+        if component in self._pending_updates or component in self._dirty_components:
             self._pending_updates.discard(component)
+            self._due_times.pop(component, None)
+            self._clear_dirty(component)
             logger.debug(f"Update cancelled for {component.__class__.__name__}")
 
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        Refresh dirty components as soon as they are shown.
+
+        Args:
+            watched: The object receiving the event
+            event: The event
+
+        Returns:
+            bool: Always False so the event is delivered normally
+        """
+        if event.type() == QEvent.Show and watched in self._dirty_components:
+            self._clear_dirty(watched)
+            self.schedule_update(watched, 0, self._priorities.get(watched, 0))
+        return False
+
+    def _now_ms(self) -> float:
+        """Get a monotonic timestamp in milliseconds."""
+        return time.perf_counter() * 1000.0
+
+    def _arm_timer(self) -> None:
+        """Start the tick timer for the earliest pending update."""
+        if not self._due_times:
+            return
+
+        delay = max(0, int(min(self._due_times.values()) - self._now_ms() + 0.999))
+        try:
+            if self._tick_timer.isActive() and self._tick_timer.remainingTime() <= delay:
+                return
+            self._tick_timer.start(delay)
+        except RuntimeError:
+            # Timer might have already been deleted during shutdown
+            pass
+
+    def _is_hidden(self, component: IUpdatable) -> bool:
+        """
+        Check if a component is a widget hidden inside a shown window.
+
+        Args:
+            component: The component to check
+
+        Returns:
+            bool: True if the update can wait until the component is shown
+        """
+        is_visible = getattr(component, "isVisible", None)
+        window = getattr(component, "window", None)
+        if not callable(is_visible) or not callable(window):
+            return False
+        try:
+            top_level = window()
+            return top_level is not component and top_level.isVisible() and not is_visible()
+        except (RuntimeError, TypeError):
+            return False
+
+    def _mark_dirty(self, component: IUpdatable) -> None:
+        """
+        Defer a hidden component's update until it is shown.
+
+        Args:
+            component: The hidden component
+        """
+        if component not in self._dirty_components:
+            self._dirty_components.add(component)
+            component.installEventFilter(self)
+            logger.debug(f"{component.__class__.__name__} is hidden, marked dirty")
+
+    def _clear_dirty(self, component: IUpdatable) -> None:
+        """
+        Stop watching a dirty component.
+
+        Args:
+            component: The component to clear
+        """
+        if component in self._dirty_components:
+            self._dirty_components.discard(component)
+            try:
+                component.removeEventFilter(self)
+            except RuntimeError:
+                # Widget might have already been deleted
+                pass
+
+    def _take_due_updates(self, include_future: bool = False) -> List[IUpdatable]:
+        """
+        Remove due updates from the queue, deferring hidden components.
+
+        Args:
+            include_future: Also take updates whose debounce period has not elapsed
+
+        Returns:
+            List[IUpdatable]: Components to update, in priority order
+        """
+        now = self._now_ms()
+        ready = []
+        for component in list(self._pending_updates):
+            if not include_future and self._due_times.get(component, now) > now:
+                continue
+            if self._is_hidden(component):
+                self._pending_updates.discard(component)
+                self._due_times.pop(component, None)
+                self._mark_dirty(component)
+                continue
+            ready.append(component)
+
+        ready.sort(key=self._queue_key)
+        return ready
+
+    def _queue_key(self, component: IUpdatable) -> tuple:
+        """
+        Get the sort key ordering due updates: visible first, then priority, then age.
+
+        Args:
+            component: The component to order
+
+        Returns:
+            tuple: Sort key
+        """
+        is_visible = getattr(component, "isVisible", None)
+        try:
+            visible = callable(is_visible) and bool(is_visible())
+        except RuntimeError:
+            # Widget might have already been deleted
+            visible = False
+        return (not visible, self._priorities.get(component, 0), self._sequence.get(component, 0))
+
+    def _on_tick(self) -> None:
+        """Run due updates until the frame budget is spent."""
+        if self._update_batch_in_progress:
+            return
+
+        queue = self._take_due_updates()
+        if queue:
+            deadline = self._now_ms() + self._frame_budget_ms
+            processed = 0
+            self._begin_batch(len(queue))
+            try:
+                for component in queue:
+                    if processed and self._now_ms() >= deadline:
+                        break
+                    self._update_component(component)
+                    processed += 1
+            finally:
+                self._end_batch()
+
+            if processed < len(queue):
+                logger.debug(
+                    f"Frame budget of {self._frame_budget_ms:.1f}ms used after {processed} "
+                    f"updates, deferring {len(queue) - processed}"
+                )
+
+        self._arm_timer()
+
     def _update_component(self, component: IUpdatable) -> None:
         """
         Update a component and its dependencies.
@@ -219,6 +421,7 @@ class UpdateManager(QObject):
         try:
             # Remove from pending updates
             self._pending_updates.discard(component)
+            self._due_times.pop(component, None)
 
             # Update the component
             if hasattr(component, "update") and callable(component.update):
@@ -249,29 +452,45 @@ class UpdateManager(QObject):
             self.schedule_update(child)
             logger.debug(f"Scheduled update for dependent {child.__class__.__name__}")
 
+    def _begin_batch(self, size: int) -> None:
+        """
+        Start a tick, emitting batch_update_started for batch ticks.
+
+        Args:
+            size: Number of components about to be processed
+        """
+        self._update_batch_in_progress = True
+        if self._batch_requested:
+            self.batch_update_started.emit()
+            logger.debug(f"Batch update started with {size} components")
+
+    def _end_batch(self) -> None:
+        """Finish a tick, emitting batch_update_completed for batch ticks."""
+        self._update_batch_in_progress = False
+        if self._batch_requested:
+            self._batch_requested = False
+            self.batch_update_completed.emit()
+
     def _process_batch(self) -> None:
-        """Process all pending updates as a batch."""
+        """Process all pending updates as a batch, ignoring debounce and frame budget."""
         if self._update_batch_in_progress:
             return
 
-        self._update_batch_in_progress = True
-        self.batch_update_started.emit()
-        logger.debug(f"Batch update started with {len(self._pending_updates)} components")
-
-        # Create a copy of pending updates to avoid modification during iteration
-        components = list(self._pending_updates)
+        self._batch_requested = True
+        queue = self._take_due_updates(include_future=True)
+        self._begin_batch(len(queue))
 
         try:
             # Update all components
-            for component in components:
+            for component in queue:
                 self._update_component(component)
 
             logger.debug("Batch update completed successfully")
         except Exception as e:
             logger.error(f"Error during batch update: {str(e)}")
         finally:
-            self._update_batch_in_progress = False
-            self.batch_update_completed.emit()
+            self._end_batch()
+            self._arm_timer()
 
     def process_pending_updates(self) -> None:
         """Process all pending updates immediately."""
@@ -396,18 +615,19 @@ class UpdateManager(QObject):
             # Cancel updates
             self.cancel_updates()
 
-            # Explicitly delete all timers
-            for timer in list(self._timers.values()):
-                try:
-                    timer.stop()
-                    timer.deleteLater()
-                except RuntimeError:
-                    # Timer might have already been deleted
-                    pass
+            # Explicitly delete the tick timer
+            try:
+                self._tick_timer.stop()
+                self._tick_timer.deleteLater()
+            except RuntimeError:
+                # Timer might have already been deleted
+                pass
 
             # Clear collections
-            self._timers.clear()
             self._pending_updates.clear()
+            self._due_times.clear()
+            self._priorities.clear()
+            self._sequence.clear()
             self._dependencies.clear()
             self._debounce_intervals.clear()
             self._data_dependencies.clear()
@@ -2,40 +2,48 @@
 UI Views Package for ChestBuddy application.
 
 This package contains various view components.
+
+Views are imported on first attribute access so that importing a single view
+module does not pull in every other view (and their heavy dependencies such as
+QtCharts) at application startup.
 """
 
-from chestbuddy.ui.views.base_view import BaseView
-from chestbuddy.ui.views.updatable_view import UpdatableView
-from chestbuddy.ui.views.data_view_adapter import DataViewAdapter
-from chestbuddy.ui.views.dashboard_view import DashboardView
-from chestbuddy.ui.views.validation_tab_view import ValidationTabView
-from chestbuddy.ui.views.correction_view import CorrectionView
-from chestbuddy.ui.views.chart_view import ChartView
-from chestbuddy.ui.views.validation_view_adapter import ValidationViewAdapter
-from chestbuddy.ui.views.correction_view_adapter import CorrectionViewAdapter
-from chestbuddy.ui.views.chart_view_adapter import ChartViewAdapter
-from chestbuddy.ui.views.validation_list_view import ValidationListView
-from chestbuddy.ui.views.validation_preferences_view import ValidationPreferencesView
-from chestbuddy.ui.views.settings_tab_view import SettingsTabView
-from chestbuddy.ui.views.settings_view_adapter import SettingsViewAdapter
-from chestbuddy.ui.views.confirmation_dialog import ConfirmationDialog
-from chestbuddy.ui.views.multi_entry_dialog import MultiEntryDialog
-
-__all__ = [
-    "BaseView",
-    "UpdatableView",
-    "DataViewAdapter",
-    "DashboardView",
-    "ValidationTabView",
-    "CorrectionView",
-    "ChartView",
-    "ValidationViewAdapter",
-    "CorrectionViewAdapter",
-    "ChartViewAdapter",
-    "ValidationListView",
-    "ValidationPreferencesView",
-    "SettingsTabView",
-    "SettingsViewAdapter",
-    "ConfirmationDialog",
-    "MultiEntryDialog",
-]
+import importlib
+from typing import Any
+
+_VIEW_MODULES = {
+    "BaseView": "chestbuddy.ui.views.base_view",
+    "UpdatableView": "chestbuddy.ui.views.updatable_view",
+    "DataViewAdapter": "chestbuddy.ui.views.data_view_adapter",
+    "DashboardView": "chestbuddy.ui.views.dashboard_view",
+    "ValidationTabView": "chestbuddy.ui.views.validation_tab_view",
+    "CorrectionView": "chestbuddy.ui.views.correction_view",
+    "ChartView": "chestbuddy.ui.views.chart_view",
+    "QueryView": "chestbuddy.ui.views.query_view",
+    "ValidationViewAdapter": "chestbuddy.ui.views.validation_view_adapter",
+    "CorrectionViewAdapter": "chestbuddy.ui.views.correction_view_adapter",
+    "ChartViewAdapter": "chestbuddy.ui.views.chart_view_adapter",
+    "ValidationListView": "chestbuddy.ui.views.validation_list_view",
+    "ValidationPreferencesView": "chestbuddy.ui.views.validation_preferences_view",
+    "SettingsTabView": "chestbuddy.ui.views.settings_tab_view",
+    "SettingsViewAdapter": "chestbuddy.ui.views.settings_view_adapter",
+    "ConfirmationDialog": "chestbuddy.ui.views.confirmation_dialog",
+    "MultiEntryDialog": "chestbuddy.ui.views.multi_entry_dialog",
+}
+
+__all__ = list(_VIEW_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested view class on first access."""
+    module_name = _VIEW_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily imported views in dir() output."""
+    return sorted(set(globals()) | set(__all__))
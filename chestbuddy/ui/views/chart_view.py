@@ -133,7 +133,9 @@ class ChartView(UpdatableView):
 
         # Chart type combobox
         self._chart_type_combo = QComboBox()
-        self._chart_type_combo.addItems(["Bar Chart", "Pie Chart", "Line Chart"])
+        self._chart_type_combo.addItems(
+            ["Bar Chart", "Pie Chart", "Line Chart", *ChartService.ROLLUP_CHART_TYPES]
+        )
         chart_type_layout.addWidget(self._chart_type_combo)
 
         options_layout.addWidget(chart_type_group, 0, 0)
@@ -301,6 +303,12 @@ class ChartView(UpdatableView):
                 chart = self._chart_service.create_line_chart(
                     x_column=x_column, y_column=y_column, title=title, group_by=group_by
                 )
+            elif chart_type == "Leaderboard":
+                chart = self._chart_service.create_leaderboard_chart(
+                    by="clan" if x_column == "CLAN" else "player", title=title
+                )
+            elif chart_type == "Weekly Trend":
+                chart = self._chart_service.create_trend_chart("week", title=title)
             else:
                 raise ValueError(f"Unsupported chart type: {chart_type}")
 
@@ -438,6 +446,9 @@ class ChartView(UpdatableView):
         # Group by is primarily useful for line charts
         self._group_by_combo.setEnabled(is_line_chart)
 
+        # Rollup charts pick their own values
+        self._y_axis_combo.setEnabled(chart_type not in ChartService.ROLLUP_CHART_TYPES)
+
     def _on_header_action_clicked(self, action_id: str):
         """
         Handle header action button clicks.
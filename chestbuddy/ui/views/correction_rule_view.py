@@ -19,8 +19,7 @@ from PySide6.QtWidgets import (
     QComboBox,
     QPushButton,
     QGroupBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QCheckBox,
     QMessageBox,
@@ -35,10 +34,14 @@ from PySide6.QtWidgets import (
 
 from chestbuddy.core.controllers import CorrectionController
 from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_graph import CorrectionRuleGraph
 from chestbuddy.ui.dialogs import AddEditRuleDialog
 from chestbuddy.ui.dialogs.batch_correction_dialog import BatchCorrectionDialog
 from chestbuddy.ui.dialogs.import_export_dialog import ImportExportDialog
-from chestbuddy.ui.models.correction_rule_table_model import CorrectionRuleTableModel
+from chestbuddy.ui.models.correction_rule_table_model import (
+    CorrectionRuleFilterProxyModel,
+    CorrectionRuleTableModel,
+)
 from chestbuddy.ui.utils import IconProvider
 from chestbuddy.utils.config import ConfigManager
 from chestbuddy.ui.views.base_view import BaseView
@@ -91,6 +94,8 @@ class CorrectionRuleView(BaseView):
 
         # Initialize UI components
         self._rule_table = None
+        self._rule_model = None
+        self._rule_proxy = None
         self._filter_controls = None
         self._rule_controls = None
         self._settings_panel = None
@@ -233,18 +238,21 @@ class CorrectionRuleView(BaseView):
         table_layout = QVBoxLayout(table_widget)
         table_layout.setContentsMargins(10, 10, 10, 10)
 
-        # Rule table
-        self._rule_table = QTableWidget()
+        # Rule table backed by a model over the full rule list and a filter proxy
+        # BaseView runs _setup_ui before the controller is assigned
+        self._rule_model = CorrectionRuleTableModel(getattr(self, "_controller", None), self)
+        self._rule_proxy = CorrectionRuleFilterProxyModel(self)
+        self._rule_proxy.setSourceModel(self._rule_model)
+
+        self._rule_table = QTableView()
         self._rule_table.setObjectName("ruleTable")
+        self._rule_table.setModel(self._rule_proxy)
         self._rule_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self._rule_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self._rule_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self._rule_table.setAlternatingRowColors(True)
+        self._rule_table.verticalHeader().setVisible(False)
 
-        # Set up columns - exactly match the order and names expected by tests
-        self._rule_table.setColumnCount(4)
-        headers = ["From", "To", "Category", "Status"]
-        self._rule_table.setHorizontalHeaderLabels(headers)
         header = self._rule_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Status
@@ -321,7 +329,7 @@ class CorrectionRuleView(BaseView):
 
         # Table signals
         self._rule_table.doubleClicked.connect(self._on_rule_double_clicked)
-        self._rule_table.itemSelectionChanged.connect(self._update_button_states)
+        self._rule_table.selectionModel().selectionChanged.connect(self._update_button_states)
 
         # Context menu
         self._rule_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -331,111 +339,48 @@ class CorrectionRuleView(BaseView):
         self._apply_button.clicked.connect(self._on_apply_corrections)
 
     def _refresh_rule_table(self):
-        """Refresh the rule table with current rules."""
-        # Get filtered rules
-        category = self._current_filter["category"]
-        status = self._current_filter["status"]
-        search = self._current_filter["search"]
-
-        # Get the rules from the controller with filter parameters
-        # We need the full unfiltered list first to get correct original indices
-        all_rules = self._controller.get_rules()
-        rule_to_index = {rule: idx for idx, rule in enumerate(all_rules)}
-
-        filtered_rules = self._controller.get_rules(
-            category=category, status=status, search_term=search
+        """Sync the rule table with the controller's rules."""
+        # The model emits fine-grained signals for single-rule changes and only
+        # resets for bulk changes such as imports
+        self._rule_model.sync()
+        self._rule_proxy.set_filters(
+            self._current_filter["category"],
+            self._current_filter["status"],
+            self._current_filter["search"],
         )
 
-        # Clear table but preserve headers
-        self._rule_table.setRowCount(0)
-        self._rule_table.setColumnCount(4)  # Ensure columns are set
-        headers = ["From", "To", "Category", "Status"]
-        self._rule_table.setHorizontalHeaderLabels(headers)
-
-        # Populate table
-        for i, rule in enumerate(filtered_rules):
-            row = self._rule_table.rowCount()
-            self._rule_table.insertRow(row)
-
-            # Create items
-            item_from = QTableWidgetItem(rule.from_value)
-            item_to = QTableWidgetItem(rule.to_value)
-            item_category = QTableWidgetItem(rule.category)
-            item_status = QTableWidgetItem(rule.status)
-
-            # Find the rule's original index in the full list
-            # We need a reliable way to map the filtered rule back to the original list
-            # Using the rule object itself as key assumes __hash__ and __eq__ are defined correctly
-            original_index = rule_to_index.get(
-                rule, -1
-            )  # Default to -1 if not found (shouldn't happen)
-            if original_index == -1:
-                logger.warning(f"Could not find original index for rule: {rule}")
-                # Fallback: Try matching based on content? This is less reliable.
-                # For now, we'll store -1, _get_selected_rule_id should handle None return.
-
-            # Store the original index in UserRole for *each* item in the row
-            item_from.setData(Qt.UserRole, original_index)
-            item_to.setData(Qt.UserRole, original_index)
-            item_category.setData(Qt.UserRole, original_index)
-            item_status.setData(Qt.UserRole, original_index)
-
-            # Add items to the table
-            self._rule_table.setItem(row, 0, item_from)
-            self._rule_table.setItem(row, 1, item_to)
-            self._rule_table.setItem(row, 2, item_category)
-            self._rule_table.setItem(row, 3, item_status)
-
-        # Restore column widths if needed (or set initially)
-        header = self._rule_table.horizontalHeader()
-        if not header.isSortIndicatorShown():  # Avoid resetting size if user sorted
-            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(
-                3, QHeaderView.ResizeMode.ResizeToContents
-            )  # Status column size
+        # Rules that form a correction cycle are highlighted
+        all_rules = self._rule_model.rules
+        graph = self._get_rule_graph()
+        self._rule_model.set_cycle_rules(graph.rules_in_cycles(all_rules) if graph else [])
 
         # Update button states after refreshing
         self._update_button_states()
 
         # Update status bar with the count of *all* rules
-        self._update_status_bar(all_rules)
+        self._update_status_bar(all_rules, graph)
+
+    def _selected_rows(self) -> List[int]:
+        """Get the selected rows of the rule table, in view coordinates."""
+        selection_model = self._rule_table.selectionModel()
+        if selection_model is None:
+            return []
+        return sorted(index.row() for index in selection_model.selectedRows())
 
     def _get_selected_rule_id(self) -> Optional[int]:
         """Get the ID (original index in the full list) of the selected rule."""
-        current_row = self._rule_table.currentRow()  # Use currentRow for single selection
-        if current_row < 0:
-            # Check selectedItems as a fallback, useful if selection mode changes
-            selected_items = self._rule_table.selectedItems()
-            if not selected_items:
-                logger.debug("_get_selected_rule_id: No selection.")
-                return None
-            # Use the row of the first selected item
-            current_row = selected_items[0].row()
-            logger.debug(f"_get_selected_rule_id: Using selectedItems[0].row() = {current_row}")
-        else:
-            logger.debug(f"_get_selected_rule_id: Using currentRow() = {current_row}")
-
-        # Get the item from the *first column* of the selected row
-        id_item = self._rule_table.item(current_row, 0)
-        if not id_item:
-            logger.warning(f"_get_selected_rule_id: No item found at row {current_row}, col 0.")
+        current = self._rule_table.currentIndex()
+        selected_rows = self._selected_rows()
+        if selected_rows and (not current.isValid() or current.row() not in selected_rows):
+            current = self._rule_proxy.index(selected_rows[0], 0)
+        if not current.isValid():
+            logger.debug("_get_selected_rule_id: No selection.")
             return None
 
-        id_data = id_item.data(Qt.UserRole)
-        logger.debug(
-            f"_get_selected_rule_id: Data from item({current_row}, 0) UserRole: {id_data} (Type: {type(id_data)})"
-        )
-
-        if id_data is not None and isinstance(id_data, int) and id_data >= 0:
-            try:
-                return int(id_data)
-            except (ValueError, TypeError) as e:
-                logger.error(f"Could not convert rule ID from item data: {id_data}. Error: {e}")
-                return None
-        logger.warning(
-            f"Selected item ({current_row}, 0) does not contain valid rule ID in UserRole data. Data: {id_data}"
-        )
-        return None
+        # Proxy rows map to source rows, which are indices in the controller's list
+        rule_id = self._rule_proxy.mapToSource(current).row()
+        logger.debug(f"_get_selected_rule_id: view row {current.row()} -> rule {rule_id}")
+        return rule_id if rule_id >= 0 else None
 
     def _update_categories_filter(self):
         """Update the category filter with available categories."""
@@ -462,12 +407,25 @@ class CorrectionRuleView(BaseView):
         if index >= 0:
             self._category_filter.setCurrentIndex(index)
 
-    def _update_status_bar(self, rules=None):
+    def _get_rule_graph(self) -> Optional[CorrectionRuleGraph]:
+        """
+        Get the compiled rule graph from the controller.
+
+        Returns:
+            CorrectionRuleGraph: The compiled rules, or None if unavailable
+        """
+        graph = None
+        if hasattr(self._controller, "get_rule_graph"):
+            graph = self._controller.get_rule_graph()
+        return graph if isinstance(graph, CorrectionRuleGraph) else None
+
+    def _update_status_bar(self, rules=None, graph=None):
         """
         Update the status bar with rule counts.
 
         Args:
             rules: Optional list of rules to use. If None, fetches rules from controller.
+            graph: Optional compiled rule graph used to report cycles
         """
         # Get rules from controller if not provided
         if rules is None:
@@ -477,13 +435,21 @@ class CorrectionRuleView(BaseView):
         enabled_rules = sum(1 for rule in rules if rule.status == "enabled")
         disabled_rules = total_rules - enabled_rules
 
-        self._status_bar.showMessage(
+        message = (
             f"Total rules: {total_rules} | Enabled: {enabled_rules} | Disabled: {disabled_rules}"
         )
 
+        if graph is None:
+            graph = self._get_rule_graph()
+        if graph and graph.cycles:
+            cycles = "; ".join(" -> ".join(cycle + cycle[:1]) for cycle in graph.cycles)
+            message += f" | Cycles: {cycles}"
+
+        self._status_bar.showMessage(message)
+
     def _update_button_states(self):
         """Update button states based on selection."""
-        has_selection = len(self._rule_table.selectedItems()) > 0
+        has_selection = len(self._selected_rows()) > 0
 
         # Update all buttons that require a selection
         self._edit_button.setEnabled(has_selection)
@@ -512,8 +478,9 @@ class CorrectionRuleView(BaseView):
         self._current_filter["status"] = status
         self._current_filter["search"] = search
 
-        # Refresh the table with the new filter
-        self._refresh_rule_table()
+        # Filtering happens in the proxy; the rule model is left untouched
+        self._rule_proxy.set_filters(category, status, search)
+        self._update_button_states()
 
     def _on_reset_filters(self):
         """Reset all filters to default values."""
@@ -767,8 +734,7 @@ class CorrectionRuleView(BaseView):
                 )
                 selected_rule = None  # Ensure rule is None if controller fails
 
-        selected_items = self._rule_table.selectedItems()
-        num_selected_rows = len(set(item.row() for item in selected_items))
+        num_selected_rows = len(self._selected_rows())
 
         # Step 3: Build the menu based on whether a rule object was successfully fetched
         if selected_rule:
@@ -802,7 +768,7 @@ class CorrectionRuleView(BaseView):
             menu.addAction(preview_action)
 
             # Move actions - only relevant if there's more than one rule total
-            if self._rule_table.rowCount() > 1:
+            if self._rule_model.rowCount() > 1:
                 menu.addSeparator()
                 move_top_action = QAction(
                     IconProvider.get_icon("move_top", fallback="go-top"), "Move to Top", self
@@ -23,6 +23,24 @@ from chestbuddy.ui.views.updatable_view import UpdatableView
 from chestbuddy.ui.resources.style import Colors, get_card_style
 from chestbuddy.ui.resources.icons import Icons
 from chestbuddy.ui.widgets.empty_state_widget import EmptyStateWidget
+from chestbuddy.utils.service_locator import ServiceLocator
+
+
+def validation_status_text() -> str:
+    """
+    Describe the validation state of the data from the table state counters.
+
+    Returns:
+        str: "Not Validated" if no cell has a validation state, otherwise the
+            number of rows with invalid or correctable cells
+    """
+    if not ServiceLocator.has_service("table_state_manager"):
+        return "Not Validated"
+    state_manager = ServiceLocator.get("table_state_manager")
+    summary = state_manager.summary()
+    if not any(summary[key] for key in ("valid", "invalid", "correctable", "corrected")):
+        return "Not Validated"
+    return f"{summary['issue_rows']:,} rows with issues"
 
 
 class StatsCard(QFrame):
@@ -98,6 +116,7 @@ class ChartWidget(QFrame):
         """
         super().__init__(parent)
         self._title = title
+        self._entry_labels = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -143,6 +162,24 @@ class ChartWidget(QFrame):
 
         self._layout.addWidget(self._content)
 
+    def set_entries(self, entries):
+        """
+        Show a ranked list instead of the placeholder.
+
+        Args:
+            entries (list): (name, value) pairs in display order; empty shows the placeholder
+        """
+        for label in self._entry_labels:
+            self._content_layout.removeWidget(label)
+            label.deleteLater()
+        self._entry_labels = []
+        self._placeholder.setVisible(not entries)
+        for rank, (name, value) in enumerate(entries, start=1):
+            label = QLabel(f"{rank}. {name} — {value:,.0f}")
+            label.setStyleSheet(f"color: {Colors.TEXT_LIGHT}; font-size: 14px;")
+            self._content_layout.addWidget(label)
+            self._entry_labels.append(label)
+
     def get_content_widget(self):
         """
         Get the content widget.
@@ -463,8 +500,8 @@ class DashboardView(UpdatableView):
         self._top_players_chart = ChartWidget("Top Players")
         self._charts_layout.addWidget(self._top_players_chart, 0, 1)
 
-        # Chest sources chart
-        self._chest_sources_chart = ChartWidget("Top Chest Sources")
+        # Chest types chart
+        self._chest_sources_chart = ChartWidget("Top Chest Types")
         self._charts_layout.addWidget(self._chest_sources_chart, 1, 0)
 
         # Quick actions widget
@@ -588,8 +625,10 @@ class DashboardView(UpdatableView):
         # Reset stats cards
         self.update_stats(0, "N/A", 0, "Never")
 
-        # Clear recent files
+        # Clear recent files and leaderboards
         self.set_recent_files([])
+        self._top_players_chart.set_entries([])
+        self._chest_sources_chart.set_entries([])
 
         # Set to empty state
         self.set_data_loaded(False)
@@ -622,6 +661,15 @@ class DashboardView(UpdatableView):
             logger = logging.getLogger(__name__)
             logger.error(f"Error updating recent file list: {e}")
 
+    def _update_leaderboards(self):
+        """Show the top players and chest types from the precomputed rollups."""
+        if not ServiceLocator.has_service("rollup_service"):
+            return
+        rollup_service = ServiceLocator.get("rollup_service")
+        self._top_players_chart.set_entries(rollup_service.leaderboard("player", limit=5))
+        chest_counts = rollup_service.chest_counts()
+        self._chest_sources_chart.set_entries(list(chest_counts.items())[:5])
+
     def _update_dashboard_stats(self):
         """Update the dashboard statistics."""
         try:
@@ -631,14 +679,9 @@ class DashboardView(UpdatableView):
                 has_data = not self._data_model.is_empty
                 if has_data:
                     # Update dashboard stats with current data
-                    row_count = (
-                        len(self._data_model.data) if hasattr(self._data_model, "data") else 0
-                    )
-                    validation_status = (
-                        "Not Validated"
-                        if self._data_model.get_validation_status().empty
-                        else f"{len(self._data_model.get_validation_status())} issues"
-                    )
+                    # Read maintained counters instead of copying the data
+                    row_count = self._data_model.row_count
+                    validation_status = validation_status_text()
                     corrections = (
                         self._data_model.get_correction_row_count()
                         if hasattr(self._data_model, "get_correction_row_count")
@@ -656,6 +699,7 @@ class DashboardView(UpdatableView):
                         corrections=corrections,
                         last_import=last_import,
                     )
+                    self._update_leaderboards()
         except Exception as e:
             import logging
 
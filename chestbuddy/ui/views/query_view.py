@@ -0,0 +1,416 @@
+"""
+query_view.py
+
+Description: Reports view for ad-hoc grouped, filtered and pivoted queries over the chest data
+Usage:
+    query_view = QueryView(data_model, query_service)
+    main_window.add_view(query_view)
+"""
+
+import logging
+import time
+from typing import Optional
+
+import pandas as pd
+from PySide6.QtCore import Signal, Slot
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFileDialog,
+    QFormLayout,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPlainTextEdit,
+    QPushButton,
+    QTableView,
+    QTabWidget,
+    QWidget,
+)
+
+from chestbuddy.core.models import ChestDataModel
+from chestbuddy.core.services.query_service import (
+    AGGREGATES,
+    FILTER_MODES,
+    TIME_BUCKETS,
+    QueryService,
+    QuerySpec,
+)
+from chestbuddy.ui.models.query_result_model import QueryResultModel
+from chestbuddy.ui.views.updatable_view import UpdatableView
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+NONE_OPTION = "None"
+ROW_COUNT_OPTION = "(rows)"
+
+
+class QueryView(UpdatableView):
+    """
+    Reports view for answering ad-hoc questions about the chest data.
+
+    Questions such as "points per player per week by chest source" are built
+    from group, time bucket, value, aggregate, pivot and filter selections, or
+    written as SQL when DuckDB is installed. Queries run in the background and
+    can be cancelled; results are shown in a paged table and can be exported
+    as CSV.
+
+    Attributes:
+        data_model (ChestDataModel): The data model containing chest data
+        query_service (QueryService): The service running the queries
+
+    Implementation Notes:
+        - Inherits from UpdatableView to maintain UI consistency and implement IUpdatable
+        - Only one query runs at a time; starting a new one cancels the previous one
+        - Results of unchanged data are served from the QueryService cache
+    """
+
+    query_started = Signal()
+    query_completed = Signal(int)  # result row count
+    query_error = Signal(str)  # error message
+    query_export_completed = Signal(str)  # file path
+
+    def __init__(
+        self,
+        data_model: ChestDataModel,
+        query_service: QueryService,
+        parent: Optional[QWidget] = None,
+        debug_mode: bool = False,
+    ):
+        """
+        Initialize the QueryView.
+
+        Args:
+            data_model (ChestDataModel): The data model containing chest data
+            query_service (QueryService): The service running the queries
+            parent (Optional[QWidget]): Parent widget
+            debug_mode (bool): Enable debug mode for signal connections
+        """
+        self._data_model = data_model
+        self._query_service = query_service
+        self._controller = None
+
+        # UI components to be created in _setup_ui
+        self._mode_tabs = None
+        self._group_by_combo = None
+        self._then_by_combo = None
+        self._time_bucket_combo = None
+        self._value_combo = None
+        self._aggregate_combo = None
+        self._pivot_combo = None
+        self._filter_column_combo = None
+        self._filter_mode_combo = None
+        self._filter_text_input = None
+        self._sql_input = None
+        self._run_button = None
+        self._cancel_button = None
+        self._export_button = None
+        self._status_label = None
+        self._result_table = None
+        self._result_model = QueryResultModel()
+
+        # Running query
+        self._handle = None
+        self._started_at = 0.0
+
+        super().__init__("Reports", parent, debug_mode=debug_mode)
+        self.setObjectName("QueryView")
+
+    def set_controller(self, controller) -> None:
+        """
+        Set the data view controller for this view.
+
+        Args:
+            controller: The DataViewController instance to use
+        """
+        self._controller = controller
+
+    def _setup_ui(self):
+        """Set up the UI components."""
+        super()._setup_ui()
+
+        self._mode_tabs = QTabWidget()
+
+        # Builder tab
+        builder = QWidget()
+        builder_layout = QGridLayout(builder)
+
+        grouping_group = QGroupBox("Group")
+        grouping_layout = QFormLayout(grouping_group)
+        self._group_by_combo = QComboBox()
+        grouping_layout.addRow("Group By:", self._group_by_combo)
+        self._then_by_combo = QComboBox()
+        grouping_layout.addRow("Then By:", self._then_by_combo)
+        self._time_bucket_combo = QComboBox()
+        self._time_bucket_combo.addItem(NONE_OPTION)
+        self._time_bucket_combo.addItems([bucket.capitalize() for bucket in TIME_BUCKETS])
+        grouping_layout.addRow("Dates By:", self._time_bucket_combo)
+        builder_layout.addWidget(grouping_group, 0, 0)
+
+        measure_group = QGroupBox("Measure")
+        measure_layout = QFormLayout(measure_group)
+        self._value_combo = QComboBox()
+        measure_layout.addRow("Value:", self._value_combo)
+        self._aggregate_combo = QComboBox()
+        self._aggregate_combo.addItems([aggregate.capitalize() for aggregate in AGGREGATES])
+        measure_layout.addRow("Aggregate:", self._aggregate_combo)
+        self._pivot_combo = QComboBox()
+        measure_layout.addRow("Columns From:", self._pivot_combo)
+        builder_layout.addWidget(measure_group, 0, 1)
+
+        filter_group = QGroupBox("Filter")
+        filter_layout = QFormLayout(filter_group)
+        self._filter_column_combo = QComboBox()
+        filter_layout.addRow("Column:", self._filter_column_combo)
+        self._filter_mode_combo = QComboBox()
+        self._filter_mode_combo.addItems(FILTER_MODES)
+        filter_layout.addRow("Mode:", self._filter_mode_combo)
+        self._filter_text_input = QLineEdit()
+        filter_layout.addRow("Text:", self._filter_text_input)
+        builder_layout.addWidget(filter_group, 0, 2)
+
+        self._mode_tabs.addTab(builder, "Builder")
+
+        # SQL tab
+        self._sql_input = QPlainTextEdit()
+        self._sql_input.setPlaceholderText(
+            "SELECT PLAYER, SOURCE, sum(TRY_CAST(SCORE AS INTEGER)) AS points\n"
+            "FROM chest_data GROUP BY ALL ORDER BY points DESC"
+        )
+        sql_index = self._mode_tabs.addTab(self._sql_input, "SQL")
+        if not QueryService.sql_available():
+            self._mode_tabs.setTabEnabled(sql_index, False)
+            self._mode_tabs.setTabToolTip(sql_index, "Install DuckDB to run SQL queries")
+
+        self.get_content_layout().addWidget(self._mode_tabs)
+
+        # Actions
+        actions_layout = QHBoxLayout()
+        self._run_button = QPushButton("Run")
+        actions_layout.addWidget(self._run_button)
+        self._cancel_button = QPushButton("Cancel")
+        self._cancel_button.setEnabled(False)
+        actions_layout.addWidget(self._cancel_button)
+        self._status_label = QLabel("")
+        actions_layout.addWidget(self._status_label, 1)
+        self._export_button = QPushButton("Export")
+        self._export_button.setEnabled(False)
+        actions_layout.addWidget(self._export_button)
+        self.get_content_layout().addLayout(actions_layout)
+
+        # Results
+        self._result_table = QTableView()
+        self._result_table.setModel(self._result_model)
+        self._result_table.setMinimumHeight(300)
+        self.get_content_layout().addWidget(self._result_table)
+
+        self._update_column_combos()
+
+    def _connect_signals(self):
+        """Connect signals and slots."""
+        super()._connect_signals()
+
+        self._run_button.clicked.connect(self._on_run_query)
+        self._cancel_button.clicked.connect(self._on_cancel_query)
+        self._export_button.clicked.connect(self._on_export_result)
+        self.header_action_clicked.connect(self._on_header_action_clicked)
+
+        if hasattr(self._data_model, "data_changed") and hasattr(self, "request_update"):
+            try:
+                self._signal_manager.connect(
+                    self._data_model, "data_changed", self, "request_update"
+                )
+                logger.debug("Connected data_model.data_changed to QueryView.request_update")
+            except Exception as e:
+                logger.error(f"Error connecting data model signals: {e}")
+
+    def _add_action_buttons(self):
+        """Add action buttons to the header."""
+        self.add_header_action("run", "Run Query")
+        self.add_header_action("export", "Export Result")
+
+    def current_query(self):
+        """
+        Get the query described by the current selections.
+
+        Returns:
+            QuerySpec or str: The builder query, or the SQL text on the SQL tab
+        """
+        if self._mode_tabs.currentWidget() is self._sql_input:
+            return self._sql_input.toPlainText().strip()
+
+        group_by = tuple(
+            column
+            for column in (self._group_by_combo.currentText(), self._then_by_combo.currentText())
+            if column and column != NONE_OPTION
+        )
+        bucket = self._time_bucket_combo.currentText()
+        value = self._value_combo.currentText()
+        pivot = self._pivot_combo.currentText()
+        filter_text = self._filter_text_input.text()
+        filters = ()
+        if filter_text and self._filter_column_combo.currentText() != NONE_OPTION:
+            filters = (
+                (
+                    self._filter_column_combo.currentText(),
+                    self._filter_mode_combo.currentText(),
+                    filter_text,
+                ),
+            )
+        return QuerySpec(
+            group_by=group_by,
+            value_column=None if value in ("", ROW_COUNT_OPTION) else value,
+            aggregate=self._aggregate_combo.currentText().lower(),
+            pivot_column=None if pivot in ("", NONE_OPTION) else pivot,
+            filters=filters,
+            time_bucket=None if bucket == NONE_OPTION else bucket.lower(),
+        )
+
+    def _on_run_query(self):
+        """Run the current query in the background."""
+        query = self.current_query()
+        if not query:
+            return
+        self._on_cancel_query()
+
+        self.query_started.emit()
+        self._started_at = time.perf_counter()
+        cached = self._query_service.cached_result(query)
+        if cached is not None:
+            self._on_query_finished(cached)
+            self._status_label.setText(self._status_label.text() + " (cached)")
+            return
+        try:
+            self._handle = self._query_service.submit(query)
+        except Exception as e:
+            self._on_query_error(e)
+            return
+        self._handle.finished.connect(self._on_query_finished)
+        self._handle.error.connect(self._on_query_error)
+        self._handle.cancelled.connect(self._on_query_cancelled)
+        self._run_button.setEnabled(False)
+        self._cancel_button.setEnabled(True)
+        self._status_label.setText("Running...")
+
+    def _on_cancel_query(self):
+        """Cancel the running query, if any."""
+        if self._handle is not None:
+            handle, self._handle = self._handle, None
+            handle.finished.disconnect(self._on_query_finished)
+            handle.cancel()
+            self._on_query_cancelled()
+
+    @Slot(object)
+    def _on_query_finished(self, result: Optional[pd.DataFrame]):
+        """Show a finished query's result."""
+        self._handle = None
+        self._run_button.setEnabled(True)
+        self._cancel_button.setEnabled(False)
+        if result is None:
+            self._status_label.setText("Cancelled")
+            return
+        elapsed = (time.perf_counter() - self._started_at) * 1000
+        self._result_model.set_result(result)
+        self._export_button.setEnabled(not result.empty)
+        self._status_label.setText(f"{len(result):,} rows in {elapsed:.0f} ms")
+        self.query_completed.emit(len(result))
+
+    @Slot(Exception)
+    def _on_query_error(self, error: Exception):
+        """Report a failed query."""
+        self._handle = None
+        self._run_button.setEnabled(True)
+        self._cancel_button.setEnabled(False)
+        error_message = f"Query failed: {error}"
+        logger.error(error_message)
+        self._status_label.setText(str(error))
+        self.query_error.emit(error_message)
+
+    @Slot()
+    def _on_query_cancelled(self):
+        """Update the controls after a query was cancelled."""
+        self._run_button.setEnabled(True)
+        self._cancel_button.setEnabled(False)
+        self._status_label.setText("Cancelled")
+
+    def _on_export_result(self):
+        """Export the shown result as CSV."""
+        result = self._result_model.result
+        if result.empty:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Report", "", "CSV Files (*.csv);;All Files (*)"
+        )
+        if not file_path:
+            return
+        success, error = self._query_service.export(result, file_path)
+        if success:
+            self._status_label.setText(f"Exported {len(result):,} rows to {file_path}")
+            self.query_export_completed.emit(file_path)
+        else:
+            self._status_label.setText(f"Export failed: {error}")
+            self.query_error.emit(f"Export failed: {error}")
+
+    def _update_column_combos(self):
+        """Fill the column selections with the columns of the loaded data."""
+        columns = list(self._data_model.column_names) if self._data_model else []
+        combos = (
+            (self._group_by_combo, []),
+            (self._then_by_combo, [NONE_OPTION]),
+            (self._value_combo, [ROW_COUNT_OPTION]),
+            (self._pivot_combo, [NONE_OPTION]),
+            (self._filter_column_combo, [NONE_OPTION]),
+        )
+        for combo, options in combos:
+            current = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(options + columns)
+            if current in options + columns:
+                combo.setCurrentText(current)
+            combo.blockSignals(False)
+        self._run_button.setEnabled(bool(columns) and self._handle is None)
+
+    def _on_header_action_clicked(self, action_id: str):
+        """
+        Handle header action button clicks.
+
+        Args:
+            action_id (str): The ID of the action button clicked
+        """
+        if action_id == "run":
+            self._on_run_query()
+        elif action_id == "export":
+            self._on_export_result()
+
+    def _update_view_content(self, data=None) -> None:
+        """
+        Update the view content with current data.
+
+        Args:
+            data: Optional data for the update (unused in this implementation)
+        """
+        self._update_column_combos()
+        logger.debug("QueryView: View content updated")
+
+    def _refresh_view_content(self) -> None:
+        """Refresh the view content without changing the underlying data."""
+        self._update_column_combos()
+
+    def _populate_view_content(self, data=None) -> None:
+        """
+        Populate the view content from scratch.
+
+        Args:
+            data: Optional data to use for population (unused in this implementation)
+        """
+        self._update_column_combos()
+
+    def _reset_view_content(self) -> None:
+        """Reset the view content to its initial state."""
+        self._on_cancel_query()
+        self._result_model.set_result(None)
+        self._export_button.setEnabled(False)
+        self._status_label.setText("")
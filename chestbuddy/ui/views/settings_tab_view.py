@@ -29,6 +29,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QSize
 
 from chestbuddy.utils.config import ConfigManager
+from chestbuddy.utils.log_pipeline import hot_path, set_log_level
+from chestbuddy.utils.process_pool import ProcessPool
 from chestbuddy.ui.resources.style import Colors
 from chestbuddy.ui.utils.icon_provider import IconProvider
 from chestbuddy.utils.service_locator import ServiceLocator
@@ -660,8 +662,92 @@ class SettingsTabView(QWidget):
             lambda value: self._on_setting_changed("UI", "table_page_size", str(value))
         )
 
-        # Add group to layout
+        # Create diagnostics group
+        diagnostics_group = QGroupBox("Diagnostics")
+        diagnostics_group.setStyleSheet(ui_group.styleSheet())
+
+        diagnostics_layout = QFormLayout(diagnostics_group)
+        diagnostics_layout.setContentsMargins(16, 24, 16, 16)
+        diagnostics_layout.setSpacing(12)
+        diagnostics_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        diagnostics_layout.setLabelAlignment(Qt.AlignRight)
+
+        # Log level
+        log_level_label = QLabel("Log Level:")
+        log_level_label.setStyleSheet(f"color: {Colors.TEXT_LIGHT};")
+
+        log_level_combo = QComboBox()
+        log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
+        log_level_combo.setObjectName("level")
+        log_level_combo.setStyleSheet(f"""
+            QComboBox {{
+                background-color: {Colors.PRIMARY_LIGHT};
+                color: {Colors.TEXT_LIGHT};
+                border: 1px solid {Colors.DARK_BORDER};
+                border-radius: 4px;
+                padding: 4px 8px;
+                min-height: 25px;
+            }}
+        """)
+
+        # Hot-path debug logging
+        hot_path_label = QLabel("Hot-path Debug Logging:")
+        hot_path_label.setStyleSheet(f"color: {Colors.TEXT_LIGHT};")
+
+        hot_path_checkbox = QCheckBox()
+        hot_path_checkbox.setObjectName("hot_path_logging")
+        hot_path_checkbox.setToolTip(
+            "Log per-cell and per-signal diagnostics. Slows down bulk operations."
+        )
+
+        diagnostics_layout.addRow(log_level_label, log_level_combo)
+        diagnostics_layout.addRow(hot_path_label, hot_path_checkbox)
+
+        self._settings_widgets["Logging"] = {"level": log_level_combo}
+        self._settings_widgets["Debug"] = {"hot_path_logging": hot_path_checkbox}
+
+        log_level_combo.currentTextChanged.connect(
+            lambda value: self._on_setting_changed("Logging", "level", value)
+        )
+        hot_path_checkbox.toggled.connect(
+            lambda checked: self._on_setting_changed("Debug", "hot_path_logging", str(checked))
+        )
+
+        # Create performance group
+        performance_group = QGroupBox("Performance")
+        performance_group.setStyleSheet(ui_group.styleSheet())
+
+        performance_layout = QFormLayout(performance_group)
+        performance_layout.setContentsMargins(16, 24, 16, 16)
+        performance_layout.setSpacing(12)
+        performance_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        performance_layout.setLabelAlignment(Qt.AlignRight)
+
+        # Worker processes for large validations and corrections
+        workers_label = QLabel("Worker Processes:")
+        workers_label.setStyleSheet(f"color: {Colors.TEXT_LIGHT};")
+
+        workers_spinner = QSpinBox()
+        workers_spinner.setObjectName("worker_processes")
+        workers_spinner.setRange(0, 64)
+        workers_spinner.setSpecialValueText("Automatic")
+        workers_spinner.setToolTip(
+            "Processes used to validate and correct large datasets. 1 disables them."
+        )
+        workers_spinner.setStyleSheet(width_spinner.styleSheet())
+
+        performance_layout.addRow(workers_label, workers_spinner)
+
+        self._settings_widgets["Performance"] = {"worker_processes": workers_spinner}
+
+        workers_spinner.valueChanged.connect(
+            lambda value: self._on_setting_changed("Performance", "worker_processes", str(value))
+        )
+
+        # Add groups to layout
         layout.addWidget(ui_group)
+        layout.addWidget(diagnostics_group)
+        layout.addWidget(performance_group)
 
         # Add spacer at the bottom
         layout.addStretch(1)
@@ -915,6 +1001,22 @@ class SettingsTabView(QWidget):
             page_size = self._config_manager.get_int("UI", "table_page_size", 100)
             page_size_spinner.setValue(page_size)
 
+        # Load diagnostics settings
+        log_level_combo = self._settings_widgets.get("Logging", {}).get("level")
+        if log_level_combo:
+            level = self._config_manager.get("Logging", "level", "INFO")
+            log_level_combo.setCurrentText(str(level).upper())
+
+        hot_path_checkbox = self._settings_widgets.get("Debug", {}).get("hot_path_logging")
+        if hot_path_checkbox:
+            hot_path_logging = self._config_manager.get_bool("Debug", "hot_path_logging", False)
+            hot_path_checkbox.setChecked(hot_path_logging)
+
+        workers_spinner = self._settings_widgets.get("Performance", {}).get("worker_processes")
+        if workers_spinner:
+            workers = self._config_manager.get_int("Performance", "worker_processes", 0)
+            workers_spinner.setValue(workers)
+
         logger.debug("Loaded settings into UI controls")
 
     def _on_setting_changed(self, section: str, option: str, value: str) -> None:
@@ -951,6 +1053,14 @@ class SettingsTabView(QWidget):
                     self._validation_service.set_auto_save(bool_value)
                     logger.debug(f"Updated ValidationService auto_save to {bool_value}")
 
+            # Diagnostics settings take effect immediately
+            if section == "Logging" and option == "level":
+                set_log_level(value)
+            elif section == "Debug" and option == "hot_path_logging":
+                hot_path.set_enabled(value.lower() in ["true", "1", "yes", "y", "on"])
+            elif section == "Performance" and option == "worker_processes":
+                ProcessPool.instance().set_workers(int(value))
+
             # Emit signal
             self.settings_changed.emit(section, option, value)
 
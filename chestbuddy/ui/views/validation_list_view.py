@@ -12,17 +12,18 @@ from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QAbstractItemView,
     QMenu,
     QMessageBox,
     QInputDialog,
     QFileDialog,
     QDialog,
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QObject
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QModelIndex
 
 from chestbuddy.core.models.validation_list_model import ValidationListModel
+from chestbuddy.ui.models.validation_entry_list_model import ValidationEntryListModel
 from chestbuddy.ui.resources.style import Colors
 from chestbuddy.ui.views.confirmation_dialog import ConfirmationDialog
 from chestbuddy.ui.views.multi_entry_dialog import MultiEntryDialog
@@ -64,7 +65,10 @@ class ValidationListView(QWidget):
 
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(300)  # 300ms debounce
+        self._search_timer.setInterval(150)  # Short debounce, searches narrow incrementally
+
+        # Virtual list model; rows are created on demand by the view
+        self._list_model = ValidationEntryListModel(self._model, self)
 
         # Set properties for proper styling
         self.setProperty("lightContentView", True)
@@ -87,30 +91,33 @@ class ValidationListView(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
-        # List widget with improved styling for consistent colors and better item spacing
-        self._list_widget = QListWidget()
+        # List view with improved styling for consistent colors and better item spacing
+        self._list_widget = QListView()
+        self._list_widget.setModel(self._list_model)
+        self._list_widget.setUniformItemSizes(True)
+        self._list_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         # Enable multiple selection using Ctrl and Shift keys
-        self._list_widget.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self._list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self._list_widget.setStyleSheet(f"""
-            QListWidget {{
+            QListView {{
                 background-color: {Colors.PRIMARY};
                 border: 1px solid {Colors.DARK_BORDER};
                 border-radius: 4px;
                 padding: 4px;
                 color: {Colors.TEXT_LIGHT};
             }}
-            QListWidget::item {{
+            QListView::item {{
                 padding: 6px 8px;
                 border-bottom: 1px solid {Colors.DARK_BORDER};
                 margin-bottom: 2px;
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: {Colors.PRIMARY_LIGHT};
                 border-left: 3px solid {Colors.SECONDARY};
                 color: {Colors.TEXT_LIGHT};
             }}
-            QListWidget::item:hover {{
+            QListView::item:hover {{
                 background-color: {Colors.PRIMARY_LIGHT};
             }}
             QScrollBar:vertical {{
@@ -137,7 +144,7 @@ class ValidationListView(QWidget):
         """)
         self._list_widget.setAutoFillBackground(True)  # Ensure list widget has proper background
 
-        # Ensure all QListWidgetItems will render with proper background
+        # Ensure all rows will render with proper background
         self._list_widget.viewport().setAutoFillBackground(True)
 
         layout.addWidget(self._list_widget)
@@ -166,8 +173,7 @@ class ValidationListView(QWidget):
 
     def _connect_signals(self) -> None:
         """Connect widget signals to slots."""
-        # Model signals
-        self._model.entries_changed.connect(self._on_entries_changed)
+        # Model signals are handled by the list model, which updates rows in place
 
         # Search input signals
         self._search_input.textChanged.connect(self._on_search_text_changed)
@@ -175,37 +181,30 @@ class ValidationListView(QWidget):
 
         # List widget signals
         self._list_widget.customContextMenuRequested.connect(self._show_context_menu)
-        self._list_widget.itemDoubleClicked.connect(self._edit_entry)
+        self._list_widget.doubleClicked.connect(self._on_entry_double_clicked)
 
     def _populate_list(self, filter_text: str = "") -> None:
         """
-        Populate the list widget with entries.
+        Show the entries matching a filter.
 
         Args:
             filter_text (str, optional): Text to filter entries by. Defaults to "".
         """
-        self._list_widget.clear()
-
-        # Get entries (filtered if search text is provided)
-        entries = (
-            self._model.find_matching_entries(filter_text)
-            if filter_text
-            else self._model.get_entries()
-        )
-
-        # Add entries to list widget
-        for entry in entries:
-            item = QListWidgetItem(entry)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self._list_widget.addItem(item)
+        self._list_model.set_filter(filter_text)
 
         # Update status
         self.status_changed.emit("List populated")
-        logger.debug(f"Populated list with {len(entries)} entries")
+        logger.debug(f"Showing {self._list_model.rowCount()} entries")
 
-    def _on_entries_changed(self) -> None:
-        """Handle changes to the model's entries."""
-        self._populate_list(self._search_input.text())
+    def _selected_entries(self) -> List[str]:
+        """
+        Get the selected entries in display order.
+
+        Returns:
+            List[str]: The selected entries
+        """
+        rows = sorted(index.row() for index in self._list_widget.selectionModel().selectedRows())
+        return [self._list_model.entry(row) for row in rows if self._list_model.entry(row)]
 
     def _on_search_text_changed(self, text: str) -> None:
         """
@@ -253,9 +252,9 @@ class ValidationListView(QWidget):
             }}
         """)
 
-        # Get selected items
-        selected_items = self._list_widget.selectedItems()
-        if not selected_items:
+        # Get selected entries
+        selected_entries = self._selected_entries()
+        if not selected_entries:
             return
 
         # Add actions
@@ -266,18 +265,28 @@ class ValidationListView(QWidget):
         # Show menu and handle action
         action = menu.exec(self._list_widget.mapToGlobal(position))
         if action == edit_action:
-            self._edit_entry(selected_items[0])
+            self._edit_entry(selected_entries[0])
         elif action == remove_action:
-            self._remove_entries(selected_items)
+            self._remove_entries(selected_entries)
+
+    def _on_entry_double_clicked(self, index: QModelIndex) -> None:
+        """
+        Edit the entry that was double-clicked.
+
+        Args:
+            index (QModelIndex): Index of the clicked row
+        """
+        entry = self._list_model.entry(index.row())
+        if entry is not None:
+            self._edit_entry(entry)
 
-    def _edit_entry(self, item: QListWidgetItem) -> None:
+    def _edit_entry(self, old_text: str) -> None:
         """
         Edit a list entry.
 
         Args:
-            item (QListWidgetItem): Item to edit
+            old_text (str): Entry to edit
         """
-        old_text = item.text()
         new_text, ok = QInputDialog.getText(self, "Edit Entry", "Enter new value:", text=old_text)
 
         if ok and new_text and new_text != old_text:
@@ -292,18 +301,18 @@ class ValidationListView(QWidget):
                     self, "Edit Failed", f"The entry '{new_text}' already exists in the list."
                 )
 
-    def _remove_entries(self, items: List[QListWidgetItem]) -> None:
+    def _remove_entries(self, entries: List[str]) -> None:
         """
         Remove entries from the list.
 
         Args:
-            items (List[QListWidgetItem]): Items to remove
+            entries (List[str]): Entries to remove
         """
-        if not items:
+        if not entries:
             return
 
-        # Create a copy of the entries to remove to avoid issues with items being deleted
-        entries_to_remove = [item.text() for item in items]
+        # Copy the entries, rows are removed from the model as entries go
+        entries_to_remove = list(entries)
 
         entry_text = "\n".join(entries_to_remove[:10])
         if len(entries_to_remove) > 10:
@@ -318,7 +327,6 @@ class ValidationListView(QWidget):
         )
 
         if dialog.exec() == QDialog.Accepted:
-            # Now work with the copied text entries instead of QListWidgetItems
             for entry in entries_to_remove:
                 if self._model.remove_entry(entry):
                     logger.info(f"Removed entry '{entry}' from {self._name}")
@@ -384,9 +392,9 @@ class ValidationListView(QWidget):
 
     def remove_selected_entries(self) -> None:
         """Remove selected entries from the list."""
-        selected_items = self._list_widget.selectedItems()
-        if selected_items:
-            self._remove_entries(selected_items)
+        selected_entries = self._selected_entries()
+        if selected_entries:
+            self._remove_entries(selected_entries)
         else:
             QMessageBox.information(self, "Remove", "No items selected")
 
@@ -3,8 +3,8 @@ Background processing utilities.
 
 This module provides utilities for running operations in the background
 while maintaining UI responsiveness. It includes a BackgroundWorker
-class that handles thread management and signal coordination, and a
-BackgroundTask base class that defines the interface for tasks.
+class that runs tasks on the shared TaskScheduler and coordinates their
+signals, and a BackgroundTask base class that defines the interface for tasks.
 """
 
 import logging
@@ -18,6 +18,8 @@ import pandas as pd
 from PySide6.QtCore import QObject, Signal, Slot, QThread, QRunnable, QThreadPool
 from PySide6.QtWidgets import QApplication
 
+from chestbuddy.utils.task_scheduler import TaskHandle, TaskPriority, TaskScheduler
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,31 @@ class BackgroundTask(QObject, Generic[T]):
         raise NotImplementedError("Subclasses must implement run() method")
 
 
+def file_fingerprint(file_paths: List[Union[str, Path]], *options: Any) -> Tuple:
+    """
+    Identify a file-reading task by its files and options.
+
+    Each file contributes its resolved path, size and modification time, so an
+    edited file gets a new fingerprint.
+
+    Args:
+        file_paths: Files the task reads
+        *options: Other task arguments that change the result
+
+    Returns:
+        Tuple: Hashable fingerprint for BackgroundWorker.execute_task()
+    """
+    files = []
+    for file_path in file_paths:
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+            files.append((str(path.resolve()), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            files.append((str(path), None, None))
+    return (tuple(files),) + options
+
+
 class MultiCSVLoadTask(BackgroundTask):
     """
     Task to load multiple CSV files, with progress reporting.
@@ -466,10 +493,11 @@ class FunctionTask(BackgroundTask):
 
 class BackgroundWorker(QObject):
     """
-    Worker for executing background tasks in a separate thread.
+    Worker for executing background tasks on the shared task scheduler.
 
-    The BackgroundWorker manages the lifetime of a background task and its thread,
-    handles signal connections, and takes care of thread cleanup.
+    The BackgroundWorker submits its task to the TaskScheduler's bounded thread
+    pool instead of starting a thread of its own, relays the task's signals and
+    keeps track of its lifetime.
     """
 
     # Signals
@@ -481,14 +509,14 @@ class BackgroundWorker(QObject):
     task_completed = Signal(str, object)  # task_id, result
     task_failed = Signal(str, Exception)  # task_id, error
 
-    # Track all active worker instances
+    # Workers with a task in flight, kept alive until the task is done
     _active_workers = set()
 
     @classmethod
     def shutdown(cls):
         """
         Class method to shut down all active background workers.
-        Used during application cleanup to ensure all threads are properly terminated.
+        Used during application cleanup to ensure all tasks are cancelled.
         """
         try:
             workers_to_shutdown = list(cls._active_workers)
@@ -507,75 +535,123 @@ class BackgroundWorker(QObject):
         except Exception as e:
             logger.error(f"Error in BackgroundWorker.shutdown: {e}")
 
-    def __init__(self) -> None:
-        """Initialize the background worker."""
-        super().__init__()
+    def __init__(
+        self,
+        priority: int = TaskPriority.NORMAL,
+        task_type: Optional[str] = None,
+        scheduler: Optional[TaskScheduler] = None,
+    ) -> None:
+        """
+        Initialize the background worker.
 
-        # Create a new thread for this worker
-        self._thread = QThread()
-        self._thread.setObjectName(f"BackgroundWorker-{id(self)}")
+        Args:
+            priority: Scheduling priority of the worker's tasks
+            task_type: Task type for deduplication and metrics, defaults to the task class
+            scheduler: Scheduler to run on, defaults to the shared instance
+        """
+        super().__init__()
+        self._priority = priority
+        self._task_type = task_type
+        self._scheduler = scheduler
+        self._task = None
+        self._handle: Optional[TaskHandle] = None
+        self._fingerprint: Any = None
 
-        # Move this worker to the thread
-        self.moveToThread(self._thread)
+    @property
+    def is_running(self) -> bool:
+        """
+        Return whether the worker has a task that is queued or running.
 
-        # Connect thread signals
-        self._thread.started.connect(self._on_thread_started)
-        self._thread.finished.connect(self._on_thread_finished)
+        Returns:
+            True if a task is in flight, False otherwise.
+        """
+        return self._handle is not None and not self._handle.is_done
 
-        # Initialize variables
-        self._task = None
-        self._is_running = False
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Return whether the current task was cancelled.
 
-        # Register this worker in the active workers set
-        BackgroundWorker._active_workers.add(self)
+        Returns:
+            True if cancellation of the current task was requested.
+        """
+        return self._handle is not None and self._handle.token.is_cancelled
 
     @property
-    def is_running(self) -> bool:
+    def fingerprint(self) -> Any:
         """
-        Return whether the worker is currently running a task.
+        Return the fingerprint of the current task.
 
         Returns:
-            True if a task is running, False otherwise.
+            The fingerprint passed with the task, or None.
         """
-        return self._is_running and self._thread.isRunning()
+        return self._fingerprint
 
-    def execute_task(self, task: BackgroundTask) -> None:
+    def is_duplicate(self, fingerprint: Any) -> bool:
         """
-        Execute a background task in a separate thread.
+        Check whether a task with this fingerprint is already in flight on this worker.
+
+        Args:
+            fingerprint: Identity of a task's input
+
+        Returns:
+            True if the current task is queued or running with the same fingerprint.
+        """
+        return fingerprint is not None and self.is_running and fingerprint == self._fingerprint
+
+    def execute_task(self, task: BackgroundTask, fingerprint: Any = None) -> None:
+        """
+        Execute a background task on the shared thread pool.
 
         Args:
             task: The task to execute.
+            fingerprint: Optional identity of the task's input; an identical task
+                in flight on this worker, or still waiting in the scheduler's
+                queue, is reused instead of queueing another
         """
+        if self.is_duplicate(fingerprint):
+            logger.debug("Coalesced duplicate task into the one in flight")
+            return
         if self.is_running:
             logger.warning("Cannot execute task: worker is already running")
             return
 
         # Store the task
         self._task = task
+        self._fingerprint = fingerprint
+
+        scheduler = self._scheduler or TaskScheduler.instance()
+        self._handle = scheduler.submit(
+            task,
+            task_type=self._task_type,
+            fingerprint=fingerprint,
+            priority=self._priority,
+            connect=self._connect_handle,
+        )
+        BackgroundWorker._active_workers.add(self)
 
-        # Connect task signals
-        task.progress.connect(self.progress)
-
-        # Start the thread
-        self._thread.start()
+    def _connect_handle(self, handle: TaskHandle) -> None:
+        """Relay the signals of a task's handle before the task starts."""
+        handle.started.connect(self.started)
+        handle.progress.connect(self.progress)
+        handle.finished.connect(self._on_task_finished)
+        handle.error.connect(self._on_task_error)
+        handle.cancelled.connect(self._on_task_cancelled)
 
     def cancel(self) -> None:
         """
-        Cancel the current task if one is running.
+        Cancel the current task if one is queued or running.
         """
         if not self.is_running or self._task is None:
             logger.warning("Cannot cancel: no task running")
             return
 
-        # Cancel the task
-        self._task.cancel()
+        # Cancel the task through its handle
+        self._handle.cancel()
 
         # Emit cancelled signal
         self.cancelled.emit()
 
-        # Quit the thread (non-blocking)
-        self._thread.quit()
-
     def stop(self) -> None:
         """
         Stop the current task if one is running.
@@ -589,126 +665,84 @@ class BackgroundWorker(QObject):
         This method exists for API compatibility; the actual starting is
         handled in execute_task() or run_task().
         """
-        # The thread is already started in execute_task or run_task,
+        # The task is already queued in execute_task or run_task,
         # so this method just exists to maintain API compatibility
         logger.debug("BackgroundWorker.start() called")
 
-    @Slot()
-    def _on_thread_started(self) -> None:
-        """Handle thread started event."""
-        if self._task is None:
-            logger.error("Thread started but no task is set")
-            self._thread.quit()
-            return
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the current task is done.
 
-        self._is_running = True
-        self.started.emit()
+        Args:
+            timeout_ms: Maximum time to wait, -1 to wait indefinitely
 
-        try:
-            # Execute the task
-            result = self._task.run()
-
-            # Check if thread is still running (might have been stopped during run)
-            if self._is_running:
-                # Emit signals for task completion
-                task_id = getattr(self._task, "task_id", "unknown")
-                logger.debug(f"Task completed: {task_id}")
-                self.finished.emit(result)
-                self.task_completed.emit(task_id, result)
-        except Exception as e:
-            logger.error(f"Error in background task: {e}")
-            traceback.print_exc()
-            self.error.emit(e)
-            # Also emit task_failed with the task ID if available
-            if hasattr(self._task, "task_id"):
-                self.task_failed.emit(self._task.task_id, e)
-            else:
-                self.task_failed.emit("unknown", e)
-        finally:
-            # Clean up thread
-            self._thread.quit()
+        Returns:
+            True if no task is in flight anymore.
+        """
+        if self._handle is None:
+            return True
+        return self._handle.wait(timeout_ms)
+
+    @Slot(object)
+    def _on_task_finished(self, result: Any) -> None:
+        """Relay the result of the completed task."""
+        task_id = getattr(self._task, "task_id", "unknown")
+        logger.debug(f"Task completed: {task_id}")
+        self._cleanup_task()
+        self.finished.emit(result)
+        self.task_completed.emit(task_id, result)
+
+    @Slot(Exception)
+    def _on_task_error(self, error: Exception) -> None:
+        """Relay the error of the failed task."""
+        task_id = getattr(self._task, "task_id", "unknown")
+        logger.error(f"Error in background task: {error}")
+        self._cleanup_task()
+        self.error.emit(error)
+        self.task_failed.emit(task_id, error)
 
     @Slot()
-    def _on_thread_finished(self) -> None:
-        """Handle thread finished event."""
-        self._is_running = False
+    def _on_task_cancelled(self) -> None:
+        """Forget the cancelled task; cancelled was emitted by cancel()."""
+        self._cleanup_task()
 
-        # Disconnect task signals
-        if self._task is not None:
+    def _cleanup_task(self) -> None:
+        """Disconnect the finished task and release the worker."""
+        if self._handle is not None:
             try:
-                self._task.progress.disconnect(self.progress)
-
-                # Check for and disconnect any other signals that might be connected
-                if hasattr(self._task, "status_signal") and isinstance(
-                    getattr(self._task, "status_signal", None), Signal
-                ):
-                    try:
-                        # Find and disconnect any connections
-                        receivers = getattr(self._task.status_signal, "_receivers", [])
-                        if receivers:
-                            logger.debug(
-                                f"Disconnecting status_signal signal with {len(receivers)} receivers"
-                            )
-                            self._task.status_signal.disconnect()
-                    except (TypeError, RuntimeError) as e:
-                        logger.debug(f"Error disconnecting status_signal signal: {e}")
-
+                self._handle.started.disconnect(self.started)
+                self._handle.progress.disconnect(self.progress)
             except (TypeError, RuntimeError) as e:
                 # Signal wasn't connected or Qt object deleted
                 logger.debug(f"Error disconnecting signals: {e}")
-
-        # Clear the task reference to allow garbage collection
         self._task = None
-
-        # Log completion
-        logger.debug("Thread finished and task cleanup completed")
+        self._fingerprint = None
+        BackgroundWorker._active_workers.discard(self)
+        logger.debug("Task cleanup completed")
 
     def __del__(self):
         """
-        Properly clean up resources when the worker is destroyed.
-        This handles Qt thread cleanup even if the application is shutting down.
+        Cancel a task still in flight when the worker is destroyed.
         """
         try:
-            # First try to cancel any running task
-            try:
-                if hasattr(self, "_task") and self._task:
-                    self._task.cancel()
-                    logger.debug(
-                        f"Cancelled task during BackgroundWorker cleanup: {self._task.__class__.__name__}"
-                    )
-            except (RuntimeError, AttributeError, ReferenceError) as e:
-                # Don't raise errors during cleanup - just log them
-                logger.debug(f"Error cancelling task during cleanup: {e}")
-                pass
-
-            # Check if thread exists and is running before trying to quit it
-            if hasattr(self, "_thread") and self._thread is not None:
-                try:
-                    if self._thread.isRunning():
-                        logger.debug("Quitting thread during BackgroundWorker cleanup")
-                        self._thread.quit()
-
-                        # Reduced wait time for faster app shutdown
-                        if not self._thread.wait(100):  # Wait 100ms instead of 500ms
-                            logger.debug("Thread did not respond to quit in time")
-                    else:
-                        logger.debug("Thread was not running during cleanup")
-                except (RuntimeError, AttributeError, ReferenceError) as e:
-                    # Handle the case where the C++ object is deleted
-                    if "C++ object" in str(e):
-                        logger.debug("Qt C++ object already deleted during thread cleanup")
-                    else:
-                        logger.debug(f"Error during thread cleanup: {e}")
-            else:
-                logger.debug("No thread to clean up")
-
-        except Exception as e:
-            # Catch all other exceptions during cleanup - we don't want to raise
-            # exceptions in __del__ as they can cause unpredictable behavior
-            logger.error(f"Error cleaning up BackgroundWorker: {e}")
-            # Don't raise the error - just log it
-
-    def run_task(self, func, *args, task_id=None, on_success=None, on_error=None, **kwargs):
+            handle = getattr(self, "_handle", None)
+            if handle is not None and not handle.is_done:
+                handle.token.cancel()
+                logger.debug("Cancelled task during BackgroundWorker cleanup")
+        except (RuntimeError, AttributeError, ReferenceError) as e:
+            # Don't raise errors during cleanup - just log them
+            logger.debug(f"Error cancelling task during cleanup: {e}")
+
+    def run_task(
+        self,
+        func,
+        *args,
+        task_id=None,
+        on_success=None,
+        on_error=None,
+        fingerprint=None,
+        **kwargs,
+    ):
         """
         Run a function as a background task.
 
@@ -720,11 +754,16 @@ class BackgroundWorker(QObject):
             task_id: Optional identifier for the task
             on_success: Optional callback to be called with the result
             on_error: Optional callback to be called with the error
+            fingerprint: Optional identity of the task's input, see execute_task()
             **kwargs: Keyword arguments for the function
 
         Returns:
-            The created FunctionTask
+            The created FunctionTask, or the task in flight if this one duplicates it
         """
+        if self.is_duplicate(fingerprint):
+            logger.debug("Coalesced duplicate function task into the one in flight")
+            return self._task
+
         # Create a task
         task = FunctionTask(func, args, kwargs, task_id)
 
@@ -741,6 +780,6 @@ class BackgroundWorker(QObject):
         self.error.connect(lambda error: self.task_failed.emit(task_id, error))
 
         # Execute the task
-        self.execute_task(task)
+        self.execute_task(task, fingerprint=fingerprint)
 
         return task
@@ -96,7 +96,10 @@ class ConfigManager:
     def _init_defaults(self) -> None:
         """Initialize default configuration settings."""
         # Logging defaults
-        self.set("Logging", "level", "DEBUG")  # Changed from INFO to DEBUG
+        self.set("Logging", "level", "INFO")
+        self.set("Logging", "max_bytes", str(5 * 1024 * 1024))
+        self.set("Logging", "backup_count", "3")
+        self.set("Logging", "queue_size", "10000")
 
         # Autosave defaults
         self.set("Autosave", "enabled", "True")
@@ -120,11 +123,31 @@ class ConfigManager:
         # Validation defaults
         self.set("Validation", "case_sensitive", "False")
         self.set("Validation", "validate_on_import", "True")
+        self.set("Validation", "flush_delay_ms", "1000")
+        self.set("Validation", "append_log", "True")
+        self.set("Validation", "incremental", "True")
 
         # Auto-correction defaults
         self.set("Correction", "auto_correct_on_validation", "False")
         self.set("Correction", "auto_correct_on_import", "False")
 
+        # Background task defaults (0 uses the ideal thread count)
+        self.set("Performance", "max_worker_threads", "0")
+        # Worker processes for large corrections and validations
+        # (0 uses the CPU count, 1 disables them)
+        self.set("Performance", "worker_processes", "0")
+        self.set("Performance", "parallel_min_rows", "200000")
+
+        # Undo/redo journal defaults
+        self.set("Journal", "max_memory_mb", "16")
+        self.set("Journal", "max_transactions", "100")
+
+        # Diagnostics defaults
+        self.set("Debug", "signal_sampling", "True")
+        self.set("Debug", "signal_sample_rate", "10")
+        self.set("Debug", "signal_digest_interval", "300")
+        self.set("Debug", "hot_path_logging", "False")
+
         # UI defaults
         self.set("UI", "window_width", "1024")
         self.set("UI", "window_height", "768")
@@ -485,7 +508,7 @@ class ConfigManager:
             },
             "Validation": {"case_sensitive": "False", "validate_on_import": "True"},
             "UI": {"window_width": "1024", "window_height": "768", "table_page_size": "100"},
-            "Logging": {"level": "DEBUG"},
+            "Logging": {"level": "INFO"},
             "Import": {"normalize_text": "True", "robust_mode": "True", "chunk_size": "100"},
             "Autosave": {"enabled": "True", "interval_minutes": "5"},
             "Preferences": {"font_size": "10", "date_format": "%Y-%m-%d"},
@@ -97,6 +97,12 @@ class ConfigManager:
                 "window_height": "768",
                 "table_page_size": "100",
             },
+            "Storage": {
+                # Single CSV files above this size are imported to an out-of-core
+                # dataset when DuckDB is installed; 0 disables it
+                "out_of_core_threshold_mb": "512",
+                "dataset_dir": str(self._config_dir / "datasets"),
+            },
         }
 
         # Initialize the configuration parser
@@ -165,6 +171,12 @@ class ConfigManager:
             self.set("Correction", "auto_correct_on_import", "False")
             logger.info("Added new config option: auto_correct_on_import")
 
+        # Add out-of-core storage settings if they don't exist
+        for option, value in self._default_config["Storage"].items():
+            if not self._config.has_option("Storage", option):
+                self.set("Storage", option, value)
+                logger.info(f"Added new config option: {option}")
+
         # Check if we need to migrate from older versions
         current_version = self.get("General", "version")
         if current_version == "1.0":
@@ -0,0 +1,241 @@
+"""
+log_pipeline.py
+
+Description: Asynchronous logging through a bounded queue and a toggleable hot-path debug channel.
+Usage:
+    from chestbuddy.utils.log_pipeline import configure_logging, hot_path, shutdown_logging
+
+    configure_logging("chestbuddy.log", level="INFO")
+
+    # In code that runs per cell or per signal
+    if hot_path.enabled:
+        hot_path.debug(logger, "Cell (%d, %d) changed", row, col)
+
+    shutdown_logging()
+"""
+
+import logging
+import logging.handlers
+import queue
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+CONSOLE_FORMAT = "%(levelname)s: %(message)s"
+
+# Seconds a warning or error waits for room in a full queue before it is dropped
+_BLOCKING_PUT_TIMEOUT = 0.5
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller on routine records.
+
+    When the queue is full, records below WARNING are dropped and counted;
+    warnings and errors wait briefly for the writer thread to catch up.
+
+    Attributes:
+        dropped (int): Number of records dropped because the queue was full
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue drained by the writer thread
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Pass the record on unformatted.
+
+        The writer thread lives in this process, so the record does not need
+        to be pickled and its message is formatted by the writer instead of
+        the caller.
+
+        Args:
+            record: The record to enqueue
+
+        Returns:
+            logging.LogRecord: The same record
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue.
+
+        Args:
+            record: The prepared record
+        """
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=_BLOCKING_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class HotPathChannel:
+    """
+    Switch for diagnostics emitted from per-cell and per-signal code paths.
+
+    Hot paths check the plain ``enabled`` attribute before building any message,
+    so a disabled channel costs one attribute lookup. Messages use %-style
+    arguments and are only formatted if the logger accepts DEBUG records.
+
+    Attributes:
+        enabled (bool): Whether hot-path diagnostics are logged
+
+    Implementation Notes:
+        - The flag is toggled at runtime from the settings tab
+        - Formatting happens on the writer thread, not in the caller
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the channel.
+
+        Args:
+            enabled: Whether hot-path diagnostics are logged initially
+        """
+        self.enabled = enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable hot-path diagnostics.
+
+        Args:
+            enabled: Whether hot-path diagnostics are logged
+        """
+        self.enabled = bool(enabled)
+        logger.info(f"Hot-path debug logging {'enabled' if self.enabled else 'disabled'}")
+
+    def debug(self, target: logging.Logger, msg: str, *args) -> None:
+        """
+        Log a hot-path message at DEBUG level if the channel is enabled.
+
+        Args:
+            target: Logger of the calling module
+            msg: %-style message
+            *args: Message arguments, formatted lazily
+        """
+        if self.enabled and target.isEnabledFor(logging.DEBUG):
+            target.debug(msg, *args, stacklevel=2)
+
+
+# Global channel for hot-path diagnostics
+hot_path = HotPathChannel()
+
+_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[BoundedQueueHandler] = None
+
+
+def _parse_level(level: Union[int, str]) -> int:
+    """Convert a level name or number to a logging level, defaulting to INFO."""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).strip().upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def configure_logging(
+    log_file: Union[str, Path],
+    level: Union[int, str] = logging.DEBUG,
+    console_level: Union[int, str] = logging.INFO,
+    max_bytes: int = 5 * 1024 * 1024,
+    backup_count: int = 3,
+    queue_size: int = 10000,
+) -> logging.handlers.QueueListener:
+    """
+    Route the root logger through a bounded queue to a background writer.
+
+    Any pipeline configured before is shut down first.
+
+    Args:
+        log_file: Path of the rotating log file
+        level: Root logger level
+        console_level: Minimum level written to the console
+        max_bytes: Size at which the log file is rotated, 0 to never rotate
+        backup_count: Number of rotated files to keep
+        queue_size: Maximum number of records waiting for the writer
+
+    Returns:
+        logging.handlers.QueueListener: The started writer
+    """
+    global _listener, _queue_handler
+
+    shutdown_logging()
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(_parse_level(console_level))
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+    queue_handler = BoundedQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+
+    with _lock:
+        root_logger = logging.getLogger()
+        root_logger.setLevel(_parse_level(level))
+        root_logger.addHandler(queue_handler)
+        _queue_handler = queue_handler
+        _listener = listener
+        listener.start()
+    return listener
+
+
+def set_log_level(level: Union[int, str]) -> None:
+    """
+    Change the root logger level at runtime.
+
+    Args:
+        level: Level name such as "INFO" or a logging level number
+    """
+    logging.getLogger().setLevel(_parse_level(level))
+    logger.info(f"Log level set to {logging.getLevelName(logging.getLogger().level)}")
+
+
+def dropped_records() -> int:
+    """
+    Get the number of records dropped because the queue was full.
+
+    Returns:
+        int: Dropped records since logging was configured
+    """
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """Write all queued records, stop the writer and close its handlers."""
+    global _listener, _queue_handler
+
+    with _lock:
+        listener, queue_handler = _listener, _queue_handler
+        _listener = None
+        _queue_handler = None
+    if queue_handler is not None:
+        logging.getLogger().removeHandler(queue_handler)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        if queue_handler is not None and queue_handler.dropped:
+            logger.warning(f"{queue_handler.dropped} log records were dropped")
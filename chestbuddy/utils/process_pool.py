@@ -0,0 +1,405 @@
+"""
+process_pool.py
+
+Description: Shared process pool for row-block work over frames held in shared memory.
+Usage:
+    from chestbuddy.utils.process_pool import ProcessPool, SharedFrame
+
+    pool = ProcessPool.instance()
+    if pool.should_parallelize(len(data)):
+        with SharedFrame(data, ["PLAYER", "CHEST"]) as frame:
+            results = pool.map_blocks(
+                check_block,  # Module-level function taking a BlockContext
+                frame,
+                payload=rule_tables,
+                progress_callback=lambda done, total: print(f"{done}/{total}"),
+                cancel_check=lambda: token.is_cancelled,
+            )
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Frames smaller than this are processed in the calling thread
+DEFAULT_MIN_ROWS = 200_000
+
+# Rows handed to a worker per task
+DEFAULT_BLOCK_ROWS = 50_000
+
+
+class SharedFrame:
+    """
+    Columns of a frame encoded as integer codes in one shared memory block.
+
+    Each column is factorized in the parent process. The row-aligned codes are
+    written to shared memory, where worker processes map them without copying,
+    and the distinct values travel to each worker once with the job payload.
+
+    Attributes:
+        columns (List[str]): Encoded column names
+        uniques (Dict[str, np.ndarray]): Distinct values of each column, indexed by code
+        row_count (int): Number of rows
+
+    Implementation Notes:
+        - Codes are int32 in column-major order, so a row block of one column is contiguous
+        - Missing values are encoded as -1
+        - The block is unlinked on close(); workers that still map it keep their view
+    """
+
+    def __init__(self, data: pd.DataFrame, columns: Sequence[str]):
+        """
+        Encode columns of a frame into shared memory.
+
+        Args:
+            data: The frame to share
+            columns: Names of the columns to encode
+        """
+        self.columns = list(columns)
+        self.row_count = len(data)
+        self.uniques: Dict[str, np.ndarray] = {}
+        size = max(1, self.row_count * len(self.columns) * np.dtype(np.int32).itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        codes = self.codes()
+        for index, column in enumerate(self.columns):
+            column_codes, uniques = pd.factorize(data[column], use_na_sentinel=True)
+            codes[index] = column_codes
+            self.uniques[column] = np.asarray(uniques, dtype=object)
+        # Drop the buffer export so the block can be closed
+        del codes
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the code array as (columns, rows)."""
+        return (len(self.columns), self.row_count)
+
+    def codes(self) -> np.ndarray:
+        """
+        Get the code array backed by the shared block.
+
+        Returns:
+            np.ndarray: int32 codes with one row per column
+        """
+        return np.ndarray(self.shape, dtype=np.int32, buffer=self._shm.buf)
+
+    def close(self) -> None:
+        """Release and unlink the shared memory block."""
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except (BufferError, FileNotFoundError) as e:
+            logger.debug(f"Error releasing shared frame: {e}")
+        self._shm = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BlockContext:
+    """
+    View of one row block handed to a block function in a worker process.
+
+    Attributes:
+        payload (Any): Job payload, unpickled once per worker
+        columns (List[str]): Encoded column names
+        uniques (Dict[str, np.ndarray]): Distinct values of each column, indexed by code
+        start (int): First row of the block
+        stop (int): Row after the last row of the block
+        cache (Dict[str, Any]): Scratch space shared by all blocks of a job in this worker
+    """
+
+    def __init__(self, job: Dict[str, Any], start: int, stop: int):
+        """
+        Initialize the context.
+
+        Args:
+            job: The worker's state for the current job
+            start: First row of the block
+            stop: Row after the last row of the block
+        """
+        self.payload = job["payload"]
+        self.columns = job["columns"]
+        self.uniques = job["uniques"]
+        self.start = start
+        self.stop = stop
+        self.cache = job["cache"]
+        self._codes = job["codes"]
+
+    def codes(self, column: str) -> np.ndarray:
+        """
+        Get the codes of a column within the block.
+
+        Args:
+            column: Column name
+
+        Returns:
+            np.ndarray: Read-only int32 codes, -1 for missing values
+        """
+        return self._codes[self.columns.index(column), self.start : self.stop]
+
+    def values(self, column: str) -> np.ndarray:
+        """
+        Decode a column within the block.
+
+        Args:
+            column: Column name
+
+        Returns:
+            np.ndarray: Object array with NaN for missing values
+        """
+        table = np.append(self.uniques[column], np.nan)
+        return table.take(self.codes(column))
+
+
+# State of the job the current worker process last ran a block of
+_worker_job: Optional[Dict[str, Any]] = None
+
+
+def _attach_job(job_name: str, frame_name: str, shape: tuple) -> Dict[str, Any]:
+    """Load a job's payload and map its frame, once per job and worker."""
+    global _worker_job
+    if _worker_job is not None and _worker_job["name"] == job_name:
+        return _worker_job
+
+    if _worker_job is not None:
+        _worker_job["codes"] = None
+        _worker_job["frame"].close()
+        _worker_job = None
+
+    header = shared_memory.SharedMemory(name=job_name)
+    try:
+        columns, uniques, payload = pickle.loads(header.buf)
+    finally:
+        header.close()
+    frame = shared_memory.SharedMemory(name=frame_name)
+    codes = np.ndarray(shape, dtype=np.int32, buffer=frame.buf)
+    codes.flags.writeable = False
+    _worker_job = {
+        "name": job_name,
+        "frame": frame,
+        "codes": codes,
+        "columns": columns,
+        "uniques": uniques,
+        "payload": payload,
+        "cache": {},
+    }
+    return _worker_job
+
+
+def _run_block(
+    func: Callable[[BlockContext], Any],
+    job_name: str,
+    frame_name: str,
+    shape: tuple,
+    start: int,
+    stop: int,
+) -> Any:
+    """Worker entry point: run a block function over rows start:stop."""
+    job = _attach_job(job_name, frame_name, shape)
+    return func(BlockContext(job, start, stop))
+
+
+class ProcessPool:
+    """
+    Shared pool of worker processes for CPU-bound work on large frames.
+
+    Work is split into row blocks of a SharedFrame. The job payload (e.g.
+    compiled rule tables) is pickled once into shared memory and loaded once
+    per worker; each task only names its block. Results come back in block
+    order.
+
+    Attributes:
+        workers (int): Number of worker processes
+        min_rows (int): Smallest frame worth distributing
+        block_rows (int): Rows per task
+
+    Implementation Notes:
+        - Workers are spawned, not forked, so Qt threads in the parent are not copied
+        - Workers start on first use and are kept for later jobs
+        - At most two blocks per worker are queued, so cancellation takes effect quickly
+        - A pool with a single worker never parallelizes
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "ProcessPool":
+        """Get or create the shared pool, sized from the Performance settings."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                workers = 0
+                min_rows = DEFAULT_MIN_ROWS
+                try:
+                    from chestbuddy.utils.config import ConfigManager
+
+                    config = ConfigManager()
+                    workers = config.get_int("Performance", "worker_processes", 0)
+                    min_rows = config.get_int("Performance", "parallel_min_rows", DEFAULT_MIN_ROWS)
+                except Exception as e:
+                    logger.debug(f"Using default process pool settings: {e}")
+                cls._instance = ProcessPool(workers, min_rows=min_rows)
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Stop the shared pool's workers if the pool was created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance = None
+
+    def __init__(
+        self,
+        workers: int = 0,
+        min_rows: int = DEFAULT_MIN_ROWS,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ):
+        """
+        Initialize the pool without starting any process.
+
+        Args:
+            workers: Number of worker processes; 0 uses the CPU count
+            min_rows: Smallest frame worth distributing
+            block_rows: Rows per task
+        """
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.min_rows = min_rows
+        self.block_rows = max(1, block_rows)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def set_workers(self, workers: int) -> None:
+        """
+        Change the number of worker processes.
+
+        Running workers are stopped; the next job starts the new number.
+
+        Args:
+            workers: Number of worker processes; 0 uses the CPU count
+        """
+        workers = workers if workers > 0 else (os.cpu_count() or 1)
+        if workers != self.workers:
+            self.shutdown()
+            self.workers = workers
+            logger.info(f"Process pool resized to {workers} workers")
+
+    def should_parallelize(self, row_count: int) -> bool:
+        """
+        Check whether a frame is worth distributing over the pool.
+
+        Args:
+            row_count: Number of rows to process
+
+        Returns:
+            bool: True if there are several workers and enough rows
+        """
+        return self.workers > 1 and row_count >= self.min_rows
+
+    def map_blocks(
+        self,
+        func: Callable[[BlockContext], Any],
+        frame: SharedFrame,
+        payload: Any = None,
+        progress_callback: Optional[Callable[[int, int], Any]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Run a block function over every row block of a shared frame.
+
+        Args:
+            func: Module-level function called with a BlockContext in the worker
+            frame: The shared frame to process
+            payload: Picklable data every block needs, shipped once per worker
+            progress_callback: Called with (finished blocks, total blocks)
+            cancel_check: Returns True to stop; queued blocks are dropped
+
+        Returns:
+            Optional[List[Any]]: Block results in row order, or None if cancelled
+        """
+        blocks = [
+            (start, min(start + self.block_rows, frame.row_count))
+            for start in range(0, frame.row_count, self.block_rows)
+        ]
+        if not blocks:
+            return []
+
+        header = pickle.dumps(
+            (frame.columns, frame.uniques, payload), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        job = shared_memory.SharedMemory(create=True, size=len(header))
+        job.buf[: len(header)] = header
+        pending: Dict[Future, int] = {}
+        try:
+            executor = self._get_executor()
+            results: List[Any] = [None] * len(blocks)
+            next_block = 0
+            finished_blocks = 0
+            while next_block < len(blocks) or pending:
+                if cancel_check is not None and cancel_check():
+                    logger.info(f"Block job cancelled after {finished_blocks}/{len(blocks)} blocks")
+                    return None
+                while next_block < len(blocks) and len(pending) < self.workers * 2:
+                    start, stop = blocks[next_block]
+                    future = executor.submit(
+                        _run_block, func, job.name, frame.name, frame.shape, start, stop
+                    )
+                    pending[future] = next_block
+                    next_block += 1
+
+                done, _ = wait(list(pending), timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+                    finished_blocks += 1
+                    if progress_callback is not None:
+                        progress_callback(finished_blocks, len(blocks))
+            return results
+        except BrokenProcessPool:
+            logger.error("A worker process died; restarting the pool on next use")
+            with self._lock:
+                self._executor = None
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+            job.close()
+            job.unlink()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; queued blocks are dropped."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.debug("Process pool shut down")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started process pool with {self.workers} workers")
+            return self._executor
@@ -5,15 +5,18 @@ This module provides tools to trace Qt signal emissions, record signal paths,
 measure timing, and visualize signal flow paths.
 
 NOTE: This is a debugging utility and should not be used in production code.
-      It is intended for development and testing purposes only.
+      It is intended for development and testing purposes only. The exception
+      is sampling mode (start_sampling), which keeps constant-size statistics
+      and is cheap enough to leave enabled in user sessions.
 """
 
+import bisect
 import inspect
 import logging
 import time
 import uuid
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 from datetime import datetime
 from io import StringIO
@@ -23,13 +26,6 @@ from PySide6.QtCore import QObject, Signal
 # Set up logger
 logger = logging.getLogger(__name__)
 
-# Issue debug utility warning
-warnings.warn(
-    "signal_tracer is a debugging utility and should not be used in production code.",
-    UserWarning,
-    stacklevel=2,
-)
-
 # Store the original emit function to restore it later
 _original_signal_emit = None
 
@@ -115,6 +111,81 @@ class SignalEmission:
         return f"{self.sender_class}.{self.signal_name} ({self.duration:.2f}ms)"
 
 
+class LatencyHistogram:
+    """
+    Constant-memory latency histogram with logarithmic buckets.
+
+    Percentiles are approximated by the upper bound of the bucket that contains
+    them, which keeps the relative error below the bucket growth factor (20%).
+
+    Attributes:
+        count: Number of recorded samples
+        total_ms: Sum of all recorded latencies in milliseconds
+        max_ms: Largest recorded latency in milliseconds
+    """
+
+    # Bucket upper bounds from 10us growing by 20% per bucket (~2 minutes at the top)
+    BUCKET_BOUNDS: List[float] = [0.01 * 1.2**i for i in range(90)]
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._buckets = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float):
+        """
+        Record a latency sample.
+
+        Args:
+            duration_ms: Latency in milliseconds
+        """
+        self._buckets[bisect.bisect_left(self.BUCKET_BOUNDS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, percent: float) -> float:
+        """
+        Approximate a latency percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in milliseconds (0.0 if no samples were recorded)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= len(self.BUCKET_BOUNDS):
+                    return self.max_ms
+                return min(self.BUCKET_BOUNDS[index], self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dict with count, mean, p50, p95 and max latencies in milliseconds
+        """
+        return {
+            "count": self.count,
+            "mean": self.total_ms / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max_ms,
+        }
+
+
 class SignalTracer:
     """
     A utility to trace Qt signal emissions throughout the application.
@@ -161,6 +232,15 @@ class SignalTracer:
         # Default threshold for all signals (ms)
         self._default_slow_threshold = 50.0
 
+        # Sampling mode state
+        self._sampling = False
+        self._sample_rate = 1
+        self._emission_counter = 0
+        self._samples: deque = deque(maxlen=1000)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._digest_interval = 300.0
+        self._next_digest_time = 0.0
+
     def is_active(self) -> bool:
         """Check if the tracer is currently active."""
         return self._active
@@ -226,6 +306,13 @@ class SignalTracer:
             logger.warning("Signal tracing is already active")
             return
 
+        # Full tracing is a debugging aid; sampling mode is meant for production
+        warnings.warn(
+            "signal_tracer is a debugging utility and should not be used in production code.",
+            UserWarning,
+            stacklevel=2,
+        )
+
         # Mock implementation for testing
         # In real use, we would monkey patch QtCore.Signal.emit
         self._original_emit_method = getattr(Signal, "__call__", None)
@@ -253,6 +340,147 @@ class SignalTracer:
         self._original_emit_method = None
         logger.debug("Signal tracing stopped (mock implementation)")
 
+    def start_sampling(
+        self,
+        sample_rate: int = 10,
+        buffer_size: int = 1000,
+        digest_interval: float = 300.0,
+    ):
+        """
+        Begin sampling emission latencies.
+
+        Unlike start_tracing, sampling only times 1 in sample_rate emissions made
+        through emit() and keeps constant-size statistics, so it can stay enabled
+        during normal use.
+
+        Args:
+            sample_rate: Time one in this many emissions (1 times every emission)
+            buffer_size: Number of recent samples kept in the ring buffer
+            digest_interval: Seconds between latency digests written to the log
+                             (0 disables the periodic digest)
+        """
+        if sample_rate < 1:
+            raise ValueError(f"sample_rate must be at least 1, got {sample_rate}")
+
+        self._sample_rate = sample_rate
+        self._samples = deque(maxlen=buffer_size)
+        self._histograms = {}
+        self._emission_counter = 0
+        self._digest_interval = digest_interval
+        self._next_digest_time = time.monotonic() + digest_interval
+        self._sampling = True
+        logger.info(
+            f"Signal sampling started (1 in {sample_rate} emissions, "
+            f"digest every {digest_interval:.0f}s)"
+        )
+
+    def stop_sampling(self):
+        """Stop sampling emission latencies. Collected statistics are kept."""
+        self._sampling = False
+        logger.info("Signal sampling stopped")
+
+    def is_sampling(self) -> bool:
+        """Check if sampling mode is currently active."""
+        return self._sampling
+
+    def emit(self, sender: QObject, signal_name: str, *args: Any):
+        """
+        Emit a signal, timing the emission if it is selected for sampling.
+
+        With direct connections the emission returns after all connected slots
+        have run, so the measured time is the total handler latency.
+
+        Args:
+            sender: The object owning the signal
+            signal_name: The name of the signal
+            *args: Arguments to emit
+        """
+        signal = getattr(sender, signal_name)
+        if not self._sampling:
+            signal.emit(*args)
+            return
+
+        self._emission_counter += 1
+        if self._emission_counter % self._sample_rate:
+            signal.emit(*args)
+            return
+
+        start = time.perf_counter()
+        try:
+            signal.emit(*args)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000.0
+            self.record_sample(f"{sender.__class__.__name__}.{signal_name}", duration_ms)
+
+    def record_sample(self, signal_key: str, duration_ms: float):
+        """
+        Record a sampled emission latency.
+
+        Args:
+            signal_key: Signal identifier (format: "Class.signal_name")
+            duration_ms: Handler latency in milliseconds
+        """
+        now = time.monotonic()
+        self._samples.append((now, signal_key, duration_ms))
+
+        histogram = self._histograms.get(signal_key)
+        if histogram is None:
+            histogram = self._histograms[signal_key] = LatencyHistogram()
+        histogram.record(duration_ms)
+
+        if self._digest_interval > 0 and now >= self._next_digest_time:
+            self._next_digest_time = now + self._digest_interval
+            self.log_digest()
+
+    def get_recent_samples(self) -> List[Tuple[float, str, float]]:
+        """
+        Get the samples currently held in the ring buffer.
+
+        Returns:
+            List of (monotonic timestamp, signal key, duration in ms) tuples
+        """
+        return list(self._samples)
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get latency statistics for every sampled signal.
+
+        Returns:
+            Dict mapping signal keys to count/mean/p50/p95/max summaries
+        """
+        return {key: histogram.summary() for key, histogram in self._histograms.items()}
+
+    def format_digest(self, limit: int = 10) -> str:
+        """
+        Format the sampled latencies, slowest p95 first.
+
+        Args:
+            limit: Maximum number of signals to include
+
+        Returns:
+            The formatted digest
+        """
+        stats = sorted(
+            self.get_latency_stats().items(), key=lambda item: item[1]["p95"], reverse=True
+        )
+        lines = [f"Signal latency digest (1 in {self._sample_rate} emissions sampled):"]
+        for signal_key, summary in stats[:limit]:
+            lines.append(
+                f"  {signal_key}: n={summary['count']} p50={summary['p50']:.2f}ms "
+                f"p95={summary['p95']:.2f}ms max={summary['max']:.2f}ms"
+            )
+        return "\n".join(lines)
+
+    def log_digest(self, limit: int = 10):
+        """
+        Write the latency digest to the log.
+
+        Args:
+            limit: Maximum number of signals to include
+        """
+        if self._histograms:
+            logger.info(self.format_digest(limit))
+
     def _build_signal_paths(self) -> List[str]:
         """
         Build a formatted text representation of signal paths.
@@ -0,0 +1,326 @@
+"""
+span_tracer.py
+
+Description: Lightweight span tracing with Chrome trace export.
+Usage:
+    from chestbuddy.utils.span_tracer import span_tracer
+
+    span_tracer.enable()
+
+    with span_tracer.span("ValidationService.validate_data", "validation"):
+        ...
+
+    @span_tracer.trace("CSVService.read_csv", "io")
+    def read_csv(...):
+        ...
+
+    span_tracer.export_chrome_trace("trace.json")  # open in chrome://tracing or Perfetto
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar, Union
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Shared no-op context manager returned while tracing is disabled
+_NULL_SPAN = nullcontext()
+
+
+class SpanRecord:
+    """
+    A completed span.
+
+    Attributes:
+        name (str): Name of the traced operation
+        category (str): Category used to group spans in the trace viewer
+        start_ns (int): perf_counter_ns value at the start of the span
+        duration_ns (int): Duration of the span in nanoseconds
+        thread_id (int): Identifier of the thread that recorded the span
+        thread_name (str): Name of the thread that recorded the span
+        depth (int): Nesting depth within the recording thread
+        args (Dict[str, Any]): Extra values shown in the trace viewer
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "start_ns",
+        "duration_ns",
+        "thread_id",
+        "thread_name",
+        "depth",
+        "args",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        duration_ns: int,
+        thread_id: int,
+        thread_name: str,
+        depth: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the span record."""
+        self.name = name
+        self.category = category
+        self.start_ns = start_ns
+        self.duration_ns = duration_ns
+        self.thread_id = thread_id
+        self.thread_name = thread_name
+        self.depth = depth
+        self.args = args or {}
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the span in milliseconds."""
+        return self.duration_ns / 1_000_000
+
+    def __repr__(self) -> str:
+        """Return a string representation of the span."""
+        return f"SpanRecord({self.name!r}, {self.duration_ms:.2f}ms, thread={self.thread_name})"
+
+
+class _ActiveSpan:
+    """Context manager that records a span into a tracer when it exits."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start_ns", "_depth")
+
+    def __init__(
+        self, tracer: "SpanTracer", name: str, category: str, args: Dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self) -> "_ActiveSpan":
+        local = self._tracer._local
+        self._depth = getattr(local, "depth", 0)
+        local.depth = self._depth + 1
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        end_ns = time.perf_counter_ns()
+        self._tracer._local.depth = self._depth
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        thread = threading.current_thread()
+        self._tracer._record(
+            SpanRecord(
+                self._name,
+                self._category,
+                self._start_ns,
+                end_ns - self._start_ns,
+                threading.get_ident(),
+                thread.name,
+                self._depth,
+                self._args,
+            )
+        )
+        return False
+
+
+class SpanTracer:
+    """
+    Records nested timing spans from any thread into a bounded ring buffer.
+
+    Complements SignalTracer, which only covers signal emissions, by timing the
+    work done inside services, managers and models. Recorded spans can be
+    exported in the Chrome trace event format for chrome://tracing or Perfetto.
+
+    Attributes:
+        _enabled (bool): Whether spans are currently recorded
+        _spans (Deque[SpanRecord]): Ring buffer of completed spans
+        _local (threading.local): Per-thread nesting depth
+        _origin_ns (int): perf_counter_ns value trace timestamps are relative to
+
+    Implementation Notes:
+        - While disabled, span() returns a shared no-op context manager and traced
+          functions are called directly, so instrumentation costs one attribute check
+        - deque.append is atomic, so recording needs no lock
+        - The oldest spans are dropped once the buffer is full
+    """
+
+    DEFAULT_CAPACITY = 100_000
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initialize the tracer (disabled).
+
+        Args:
+            capacity: Maximum number of spans kept in the ring buffer
+        """
+        self._enabled = False
+        self._spans: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are currently being recorded."""
+        return self._enabled
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of spans kept in the ring buffer."""
+        return self._spans.maxlen
+
+    def enable(self, capacity: Optional[int] = None) -> None:
+        """
+        Start recording spans.
+
+        Args:
+            capacity: Optional new ring buffer size (existing spans are kept)
+        """
+        if capacity is not None and capacity != self._spans.maxlen:
+            self._spans = deque(self._spans, maxlen=capacity)
+        self._enabled = True
+        logger.info(f"Span tracing enabled (capacity {self._spans.maxlen} spans)")
+
+    def disable(self) -> None:
+        """Stop recording spans. Recorded spans are kept until cleared."""
+        self._enabled = False
+        logger.info("Span tracing disabled")
+
+    def clear(self) -> None:
+        """Remove all recorded spans."""
+        self._spans.clear()
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "app", **args: Any):
+        """
+        Create a context manager that times the enclosed block.
+
+        Args:
+            name: Name of the traced operation
+            category: Category used to group spans in the trace viewer
+            **args: Extra values shown with the span in the trace viewer
+
+        Returns:
+            A context manager recording the span (a no-op while disabled)
+        """
+        if not self._enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, category, args)
+
+    def trace(self, name: Optional[str] = None, category: str = "app") -> Callable[[F], F]:
+        """
+        Decorate a function so each call is recorded as a span.
+
+        Args:
+            name: Span name. Defaults to the function's qualified name.
+            category: Category used to group spans in the trace viewer
+
+        Returns:
+            The decorator
+        """
+
+        def decorator(func: F) -> F:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self._enabled:
+                    return func(*args, **kwargs)
+                with _ActiveSpan(self, span_name, category, {}):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def _record(self, span: SpanRecord) -> None:
+        """Append a completed span to the ring buffer."""
+        self._spans.append(span)
+
+    def get_spans(self) -> List[SpanRecord]:
+        """
+        Get a snapshot of the recorded spans.
+
+        Returns:
+            List[SpanRecord]: Spans in completion order
+        """
+        return list(self._spans)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the recorded spans to the Chrome trace event format.
+
+        Returns:
+            Dict[str, Any]: A JSON-serializable trace object
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        thread_names: Dict[int, str] = {}
+
+        for span in self.get_spans():
+            thread_names[span.thread_id] = span.thread_name
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start_ns - self._origin_ns) / 1000.0,
+                    "dur": span.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {key: _json_safe(value) for key, value in span.args.items()},
+                }
+            )
+
+        for thread_id, thread_name in thread_names.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path: Union[str, Path]) -> Path:
+        """
+        Write the recorded spans as a Chrome trace JSON file.
+
+        Args:
+            file_path: Destination path
+
+        Returns:
+            Path: The written file
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        trace = self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        logger.info(f"Exported {len(self._spans)} spans to {path}")
+        return path
+
+
+def _json_safe(value: Any) -> Any:
+    """Return value if it is JSON serializable, otherwise its string form."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# Global instance used for application-wide tracing
+span_tracer = SpanTracer()
@@ -0,0 +1,167 @@
+"""
+startup_profiler.py
+
+Description: Lightweight phase timer for measuring application startup.
+Usage:
+    from chestbuddy.utils.startup_profiler import startup_profiler
+
+    with startup_profiler.phase("services"):
+        create_services()
+
+    startup_profiler.mark("first_window_shown")
+    startup_profiler.log_timeline()
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """
+    Records per-phase timings during application startup.
+
+    Phases are recorded in the order they complete, similar to the output of
+    ``python -X importtime``, so the resulting timeline shows where cold-start
+    time is spent (imports, services, controllers, UI construction, ...).
+
+    Attributes:
+        _origin (float): perf_counter value all offsets are measured from
+        _phases (List[Tuple[str, float, float, int]]): (name, start ms, duration ms, depth)
+        _marks (Dict[str, float]): Named points in time as offsets in ms
+        _depth (int): Current nesting depth of active phases
+    """
+
+    def __init__(self, origin: Optional[float] = None) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            origin: Optional perf_counter value to measure from. Defaults to now.
+        """
+        self._origin = origin if origin is not None else time.perf_counter()
+        self._phases: List[Tuple[str, float, float, int]] = []
+        self._marks: Dict[str, float] = {}
+        self._depth = 0
+
+    def reset(self, origin: Optional[float] = None) -> None:
+        """
+        Clear all recorded phases and marks and restart the clock.
+
+        Args:
+            origin: Optional perf_counter value to measure from. Defaults to now.
+        """
+        self._origin = origin if origin is not None else time.perf_counter()
+        self._phases.clear()
+        self._marks.clear()
+        self._depth = 0
+
+    def _offset_ms(self, timestamp: Optional[float] = None) -> float:
+        """Return milliseconds elapsed between the origin and the given timestamp."""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        return (timestamp - self._origin) * 1000.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a named startup phase.
+
+        Phases may be nested; nesting is preserved in the logged timeline.
+
+        Args:
+            name: The name of the phase
+        """
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.record(name, start, time.perf_counter(), depth)
+
+    def record(self, name: str, start: float, end: float, depth: int = 0) -> None:
+        """
+        Record a phase measured externally with perf_counter values.
+
+        Args:
+            name: The name of the phase
+            start: perf_counter value at the start of the phase
+            end: perf_counter value at the end of the phase
+            depth: Nesting depth used when formatting the timeline
+        """
+        self._phases.append((name, self._offset_ms(start), (end - start) * 1000.0, depth))
+
+    def mark(self, name: str) -> float:
+        """
+        Record a named point in time.
+
+        Args:
+            name: The name of the mark
+
+        Returns:
+            float: Milliseconds elapsed since the origin
+        """
+        offset = self._offset_ms()
+        self._marks[name] = offset
+        return offset
+
+    def get_mark(self, name: str) -> Optional[float]:
+        """
+        Get the offset of a previously recorded mark.
+
+        Args:
+            name: The name of the mark
+
+        Returns:
+            Optional[float]: Milliseconds since the origin, or None if not recorded
+        """
+        return self._marks.get(name)
+
+    def get_phase_durations(self) -> Dict[str, float]:
+        """
+        Get the duration of each recorded phase.
+
+        Returns:
+            Dict[str, float]: Mapping of phase name to duration in milliseconds
+        """
+        return {name: duration for name, _start, duration, _depth in self._phases}
+
+    def format_timeline(self) -> str:
+        """
+        Format the recorded phases and marks as a human readable timeline.
+
+        Returns:
+            str: One line per phase/mark, ordered by start time
+        """
+        entries = [
+            (start, f"{start:9.1f} ms | {duration:9.1f} ms | {'  ' * depth}{name}")
+            for name, start, duration, depth in self._phases
+        ]
+        entries.extend(
+            (offset, f"{offset:9.1f} ms | {'mark':>12} | {name}")
+            for name, offset in self._marks.items()
+        )
+        entries.sort(key=lambda entry: entry[0])
+
+        lines = ["   offset    |   duration   | phase"]
+        lines.extend(line for _offset, line in entries)
+        return "\n".join(lines)
+
+    def log_timeline(self, log: Optional[logging.Logger] = None) -> None:
+        """
+        Write the startup timeline to the log at INFO level.
+
+        Args:
+            log: Logger to write to. Defaults to this module's logger.
+        """
+        (log or logger).info("Startup timeline:\n%s", self.format_timeline())
+
+
+# Global instance used by the application entry point
+startup_profiler = StartupProfiler()
@@ -0,0 +1,458 @@
+"""
+task_scheduler.py
+
+Description: Shared prioritized scheduler for background tasks on a bounded thread pool.
+Usage:
+    from chestbuddy.utils.task_scheduler import TaskPriority, TaskScheduler
+
+    scheduler = TaskScheduler.instance()
+    handle = scheduler.submit(
+        task,
+        task_type="validation",
+        fingerprint=data_state.data_hash,
+        priority=TaskPriority.INTERACTIVE,
+    )
+    handle.finished.connect(on_result)
+    handle.cancel()
+
+    scheduler.metrics()  # Queue depth, running tasks and durations per task type
+"""
+
+import logging
+import threading
+import time
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPriority(IntEnum):
+    """Scheduling priority; higher values start first."""
+
+    BACKGROUND = 0
+    NORMAL = 50
+    INTERACTIVE = 100
+
+
+class TaskState(Enum):
+    """Lifecycle state of a scheduled task."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag shared between a task and its submitter.
+
+    Implementation Notes:
+        - Long running tasks check is_cancelled between units of work
+        - Callbacks registered with on_cancel() run once, in the cancelling thread
+    """
+
+    def __init__(self):
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation and run the registered callbacks."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Error in cancellation callback: {e}")
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback for cancellation.
+
+        Args:
+            callback: Called when the token is cancelled, immediately if it already is
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class TaskHandle(QObject):
+    """
+    Handle of a submitted task, used to observe and cancel it.
+
+    Signals are emitted from the pool thread; receivers living in the main
+    thread get them through queued connections.
+
+    Attributes:
+        task_id (str): Identifier of the task
+        task_type (str): Type used for deduplication and metrics
+        key (Optional[Tuple[str, Hashable]]): Deduplication key, None if not deduplicated
+        priority (int): Scheduling priority
+        token (CancellationToken): Cancellation token shared with the task
+        state (TaskState): Current lifecycle state
+        result (Any): Result of a finished task
+        exception (Optional[Exception]): Error of a failed task
+    """
+
+    started = Signal()
+    progress = Signal(int, int)  # current, total
+    finished = Signal(object)  # result
+    error = Signal(Exception)
+    cancelled = Signal()
+
+    def __init__(
+        self,
+        scheduler: "TaskScheduler",
+        task: Any,
+        task_type: str,
+        key: Optional[Tuple[str, Hashable]],
+        priority: int,
+    ):
+        """
+        Initialize the handle.
+
+        Args:
+            scheduler: The scheduler running the task
+            task: A BackgroundTask or a callable taking no arguments
+            task_type: Type used for deduplication and metrics
+            key: Deduplication key, None if not deduplicated
+            priority: Scheduling priority
+        """
+        super().__init__()
+        self._scheduler = scheduler
+        self.task = task
+        self.task_id = str(getattr(task, "task_id", id(task)))
+        self.task_type = task_type
+        self.key = key
+        self.priority = int(priority)
+        self.token = CancellationToken()
+        self.state = TaskState.PENDING
+        self.result = None
+        self.exception: Optional[Exception] = None
+        self.submitted_at = time.perf_counter()
+        self._done = threading.Event()
+
+        if hasattr(task, "cancel"):
+            self.token.on_cancel(task.cancel)
+        if hasattr(task, "progress"):
+            task.progress.connect(self.progress)
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the task finished, failed or was cancelled."""
+        return self.state in (TaskState.FINISHED, TaskState.FAILED, TaskState.CANCELLED)
+
+    def cancel(self) -> None:
+        """Cancel the task; a pending task is removed from the queue."""
+        self._scheduler.cancel(self)
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the task is done.
+
+        Args:
+            timeout_ms: Maximum time to wait, -1 to wait indefinitely
+
+        Returns:
+            bool: True if the task is done
+        """
+        return self._done.wait(None if timeout_ms < 0 else timeout_ms / 1000)
+
+
+class _TaskRunnable(QRunnable):
+    """Runs a task handle on the thread pool."""
+
+    def __init__(self, scheduler: "TaskScheduler", handle: TaskHandle):
+        """
+        Initialize the runnable.
+
+        Args:
+            scheduler: The scheduler running the task
+            handle: Handle of the task to run
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self._scheduler = scheduler
+        self.handle = handle
+
+    def run(self) -> None:
+        """Run the task on the current pool thread."""
+        self._scheduler._run(self)
+
+
+class TaskScheduler(QObject):
+    """
+    Runs background tasks on one bounded QThreadPool.
+
+    Loads, validations, corrections and chart builds share the pool instead of
+    starting a thread each. Tasks start by priority, identical pending tasks
+    are merged and every task can be cancelled through its handle.
+
+    Attributes:
+        max_threads (int): Maximum number of concurrently running tasks
+
+    Implementation Notes:
+        - A task submitted with a fingerprint is keyed by (task type, fingerprint);
+          submitting the same key while a task is still queued returns its handle
+        - Cancelling a queued task takes it off the pool, cancelling a running
+          task sets its token and calls the task's cancel()
+        - Metrics hold counters and per-type duration statistics, updated under a lock
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "TaskScheduler":
+        """Get or create the shared scheduler."""
+        if cls._instance is None:
+            max_threads = 0
+            try:
+                from chestbuddy.utils.config import ConfigManager
+
+                max_threads = ConfigManager().get_int("Performance", "max_worker_threads", 0)
+            except Exception as e:
+                logger.debug(f"Using default scheduler thread count: {e}")
+            cls._instance = TaskScheduler(max_threads)
+        return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls, timeout_ms: int = 1000) -> None:
+        """
+        Shut down the shared scheduler if it was created.
+
+        Args:
+            timeout_ms: Maximum time to wait for running tasks
+        """
+        if cls._instance is not None:
+            cls._instance.shutdown(timeout_ms)
+            cls._instance = None
+
+    def __init__(self, max_threads: int = 0, parent: Optional[QObject] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_threads: Maximum number of concurrent tasks; 0 uses the ideal thread count
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._pool = QThreadPool()
+        if max_threads <= 0:
+            max_threads = max(2, QThreadPool.globalInstance().maxThreadCount())
+        self._pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._runnables: Dict[int, _TaskRunnable] = {}
+        self._pending_keys: Dict[Tuple[str, Hashable], TaskHandle] = {}
+        self._counters = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "finished": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+        self._durations: Dict[str, Dict[str, float]] = {}
+        self._pending = 0
+        self._running = 0
+
+    @property
+    def max_threads(self) -> int:
+        """Maximum number of concurrently running tasks."""
+        return self._pool.maxThreadCount()
+
+    def submit(
+        self,
+        task: Any,
+        task_type: Optional[str] = None,
+        fingerprint: Optional[Hashable] = None,
+        priority: Union[TaskPriority, int] = TaskPriority.NORMAL,
+        connect: Optional[Callable[[TaskHandle], None]] = None,
+    ) -> TaskHandle:
+        """
+        Queue a task.
+
+        Args:
+            task: A BackgroundTask or a callable taking no arguments
+            task_type: Type used for deduplication and metrics, defaults to the class name
+            fingerprint: Identifies the task's input, e.g. a data hash; tasks are
+                only deduplicated when a fingerprint is given
+            priority: Scheduling priority
+            connect: Called with the handle before the task can start, so that
+                signals of a task that finishes at once are not missed
+
+        Returns:
+            TaskHandle: Handle of the queued task, or of an identical pending task
+        """
+        task_type = task_type or type(task).__name__
+        key = (task_type, fingerprint) if fingerprint is not None else None
+        with self._lock:
+            if key is not None:
+                existing = self._pending_keys.get(key)
+                if existing is not None and existing.state == TaskState.PENDING:
+                    self._counters["deduplicated"] += 1
+                    logger.debug(f"Merged duplicate {task_type} task into {existing.task_id}")
+                    # Pending tasks only start after taking the lock
+                    if connect is not None:
+                        connect(existing)
+                    return existing
+
+            handle = TaskHandle(self, task, task_type, key, priority)
+            runnable = _TaskRunnable(self, handle)
+            self._runnables[id(handle)] = runnable
+            if key is not None:
+                self._pending_keys[key] = handle
+            self._counters["submitted"] += 1
+            self._pending += 1
+
+        if connect is not None:
+            connect(handle)
+        self._pool.start(runnable, handle.priority)
+        logger.debug(f"Queued {task_type} task {handle.task_id} with priority {handle.priority}")
+        return handle
+
+    def cancel(self, handle: TaskHandle) -> None:
+        """
+        Cancel a task.
+
+        Args:
+            handle: Handle of the task
+        """
+        handle.token.cancel()
+        runnable = self._runnables.get(id(handle))
+        if runnable is None or handle.state != TaskState.PENDING:
+            return
+        if self._pool.tryTake(runnable):
+            # Never started; finish it here
+            with self._lock:
+                self._pending -= 1
+                self._release(handle)
+            self._complete(handle, TaskState.CANCELLED)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get queue and duration metrics.
+
+        Returns:
+            Dict[str, Any]: queue_depth, running, max_threads, the task counters and
+                per task type durations (count, total_ms, avg_ms, max_ms, last_ms)
+        """
+        with self._lock:
+            durations = {
+                task_type: dict(stats, avg_ms=stats["total_ms"] / stats["count"])
+                for task_type, stats in self._durations.items()
+            }
+            return {
+                "queue_depth": self._pending,
+                "running": self._running,
+                "max_threads": self.max_threads,
+                **self._counters,
+                "durations": durations,
+            }
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """
+        Wait until all tasks are done.
+
+        Args:
+            timeout_ms: Maximum time to wait, -1 to wait indefinitely
+
+        Returns:
+            bool: True if all tasks are done
+        """
+        return self._pool.waitForDone(timeout_ms)
+
+    def shutdown(self, timeout_ms: int = 1000) -> None:
+        """
+        Cancel all tasks and wait for running ones to stop.
+
+        Args:
+            timeout_ms: Maximum time to wait for running tasks
+        """
+        with self._lock:
+            handles = [runnable.handle for runnable in self._runnables.values()]
+        logger.debug(f"Shutting down task scheduler with {len(handles)} tasks")
+        for handle in handles:
+            self.cancel(handle)
+        if not self._pool.waitForDone(timeout_ms):
+            logger.debug("Task scheduler shutdown timed out waiting for running tasks")
+
+    def _run(self, runnable: _TaskRunnable) -> None:
+        """Run a task on a pool thread and record its outcome."""
+        handle = runnable.handle
+        with self._lock:
+            self._pending -= 1
+            if handle.key is not None and self._pending_keys.get(handle.key) is handle:
+                del self._pending_keys[handle.key]
+            if handle.token.is_cancelled:
+                self._release(handle)
+                cancelled = True
+            else:
+                handle.state = TaskState.RUNNING
+                self._running += 1
+                cancelled = False
+        if cancelled:
+            self._complete(handle, TaskState.CANCELLED)
+            return
+
+        handle.started.emit()
+        start = time.perf_counter()
+        state = TaskState.FINISHED
+        try:
+            task = handle.task
+            handle.result = task.run() if hasattr(task, "run") else task()
+            if handle.token.is_cancelled:
+                state = TaskState.CANCELLED
+        except Exception as e:
+            logger.error(f"Error in {handle.task_type} task {handle.task_id}: {e}")
+            handle.exception = e
+            state = TaskState.FAILED
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._running -= 1
+            stats = self._durations.setdefault(
+                handle.task_type, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            stats["last_ms"] = duration_ms
+            self._release(handle)
+        logger.debug(f"{handle.task_type} task {handle.task_id} {state.value} in {duration_ms:.1f}ms")
+        self._complete(handle, state)
+
+    def _release(self, handle: TaskHandle) -> None:
+        """Forget a task that left the queue; the caller holds the lock."""
+        self._runnables.pop(id(handle), None)
+        if handle.key is not None and self._pending_keys.get(handle.key) is handle:
+            del self._pending_keys[handle.key]
+
+    def _complete(self, handle: TaskHandle, state: TaskState) -> None:
+        """Set the final state of a task and emit the matching handle signal."""
+        with self._lock:
+            handle.state = state
+            self._counters[state.value] += 1
+        handle._done.set()
+        if state == TaskState.FINISHED:
+            handle.finished.emit(handle.result)
+        elif state == TaskState.FAILED:
+            handle.error.emit(handle.exception)
+        else:
+            handle.cancelled.emit()
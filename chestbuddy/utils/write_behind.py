@@ -0,0 +1,237 @@
+"""
+write_behind.py
+
+Description: Debounced write-behind persistence with atomic file replacement.
+Usage:
+    from chestbuddy.utils.write_behind import (
+        AppendOnlyLog,
+        WriteBehindPersister,
+        atomic_write_text,
+    )
+
+    persister = WriteBehindPersister(lambda: atomic_write_text(path, render()), delay_ms=1000)
+    persister.schedule()  # Coalesces with any write already pending
+    persister.flush()     # Writes now if anything is pending
+
+    log = AppendOnlyLog(path.with_name(path.name + ".log"))
+    log.append("+", "New entry")  # O(1) I/O for a single change
+"""
+
+import atexit
+import logging
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+# Persisters with pending writes are flushed when the application exits
+_persisters: "weakref.WeakSet[WriteBehindPersister]" = weakref.WeakSet()
+
+
+def atomic_write_text(path: Union[str, Path], text: str, encoding: str = "utf-8") -> None:
+    """
+    Replace a file's content atomically.
+
+    The text is written to a temporary file in the same directory, synced to
+    disk and renamed over the target, so readers see either the old or the new
+    file and never a partially written one.
+
+    Args:
+        path: The file to write
+        text: The complete new content
+        encoding: Text encoding
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+class AppendOnlyLog:
+    """
+    Line-based log of "+value"/"-value" operations stored next to a data file.
+
+    A single change is persisted by appending one line instead of rewriting the
+    data file. The log is replayed on load and truncated once the data file has
+    been rewritten (compacted).
+
+    Attributes:
+        path (Path): Location of the log file
+
+    Implementation Notes:
+        - Replaying set additions and removals is idempotent, so a crash between
+          compaction and truncation only replays operations already contained
+          in the data file
+        - Lines without a known operation prefix are skipped
+    """
+
+    ADD = "+"
+    REMOVE = "-"
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the log.
+
+        Args:
+            path: Location of the log file
+        """
+        self.path = Path(path)
+
+    def append(self, op: str, value: str) -> None:
+        """
+        Append one operation.
+
+        Args:
+            op: ADD or REMOVE
+            value: The value added or removed
+
+        Raises:
+            OSError: If the log cannot be written
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(f"{op}{value}\n")
+
+    def read(self) -> List[Tuple[str, str]]:
+        """
+        Read all operations in the order they were appended.
+
+        Returns:
+            List[Tuple[str, str]]: (op, value) pairs, empty if there is no log
+        """
+        if not self.path.exists():
+            return []
+        operations = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if len(line) > 1 and line[0] in (self.ADD, self.REMOVE):
+                    operations.append((line[0], line[1:]))
+        return operations
+
+    def clear(self) -> None:
+        """Remove the log after its operations have been compacted into the data file."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class WriteBehindPersister(QObject):
+    """
+    Coalesces save requests and performs them after a quiet period.
+
+    Any number of schedule() calls within the delay result in one call of the
+    write function. Pending writes are performed by flush(), by flush_all() on
+    application exit, or by the debounce timer.
+
+    Attributes:
+        delay_ms (int): Quiet period before a scheduled write is performed
+
+    Implementation Notes:
+        - Without a running Qt application there is no event loop to fire the
+          timer, so schedule() writes immediately
+        - A failed write stays pending so the next flush retries it
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[], None],
+        delay_ms: int = 1000,
+        name: str = "",
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Initialize the persister.
+
+        Args:
+            write_fn: Performs the actual write; raises on failure
+            delay_ms: Quiet period before a scheduled write is performed
+            name: Name used in log messages
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._write_fn = write_fn
+        self.delay_ms = max(0, int(delay_ms))
+        self._name = name or getattr(write_fn, "__qualname__", "writer")
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        _persisters.add(self)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a write has been scheduled but not yet performed."""
+        return self._pending
+
+    def schedule(self) -> None:
+        """Request a write, restarting the quiet period."""
+        self._pending = True
+        if self.delay_ms == 0 or QCoreApplication.instance() is None:
+            self.flush()
+            return
+        self._timer.start(self.delay_ms)
+
+    def cancel(self) -> None:
+        """Drop a pending write, e.g. after the data was written by other means."""
+        self._pending = False
+        self._timer.stop()
+
+    def flush(self) -> bool:
+        """
+        Perform the pending write now.
+
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        self._timer.stop()
+        if not self._pending:
+            return True
+        try:
+            self._write_fn()
+        except Exception as e:
+            logger.error(f"Write-behind flush failed for {self._name}: {e}")
+            return False
+        self._pending = False
+        logger.debug(f"Write-behind flush completed for {self._name}")
+        return True
+
+
+def flush_all() -> bool:
+    """
+    Flush every persister with a pending write.
+
+    Returns:
+        bool: True if all pending writes succeeded
+    """
+    success = True
+    for persister in list(_persisters):
+        try:
+            if persister.pending:
+                success = persister.flush() and success
+        except RuntimeError:
+            # The underlying Qt object was already deleted during shutdown
+            continue
+    return success
+
+
+atexit.register(flush_all)
@@ -58,7 +58,7 @@ class TestChestBuddyApp:
     def setup_patches(self, monkeypatch):
         """Set up common patches for all tests."""
         # Skip initialization methods
-        monkeypatch.setattr("chestbuddy.app.ChestBuddyApp._setup_logging", lambda self: None)
+        monkeypatch.setattr("chestbuddy.app.ChestBuddyApp._setup_logging", lambda self, *args: None)
         monkeypatch.setattr("chestbuddy.app.ChestBuddyApp._create_ui", lambda self: None)
         monkeypatch.setattr("chestbuddy.app.apply_application_style", lambda: None)
         monkeypatch.setattr(
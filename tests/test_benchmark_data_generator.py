@@ -0,0 +1,83 @@
+"""
+Tests for the benchmark data generator and result comparison.
+"""
+
+import pandas as pd
+import pytest
+
+from benchmarks.data_generator import TotalBattleDataGenerator
+from benchmarks.run_benchmarks import compare_results
+
+
+def test_generator_is_deterministic():
+    """The same seed produces identical data."""
+    first = TotalBattleDataGenerator(seed=7).generate(500)
+    second = TotalBattleDataGenerator(seed=7).generate(500)
+    other = TotalBattleDataGenerator(seed=8).generate(500)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(other)
+
+
+def test_generator_columns_and_size():
+    """Generated data has the expected columns and row count."""
+    df = TotalBattleDataGenerator().generate(1000)
+
+    assert list(df.columns) == TotalBattleDataGenerator.EXPECTED_COLUMNS
+    assert len(df) == 1000
+
+
+@pytest.mark.parametrize("invalid_rate", [0.0, 0.1, 0.5])
+def test_generator_invalid_rate(invalid_rate):
+    """Roughly invalid_rate of the rows deviate from the clean reference values."""
+    generator = TotalBattleDataGenerator(seed=3, invalid_rate=invalid_rate)
+    df = generator.generate(2000)
+
+    clean = (
+        df["PLAYER"].isin(generator.PLAYERS)
+        & df["SOURCE"].isin(generator.SOURCES)
+        & df["CHEST"].isin(list(generator.CHESTS))
+        & (df["SCORE"] == df["CHEST"].map(generator.CHESTS))
+    )
+    assert (~clean).sum() == pytest.approx(2000 * invalid_rate, abs=2000 * 0.01)
+
+
+def test_generator_rejects_bad_invalid_rate():
+    """invalid_rate outside 0..1 is rejected."""
+    with pytest.raises(ValueError):
+        TotalBattleDataGenerator(invalid_rate=1.5)
+
+
+def test_corruptions_are_covered_by_correction_rules():
+    """Mojibake and Cyrillic look-alike variants map back to the clean value."""
+    generator = TotalBattleDataGenerator()
+    rules = {
+        (rule.category, rule.from_value): rule.to_value for rule in generator.correction_rules()
+    }
+
+    assert rules[("player", generator.mojibake("Feldjäger"))] == "Feldjäger"
+    assert generator.mojibake("Feldjäger") == "FeldjÃ¤ger"
+    assert rules[("chest", generator.lookalike("Fire Chest"))] == "Fire Chest"
+    assert generator.lookalike("Fire Chest") != "Fire Chest"
+
+
+def test_validation_lists_written(tmp_path):
+    """Validation lists use the file names ValidationService expects."""
+    generator = TotalBattleDataGenerator()
+    players, chests, sources = generator.write_validation_lists(tmp_path)
+
+    assert players.name == "players.txt"
+    assert chests.name == "chest_types.txt"
+    assert sources.name == "sources.txt"
+    assert "Feldjäger" in players.read_text(encoding="utf-8").splitlines()
+
+
+def test_compare_results_flags_regressions():
+    """Stages slower than the threshold are flagged, faster ones are not."""
+    baseline = {"results": {"1000": {"load": {"seconds": 1.0}, "sort": {"seconds": 1.0}}}}
+    current = {"results": {"1000": {"load": {"seconds": 1.5}, "sort": {"seconds": 0.5}}}}
+
+    comparisons = {c["stage"]: c for c in compare_results(current, baseline, threshold=0.2)}
+
+    assert comparisons["load"]["regression"]
+    assert not comparisons["sort"]["regression"]
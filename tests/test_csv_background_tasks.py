@@ -64,9 +64,7 @@ def worker():
     yield worker
 
     # Clean up the worker after the test
-    if worker._thread.isRunning():
-        worker._thread.quit()
-        worker._thread.wait(1000)  # Wait up to 1 second for thread to finish
+    worker.wait(1000)  # Wait up to 1 second for the task to finish
 
 
 def test_csv_read_task_creation(csv_service: CSVService, sample_csv_file: Path):
@@ -250,10 +248,8 @@ def test_csv_read_task_cancellation(
     assert task_cancelled[0]
     assert task.is_cancelled
 
-    # Wait for thread to clean up
-    if worker._thread.isRunning():
-        worker._thread.quit()
-        worker._thread.wait(1000)
+    # Wait for the task to finish
+    worker.wait(1000)
 
 
 def test_csv_service_read_csv_background(
@@ -295,7 +291,5 @@ def test_csv_service_read_csv_background(
     assert len(progress_values) > 0
     assert progress_values[-1][0] == progress_values[-1][1]  # Final progress should show completion
 
-    # Clean up the worker thread
-    if worker._thread.isRunning():
-        worker._thread.quit()
-        worker._thread.wait(1000)
+    # Wait for the worker's task to finish
+    worker.wait(1000)
@@ -14,6 +14,7 @@ from typing import Dict, List, Generator, Callable, Optional
 import pandas as pd
 import pytest
 
+from chestbuddy.core.services import csv_service as csv_service_module
 from chestbuddy.core.services.csv_service import CSVService
 
 
@@ -185,3 +186,98 @@ def test_error_handling_in_chunks(csv_service: CSVService, tmp_path: Path):
     # Should fail with an error
     assert error is not None
     assert "error" in error.lower() or "expected" in error.lower()
+
+
+requires_pyarrow = pytest.mark.skipif(
+    csv_service_module._load_arrow_csv() is None, reason="pyarrow is not installed"
+)
+
+
+def _read_with_pandas(csv_service: CSVService, file_path: Path, monkeypatch, **kwargs):
+    """Read a file with the pandas path only."""
+    with monkeypatch.context() as patch:
+        patch.setattr(csv_service_module, "_arrow_csv", False)
+        return csv_service.read_csv_chunked(file_path, **kwargs)
+
+
+@requires_pyarrow
+def test_arrow_reader_matches_pandas_path(csv_service: CSVService, tmp_path: Path, monkeypatch):
+    """The Arrow reader returns the same strings and missing values as the pandas path."""
+    file_path = tmp_path / "arrow.csv"
+    pd.DataFrame(
+        {
+            "Date": ["2024-01-01", "", "2024-01-03"],
+            "Player": ["Jürgen", "Zoë", "NA"],
+            "Score": [10, 20, 30],
+        }
+    ).to_csv(file_path, index=False, encoding="utf-8-sig")
+    progress = []
+
+    arrow_df, arrow_error = csv_service.read_csv_chunked(
+        file_path, encoding="utf-8-sig", progress_callback=lambda c, t: progress.append(c)
+    )
+    pandas_df, _ = _read_with_pandas(csv_service, file_path, monkeypatch, encoding="utf-8-sig")
+
+    assert arrow_error is None
+    assert list(arrow_df.columns) == ["Date", "Player", "Score"]
+    assert arrow_df["Score"].tolist() == ["10", "20", "30"]
+    assert arrow_df.equals(pandas_df)
+    assert progress[-1] == 100
+
+
+@requires_pyarrow
+def test_arrow_reader_falls_back_for_malformed_files(
+    csv_service: CSVService, tmp_path: Path, monkeypatch
+):
+    """Rows with a wrong number of fields are left to the pandas path."""
+    file_path = tmp_path / "malformed.csv"
+    file_path.write_text("A,B,C\n1,2,3\nbad,line\n4,5,6\n", encoding="utf-8")
+
+    assert csv_service._read_csv_arrow(file_path, "utf-8") is None
+
+    result_df, error = csv_service.read_csv_chunked(file_path, encoding="utf-8")
+    pandas_df, _ = _read_with_pandas(csv_service, file_path, monkeypatch, encoding="utf-8")
+    assert error is None
+    assert result_df.equals(pandas_df)
+
+
+@requires_pyarrow
+def test_arrow_reader_matches_pandas_missing_values(
+    csv_service: CSVService, tmp_path: Path, monkeypatch
+):
+    """Every marker pandas reads as missing is missing in the Arrow result too."""
+    file_path = tmp_path / "nulls.csv"
+    markers = ["None", "<NA>", "NULL", "n/a", "nan", "#N/A", "", "none", "Nonesuch"]
+    lines = ["Player,Chest"] + [f"{marker},Gold" for marker in markers]
+    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    arrow_df = csv_service._read_csv_arrow(file_path, "utf-8")[0]
+    pandas_df, _ = _read_with_pandas(csv_service, file_path, monkeypatch, encoding="utf-8")
+
+    assert arrow_df["Player"].isna().tolist() == pandas_df["Player"].isna().tolist()
+    assert arrow_df.equals(pandas_df)
+    assert arrow_df["Player"].dropna().tolist() == ["none", "Nonesuch"]
+
+
+@pytest.mark.parametrize("use_arrow", [False, True])
+def test_only_false_from_progress_callback_cancels(
+    csv_service: CSVService, large_csv_file: Path, monkeypatch, use_arrow: bool
+):
+    """Both readers keep going when the callback returns None and stop on False."""
+    if use_arrow and csv_service_module._load_arrow_csv() is None:
+        pytest.skip("pyarrow is not installed")
+    if not use_arrow:
+        monkeypatch.setattr(csv_service_module, "_arrow_csv", False)
+    monkeypatch.setattr(csv_service_module, "ARROW_BLOCK_SIZE", 1 << 14)
+
+    result_df, error = csv_service.read_csv_chunked(
+        large_csv_file, chunk_size=1000, progress_callback=lambda current, total: None
+    )
+    assert error is None
+    assert len(result_df) == 10000
+
+    result_df, error = csv_service.read_csv_chunked(
+        large_csv_file, chunk_size=1000, progress_callback=lambda current, total: False
+    )
+    assert result_df is None
+    assert "cancelled" in error
@@ -103,7 +103,7 @@ def test_load_csv_emits_progress_signals(qtbot, data_manager):
     original_execute_task = data_manager._worker.execute_task
     captured_task = [None]
 
-    def mock_execute_task(task):
+    def mock_execute_task(task, fingerprint=None):
         captured_task[0] = task
         # Instead of running the task in a thread, run it directly
         result = task.run()
@@ -209,7 +209,7 @@ def test_load_csv_with_multiple_files(qtbot, data_manager):
     original_execute_task = data_manager._worker.execute_task
     captured_task = [None]
 
-    def mock_execute_task(task):
+    def mock_execute_task(task, fingerprint=None):
         captured_task[0] = task
         # Instead of running the task in a thread, run it directly
         result = task.run()
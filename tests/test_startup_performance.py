@@ -0,0 +1,129 @@
+"""
+Tests for application startup performance.
+
+This module checks that heavy optional modules are imported lazily, that
+secondary views are only constructed on first navigation, and that the time
+until the main window is first shown stays within a budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QLabel, QStackedWidget
+
+from chestbuddy.core.controllers.view_state_controller import ViewStateController
+from chestbuddy.core.models import ChestDataModel
+from chestbuddy.utils.signal_manager import SignalManager
+
+# Time-to-first-window budget in milliseconds (override for slow CI machines)
+STARTUP_BUDGET_MS = float(os.environ.get("CHESTBUDDY_STARTUP_BUDGET_MS", "5000"))
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+LAZY_MODULES = ["PySide6.QtCharts", "ftfy", "chardet", "charset_normalizer"]
+
+
+def _run_python(code: str, cwd: Path) -> str:
+    """Run a snippet in a fresh interpreter and return its stdout."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PROJECT_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_heavy_modules_not_imported_at_startup(tmp_path):
+    """Importing the application must not import charting or encoding libraries."""
+    output = _run_python(
+        "import sys\n"
+        "import chestbuddy.app\n"
+        f"print('LOADED', [m for m in {LAZY_MODULES!r} if m in sys.modules])\n",
+        cwd=tmp_path,
+    )
+    assert "LOADED []" in output.splitlines()
+
+
+@pytest.mark.slow
+def test_time_to_first_window_within_budget(tmp_path):
+    """The main window must be shown within the startup budget."""
+    output = _run_python(
+        "import sys\n"
+        "from PySide6.QtWidgets import QApplication\n"
+        "app = QApplication(sys.argv)\n"
+        "from chestbuddy.app import ChestBuddyApp\n"
+        "from chestbuddy.utils.startup_profiler import startup_profiler\n"
+        "chest_buddy_app = ChestBuddyApp([])\n"
+        "print('FIRST_WINDOW_MS', startup_profiler.get_mark('first_window_shown'))\n"
+        "print('VIEWS', ','.join(chest_buddy_app._main_window._views))\n"
+        "chest_buddy_app.cleanup()\n",
+        cwd=tmp_path,
+    )
+    values = dict(line.split(" ", 1) for line in output.splitlines() if " " in line)
+
+    first_window_ms = float(values["FIRST_WINDOW_MS"])
+    assert first_window_ms < STARTUP_BUDGET_MS, (
+        f"Time to first window {first_window_ms:.0f}ms exceeds budget {STARTUP_BUDGET_MS:.0f}ms"
+    )
+    # Only the landing views are built before the first paint
+    assert values["VIEWS"].split(",") == ["Dashboard", "Data"]
+
+
+class TestLazyViewCreation:
+    """Tests for on-demand view construction in ViewStateController."""
+
+    @pytest.fixture
+    def controller(self, qtbot):
+        """Create a ViewStateController with one eager and one lazy view."""
+        controller = ViewStateController(ChestDataModel(), SignalManager())
+        self.stack = QStackedWidget()
+        qtbot.addWidget(self.stack)
+        self.created = []
+
+        def create_charts():
+            view = QLabel("Charts")
+            self.created.append(view)
+            return view
+
+        views = {"Dashboard": QLabel("Dashboard"), "Data": QLabel("Data")}
+        for view in views.values():
+            self.stack.addWidget(view)
+        controller.set_ui_components(views, None, self.stack, {"Charts": create_charts})
+        controller.set_active_view("Dashboard")
+        qtbot.waitUntil(lambda: not controller.is_transition_in_progress)
+        return controller
+
+    def test_lazy_view_not_created_until_navigation(self, controller, qtbot):
+        """Registered factories are only invoked on first navigation."""
+        assert "Charts" in controller.view_names
+        assert not controller.is_view_created("Charts")
+        assert self.created == []
+
+        controller.update_data_loaded_state(True)
+        controller.set_active_view("Charts")
+
+        assert controller.is_view_created("Charts")
+        assert len(self.created) == 1
+        assert self.stack.currentWidget() is self.created[0]
+
+    def test_lazy_view_created_only_once(self, controller, qtbot):
+        """Navigating back to a lazy view reuses the created widget."""
+        controller.update_data_loaded_state(True)
+        controller.set_active_view("Charts")
+        qtbot.waitUntil(lambda: not controller.is_transition_in_progress)
+        controller.set_active_view("Dashboard")
+        qtbot.waitUntil(lambda: not controller.is_transition_in_progress)
+        controller.set_active_view("Charts")
+
+        assert len(self.created) == 1
+        assert controller.get_view("Charts") is self.created[0]
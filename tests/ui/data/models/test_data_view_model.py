@@ -2,6 +2,7 @@
 Tests for the DataViewModel class.
 """
 
+import pandas as pd
 import pytest
 from PySide6.QtCore import Qt, QModelIndex, Signal
 from PySide6.QtGui import QColor
@@ -183,38 +184,56 @@ class TestDataViewModel:
 
     # --- Sorting Tests --- #
 
-    def test_sort_delegates_to_source(self, qtbot):
-        """Test sort calls source model's sort_data method."""
-        self.mock_source_model.headerData.return_value = "ColumnA"  # Mock header name
-        # Ensure source model has the sort_data method
+    def _use_frame(self):
+        """Give the mock source model a real DataFrame to sort."""
+        self.mock_source_model._data = pd.DataFrame(
+            {
+                "ColumnA": ["b", "a", "c", "a"],
+                "ColumnB": [1, 2, 3, 4],
+                "ColumnC": ["x", None, "y", "z"],
+            }
+        )
+
+    def test_sort_maps_rows_without_reordering_source(self, qtbot):
+        """Test sort presents rows through a permutation and leaves the data in place."""
+        self._use_frame()
         self.mock_source_model.sort_data = MagicMock()
+        original = self.mock_source_model._data.copy()
 
         with qtbot.waitSignals([self.model.layoutAboutToBeChanged, self.model.layoutChanged]):
             self.model.sort(0, Qt.AscendingOrder)
 
-        # Use keyword arguments for assertion
-        self.mock_source_model.sort_data.assert_called_once_with(
-            column_name="ColumnA", ascending=True
-        )
+        self.mock_source_model.sort_data.assert_not_called()
+        pd.testing.assert_frame_equal(self.mock_source_model._data, original)
+        assert [self.model.source_row(r) for r in range(4)] == [1, 3, 0, 2]
+        assert self.model.view_row(0) == 2
+        assert self.model.current_sort_column() == 0
 
-    def test_sort_descending(self, mock_chest_data_model, qtbot):
-        """Test sort with descending order."""
-        mock_chest_data_model.headerData.return_value = "ColumnB"
-        mock_chest_data_model.sort_data = MagicMock()
-        # Instantiate with a mock state manager, even if None, to match constructor
-        mock_state_manager = MagicMock(spec=TableStateManager)
-        mock_state_manager.state_changed = Signal(set)  # Add expected signal
-        # Configure the receivers method on the local mock
-        mock_state_manager.receivers.return_value = 0
-        model = DataViewModel(mock_chest_data_model, mock_state_manager)
-
-        with qtbot.waitSignals([model.layoutAboutToBeChanged, model.layoutChanged]):
-            model.sort(1, Qt.DescendingOrder)
-
-        # Use keyword arguments for assertion
-        mock_chest_data_model.sort_data.assert_called_once_with(
-            column_name="ColumnB", ascending=False
-        )
+        # State lookups use the data row
+        self.model.data(self.model.index(0, 1), DataViewModel.ValidationStateRole)
+        self.mock_state_manager.get_full_cell_state.assert_called_with(1, 1)
+
+    def test_sort_descending(self, qtbot):
+        """Test descending sort is stable and keeps missing values last."""
+        self._use_frame()
+
+        with qtbot.waitSignals([self.model.layoutAboutToBeChanged, self.model.layoutChanged]):
+            self.model.sort(2, Qt.DescendingOrder)
+
+        assert [self.model.source_row(r) for r in range(4)] == [3, 2, 0, 1]
+        assert self.model.current_sort_order() == Qt.DescendingOrder
+
+    def test_sort_by_multiple_columns(self, qtbot):
+        """Test multi-key sort and restoring data order."""
+        self._use_frame()
+
+        self.model.sort_by_columns([(0, True), (1, False)])
+        assert [self.model.source_row(r) for r in range(4)] == [3, 1, 0, 2]
+        assert self.model.sort_keys() == [(0, True), (1, False)]
+
+        self.model.clear_sort()
+        assert [self.model.source_row(r) for r in range(4)] == [0, 1, 2, 3]
+        assert self.model.current_sort_column() == -1
 
     def test_sort_invalid_column(self, mock_chest_data_model, qtbot):
         """Test sort does nothing if header data is not found."""
@@ -229,20 +248,18 @@ class TestDataViewModel:
         mock_chest_data_model.sort_data.assert_not_called()
         assert model.current_sort_column() == -1  # Should remain default
 
-    def test_sort_no_source_method(self, mock_chest_data_model, qtbot):
-        """Test sort does nothing if source model lacks sort_data method."""
-        mock_chest_data_model.headerData.return_value = "ColumnA"
-        # Ensure source model *does not* have sort_data
-        if hasattr(mock_chest_data_model, "sort_data"):
-            del mock_chest_data_model.sort_data
+    def test_source_change_resorts_touched_columns(self):
+        """Test an edit in the sort column updates the row mapping."""
+        self._use_frame()
+        self.model.sort(1, Qt.AscendingOrder)
+        assert self.model.source_row(0) == 0
 
-        model = DataViewModel(mock_chest_data_model, None)
+        self.mock_source_model._data.iloc[0, 1] = 10
+        data_state = MagicMock()
+        data_state.changed_ranges = [(0, 1, 0, 1)]
+        self.model._on_source_data_changed(data_state)
 
-        with qtbot.assertNotEmitted(model.layoutAboutToBeChanged):
-            with qtbot.assertNotEmitted(model.layoutChanged):
-                model.sort(0, Qt.AscendingOrder)
-
-        assert model.current_sort_column() == -1  # Should remain default
+        assert [self.model.source_row(r) for r in range(4)] == [1, 2, 3, 0]
 
     def test_data_for_edit_role(self):
         """Test data returns the correct value for EditRole (delegated)."""
@@ -0,0 +1,57 @@
+"""
+Tests for the SortIndex permutation cache.
+"""
+
+import numpy as np
+import pandas as pd
+
+from chestbuddy.ui.data.models.sort_index import SortIndex
+
+
+def _frame():
+    return pd.DataFrame({"name": ["b", "a", None, "a"], "score": [3, 1, 2, 5]})
+
+
+def test_permutation_is_stable_and_puts_missing_values_last():
+    """Equal keys keep data order and missing values sort last in both directions."""
+    index = SortIndex()
+    df = _frame()
+
+    assert index.permutation(df, [(0, True)]).tolist() == [1, 3, 0, 2]
+    assert index.permutation(df, [(0, False)]).tolist() == [0, 1, 3, 2]
+    assert index.permutation(df, [(0, True), (1, False)]).tolist() == [3, 1, 0, 2]
+    assert index.permutation(df, []).tolist() == [0, 1, 2, 3]
+
+
+def test_permutations_are_cached_until_their_columns_change():
+    """A repeated sort reuses the cached permutation until its column is invalidated."""
+    index = SortIndex(max_entries=2)
+    df = _frame()
+
+    first = index.permutation(df, [(1, True)])
+    assert index.permutation(df, [(1, True)]) is first
+
+    index.invalidate([0])
+    assert index.permutation(df, [(1, True)]) is first
+
+    df.iloc[0, 1] = 0
+    index.invalidate([1])
+    assert index.permutation(df, [(1, True)]).tolist() == [0, 1, 2, 3]
+
+
+def test_cache_is_bounded():
+    """Least recently used permutations are evicted."""
+    index = SortIndex(max_entries=1)
+    df = _frame()
+
+    first = index.permutation(df, [(1, True)])
+    index.permutation(df, [(1, False)])
+    assert index.permutation(df, [(1, True)]) is not first
+
+
+def test_mixed_types_are_ranked():
+    """Columns mixing text and numbers can still be sorted."""
+    df = pd.DataFrame({"value": ["b", 1, np.nan, "a"]})
+    order = SortIndex().permutation(df, [(0, True)])
+    assert order[-1] == 2
+    assert sorted(order.tolist()) == [0, 1, 2, 3]
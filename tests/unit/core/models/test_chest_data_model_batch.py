@@ -0,0 +1,158 @@
+"""
+Test suite for batched cell edits on ChestDataModel.
+
+Covers staging, vectorized commit, bulk status reset, the single change
+notification with its cell ranges, and undo of a batch.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.state.data_state import DataState
+
+
+@pytest.fixture
+def model(qtbot):
+    """Create a data model with a few rows."""
+    model = ChestDataModel()
+    model.update_data(
+        pd.DataFrame(
+            {
+                "DATE": ["2024-01-01"] * 4,
+                "PLAYER": ["Jhon", "Jane", "Bob", "Ann"],
+                "SOURCE": ["Crypt"] * 4,
+                "CHEST": ["Gold", "Silver", "Wood", "Gold"],
+                "SCORE": [10, 20, 30, 40],
+                "CLAN": ["A"] * 4,
+            }
+        )
+    )
+    model.journal.clear()
+    return model
+
+
+def test_batch_stages_until_commit_and_emits_once(model):
+    """Edits are written on commit with one notification carrying the ranges."""
+    emitted = []
+    model.data_changed.connect(emitted.append)
+
+    model.begin_batch("Paste")
+    model.update_cell(0, "PLAYER", "John")
+    model.apply_cell_values([1, 2], [1, 1], ["Janet", "Bobby"])
+    model.set_cell_value(3, "CHEST", "Wood")
+    assert model.data.at[0, "PLAYER"] == "Jhon"
+
+    assert model.commit_batch() == 4
+    model.flush_notifications()
+    assert model.data["PLAYER"].tolist() == ["John", "Janet", "Bobby", "Ann"]
+    assert model.data.at[3, "CHEST"] == "Wood"
+    assert len(emitted) == 1
+    assert emitted[0].changed_ranges == [(0, 1, 2, 1), (3, 3, 3, 3)]
+
+
+def test_batch_resets_cell_status_in_bulk(model):
+    """Committed cells are marked as not validated and not corrected."""
+    model._correction_status["PLAYER_corrected"] = True
+
+    with model.batch("Rename"):
+        model.apply_cell_values(np.array([0, 2]), np.array([1, 1]), ["A", "B"])
+
+    assert model._validation_status["PLAYER_valid"].tolist() == [False, True, False, True]
+    assert model._correction_status["PLAYER_corrected"].tolist() == [False, True, False, True]
+
+
+def test_batch_is_one_undo_step_and_last_value_wins(model):
+    """A batch is undone in one step and repeated cells keep their last value."""
+    with model.batch("Rename"):
+        model.update_cell(0, "PLAYER", "John")
+        model.update_cell(0, "PLAYER", "Johnny")
+        model.update_cell(1, "SCORE", 25)
+
+    assert model.data.at[0, "PLAYER"] == "Johnny"
+    assert model.journal.undo_label() == "Rename"
+    model.journal.undo()
+    assert model.data["PLAYER"].tolist() == ["Jhon", "Jane", "Bob", "Ann"]
+    assert model.data["SCORE"].tolist() == [10, 20, 30, 40]
+
+
+def test_batch_rolls_back_on_error(model):
+    """Staged edits are discarded when the batch block raises."""
+    with pytest.raises(RuntimeError):
+        with model.batch():
+            model.update_cell(0, "PLAYER", "John")
+            raise RuntimeError("abort")
+
+    assert not model.in_batch
+    assert model.data.at[0, "PLAYER"] == "Jhon"
+    assert not model.journal.can_undo()
+
+
+def test_ranges_from_cells_groups_consecutive_rows():
+    """Consecutive rows of a column form one range."""
+    ranges = DataState.ranges_from_cells(np.array([5, 1, 2, 3, 0]), np.array([0, 0, 0, 0, 2]))
+
+    assert ranges == [(1, 0, 3, 0), (5, 0, 5, 0), (0, 2, 0, 2)]
+
+
+def test_notifications_in_window_are_coalesced(model, qtbot):
+    """A burst of changes emits once at the end of the window with merged ranges."""
+    emitted = []
+    model.data_changed.connect(emitted.append)
+    model._emission_rate_limit_ms = 50
+    model.flush_notifications()
+    model._last_emission_time = 0
+
+    model.apply_cell_values([0], [1], ["John"])
+    model.apply_cell_values([2], [4], [35])
+    model.apply_cell_values([3], [1], ["Anna"])
+    assert len(emitted) == 1
+
+    qtbot.waitUntil(lambda: len(emitted) == 2, timeout=1000)
+    assert emitted[1].changed_ranges == [(2, 4, 2, 4), (3, 1, 3, 1)]
+    assert model.data.at[3, "PLAYER"] == "Anna"
+
+
+def test_notifications_from_worker_thread_are_not_lost(model, qtbot):
+    """Changes made on another thread are emitted on the model's thread."""
+    import threading
+
+    emitted = []
+    model.data_changed.connect(emitted.append)
+    model._emission_rate_limit_ms = 50
+    model.flush_notifications()
+
+    def edit():
+        model.apply_cell_values([0], [1], ["John"])
+        model.apply_cell_values([3], [1], ["Anna"])
+
+    worker = threading.Thread(target=edit)
+    worker.start()
+    worker.join()
+
+    qtbot.waitUntil(lambda: not model._pending_change, timeout=1000)
+    assert emitted
+    assert (3, 1, 3, 1) in emitted[-1].changed_ranges
+    assert model.data.at[3, "PLAYER"] == "Anna"
+
+
+def test_clear_cancels_deferred_notification(model, qtbot):
+    """Clearing the model emits at once and drops a change still waiting for its window."""
+    emitted = []
+    model._emission_rate_limit_ms = 50
+    model.flush_notifications()
+    model._last_emission_time = 0
+    model.apply_cell_values([0], [1], ["John"])
+    model.apply_cell_values([3], [1], ["Anna"])
+    assert model._notify_timer.isActive()
+
+    model.data_changed.connect(emitted.append)
+    model.clear()
+    assert not model._notify_timer.isActive()
+    assert not model._pending_change
+    assert len(emitted) == 1
+    assert emitted[0].changed_ranges is None
+
+    qtbot.wait(100)
+    assert len(emitted) == 1
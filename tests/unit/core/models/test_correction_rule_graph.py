@@ -0,0 +1,88 @@
+"""
+Test suite for the CorrectionRuleGraph class.
+
+This module contains tests for chain resolution, cycle detection and
+single-pass recursive correction.
+"""
+
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_graph import CorrectionRuleGraph
+from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.core.services.correction_service import CorrectionService
+
+
+@pytest.fixture
+def chain_rules():
+    """Fixture providing rules that form a chain and a cycle."""
+    return [
+        CorrectionRule("Jon", "Jhon", "player"),
+        CorrectionRule("John", "Jon", "player"),
+        CorrectionRule("Beta", "Alpha", "player"),
+        CorrectionRule("Alpha", "Beta", "player"),
+        CorrectionRule("Gold", "gold", "general"),
+    ]
+
+
+class TestCorrectionRuleGraph:
+    """Test cases for the CorrectionRuleGraph class."""
+
+    def test_resolves_chains_to_final_target(self, chain_rules):
+        """Test that chains are followed to their final target."""
+        graph = CorrectionRuleGraph(chain_rules)
+
+        assert graph.resolve("Jhon", "player") == ("John", 2)
+        assert graph.resolve("jon", "player") == ("John", 1)
+        assert graph.resolve("Unrelated", "player") == ("Unrelated", 0)
+
+    def test_category_rules_apply_only_to_their_category(self, chain_rules):
+        """Test that category rules are not applied to other columns."""
+        graph = CorrectionRuleGraph(chain_rules)
+
+        assert graph.resolve("Jhon", "chest") == ("Jhon", 0)
+        assert graph.resolve("gold", "chest") == ("Gold", 1)
+
+    def test_detects_cycles(self, chain_rules):
+        """Test that cycles are reported once and fall back to a single pass."""
+        graph = CorrectionRuleGraph(chain_rules)
+
+        assert len(graph.cycles) == 1
+        assert set(graph.cycles[0]) == {"Alpha", "Beta"}
+        assert graph.resolve("Alpha", "player") == ("Beta", 1)
+        assert set(graph.rules_in_cycles(chain_rules)) == set(chain_rules[2:4])
+
+    def test_disabled_rules_are_ignored(self):
+        """Test that disabled rules do not take part in chains."""
+        rules = [
+            CorrectionRule("B", "A", "player"),
+            CorrectionRule("C", "B", "player", status="disabled"),
+        ]
+
+        assert CorrectionRuleGraph(rules).resolve("A", "player") == ("B", 1)
+
+    def test_recursive_correction_runs_single_pass(self, chain_rules):
+        """Test that recursive correction applies resolved chains in one data update."""
+        data_model = Mock(spec=ChestDataModel)
+        data_model.data = pd.DataFrame(
+            {"PLAYER": ["Jhon", "Alpha", "Other", None], "CHEST": ["gold", "box", "Gold", "x"]}
+        )
+        service = CorrectionService(data_model)
+        manager = CorrectionRuleManager()
+        for rule in chain_rules:
+            manager.add_rule(rule)
+        service._rule_manager = manager
+
+        stats = service.apply_corrections(recursive=True)
+
+        data_model.update_data.assert_called_once()
+        corrected = data_model.update_data.call_args.args[0]
+        assert corrected["PLAYER"].tolist()[:3] == ["John", "Beta", "Other"]
+        assert corrected["CHEST"].tolist() == ["Gold", "box", "Gold", "x"]
+        assert stats["corrected_cells"] == 3
+        assert stats["total_corrections"] == 4
+        assert stats["cycles"] == 1
@@ -249,14 +249,37 @@ class TestCorrectionRuleManager:
 
         prioritized_rules = manager.get_prioritized_rules()
 
-        # General rules should come first
-        assert prioritized_rules[0].category == "general"
-        assert prioritized_rules[1].category == "general"
+        # Column-specific rules come first, in list order, then enabled general rules
+        assert [rule.to_value for rule in prioritized_rules] == [
+            "Player1",
+            "Player2",
+            "Chest1",
+            "Source1",
+            "General1",
+        ]
+
+    def test_get_prioritized_rules_follows_stored_priority(self, sample_rules):
+        """Moving a rule changes its place within its group, not across groups."""
+        manager = CorrectionRuleManager()
+        for rule in sample_rules:
+            manager.add_rule(rule)
+        manager.add_rule(CorrectionRule("General3", "general3", "general", "enabled"))
 
-        # Category-specific rules should follow
-        # The exact order within categories depends on implementation details
-        category_rules = prioritized_rules[2:]
-        assert all(rule.category in ["player", "chest_type", "source"] for rule in category_rules)
+        manager.move_rule(6, 0)
+        manager.move_rule(2, 6)
+        prioritized_rules = manager.get_prioritized_rules()
+
+        assert [rule.to_value for rule in prioritized_rules] == [
+            "Player1",
+            "Chest1",
+            "Source1",
+            "Player2",
+            "General3",
+            "General1",
+        ]
+        priorities = [manager.get_priority(rule) for rule in prioritized_rules]
+        assert priorities[:4] == sorted(priorities[:4])
+        assert priorities[4:] == sorted(priorities[4:])
 
     def test_save_and_load_rules(self, sample_rules, temp_csv_file):
         """Test saving rules to CSV and loading them back."""
@@ -359,3 +382,53 @@ class TestCorrectionRuleManager:
         assert result[0].to_value == "PlayerSearch"
         assert result[0].category == "player"
         assert result[0].status == "enabled"
+
+    def test_find_rules_uses_index(self, sample_rules):
+        """Test indexed lookups by category and normalized from_value."""
+        manager = CorrectionRuleManager()
+        for rule in sample_rules:
+            manager.add_rule(rule)
+
+        assert manager.find_rules("PLAYER1", ["player", "general"]) == [sample_rules[0]]
+        assert manager.find_rules("PLAYER1", ["player"], case_sensitive=True) == []
+        assert manager.find_rules("player1", ["chest_type"]) == []
+
+        # Disabled rules are skipped unless requested
+        assert manager.find_rules("general2", ["general"]) == []
+        assert manager.find_rules("general2", ["general"], enabled_only=False) == [sample_rules[5]]
+
+    def test_index_follows_mutations(self, sample_rules):
+        """Test that the index stays current through updates, deletes, moves and toggles."""
+        manager = CorrectionRuleManager()
+        for rule in sample_rules:
+            manager.add_rule(rule)
+
+        manager.update_rule(0, CorrectionRule("Player9", "player9", "player", "enabled"))
+        assert manager.find_rules("player1", ["player"]) == []
+        assert manager.find_rules("player9", ["player"])[0].to_value == "Player9"
+
+        manager.delete_rule(1)
+        assert manager.find_rules("player2", ["player"]) == []
+
+        manager.toggle_rule_status(0)
+        assert manager.find_rules("player9", ["player"]) == []
+
+        manager.move_rule(2, 0)
+        assert manager.get_priority(manager.get_rule(0)) == 0
+        assert manager.get_priority(manager.get_rule(2)) == 2
+
+    def test_correction_mapping_respects_priority(self):
+        """Test that the highest priority rule wins in the vectorized mapping."""
+        manager = CorrectionRuleManager()
+        manager.add_rule(CorrectionRule("First", "typo", "player"))
+        manager.add_rule(CorrectionRule("Second", "TYPO", "general"))
+        manager.add_rule(CorrectionRule("Chest", "box", "chest_type"))
+
+        assert manager.get_correction_mapping(["player", "general"]) == {"typo": "First"}
+
+        manager.move_rule(1, 0)
+        assert manager.get_correction_mapping(["player", "general"]) == {"typo": "Second"}
+        assert manager.get_correction_mapping(["player", "general"], case_sensitive=True) == {
+            "typo": "First",
+            "TYPO": "Second",
+        }
@@ -0,0 +1,122 @@
+"""
+Tests for incremental revalidation in ValidationService.
+
+Verifies that the group index tracks duplicate groups and outlier bounds under
+edits and that edited cells are revalidated with the same result as a full run.
+"""
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.enums.validation_enums import ValidationStatus
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.models.validation_list_model import ValidationListModel
+from chestbuddy.core.services.validation_groups import ValidationGroupIndex
+from chestbuddy.core.services.validation_service import ValidationService
+
+
+def _frame():
+    """Create test data with one duplicate pair and one score outlier."""
+    return pd.DataFrame(
+        {
+            "DATE": ["2024-01-01"] * 6,
+            "PLAYER": ["Alice", "Bob", "Carol", "Dave", "Alice", "Eve"],
+            "SOURCE": ["Crypt"] * 6,
+            "CHEST": ["Gold", "Gold", "Wood", "Wood", "Gold", "Wood"],
+            "SCORE": [10, 11, 12, 13, 10, 500],
+            "CLAN": ["A"] * 6,
+        }
+    )
+
+
+@pytest.fixture
+def service(qtbot, tmp_path):
+    """Create a validation service over a real data model and temporary lists."""
+    model = ChestDataModel()
+    model.update_data(_frame())
+    model.flush_notifications()
+    service = ValidationService(model)
+
+    def list_model(name, entries):
+        path = tmp_path / name
+        path.write_text("\n".join(entries) + "\n", encoding="utf-8")
+        return ValidationListModel(str(path), flush_delay_ms=0)
+
+    service._player_list_model = list_model("players.txt", ["Alice", "Bob", "Carol", "Dave", "Eve"])
+    service._chest_type_list_model = list_model("chests.txt", ["Gold", "Wood"])
+    service._source_list_model = list_model("sources.txt", ["Crypt"])
+    return service
+
+
+def test_group_index_tracks_duplicate_groups():
+    """Editing a row out of a duplicate group affects the group's other rows."""
+    data = _frame()
+    index = ValidationGroupIndex()
+    index.build(data)
+    assert index.duplicate_messages(range(6)) == {4: ValidationGroupIndex.DUPLICATE_MESSAGE}
+
+    data.at[0, "PLAYER"] = "Alicia"
+    affected = index.update(data, [0])
+
+    assert {0, 4} <= affected
+    assert index.duplicate_messages(range(6)) == {}
+
+
+def test_group_index_outliers_match_full_rule(service):
+    """Outlier messages after an edit equal those of the full outliers rule."""
+    data = _frame()
+    index = ValidationGroupIndex()
+    index.build(data)
+
+    data.at[5, "SCORE"] = 14
+    data.at[2, "SCORE"] = 900
+    affected = index.update(data, [2, 5])
+
+    assert {2, 5} <= affected
+    assert index.outlier_messages(data, range(6)) == service._check_outliers(data)
+
+
+def test_edit_emits_delta_for_affected_rows_only(service, qtbot):
+    """An edit revalidates the edited row and its former duplicate."""
+    service.validate_data()
+    deltas = []
+    service.validation_delta.connect(deltas.append)
+
+    service._data_model.update_cell(4, "PLAYER", "Mallory")
+    service._data_model.flush_notifications()
+
+    assert len(deltas) == 1
+    delta = deltas[0]
+    assert sorted(delta.index) == [0, 4]
+    assert delta.at[4, "PLAYER_status"] == ValidationStatus.INVALID
+    assert delta.at[0, "PLAYER_status"] != ValidationStatus.INVALID
+
+
+def test_revalidation_matches_full_validation(service):
+    """Revalidated rows have the status a full validation assigns them."""
+    service.validate_data()
+    service._data_model.apply_cell_values([1, 5], [3, 4], ["Stone", 15], record=False)
+    delta = service.revalidate_cells([(1, 3), (5, 4)])
+
+    captured = []
+    service.validation_complete.connect(captured.append)
+    service.validate_data()
+    full = captured[0]
+
+    for column in delta.columns:
+        assert delta[column].tolist() == full.loc[delta.index, column].tolist(), column
+
+
+def test_summary_counts_follow_revalidation(service):
+    """The maintained summary equals the summary of a full validation after an edit."""
+    service.validate_data()
+    service._data_model.update_cell(1, "PLAYER", "Mallory")
+    service._data_model.flush_notifications()
+    summary = service.get_validation_summary()
+    assert summary["invalid"] > 0
+    assert service.get_column_summary("PLAYER")["invalid"] == 1
+
+    captured = []
+    service.validation_complete.connect(captured.append)
+    service.validate_data()
+    assert service._summarize_counts(service._count_statuses(captured[0])) == summary
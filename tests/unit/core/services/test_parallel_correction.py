@@ -0,0 +1,124 @@
+"""
+Unit tests for applying corrections on a process pool.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.enums.validation_enums import ValidationStatus
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.core.services.correction_service import CorrectionService
+from chestbuddy.utils.process_pool import ProcessPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Create a two-process pool that splits even small frames into blocks."""
+    pool = ProcessPool(workers=2, min_rows=1, block_rows=7)
+    yield pool
+    pool.shutdown()
+
+
+def _create_service():
+    """Create a correction service over data with chains, a cycle and missing values."""
+    data_model = ChestDataModel()
+    data_model.update_data(
+        pd.DataFrame(
+            {
+                "PLAYER": ["Jhon", "Alpha", "Other", None, "jon"] * 10,
+                "CHEST": ["gold", "box", "Gold", "x", "GOLD"] * 10,
+                "SCORE": ["1", "2", "3", "4", "5"] * 10,
+            }
+        )
+    )
+    data_model.flush_notifications()
+    service = CorrectionService(data_model)
+    manager = CorrectionRuleManager()
+    for rule in [
+        CorrectionRule("Jon", "Jhon", "player"),
+        CorrectionRule("John", "Jon", "player"),
+        CorrectionRule("Beta", "Alpha", "player"),
+        CorrectionRule("Alpha", "Beta", "player"),
+        CorrectionRule("Gold", "gold", "general"),
+    ]:
+        manager.add_rule(rule)
+    service._rule_manager = manager
+    return service
+
+
+def test_parallel_corrections_match_serial(pool):
+    """Block-wise correction produces the data and statistics of the serial pass."""
+    serial = _create_service()
+    parallel = _create_service()
+    progress = []
+
+    serial_stats = serial.apply_corrections(recursive=True)
+    parallel_stats = parallel.apply_corrections_in_parallel(
+        pool=pool, progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    pd.testing.assert_frame_equal(parallel._data_model.data, serial._data_model.data)
+    assert parallel_stats == serial_stats
+    assert progress[-1] == (8, 8)
+    # All corrections were written as one undoable step
+    assert parallel._data_model.journal.can_undo
+
+
+def test_cancelled_parallel_correction_leaves_data_unchanged(pool):
+    """Nothing is written when the run is cancelled."""
+    service = _create_service()
+    before = service._data_model.data
+
+    stats = service.apply_corrections_in_parallel(pool=pool, cancel_check=lambda: True)
+
+    assert stats["cancelled"]
+    pd.testing.assert_frame_equal(service._data_model.data, before)
+
+
+def test_small_data_is_left_to_the_serial_path():
+    """Data below the pool's row threshold is not distributed."""
+    service = _create_service()
+
+    assert service.apply_corrections_in_parallel(pool=ProcessPool(2, min_rows=1000)) is None
+
+
+def test_parallel_only_invalid_uses_validation_status(pool):
+    """Only cells marked invalid or correctable are corrected."""
+    service = _create_service()
+    model = service._data_model
+    status = pd.DataFrame(index=range(model.row_count))
+    for column in model.column_names:
+        status[f"{column}_status"] = ValidationStatus.VALID
+    status.loc[[1, 4], "PLAYER_status"] = ValidationStatus.INVALID
+    status.loc[[5], "PLAYER_status"] = ValidationStatus.CORRECTABLE
+    model.set_validation_status(status)
+    before = model.data
+
+    stats = service.apply_corrections_in_parallel(only_invalid=True, pool=pool)
+
+    after = model.data
+    changed = (before["PLAYER"] != after["PLAYER"]) & before["PLAYER"].notna()
+    assert changed[changed].index.tolist() == [1, 4, 5]
+    assert after.at[0, "PLAYER"] == "Jhon"
+    assert (before["CHEST"] == after["CHEST"]).all()
+    assert stats["corrected_cells"] == 3
+
+
+def test_parallel_correction_from_worker_thread_notifies(pool, qtbot):
+    """Results written from a background thread still reach data_changed."""
+    service = _create_service()
+    emitted = []
+    service._data_model.data_changed.connect(emitted.append)
+    service._data_model._last_emission_time = int(time.time() * 1000)
+
+    worker = threading.Thread(target=lambda: service.apply_corrections_in_parallel(pool=pool))
+    worker.start()
+    worker.join()
+
+    qtbot.waitUntil(lambda: len(emitted) == 1, timeout=2000)
+    assert service._data_model.data.at[4, "PLAYER"] == "John"
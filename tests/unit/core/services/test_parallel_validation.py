@@ -0,0 +1,71 @@
+"""
+Tests for validating large data on a process pool.
+
+Verifies that block-wise validation gives the results of serial validation on
+the benchmark data.
+"""
+
+import pandas as pd
+import pytest
+
+from benchmarks.data_generator import TotalBattleDataGenerator
+from benchmarks.run_benchmarks import BenchmarkConfig
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.validation_service import ValidationService
+from chestbuddy.utils.process_pool import ProcessPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Create a two-process pool that splits even small frames into blocks."""
+    pool = ProcessPool(workers=2, min_rows=1, block_rows=250)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def benchmark_setup(tmp_path):
+    """Generate benchmark data as loaded from CSV and its validation lists."""
+    generator = TotalBattleDataGenerator(seed=11, invalid_rate=0.2)
+    data = generator.generate(2000).astype(str)
+    # Add missing values and exact duplicates
+    data.loc[5, "CLAN"] = ""
+    data.loc[7, "PLAYER"] = None
+    data.loc[1500] = data.loc[3]
+    generator.write_validation_lists(tmp_path)
+    return data, BenchmarkConfig(tmp_path, tmp_path / "rules.csv")
+
+
+def _validate(data, config, pool):
+    """Validate a copy of the data with the given pool."""
+    model = ChestDataModel()
+    model.update_data(data.copy())
+    model.flush_notifications()
+    service = ValidationService(model, config)
+    service._process_pool = pool
+    return service.validate_data(), model.get_validation_status()
+
+
+def test_parallel_validation_matches_serial(qtbot, benchmark_setup, pool):
+    """Every rule finds the same rows with the same messages in both modes."""
+    data, config = benchmark_setup
+
+    serial_results, serial_status = _validate(data, config, ProcessPool(workers=1))
+    parallel_results, parallel_status = _validate(data, config, pool)
+
+    assert set(serial_results) >= {"missing_values", "duplicates", "player_validation"}
+    assert parallel_results == serial_results
+    pd.testing.assert_frame_equal(parallel_status, serial_status)
+
+
+def test_custom_rules_stay_serial(qtbot, benchmark_setup, pool):
+    """Rules replaced through add_validation_rule are not distributed."""
+    data, config = benchmark_setup
+    model = ChestDataModel()
+    model.update_data(data)
+    service = ValidationService(model, config)
+    service.add_validation_rule("player_validation", lambda df: {0: "Custom"})
+
+    results = service._validate_in_parallel(data, ["player_validation", "data_types"], pool)
+
+    assert list(results) == ["data_types"]
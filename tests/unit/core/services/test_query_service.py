@@ -0,0 +1,124 @@
+"""
+Unit tests for ad-hoc queries over the chest data.
+"""
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.query_service import QueryError, QueryService, QuerySpec, QueryTask
+from chestbuddy.core.storage import storage_available
+from chestbuddy.utils.task_scheduler import TaskScheduler
+
+requires_duckdb = pytest.mark.skipif(not storage_available(), reason="DuckDB is not installed")
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler for background queries."""
+    scheduler = TaskScheduler(max_threads=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def service(scheduler):
+    """Create a query service over a small chest history."""
+    model = ChestDataModel()
+    model.update_data(
+        pd.DataFrame(
+            {
+                "DATE": ["2024-01-01", "2024-01-03", "2024-01-08", "2024-01-09", "2024-01-10"],
+                "PLAYER": ["Ann", "Ann", "Ann", "Bob", "Bob"],
+                "SOURCE": ["Crypt", "Arena", "Crypt", "Crypt", "Crypt"],
+                "CHEST": ["Wood", "Stone", "Wood", "Gold", "Wood"],
+                "SCORE": ["10", "5", "20", "7", "3"],
+                "CLAN": ["X", "X", "X", "X", "X"],
+            }
+        )
+    )
+    model.flush_notifications()
+    return QueryService(model, scheduler=scheduler)
+
+
+def test_spec_groups_by_player_and_week(service):
+    """Dates are bucketed into weeks starting on Monday and scores are summed."""
+    result = service.run(
+        QuerySpec(group_by=("PLAYER", "DATE"), value_column="SCORE", time_bucket="week")
+    )
+
+    assert result["PLAYER"].tolist() == ["Ann", "Ann", "Bob"]
+    assert result["DATE"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2024-01-01",
+        "2024-01-08",
+        "2024-01-08",
+    ]
+    assert result["value"].tolist() == [15, 20, 10]
+
+
+def test_spec_filters_and_pivots(service):
+    """Filters apply before grouping and pivot values become columns."""
+    result = service.run(
+        QuerySpec(
+            group_by=("PLAYER",),
+            value_column="SCORE",
+            pivot_column="SOURCE",
+            filters=(("CHEST", "Equals", "wood"),),
+        )
+    )
+
+    assert list(result.columns) == ["PLAYER", "Crypt"]
+    assert result["Crypt"].tolist() == [30, 3]
+
+
+def test_results_are_cached_until_data_changes(service):
+    """A repeated query is served from the cache; a data change invalidates it."""
+    spec = QuerySpec(group_by=("PLAYER",))
+    first = service.run(spec)
+    assert first["value"].tolist() == [3, 2]
+    assert service.cached_result(spec) is first
+    assert service.run(spec) is first
+
+    service._data_model.update_cell(0, "PLAYER", "Bob")
+    assert service.cached_result(spec) is None
+    assert service.run(spec)["value"].tolist() == [2, 3]
+
+
+def test_background_query_and_cancellation(service):
+    """Submitted queries finish in the background; cancelled ones return nothing."""
+    handle = service.submit(QuerySpec(group_by=("SOURCE",)))
+    assert handle.wait(5000)
+    assert handle.result["value"].tolist() == [1, 4]
+
+    task = QueryTask(service, QuerySpec(group_by=("CHEST",)), service._data_model.data, "fp")
+    task.cancel()
+    assert task.run() is None
+    assert service.cached_result(QuerySpec(group_by=("CHEST",))) is None
+
+
+def test_invalid_spec_raises(service):
+    """Unknown columns are reported as query errors."""
+    with pytest.raises(QueryError):
+        service.run(QuerySpec(group_by=("GUILD",)))
+
+
+def test_export_writes_result(service, tmp_path):
+    """Results are exported as CSV."""
+    result = service.run(QuerySpec(group_by=("PLAYER",), value_column="SCORE"))
+    path = tmp_path / "report.csv"
+
+    success, error = service.export(result, path)
+
+    assert success, error
+    assert pd.read_csv(path)["value"].tolist() == [35, 10]
+
+
+@requires_duckdb
+def test_sql_query_over_loaded_data(service):
+    """SQL runs over the loaded data as the table chest_data."""
+    result = service.run(
+        "SELECT PLAYER, sum(CAST(SCORE AS INTEGER)) AS points "
+        "FROM chest_data GROUP BY PLAYER ORDER BY PLAYER"
+    )
+
+    assert result["points"].tolist() == [35, 10]
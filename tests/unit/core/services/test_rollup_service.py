@@ -0,0 +1,124 @@
+"""
+Unit tests for the precomputed score rollups.
+"""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.rollup_service import RollupService
+from chestbuddy.core.storage import DatasetStore
+
+
+@pytest.fixture
+def model():
+    """Create a data model with a small chest history."""
+    model = ChestDataModel()
+    model.update_data(
+        pd.DataFrame(
+            {
+                "DATE": ["2024-01-01", "2024-01-03", "2024-01-08", "2024-01-09", "not a date"],
+                "PLAYER": ["Ann", "Ann", "Ann", "Bob", "Bob"],
+                "SOURCE": ["Crypt", "Arena", "Crypt", "Crypt", "Crypt"],
+                "CHEST": ["Wood", "Stone", "Wood", "Gold", "Wood"],
+                "SCORE": ["10", "5", "20", "7", "3"],
+                "CLAN": ["X", "X", "X", "Y", "Y"],
+            }
+        )
+    )
+    model.flush_notifications()
+    return model
+
+
+def _assert_matches_rebuild(model, rollups):
+    """Incrementally updated rollups answer like freshly built ones."""
+    rebuilt = RollupService(model)
+    assert rollups.leaderboard(limit=None) == rebuilt.leaderboard(limit=None)
+    assert rollups.leaderboard("clan", "count") == rebuilt.leaderboard("clan", "count")
+    assert rollups.chest_counts() == rebuilt.chest_counts()
+    assert rollups.trend("day").equals(rebuilt.trend("day"))
+
+
+def test_leaderboards_and_windows(model):
+    """Players and clans are ranked over the whole history or a date window."""
+    rollups = RollupService(model)
+
+    assert rollups.leaderboard() == [("Ann", 35.0), ("Bob", 7.0)]
+    assert rollups.leaderboard("clan", "count") == [("X", 3), ("Y", 1)]
+    assert rollups.leaderboard(start="2024-01-08", end="2024-01-08") == [("Ann", 20.0)]
+    assert rollups.chest_counts() == {"Wood": 2, "Stone": 1, "Gold": 1}
+    assert rollups.chest_counts("Ann", end="2024-01-05") == {"Wood": 1, "Stone": 1}
+
+
+def test_trends_by_week_and_month(model):
+    """Trends are bucketed by weeks starting on Monday and by month."""
+    rollups = RollupService(model)
+
+    weekly = rollups.trend("week")
+    assert weekly.index.strftime("%Y-%m-%d").tolist() == ["2024-01-01", "2024-01-08"]
+    assert weekly.tolist() == [15.0, 27.0]
+    assert rollups.trend("month", clan="Y", metric="count").tolist() == [1]
+    assert rollups.trend("week", player="Nobody").empty
+
+
+def test_edited_cells_move_rows_between_buckets(model):
+    """Edits update the rollups in place, including dates before the first day."""
+    rollups = RollupService(model)
+    rollups.leaderboard()
+
+    model.update_cell(1, "PLAYER", "Cid")
+    model.update_cell(0, "DATE", "2023-12-25")
+    model.update_cell(3, "SCORE", "70")
+    model.flush_notifications()
+
+    assert rollups._built
+    assert rollups.leaderboard() == [("Bob", 70.0), ("Ann", 30.0), ("Cid", 5.0)]
+    assert rollups.date_range()[0] == pd.Timestamp("2023-12-25")
+    _assert_matches_rebuild(model, rollups)
+
+
+def test_appended_rows_are_added(model):
+    """Appended rows are added without a rebuild; other changes rebuild lazily."""
+    rollups = RollupService(model)
+    rollups.leaderboard()
+
+    model.add_row(
+        {"DATE": "2024-02-01", "PLAYER": "Dan", "CHEST": "Epic", "SCORE": "100", "CLAN": "Z"}
+    )
+    model.flush_notifications()
+
+    assert rollups._built
+    assert rollups.leaderboard(limit=1) == [("Dan", 100.0)]
+    _assert_matches_rebuild(model, rollups)
+
+    model.delete_row(0)
+    model.flush_notifications()
+    assert not rollups._built
+    assert rollups.leaderboard()[1] == ("Ann", 25.0)
+
+
+def test_dataset_rollups_come_from_group_totals(model):
+    """An out-of-core dataset is rolled up from its per-group totals like in-memory data."""
+    data = model.data
+
+    def aggregate(keys, value_column, func):
+        groups = [data[key] for key in keys]
+        if value_column is None:
+            values = data.groupby(groups, dropna=False).size()
+        else:
+            values = pd.to_numeric(data[value_column]).groupby(groups, dropna=False).sum()
+        return values.rename("value").reset_index()
+
+    dataset = MagicMock(spec=DatasetStore)
+    dataset.row_count = len(data)
+    dataset.column_names = list(data.columns)
+    dataset.aggregate.side_effect = aggregate
+    dataset_model = ChestDataModel()
+    dataset_model.attach_dataset(dataset)
+    dataset_model.flush_notifications()
+
+    rollups = RollupService(dataset_model)
+    _assert_matches_rebuild(model, rollups)
+    assert rollups.leaderboard("clan", "count") == [("X", 3), ("Y", 1)]
@@ -0,0 +1,128 @@
+"""
+Test suite for the ChangeJournal undo/redo history.
+
+Covers transactions, replay into ChestDataModel and TableStateManager,
+and spilling old transactions to disk.
+"""
+
+import pandas as pd
+import pytest
+
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.state.change_journal import ChangeJournal
+from chestbuddy.core.table_state_manager import CellFullState, CellState, TableStateManager
+
+
+@pytest.fixture
+def model(qtbot):
+    """Create a data model with a few rows."""
+    model = ChestDataModel()
+    model.update_data(
+        pd.DataFrame(
+            {
+                "DATE": ["2024-01-01"] * 3,
+                "PLAYER": ["Jhon", "Jane", "Bob"],
+                "SOURCE": ["Crypt"] * 3,
+                "CHEST": ["Gold", "Silver", "Wood"],
+                "SCORE": [10, 20, 30],
+                "CLAN": ["A"] * 3,
+            }
+        )
+    )
+    model.journal.clear()
+    return model
+
+
+def test_cell_edit_undo_redo(model):
+    """Single cell edits are undoable steps."""
+    model.set_cell_value(0, "PLAYER", "John")
+    assert model.journal.can_undo()
+
+    assert model.journal.undo()
+    assert model.data.at[0, "PLAYER"] == "Jhon"
+    assert model.journal.redo()
+    assert model.data.at[0, "PLAYER"] == "John"
+    assert not model.journal.can_redo()
+
+
+def test_transaction_groups_changes(model):
+    """Changes between begin and commit are undone together, in one step."""
+    journal = model.journal
+    journal.begin("Rename")
+    model.set_cell_value(0, 1, "John")
+    model.set_cell_value(0, 1, "Johnny")
+    model.set_cell_value(2, "SCORE", 35)
+    journal.commit()
+
+    assert journal.undo_label() == "Rename"
+    journal.undo()
+    assert model.data["PLAYER"].tolist() == ["Jhon", "Jane", "Bob"]
+    assert model.data["SCORE"].tolist() == [10, 20, 30]
+    assert not journal.can_undo()
+
+    journal.redo()
+    assert model.data.at[0, "PLAYER"] == "Johnny"
+    assert model.data.at[2, "SCORE"] == 35
+
+
+def test_update_data_records_cell_diff(model):
+    """Replacing the data with a same-shaped frame records only the changed cells."""
+    corrected = model.data.copy()
+    corrected.loc[1, "CHEST"] = "Gold"
+    model.update_data(corrected)
+
+    transaction = model.journal._undo_stack[-1]
+    assert len(transaction) == 1
+    model.journal.undo()
+    assert model.data.at[1, "CHEST"] == "Silver"
+
+
+def test_new_edit_clears_redo_and_structure_change_clears_history(model):
+    """Redo is dropped by a new edit; row changes invalidate the history."""
+    model.set_cell_value(0, "PLAYER", "John")
+    model.journal.undo()
+    model.set_cell_value(1, "PLAYER", "Janet")
+    assert not model.journal.can_redo()
+
+    model.add_row({"PLAYER": "New"})
+    assert not model.journal.can_undo()
+
+
+def test_undo_restores_cell_states(model):
+    """Undo restores the state a cell had before the change."""
+    state_manager = TableStateManager(model)
+    model.journal.set_state_manager(state_manager)
+    state_manager.update_states({(0, 1): CellFullState(validation_status=CellState.INVALID)})
+
+    model.set_cell_value(0, 1, "John")
+    state_manager.update_states({(0, 1): CellFullState(validation_status=CellState.CORRECTED)})
+
+    model.journal.undo()
+    assert state_manager.get_full_cell_state(0, 1).validation_status == CellState.INVALID
+    model.journal.redo()
+    assert state_manager.get_full_cell_state(0, 1).validation_status == CellState.NORMAL
+
+
+def test_rollback_reverts_pending_changes(model):
+    """Rollback reverts the open transaction without adding history."""
+    model.journal.begin("Failed operation")
+    model.set_cell_value(1, "PLAYER", "Broken")
+    model.journal.rollback()
+
+    assert model.data.at[1, "PLAYER"] == "Jane"
+    assert not model.journal.can_undo()
+
+
+def test_old_transactions_spill_to_disk(model, tmp_path):
+    """Transactions above the memory cap are spilled and loaded back on undo."""
+    journal = ChangeJournal(model, max_memory_mb=0.0001, spill_dir=str(tmp_path))
+    model._journal = journal
+    for value in range(5):
+        model.set_cell_value(0, "SCORE", value)
+
+    assert journal.spilled_count > 0
+    assert any(tmp_path.iterdir())
+    while journal.can_undo():
+        journal.undo()
+    assert model.data.at[0, "SCORE"] == 10
+    assert journal.spilled_count == 0
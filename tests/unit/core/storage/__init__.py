@@ -0,0 +1,3 @@
+"""
+Package initialization for core.storage unit tests.
+"""
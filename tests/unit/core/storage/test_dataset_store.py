@@ -0,0 +1,235 @@
+"""
+Test suite for the out-of-core DatasetStore and its use by the data model and services.
+
+Tests that query a real dataset need DuckDB and are skipped without it; the
+others stand in a mock dataset.
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chestbuddy.core.enums.validation_enums import ValidationStatus
+from chestbuddy.core.models.chest_data_model import ChestDataModel
+from chestbuddy.core.services.chart_service import ChartService
+from chestbuddy.core.services.data_manager import DataManager
+from chestbuddy.core.services.validation_service import ValidationService
+from chestbuddy.core.storage import DatasetStore, StorageUnavailableError, storage_available
+
+requires_duckdb = pytest.mark.skipif(not storage_available(), reason="DuckDB is not installed")
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small chest CSV file."""
+    path = tmp_path / "chests.csv"
+    pd.DataFrame(
+        {
+            "PLAYER": ["Alice", "bob", "Carol", "", "alice"],
+            "CHEST": ["Gold", "Silver", "Gold", "Wood", "Gold"],
+            "SCORE": ["10", "5", "7", "1", "3"],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def store(csv_file, tmp_path):
+    """Import the CSV file into a Parquet dataset with tiny pages."""
+    store = DatasetStore.import_csv(csv_file, tmp_path / "chests.parquet", page_size=2)
+    yield store
+    store.close()
+
+
+def test_unavailable_backend_raises(monkeypatch, tmp_path):
+    """Opening a dataset without DuckDB raises a clear error."""
+    monkeypatch.setattr("chestbuddy.core.storage.dataset_store.duckdb", None)
+    with pytest.raises(StorageUnavailableError):
+        DatasetStore(tmp_path / "missing.parquet")
+
+
+def test_model_reads_through_attached_dataset(qtbot):
+    """ChestDataModel answers shape and cell reads from an attached dataset."""
+    dataset = MagicMock(spec=DatasetStore)
+    dataset.row_count = 10_000_000
+    dataset.column_names = ["PLAYER", "SCORE"]
+    dataset.value_at.return_value = "Alice"
+    model = ChestDataModel()
+
+    model.attach_dataset(dataset)
+
+    assert model.dataset is dataset
+    assert model.row_count == 10_000_000
+    assert not model.is_empty
+    assert model.column_names == ["PLAYER", "SCORE"]
+    assert model.get_cell_value(9_999_999, "PLAYER") == "Alice"
+    dataset.value_at.assert_called_with(9_999_999, "PLAYER")
+
+    model.update_data(pd.DataFrame({"PLAYER": ["Bob"], "SCORE": [1]}))
+    dataset.close.assert_called_once()
+    assert model.dataset is None
+    assert model.row_count == 1
+
+
+def _mock_dataset(row_count=10_000_000, columns=("PLAYER", "SCORE")):
+    """Create a mock dataset with a given shape."""
+    dataset = MagicMock(spec=DatasetStore)
+    dataset.row_count = row_count
+    dataset.column_names = list(columns)
+    dataset.page_size = 5000
+    return dataset
+
+
+def test_model_filters_load_one_page(qtbot):
+    """Filtering an attached dataset never loads more than one page of rows."""
+    dataset = _mock_dataset()
+    model = ChestDataModel()
+    model.attach_dataset(dataset)
+
+    model.filter_data("PLAYER", "", "Contains", False)
+    dataset.rows.assert_called_once_with(0, 5000)
+
+    model.filter_data("PLAYER", "Al", "Contains", False)
+    dataset.filter_rows.assert_called_once_with("PLAYER", "Al", "Contains", False, limit=5000)
+
+
+def test_dataset_validation_publishes_status(qtbot):
+    """List checks of a dataset update the status frame and emit validation_complete."""
+    dataset = _mock_dataset(columns=("PLAYER", "CHEST", "SCORE"))
+    dataset.invalid_row_ids.return_value = np.array([3, 9_000_000])
+    model = ChestDataModel()
+    model.attach_dataset(dataset)
+    service = ValidationService(model)
+    service._player_list_model = MagicMock(entries=["Alice"], is_case_sensitive=lambda: True)
+    service._chest_type_list_model = None
+    service._source_list_model = None
+
+    with qtbot.waitSignal(service.validation_complete) as blocker:
+        results = service.validate_data(["player_validation", "missing_values"])
+
+    assert results == {
+        "player_validation": {3: "Invalid player name", 9_000_000: "Invalid player name"}
+    }
+    status_df = blocker.args[0]
+    assert status_df.index.tolist() == [3, 9_000_000]
+    assert status_df["PLAYER_status"].tolist() == [ValidationStatus.INVALID] * 2
+    assert status_df["CHEST_status"].tolist() == [ValidationStatus.NOT_VALIDATED] * 2
+    mask = model.get_validation_status_mask("PLAYER", [ValidationStatus.INVALID])
+    assert np.flatnonzero(mask).tolist() == [3, 9_000_000]
+    assert model.get_invalid_rows() == [3, 9_000_000]
+
+
+def test_dataset_charts_use_pushed_down_totals(qtbot):
+    """Bar charts of a dataset are drawn from the totals the dataset computes."""
+    dataset = _mock_dataset(columns=("CHEST", "SCORE"))
+    dataset.aggregate.return_value = pd.DataFrame(
+        {"CHEST": ["Gold", "Wood"], "value": [20.0, None]}
+    )
+    model = ChestDataModel()
+    model.attach_dataset(dataset)
+    service = ChartService(model)
+
+    data = service._chart_data("CHEST", "SCORE")
+    chart = service.create_bar_chart("CHEST", "SCORE")
+
+    dataset.aggregate.assert_called_with(["CHEST"], "SCORE", "sum")
+    assert data.to_dict("list") == {"CHEST": ["Gold", "Wood"], "SCORE": [20.0, 0.0]}
+    assert chart.series()[0].barSets()[0].at(0) == 20.0
+    with pytest.raises(ValueError):
+        service.create_bar_chart("PLAYER", "SCORE")
+
+
+def test_large_file_load_attaches_dataset(qtbot, monkeypatch, tmp_path):
+    """Loading a file above the threshold imports it and attaches the dataset."""
+    large = tmp_path / "large.csv"
+    large.write_text("player,score\n" + "Alice,1\n" * 200_000)
+    dataset = _mock_dataset(row_count=200_000)
+    import_csv = MagicMock(return_value=dataset)
+    monkeypatch.setattr("chestbuddy.core.services.data_manager.storage_available", lambda: True)
+    monkeypatch.setattr(DatasetStore, "import_csv", import_csv)
+    model = ChestDataModel()
+    manager = DataManager(model, MagicMock())
+    # Import files over 1 MB to a temporary directory
+    manager._config = MagicMock()
+    manager._config.get_int.return_value = 1
+    manager._config.get_path.return_value = tmp_path / "datasets"
+
+    with qtbot.waitSignal(manager.data_loaded, timeout=10000):
+        manager.load_csv(str(large))
+
+    assert model.dataset is dataset
+    csv_path, dataset_path = import_csv.call_args.args
+    assert csv_path == str(large)
+    assert dataset_path.parent == tmp_path / "datasets"
+    assert import_csv.call_args.kwargs["canonical_columns"] == ChestDataModel.EXPECTED_COLUMNS
+
+    # Small files still load into memory
+    (tmp_path / "small.csv").write_text("player,score\nAlice,1\n")
+    assert not manager._should_import_dataset([str(tmp_path / "small.csv")])
+
+
+@requires_duckdb
+def test_windowed_rows(store):
+    """Rows are read in pages addressed by row id."""
+    assert store.row_count == 5
+    assert store.column_names == ["PLAYER", "CHEST", "SCORE"]
+    assert store.value_at(2, 0) == "Carol"
+    assert store.value_at(4, "CHEST") == "Gold"
+    assert store.value_at(3, "PLAYER") is None
+    assert store.rows(1, 4)["PLAYER"].tolist()[:2] == ["bob", "Carol"]
+
+
+@requires_duckdb
+def test_pushed_down_queries(store):
+    """Filters, sorting and aggregates run inside DuckDB."""
+    assert store.filter_row_ids("PLAYER", "ALICE", "Equals").tolist() == [0, 4]
+    assert store.filter_rows("CHEST", "gol", "Starts with").index.tolist() == [0, 2, 4]
+    assert store.sorted_row_ids([(1, False), (0, True)]).tolist() == [3, 1, 0, 2, 4]
+
+    totals = store.aggregate("CHEST", "SCORE", "sum").set_index("CHEST")["value"]
+    assert totals.to_dict() == {"Gold": 20.0, "Silver": 5.0, "Wood": 1.0}
+    assert store.filter_rows("CHEST", "gol", "Starts with", limit=2).index.tolist() == [0, 2]
+
+
+@requires_duckdb
+def test_import_uses_canonical_column_names(tmp_path):
+    """CSV columns are renamed to the expected names regardless of their case."""
+    path = tmp_path / "mixed.csv"
+    path.write_text("Player,chest,Notes\nAlice,Gold,x\n")
+    store = DatasetStore.import_csv(
+        path, tmp_path / "mixed.parquet", canonical_columns=ChestDataModel.EXPECTED_COLUMNS
+    )
+    try:
+        assert store.column_names == ["PLAYER", "CHEST", "Notes"]
+        assert store.value_at(0, "PLAYER") == "Alice"
+    finally:
+        store.close()
+
+
+@requires_duckdb
+def test_validation_list_join(store):
+    """Values are checked against a validation list without loading the data."""
+    counts = store.list_match_counts("PLAYER", ["Alice", "Bob"], case_sensitive=False)
+    assert counts == {"valid": 3, "invalid": 1, "missing": 1}
+    assert store.invalid_row_ids("PLAYER", ["Alice", "Bob"]).tolist() == [1, 2, 4]
+    assert isinstance(store.invalid_row_ids("PLAYER", []), np.ndarray)
+
+
+@requires_duckdb
+def test_attached_dataset_validates_and_charts(store, qtbot):
+    """A real dataset publishes its invalid rows and chart totals through the services."""
+    model = ChestDataModel()
+    model.attach_dataset(store)
+    service = ValidationService(model)
+    service._player_list_model = MagicMock(entries=["Alice", "Bob"], is_case_sensitive=lambda: True)
+    service._chest_type_list_model = None
+    service._source_list_model = None
+
+    service.validate_data(["player_validation"])
+    totals = ChartService(model)._chart_data("CHEST", "SCORE")
+
+    assert model.get_invalid_rows() == [1, 2, 4]
+    expected = {"Gold": 20.0, "Silver": 5.0, "Wood": 1.0}
+    assert totals.set_index("CHEST")["SCORE"].to_dict() == expected
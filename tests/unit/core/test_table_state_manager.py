@@ -280,3 +280,39 @@ class TestTableStateManager:
         # Only row 1 was changed in both columns
         assert set(affected["rows"]) == {1}
         assert set(affected["columns"]) == {"PLAYER", "CHEST"}
+
+    def test_counters_follow_state_changes(self, table_state_manager):
+        """Aggregate counters are updated by every kind of state change."""
+        table_state_manager.update_states(
+            {
+                (0, 0): CellFullState(validation_status=CellState.INVALID),
+                (0, 1): CellFullState(validation_status=CellState.CORRECTABLE),
+                (1, 0): CellFullState(validation_status=CellState.VALID),
+                (2, 1): CellFullState(validation_status=CellState.INVALID),
+            }
+        )
+        assert table_state_manager.count_cells(CellState.INVALID) == 2
+        assert table_state_manager.column_state_counts(1) == {
+            CellState.CORRECTABLE: 1,
+            CellState.INVALID: 1,
+        }
+        assert table_state_manager.issue_rows() == [0, 2]
+
+        # Fixing one of two issues keeps the row counted
+        table_state_manager.update_states(
+            {(0, 0): CellFullState(validation_status=CellState.VALID)}
+        )
+        assert table_state_manager.issue_row_count() == 2
+        table_state_manager.reset_cell_state(0, 1)
+        table_state_manager.reset_rows([2])
+        assert table_state_manager.issue_row_count() == 0
+        assert table_state_manager.count_rows(CellState.VALID) == 2
+
+        summary = table_state_manager.summary()
+        assert summary["valid"] == 2
+        assert summary["invalid"] == 0
+        assert summary["issue_rows"] == 0
+
+        table_state_manager.reset_cell_states()
+        assert table_state_manager.count_cells(CellState.VALID) == 0
+        assert table_state_manager.column_state_counts(0) == {}
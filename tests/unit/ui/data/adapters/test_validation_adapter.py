@@ -328,3 +328,40 @@ def test_validation_complete_handles_invalid_row_status(
 # Removed: test_process_validation_results_logic
 # Removed: test_process_validation_results_empty_df
 # Removed: test_process_validation_results_missing_column
+
+
+def test_validation_complete_sends_only_changed_cells(
+    mock_validation_service: MockValidationService,
+):
+    """Test that only cells whose state changed reach a real TableStateManager."""
+    from chestbuddy.core.models.chest_data_model import ChestDataModel
+
+    data_model = ChestDataModel()
+    data_model.update_data(pd.DataFrame({"PLAYER": ["a", "b", "c"], "SCORE": [1, 2, 3]}))
+    state_manager = TableStateManager(data_model)
+    adapter = ValidationAdapter(mock_validation_service, state_manager)
+    emitted = []
+    state_manager.state_changed.connect(emitted.append)
+    col = state_manager.headers_map["PLAYER"]
+
+    status_df = pd.DataFrame(
+        {
+            "PLAYER_status": [ValidationStatus.NOT_VALIDATED, ValidationStatus.INVALID, None],
+            "PLAYER_message": ["", "Error A1", None],
+            "SCORE_status": [ValidationStatus.NOT_VALIDATED] * 3,
+            "SCORE_message": [""] * 3,
+        }
+    )
+    mock_validation_service.validation_complete.emit(status_df)
+
+    assert emitted == [{(1, col)}]
+    assert set(state_manager.stored_cells()) == {(1, col)}
+
+    # Revalidating clears the stored error; unchanged cells are not sent again
+    status_df.loc[1, ["PLAYER_status", "PLAYER_message"]] = [ValidationStatus.NOT_VALIDATED, ""]
+    mock_validation_service.validation_complete.emit(status_df)
+    mock_validation_service.validation_complete.emit(status_df)
+
+    assert emitted[1:] == [{(1, col)}]
+    assert state_manager.get_cell_state(1, col) == CellState.NORMAL
+    adapter.disconnect_signals()
@@ -0,0 +1,3 @@
+"""
+Package initialization for ui.models unit tests.
+"""
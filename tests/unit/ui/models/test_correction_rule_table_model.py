@@ -0,0 +1,85 @@
+"""
+Tests for CorrectionRuleTableModel and CorrectionRuleFilterProxyModel.
+
+Covers the fine-grained change signals emitted by sync() and the proxy filters.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.ui.models.correction_rule_table_model import (
+    CorrectionRuleFilterProxyModel,
+    CorrectionRuleTableModel,
+)
+
+
+@pytest.fixture
+def manager():
+    """Create a rule manager with a few rules."""
+    manager = CorrectionRuleManager()
+    manager.add_rule(CorrectionRule("John", "Jon", "player"))
+    manager.add_rule(CorrectionRule("Gold", "gold", "general"))
+    manager.add_rule(CorrectionRule("Silver", "silvr", "chest", status="disabled"))
+    return manager
+
+
+@pytest.fixture
+def model(qtbot, manager):
+    """Create a table model over the manager's rules."""
+    controller = MagicMock()
+    controller.get_rules.side_effect = lambda: manager.get_rules()
+    return CorrectionRuleTableModel(controller)
+
+
+def test_toggle_emits_data_changed_for_one_row(qtbot, model, manager):
+    """Editing a rule in place updates only its row."""
+    with qtbot.assertNotEmitted(model.modelReset):
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            manager.toggle_rule_status(1)
+            model.sync()
+
+    assert blocker.args[0].row() == blocker.args[1].row() == 1
+    assert model.index(1, 3).data() == "disabled"
+
+
+def test_move_emits_rows_moved(qtbot, model, manager):
+    """Reordering a rule moves its row without a reset."""
+    with qtbot.assertNotEmitted(model.modelReset):
+        with qtbot.waitSignal(model.rowsMoved):
+            manager.move_rule(0, 2)
+            model.sync()
+
+    assert [model.index(row, 0).data() for row in range(3)] == ["gold", "silvr", "Jon"]
+
+
+def test_add_and_delete_emit_row_signals(qtbot, model, manager):
+    """Adding and deleting a rule insert and remove single rows."""
+    with qtbot.assertNotEmitted(model.modelReset):
+        with qtbot.waitSignal(model.rowsInserted):
+            manager.add_rule(CorrectionRule("Bob", "Bobb", "player"))
+            model.sync()
+        with qtbot.waitSignal(model.rowsRemoved) as blocker:
+            manager.delete_rule(0)
+            model.sync()
+
+    assert blocker.args[1] == 0
+    assert model.rowCount() == 3
+
+
+def test_proxy_filters(qtbot, model):
+    """The proxy applies category, status and search filters."""
+    proxy = CorrectionRuleFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.set_filters(status="Enabled")
+    assert proxy.rowCount() == 2
+
+    proxy.set_filters(search="SILV")
+    assert proxy.rowCount() == 1
+    assert proxy.mapToSource(proxy.index(0, 0)).row() == 2
+
+    proxy.set_filters(category="player", search="jo")
+    assert proxy.rowCount() == 1
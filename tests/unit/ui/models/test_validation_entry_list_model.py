@@ -0,0 +1,66 @@
+"""
+Tests for ValidationEntryListModel.
+
+Covers incremental search and targeted row updates for entry changes.
+"""
+
+import pytest
+
+from chestbuddy.core.models.validation_list_model import ValidationListModel
+from chestbuddy.ui.models.validation_entry_list_model import ValidationEntryListModel
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Create a validation list with a few entries."""
+    path = tmp_path / "players.txt"
+    path.write_text("Zoe\nJohn\nJohanna\nBob\nJo\n", encoding="utf-8")
+    return ValidationListModel(str(path))
+
+
+@pytest.fixture
+def model(qtbot, source):
+    """Create a list model over the validation list."""
+    return ValidationEntryListModel(source)
+
+
+def rows(model):
+    """Get all visible entries."""
+    return [model.entry(row) for row in range(model.rowCount())]
+
+
+def test_entries_sorted(model):
+    """All entries are shown in sorted order without a filter."""
+    assert rows(model) == ["Bob", "Jo", "Johanna", "John", "Zoe"]
+
+
+def test_search_is_case_insensitive_substring(model):
+    """Searching matches substrings regardless of case."""
+    model.set_filter("OH")
+    assert rows(model) == ["Johanna", "John"]
+
+
+def test_extending_search_narrows_rows(qtbot, model):
+    """Typing more characters removes rows instead of resetting the model."""
+    model.set_filter("jo")
+    with qtbot.assertNotEmitted(model.modelReset):
+        with qtbot.waitSignal(model.rowsRemoved):
+            model.set_filter("joh")
+    assert rows(model) == ["Johanna", "John"]
+
+    model.set_filter("b")
+    assert rows(model) == ["Bob"]
+
+
+def test_add_and_remove_emit_targeted_rows(qtbot, model, source):
+    """Entry edits insert and remove single rows in sorted position."""
+    model.set_filter("jo")
+    with qtbot.assertNotEmitted(model.modelReset):
+        with qtbot.waitSignal(model.rowsInserted) as inserted:
+            source.add_entry("Joe")
+        with qtbot.waitSignal(model.rowsRemoved):
+            source.remove_entry("John")
+        source.add_entry("Alice")
+
+    assert inserted.args[1] == 1
+    assert rows(model) == ["Jo", "Joe", "Johanna"]
@@ -0,0 +1,136 @@
+"""
+Tests for the UpdateManager scheduler.
+
+Covers the single-timer tick, visibility ordering, the frame budget and
+deferred refreshes of hidden components.
+"""
+
+import time
+from typing import Any, List, Optional
+
+import pytest
+from PySide6.QtWidgets import QStackedWidget, QVBoxLayout, QWidget
+
+from chestbuddy.ui.utils.update_manager import UpdateManager
+
+
+class RecordingView(QWidget):
+    """Updatable widget that records the order of its updates."""
+
+    def __init__(self, name: str, log: List[str], delay: float = 0.0):
+        super().__init__()
+        self.name = name
+        self.log = log
+        self.delay = delay
+
+    def refresh(self) -> None:
+        pass
+
+    def update(self, data: Optional[Any] = None) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        self.log.append(self.name)
+
+    def populate(self, data: Optional[Any] = None) -> None:
+        pass
+
+    def needs_update(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        pass
+
+    def last_update_time(self) -> float:
+        return 0.0
+
+
+@pytest.fixture
+def manager(qtbot):
+    """Create an update manager."""
+    return UpdateManager()
+
+
+@pytest.fixture
+def stacked(qtbot):
+    """Create a shown window with a stack of two views, the first one current."""
+    log: List[str] = []
+    window = QWidget()
+    stack = QStackedWidget(window)
+    QVBoxLayout(window).addWidget(stack)
+    visible = RecordingView("visible", log)
+    hidden = RecordingView("hidden", log)
+    stack.addWidget(visible)
+    stack.addWidget(hidden)
+    qtbot.addWidget(window)
+    window.show()
+    qtbot.waitExposed(window)
+    return window, stack, visible, hidden, log
+
+
+def test_single_tick_processes_all_due_updates(qtbot, manager):
+    """Updates scheduled together run on one shared timer tick."""
+    log: List[str] = []
+    views = [RecordingView(f"view_{i}", log) for i in range(3)]
+
+    for view in views:
+        manager.schedule_update(view, debounce_ms=10)
+
+    qtbot.waitUntil(lambda: len(log) == 3, timeout=1000)
+    assert log == ["view_0", "view_1", "view_2"]
+    assert not manager.has_pending_updates()
+
+
+def test_priority_orders_updates(qtbot, manager):
+    """Lower priority values run first among equally visible components."""
+    log: List[str] = []
+    low = RecordingView("low", log)
+    high = RecordingView("high", log)
+
+    manager.schedule_update(low, debounce_ms=0, priority=5)
+    manager.schedule_update(high, debounce_ms=0, priority=1)
+    manager.process_pending_updates()
+
+    assert log == ["high", "low"]
+
+
+def test_frame_budget_splits_work(qtbot, manager):
+    """Work beyond the frame budget is deferred to a later tick."""
+    log: List[str] = []
+    manager.frame_budget_ms = 1
+    views = [RecordingView(f"slow_{i}", log, delay=0.005) for i in range(3)]
+
+    for view in views:
+        manager.schedule_update(view, debounce_ms=0)
+
+    # Run one tick by hand: the first update already exceeds the budget
+    manager._on_tick()
+    assert log == ["slow_0"]
+    qtbot.waitUntil(lambda: len(log) == 3, timeout=1000)
+
+
+def test_hidden_view_marked_dirty_and_refreshed_on_show(qtbot, manager, stacked):
+    """Hidden views are skipped until they are shown."""
+    _, stack, visible, hidden, log = stacked
+
+    manager.schedule_update(hidden, debounce_ms=0)
+    manager.schedule_update(visible, debounce_ms=0)
+    qtbot.waitUntil(lambda: log == ["visible"], timeout=1000)
+
+    assert manager.is_dirty(hidden)
+    assert not manager.has_pending_updates()
+
+    stack.setCurrentWidget(hidden)
+    qtbot.waitUntil(lambda: log == ["visible", "hidden"], timeout=1000)
+    assert not manager.is_dirty(hidden)
+
+
+def test_visible_views_refresh_first(qtbot, manager, stacked):
+    """Visible widgets are updated before components that are not widgets on screen."""
+    _, _, visible, _, log = stacked
+    offscreen = RecordingView("offscreen", log)
+
+    manager.schedule_update(offscreen, debounce_ms=0)
+    manager.schedule_update(visible, debounce_ms=0)
+    manager.process_pending_updates()
+
+    assert log == ["visible", "offscreen"]
@@ -14,7 +14,7 @@ from PySide6.QtCore import Qt, Signal, QModelIndex, QPoint, QItemSelection, QIte
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QApplication,
-    QTableWidget,
+    QTableView,
     QComboBox,
     QLineEdit,
     QCheckBox,
@@ -118,7 +118,7 @@ class TestCorrectionRuleView:
         assert isinstance(correction_rule_view._search_edit, QLineEdit)
 
         # Check rule table
-        assert isinstance(correction_rule_view._rule_table, QTableWidget)
+        assert isinstance(correction_rule_view._rule_table, QTableView)
         assert correction_rule_view._rule_table.model() is not None
 
         # Check rule controls
@@ -160,19 +160,15 @@ class TestCorrectionRuleView:
         # Manually call refresh to ensure it's called only once
         correction_rule_view._refresh_rule_table()
 
-        # Check that get_rules was called to populate the table
-        mock_correction_controller.get_rules.assert_called_once_with(
-            category="", status="", search_term=""
-        )
+        # The model fetches the unfiltered rules once; filtering happens in the proxy
+        mock_correction_controller.get_rules.assert_called_once_with()
 
         # Check that the table has the correct number of rows
-        assert correction_rule_view._rule_table.rowCount() == 3
+        model = correction_rule_view._rule_table.model()
+        assert model.rowCount() == 3
 
         # Check column headers
-        headers = [
-            correction_rule_view._rule_table.horizontalHeaderItem(i).text() for i in range(5)
-        ]
-        assert "Order" in headers
+        headers = [model.headerData(i, Qt.Horizontal) for i in range(model.columnCount())]
         assert "From" in headers
         assert "To" in headers
         assert "Category" in headers
@@ -414,7 +410,7 @@ class TestCorrectionRuleView:
         """Test that the 'Preview Rule' action exists in the context menu."""
         # Select one row to enable actions
         correction_rule_view._rule_table.selectRow(0)
-        qtbot.waitUntil(lambda: len(correction_rule_view._rule_table.selectedItems()) > 0)
+        qtbot.waitUntil(lambda: len(correction_rule_view._rule_table.selectionModel().selectedRows()) > 0)
 
         # Mock the QMenu to capture actions
         mock_menu = MagicMock(spec=QMenu)
@@ -438,8 +434,8 @@ class TestCorrectionRuleView:
 
         with patch("PySide6.QtWidgets.QMenu", return_value=mock_menu):
             # Trigger context menu
-            table_pos = correction_rule_view._rule_table.visualItemRect(
-                correction_rule_view._rule_table.item(0, 0)
+            table_pos = correction_rule_view._rule_table.visualRect(
+                correction_rule_view._rule_table.model().index(0, 0)
             ).center()
             correction_rule_view._show_context_menu(table_pos, menu=mock_menu)
 
@@ -482,7 +478,7 @@ class TestCorrectionRuleView:
             # --- Case 2: One row selected ---
             # Use selection model to select row 0
             start_index_row0 = table.model().index(0, 0)
-            end_index_row0 = table.model().index(0, table.columnCount() - 1)
+            end_index_row0 = table.model().index(0, table.model().columnCount() - 1)
             selection_range_row0 = QItemSelection(start_index_row0, end_index_row0)
             selection_model.select(
                 selection_range_row0, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
@@ -511,7 +507,7 @@ class TestCorrectionRuleView:
             table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
             # Use selection model to select rows 0 and 1
             start_index_row1 = table.model().index(1, 0)
-            end_index_row1 = table.model().index(1, table.columnCount() - 1)
+            end_index_row1 = table.model().index(1, table.model().columnCount() - 1)
             selection_range_row1 = QItemSelection(start_index_row1, end_index_row1)
 
             # Select row 0 first, then add row 1 to the selection
@@ -558,14 +554,14 @@ class TestCorrectionRuleView:
         table = correction_rule_view._rule_table
 
         # --- Setup ---
-        qtbot.waitUntil(lambda: table.rowCount() > 1)
+        qtbot.waitUntil(lambda: table.model().rowCount() > 1)
         target_row_index = 1
-        target_item = table.item(target_row_index, 0)
-        assert target_item is not None, "Table item for selection not found"
-        target_pos = table.visualItemRect(target_item).center()
+        target_index = table.model().index(target_row_index, 0)
+        assert target_index.isValid(), "Table index for selection not found"
+        target_pos = table.visualRect(target_index).center()
         qtbot.mouseClick(table.viewport(), Qt.LeftButton, pos=target_pos)
-        qtbot.waitUntil(lambda: table.currentRow() == target_row_index, timeout=1000)
-        qtbot.waitUntil(lambda: len(table.selectedItems()) > 0, timeout=1000)
+        qtbot.waitUntil(lambda: table.currentIndex().row() == target_row_index, timeout=1000)
+        qtbot.waitUntil(lambda: len(table.selectionModel().selectedRows()) > 0, timeout=1000)
 
         # Verify _get_selected_rule_id works
         selected_id = correction_rule_view._get_selected_rule_id()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the asynchronous logging pipeline and the hot-path channel.
+"""
+
+import logging
+import queue
+
+import pytest
+
+from chestbuddy.utils import log_pipeline
+from chestbuddy.utils.log_pipeline import (
+    BoundedQueueHandler,
+    HotPathChannel,
+    configure_logging,
+    set_log_level,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def root_level():
+    """Restore the root logger level after the test."""
+    level = logging.getLogger().level
+    yield
+    shutdown_logging()
+    logging.getLogger().setLevel(level)
+
+
+def test_records_are_written_by_background_thread(tmp_path, root_level):
+    """Records reach the rotating file once the pipeline is shut down."""
+    log_file = tmp_path / "app.log"
+    configure_logging(log_file, level="INFO", console_level="CRITICAL")
+
+    logging.getLogger("chestbuddy.test").info("value is %d", 42)
+    logging.getLogger("chestbuddy.test").debug("not written")
+    shutdown_logging()
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "chestbuddy.test - INFO - value is 42" in content
+    assert "not written" not in content
+
+
+def test_full_queue_drops_routine_records():
+    """A full queue drops records below WARNING instead of blocking."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    logger = logging.getLogger("chestbuddy.test.bounded")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        logger.warning("first")
+        logger.warning("blocked")
+        logger.info("dropped")
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    assert handler.dropped == 2
+    assert handler.queue.get_nowait().getMessage() == "first"
+
+
+def test_set_log_level_changes_root_level(root_level):
+    """The root level can be changed at runtime by name."""
+    set_log_level("warning")
+    assert logging.getLogger().level == logging.WARNING
+    set_log_level("bogus")
+    assert logging.getLogger().level == logging.INFO
+
+
+def test_hot_path_channel_formats_only_when_enabled(caplog):
+    """A disabled channel never formats its arguments."""
+
+    class Expensive:
+        formatted = 0
+
+        def __str__(self):
+            Expensive.formatted += 1
+            return "expensive"
+
+    channel = HotPathChannel()
+    logger = logging.getLogger("chestbuddy.test.hot")
+    with caplog.at_level(logging.DEBUG, logger="chestbuddy.test.hot"):
+        channel.debug(logger, "value %s", Expensive())
+        assert Expensive.formatted == 0
+        assert not caplog.records
+
+        channel.set_enabled(True)
+        channel.debug(logger, "value %s", Expensive())
+
+    assert [r.getMessage() for r in caplog.records if r.name == logger.name] == ["value expensive"]
+    assert log_pipeline.hot_path.enabled is False
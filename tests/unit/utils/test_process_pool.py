@@ -0,0 +1,73 @@
+"""
+Unit tests for the shared process pool and shared frames.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chestbuddy.utils.process_pool import ProcessPool, SharedFrame
+
+
+def _summarize_block(context):
+    """Report a block's rows, decoded values and payload."""
+    return (
+        context.start,
+        context.stop,
+        context.values("NAME").tolist(),
+        context.payload,
+    )
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Create a two-process pool with small blocks."""
+    pool = ProcessPool(workers=2, min_rows=1, block_rows=3)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def frame():
+    """Share a frame with repeated and missing values."""
+    data = pd.DataFrame({"NAME": ["a", "b", None, "a", "c", "b", "a"], "SCORE": range(7)})
+    with SharedFrame(data, ["NAME"]) as frame:
+        yield frame
+
+
+def test_shared_frame_encodes_columns_as_codes(frame):
+    """Columns are factorized into row-aligned codes with -1 for missing values."""
+    assert frame.shape == (1, 7)
+    assert frame.uniques["NAME"].tolist() == ["a", "b", "c"]
+    assert frame.codes()[0].tolist() == [0, 1, -1, 0, 2, 1, 0]
+
+
+def test_map_blocks_returns_results_in_row_order(pool, frame):
+    """Every block is processed once and results keep the block order."""
+    progress = []
+
+    results = pool.map_blocks(
+        _summarize_block,
+        frame,
+        payload={"rules": 1},
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert [(start, stop) for start, stop, _, _ in results] == [(0, 3), (3, 6), (6, 7)]
+    values = [value for _, _, block, _ in results for value in block]
+    assert values[:2] + values[3:] == ["a", "b", "a", "c", "b", "a"]
+    assert np.isnan(values[2])
+    assert all(payload == {"rules": 1} for _, _, _, payload in results)
+    assert progress[-1] == (3, 3)
+
+
+def test_cancelled_jobs_return_none(pool, frame):
+    """A cancelled job stops before collecting results."""
+    assert pool.map_blocks(_summarize_block, frame, cancel_check=lambda: True) is None
+
+
+def test_small_frames_and_single_workers_stay_serial():
+    """Only frames with enough rows on several workers are distributed."""
+    assert not ProcessPool(workers=1, min_rows=1).should_parallelize(10)
+    assert not ProcessPool(workers=4, min_rows=100).should_parallelize(99)
+    assert ProcessPool(workers=4, min_rows=100).should_parallelize(100)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the SignalTracer sampling mode.
+"""
+
+import logging
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+from chestbuddy.utils.signal_tracer import LatencyHistogram, SignalTracer
+
+
+class Emitter(QObject):
+    """Simple signal source for testing."""
+
+    value_changed = Signal(int)
+
+
+@pytest.fixture
+def tracer():
+    """Create a tracer with sampling enabled for every emission."""
+    tracer = SignalTracer()
+    tracer.start_sampling(sample_rate=1, buffer_size=5, digest_interval=0)
+    return tracer
+
+
+def test_histogram_percentiles():
+    """Percentiles land within one bucket of the true value."""
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(float(value))
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["max"] == 100.0
+    assert summary["mean"] == pytest.approx(50.5)
+    assert 50 <= summary["p50"] <= 50 * 1.2
+    assert 95 <= summary["p95"] <= 100.0
+
+
+def test_emit_delivers_every_emission(qtbot):
+    """Emissions are delivered whether or not they are sampled."""
+    tracer = SignalTracer()
+    tracer.start_sampling(sample_rate=3, digest_interval=0)
+    emitter = Emitter()
+    received = []
+    emitter.value_changed.connect(received.append)
+
+    for i in range(9):
+        tracer.emit(emitter, "value_changed", i)
+
+    assert received == list(range(9))
+    assert tracer.get_latency_stats()["Emitter.value_changed"]["count"] == 3
+
+
+def test_emit_without_sampling_records_nothing(qtbot):
+    """No statistics are kept while sampling is off."""
+    tracer = SignalTracer()
+    emitter = Emitter()
+    received = []
+    emitter.value_changed.connect(received.append)
+
+    tracer.emit(emitter, "value_changed", 1)
+
+    assert received == [1]
+    assert tracer.get_latency_stats() == {}
+
+
+def test_ring_buffer_is_bounded(tracer):
+    """Only the most recent samples are kept in the ring buffer."""
+    for i in range(20):
+        tracer.record_sample("Model.data_changed", float(i))
+
+    samples = tracer.get_recent_samples()
+    assert len(samples) == 5
+    assert [duration for _, _, duration in samples] == [15.0, 16.0, 17.0, 18.0, 19.0]
+    assert tracer.get_latency_stats()["Model.data_changed"]["count"] == 20
+
+
+def test_log_digest(tracer, caplog):
+    """The digest lists sampled signals, slowest first."""
+    tracer.record_sample("Fast.signal", 0.1)
+    tracer.record_sample("Slow.signal", 40.0)
+
+    with caplog.at_level(logging.INFO, logger="chestbuddy.utils.signal_tracer"):
+        tracer.log_digest()
+
+    digest = caplog.records[-1].getMessage()
+    assert digest.index("Slow.signal") < digest.index("Fast.signal")
+
+
+def test_invalid_sample_rate():
+    """A sample rate below one is rejected."""
+    with pytest.raises(ValueError):
+        SignalTracer().start_sampling(sample_rate=0)
+
+
+
+def test_only_full_tracing_warns():
+    """Importing and sampling are silent; starting full tracing warns."""
+    import subprocess
+    import sys
+
+    code = (
+        "from chestbuddy.utils.signal_tracer import SignalTracer\n"
+        "SignalTracer().start_sampling(sample_rate=1)"
+    )
+    result = subprocess.run([sys.executable, "-W", "error", "-c", code], capture_output=True)
+    assert result.returncode == 0, result.stderr.decode()
+
+    with pytest.warns(UserWarning, match="debugging utility"):
+        SignalTracer().start_tracing()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the SpanTracer utility.
+"""
+
+import json
+import threading
+
+import pytest
+
+from chestbuddy.app import parse_arguments
+from chestbuddy.utils.span_tracer import SpanTracer
+
+
+@pytest.fixture
+def tracer():
+    """Create an enabled tracer with a small buffer."""
+    tracer = SpanTracer(capacity=10)
+    tracer.enable()
+    return tracer
+
+
+def test_disabled_tracer_records_nothing():
+    """Spans and traced calls are not recorded while disabled."""
+    tracer = SpanTracer()
+
+    @tracer.trace("work")
+    def work(value):
+        return value * 2
+
+    with tracer.span("block"):
+        pass
+
+    assert work(21) == 42
+    assert tracer.get_spans() == []
+
+
+def test_nested_spans_record_depth(tracer):
+    """Nested spans are recorded with their nesting depth."""
+    with tracer.span("outer", "io", rows=3):
+        with tracer.span("inner"):
+            pass
+
+    spans = {span.name: span for span in tracer.get_spans()}
+    assert spans["outer"].depth == 0
+    assert spans["inner"].depth == 1
+    assert spans["outer"].args == {"rows": 3}
+    assert spans["outer"].category == "io"
+    assert spans["outer"].duration_ns >= spans["inner"].duration_ns
+
+
+def test_trace_decorator_records_errors(tracer):
+    """A traced call that raises is recorded with the exception type."""
+
+    @tracer.trace()
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        fail()
+
+    (span,) = tracer.get_spans()
+    assert span.name.endswith("fail")
+    assert span.args["error"] == "ValueError"
+
+
+def test_ring_buffer_drops_oldest(tracer):
+    """Only the most recent spans are kept once the buffer is full."""
+    for i in range(15):
+        with tracer.span(f"span-{i}"):
+            pass
+
+    names = [span.name for span in tracer.get_spans()]
+    assert len(names) == 10
+    assert names[0] == "span-5"
+    assert names[-1] == "span-14"
+
+
+def test_spans_record_thread_ids(tracer):
+    """Spans from worker threads carry the worker's thread id."""
+
+    def worker():
+        with tracer.span("background"):
+            pass
+
+    thread = threading.Thread(target=worker, name="loader")
+    thread.start()
+    thread.join()
+    with tracer.span("main"):
+        pass
+
+    spans = {span.name: span for span in tracer.get_spans()}
+    assert spans["background"].thread_name == "loader"
+    assert spans["background"].thread_id != spans["main"].thread_id
+
+
+def test_export_chrome_trace(tracer, tmp_path):
+    """The exported file is valid Chrome trace JSON."""
+    with tracer.span("CSVService.read_csv", "io", path=tmp_path):
+        pass
+
+    path = tracer.export_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text(encoding="utf-8"))
+
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    assert complete[0]["name"] == "CSVService.read_csv"
+    assert complete[0]["cat"] == "io"
+    assert complete[0]["args"]["path"] == str(tmp_path)
+    assert metadata[0]["args"]["name"] == threading.current_thread().name
+
+
+def test_trace_cli_flag():
+    """--trace is consumed and remaining arguments are passed on to Qt."""
+    options, qt_argv = parse_arguments(["chestbuddy", "--trace", "out.json", "-style", "fusion"])
+
+    assert options.trace == "out.json"
+    assert qt_argv == ["chestbuddy", "-style", "fusion"]
@@ -0,0 +1,63 @@
+"""
+Unit tests for the StartupProfiler utility.
+"""
+
+import time
+
+import pytest
+
+from chestbuddy.utils.startup_profiler import StartupProfiler
+
+
+@pytest.fixture
+def profiler():
+    """Create a fresh profiler."""
+    return StartupProfiler()
+
+
+def test_phase_records_duration(profiler):
+    """A phase records its duration in milliseconds."""
+    with profiler.phase("services"):
+        time.sleep(0.01)
+
+    durations = profiler.get_phase_durations()
+    assert "services" in durations
+    assert durations["services"] >= 10.0
+
+
+def test_phase_records_on_exception(profiler):
+    """A phase is still recorded if its body raises."""
+    with pytest.raises(RuntimeError):
+        with profiler.phase("ui"):
+            raise RuntimeError("boom")
+
+    assert "ui" in profiler.get_phase_durations()
+
+
+def test_mark_and_timeline_ordering(profiler):
+    """Marks and nested phases appear in start order in the timeline."""
+    with profiler.phase("ui"):
+        with profiler.phase("main_window"):
+            pass
+        profiler.mark("first_window_shown")
+
+    assert profiler.get_mark("first_window_shown") is not None
+    assert profiler.get_mark("missing") is None
+
+    lines = profiler.format_timeline().splitlines()
+    names = [line.split("|")[-1].strip() for line in lines[1:]]
+    assert names == ["ui", "main_window", "first_window_shown"]
+    # Nested phases are indented under their parent
+    assert lines[2].split("|")[-1].startswith("   main_window")
+
+
+def test_reset_clears_state(profiler):
+    """reset() removes recorded phases and marks."""
+    with profiler.phase("logging"):
+        pass
+    profiler.mark("done")
+
+    profiler.reset()
+
+    assert profiler.get_phase_durations() == {}
+    assert profiler.get_mark("done") is None
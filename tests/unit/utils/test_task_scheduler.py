@@ -0,0 +1,146 @@
+"""
+Unit tests for the shared task scheduler.
+"""
+
+import threading
+
+import pytest
+
+from chestbuddy.utils.background_processing import (
+    BackgroundWorker,
+    FunctionTask,
+    file_fingerprint,
+)
+from chestbuddy.utils.task_scheduler import TaskPriority, TaskScheduler, TaskState
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler with a single thread so queue order is observable."""
+    scheduler = TaskScheduler(max_threads=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def _blocker(scheduler):
+    """Occupy the only pool thread until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    handle = scheduler.submit(block, task_type="block")
+    assert started.wait(5)
+    return release, handle
+
+
+def test_higher_priority_tasks_start_first(scheduler):
+    """Queued tasks start by priority."""
+    release, _ = _blocker(scheduler)
+    order = []
+    scheduler.submit(lambda: order.append("background"), priority=TaskPriority.BACKGROUND)
+    scheduler.submit(lambda: order.append("interactive"), priority=TaskPriority.INTERACTIVE)
+
+    release.set()
+    assert scheduler.wait_for_done(5000)
+    assert order == ["interactive", "background"]
+
+
+def test_identical_pending_tasks_are_deduplicated(scheduler):
+    """A task with the same type and fingerprint as a queued task reuses its handle."""
+    release, _ = _blocker(scheduler)
+    runs = []
+    first = scheduler.submit(lambda: runs.append(1), task_type="validate", fingerprint="abc")
+    second = scheduler.submit(lambda: runs.append(2), task_type="validate", fingerprint="abc")
+    other = scheduler.submit(lambda: runs.append(3), task_type="validate", fingerprint="def")
+
+    assert second is first
+    assert other is not first
+    release.set()
+    assert scheduler.wait_for_done(5000)
+    assert sorted(runs) == [1, 3]
+    assert scheduler.metrics()["deduplicated"] == 1
+
+
+def test_handles_are_connected_before_tasks_start(scheduler, qtbot):
+    """Signals of a task that finishes at once reach a worker that just queued it."""
+    events = []
+    scheduler.submit(
+        lambda: events.append("ran"), connect=lambda handle: events.append("connected")
+    )
+    assert scheduler.wait_for_done(5000)
+    assert events == ["connected", "ran"]
+
+    worker = BackgroundWorker(scheduler=scheduler)
+    with qtbot.waitSignal(worker.finished, timeout=5000) as blocker:
+        worker.execute_task(FunctionTask(lambda: 42))
+    assert blocker.args == [42]
+
+
+def test_cancelled_pending_task_never_runs(scheduler):
+    """Cancelling a queued task removes it from the queue."""
+    release, _ = _blocker(scheduler)
+    runs = []
+    handle = scheduler.submit(lambda: runs.append(1))
+    assert scheduler.metrics()["queue_depth"] == 1
+
+    handle.cancel()
+    release.set()
+    assert scheduler.wait_for_done(5000)
+
+    assert runs == []
+    assert handle.state == TaskState.CANCELLED
+    assert handle.token.is_cancelled
+    assert scheduler.metrics()["queue_depth"] == 0
+
+
+def test_metrics_record_durations_and_failures(scheduler):
+    """Durations are recorded per task type and failures are counted."""
+
+    def fail():
+        raise ValueError("boom")
+
+    ok = scheduler.submit(lambda: 42, task_type="chart")
+    failed = scheduler.submit(fail, task_type="chart")
+    assert ok.wait(5000) and failed.wait(5000)
+
+    metrics = scheduler.metrics()
+    assert ok.result == 42
+    assert isinstance(failed.exception, ValueError)
+    assert metrics["finished"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["durations"]["chart"]["count"] == 2
+
+
+def test_duplicate_file_loads_are_coalesced(scheduler, qtbot, tmp_path):
+    """Reading the same unchanged file twice queues one task; editing it queues another."""
+    file_path = tmp_path / "chests.csv"
+    file_path.write_text("PLAYER,CHEST\nJohn,Gold\n", encoding="utf-8")
+    release, _ = _blocker(scheduler)
+    runs = []
+
+    def load(worker, run):
+        task = FunctionTask(lambda: runs.append(run))
+        worker.execute_task(task, fingerprint=file_fingerprint([file_path]))
+
+    first = BackgroundWorker(task_type="csv_read", scheduler=scheduler)
+    second = BackgroundWorker(task_type="csv_read", scheduler=scheduler)
+    load(first, 1)
+    load(second, 2)
+    # Repeating the request on the same worker joins its task as well
+    load(first, 3)
+
+    assert second._handle is first._handle
+    assert scheduler.metrics()["deduplicated"] == 1
+
+    file_path.write_text("PLAYER,CHEST\nJane,Wood\nJohn,Gold\n", encoding="utf-8")
+    third = BackgroundWorker(task_type="csv_read", scheduler=scheduler)
+    load(third, 4)
+    assert third._handle is not first._handle
+
+    release.set()
+    assert scheduler.wait_for_done(5000)
+    qtbot.waitUntil(lambda: not first.is_running and not third.is_running, timeout=2000)
+    assert sorted(runs) == [1, 4]
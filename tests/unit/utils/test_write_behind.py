@@ -0,0 +1,89 @@
+"""
+Unit tests for write-behind persistence of validation lists and correction rules.
+"""
+
+from chestbuddy.core.models.correction_rule import CorrectionRule
+from chestbuddy.core.models.correction_rule_manager import CorrectionRuleManager
+from chestbuddy.core.models.validation_list_model import ValidationListModel
+from chestbuddy.utils.write_behind import (
+    AppendOnlyLog,
+    WriteBehindPersister,
+    atomic_write_text,
+    flush_all,
+)
+
+
+def test_atomic_write_replaces_content_without_leftovers(tmp_path):
+    """The target is replaced and no temporary files remain."""
+    path = tmp_path / "list.txt"
+    path.write_text("old\n", encoding="utf-8")
+
+    atomic_write_text(path, "new\n")
+
+    assert path.read_text(encoding="utf-8") == "new\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["list.txt"]
+
+
+def test_persister_coalesces_scheduled_writes(qtbot):
+    """Several schedule() calls result in a single write after the delay."""
+    writes = []
+    persister = WriteBehindPersister(lambda: writes.append(1), delay_ms=20)
+
+    for _ in range(5):
+        persister.schedule()
+    assert writes == []
+    assert persister.pending
+
+    qtbot.waitUntil(lambda: not persister.pending, timeout=1000)
+    assert writes == [1]
+
+
+def test_flush_all_writes_pending_persisters(qtbot):
+    """flush_all() performs pending writes immediately."""
+    writes = []
+    persister = WriteBehindPersister(lambda: writes.append(1), delay_ms=60000)
+    persister.schedule()
+
+    assert flush_all()
+    assert writes == [1]
+    assert not persister.pending
+
+
+def test_validation_list_logs_single_changes(qtbot, tmp_path):
+    """Additions and removals are appended to the log and compacted on flush."""
+    path = tmp_path / "players.txt"
+    path.write_text("Alice\nBob\n", encoding="utf-8")
+    model = ValidationListModel(str(path), flush_delay_ms=60000)
+
+    model.add_entry("Carol")
+    model.remove_entry("Alice")
+
+    log = AppendOnlyLog(tmp_path / "players.txt.log")
+    assert log.read() == [("+", "Carol"), ("-", "Alice")]
+    assert path.read_text(encoding="utf-8") == "Alice\nBob\n"
+    assert model.has_unsaved_changes()
+
+    # A reload before compaction replays the log
+    assert ValidationListModel(str(path), flush_delay_ms=60000).get_entries() == ["Bob", "Carol"]
+
+    assert model.flush()
+    assert path.read_text(encoding="utf-8") == "Bob\nCarol\n"
+    assert not log.path.exists()
+    assert not model.has_unsaved_changes()
+
+
+def test_rule_manager_schedule_save_coalesces(qtbot, tmp_path):
+    """Scheduled rule saves are deferred until flushed."""
+    path = tmp_path / "rules.csv"
+    manager = CorrectionRuleManager()
+    manager._custom_path = path
+
+    for i in range(3):
+        manager.add_rule(CorrectionRule(f"To{i}", f"From{i}", "player"))
+        manager.schedule_save(delay_ms=60000)
+    assert not path.exists()
+
+    assert manager.flush()
+    loaded = CorrectionRuleManager()
+    loaded.load_rules(path)
+    assert len(loaded.get_rules()) == 3